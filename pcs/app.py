@@ -21,26 +21,6 @@ from pcs.cli.reports.output import (
     error,
     print_to_stderr,
 )
-from pcs.cli.routing import (
-    acl,
-    alert,
-    booth,
-    client,
-    cluster,
-    config,
-    constraint,
-    dr,
-    host,
-    node,
-    pcsd,
-    prop,
-    qdevice,
-    quorum,
-    resource,
-    status,
-    stonith,
-    tag,
-)
 from pcs.lib.errors import LibraryError
 
 
@@ -248,25 +228,31 @@ def main(argv=None):
 
     if (os.getuid() != 0) and (argv and argv[0] != "help") and not usefile:
         _non_root_run(argv)
+    # Routers are imported only for the command being run, importing all of
+    # them noticeably slows down every run of pcs.
     cmd_map = {
-        "resource": resource.resource_cmd,
-        "cluster": cluster.cluster_cmd,
-        "stonith": stonith.stonith_cmd,
-        "property": prop.property_cmd,
-        "constraint": constraint.constraint_cmd,
-        "acl": acl.acl_cmd,
-        "status": status.status_cmd,
-        "config": config.config_cmd,
-        "pcsd": pcsd.pcsd_cmd,
-        "node": node.node_cmd,
-        "quorum": quorum.quorum_cmd,
-        "qdevice": qdevice.qdevice_cmd,
-        "alert": alert.alert_cmd,
-        "booth": booth.booth_cmd,
-        "host": host.host_cmd,
-        "client": client.client_cmd,
-        "dr": dr.dr_cmd,
-        "tag": tag.tag_cmd,
+        "resource": routing.import_cmd(
+            "pcs.cli.routing.resource", "resource_cmd"
+        ),
+        "cluster": routing.import_cmd("pcs.cli.routing.cluster", "cluster_cmd"),
+        "stonith": routing.import_cmd("pcs.cli.routing.stonith", "stonith_cmd"),
+        "property": routing.import_cmd("pcs.cli.routing.prop", "property_cmd"),
+        "constraint": routing.import_cmd(
+            "pcs.cli.routing.constraint", "constraint_cmd"
+        ),
+        "acl": routing.import_cmd("pcs.cli.routing.acl", "acl_cmd"),
+        "status": routing.import_cmd("pcs.cli.routing.status", "status_cmd"),
+        "config": routing.import_cmd("pcs.cli.routing.config", "config_cmd"),
+        "pcsd": routing.import_cmd("pcs.cli.routing.pcsd", "pcsd_cmd"),
+        "node": routing.import_cmd("pcs.cli.routing.node", "node_cmd"),
+        "quorum": routing.import_cmd("pcs.cli.routing.quorum", "quorum_cmd"),
+        "qdevice": routing.import_cmd("pcs.cli.routing.qdevice", "qdevice_cmd"),
+        "alert": routing.import_cmd("pcs.cli.routing.alert", "alert_cmd"),
+        "booth": routing.import_cmd("pcs.cli.routing.booth", "booth_cmd"),
+        "host": routing.import_cmd("pcs.cli.routing.host", "host_cmd"),
+        "client": routing.import_cmd("pcs.cli.routing.client", "client_cmd"),
+        "dr": routing.import_cmd("pcs.cli.routing.dr", "dr_cmd"),
+        "tag": routing.import_cmd("pcs.cli.routing.tag", "tag_cmd"),
         "help": lambda lib, argv, modifiers: print(usage.main()),
     }
     try:
@@ -3,34 +3,6 @@ from collections import namedtuple
 
 from pcs import settings
 from pcs.cli.common import middleware
-from pcs.lib.commands import (
-    acl,
-    alert,
-    booth,
-    cib_options,
-    cluster,
-    cluster_property,
-    dr,
-    fencing_topology,
-    node,
-    pcsd,
-    qdevice,
-    quorum,
-    remote_node,
-    resource,
-    resource_agent,
-    sbd,
-    scsi,
-    services,
-    status,
-    stonith,
-    stonith_agent,
-    tag,
-)
-from pcs.lib.commands.constraint import colocation as constraint_colocation
-from pcs.lib.commands.constraint import order as constraint_order
-from pcs.lib.commands.constraint import ticket as constraint_ticket
-from pcs.lib.env import LibraryEnvironment
 
 
 def wrapper(dictionary):
@@ -38,6 +10,9 @@ def wrapper(dictionary):
 
 
 def cli_env_to_lib_env(cli_env):
+    # pylint: disable=import-outside-toplevel
+    from pcs.lib.env import LibraryEnvironment
+
     return LibraryEnvironment(
         logging.getLogger("pcs"),
         cli_env.report_processor,
@@ -101,7 +76,12 @@ def bind_all(env, run_with_middleware, dictionary):
 
 def load_module(env, middleware_factory, name):
     # pylint: disable=too-many-return-statements, too-many-branches
+    # pylint: disable=import-outside-toplevel
+    # Library commands are imported only when they are needed, importing all
+    # of them noticeably slows down every run of pcs.
     if name == "acl":
+        from pcs.lib.commands import acl
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -125,6 +105,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "alert":
+        from pcs.lib.commands import alert
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -140,6 +122,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "booth":
+        from pcs.lib.commands import booth
+
         bindings = {
             "config_setup": booth.config_setup,
             "config_destroy": booth.config_destroy,
@@ -176,6 +160,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cluster":
+        from pcs.lib.commands import cluster
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -200,6 +186,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "dr":
+        from pcs.lib.commands import dr
+
         return bind_all(
             env,
             middleware.build(middleware_factory.corosync_conf_existing),
@@ -212,6 +200,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "remote_node":
+        from pcs.lib.commands import remote_node
+
         return bind_all(
             env,
             middleware.build(
@@ -227,6 +217,10 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_colocation":
+        from pcs.lib.commands.constraint import (
+            colocation as constraint_colocation,
+        )
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -237,6 +231,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_order":
+        from pcs.lib.commands.constraint import order as constraint_order
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -247,6 +243,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "constraint_ticket":
+        from pcs.lib.commands.constraint import ticket as constraint_ticket
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -259,6 +257,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "fencing_topology":
+        from pcs.lib.commands import fencing_topology
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -274,6 +274,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "node":
+        from pcs.lib.commands import node
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -294,6 +296,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "pcsd":
+        from pcs.lib.commands import pcsd
+
         return bind_all(
             env,
             middleware.build(),
@@ -301,6 +305,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "qdevice":
+        from pcs.lib.commands import qdevice
+
         return bind_all(
             env,
             middleware.build(),
@@ -326,6 +332,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "quorum":
+        from pcs.lib.commands import quorum
+
         return bind_all(
             env,
             middleware.build(middleware_factory.corosync_conf_existing),
@@ -346,10 +354,13 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "resource_agent":
+        from pcs.lib.commands import resource_agent
+
         return bind_all(
             env,
             middleware.build(),
             {
+                "clear_metadata_cache": resource_agent.clear_metadata_cache,
                 "describe_agent": resource_agent.describe_agent,
                 "get_agent_default_operations": resource_agent.get_agent_default_operations,
                 "get_agent_metadata": resource_agent.get_agent_metadata,
@@ -365,6 +376,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "resource":
+        from pcs.lib.commands import resource
+
         return bind_all(
             env,
             middleware.build(
@@ -401,6 +414,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cib_options":
+        from pcs.lib.commands import cib_options
+
         return bind_all(
             env,
             middleware.build(
@@ -419,6 +434,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "status":
+        from pcs.lib.commands import status
+
         return bind_all(
             env,
             middleware.build(
@@ -434,6 +451,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "stonith":
+        from pcs.lib.commands import stonith
+
         return bind_all(
             env,
             middleware.build(
@@ -452,6 +471,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "sbd":
+        from pcs.lib.commands import sbd
+
         return bind_all(
             env,
             middleware.build(),
@@ -472,6 +493,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "services":
+        from pcs.lib.commands import services
+
         return bind_all(
             env,
             middleware.build(),
@@ -484,6 +507,8 @@ def load_module(env, middleware_factory, name):
             },
         )
     if name == "scsi":
+        from pcs.lib.commands import scsi
+
         return bind_all(
             env,
             middleware.build(),
@@ -494,6 +519,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "stonith_agent":
+        from pcs.lib.commands import stonith_agent
+
         return bind_all(
             env,
             middleware.build(),
@@ -504,6 +531,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "tag":
+        from pcs.lib.commands import tag
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
@@ -516,6 +545,8 @@ def load_module(env, middleware_factory, name):
         )
 
     if name == "cluster_property":
+        from pcs.lib.commands import cluster_property
+
         return bind_all(
             env,
             middleware.build(middleware_factory.cib),
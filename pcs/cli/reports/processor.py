@@ -35,11 +35,16 @@ class ReportProcessorToConsole(ReportProcessor):
 
     def _do_report(self, report_item: ReportItem) -> None:
         filtered_report_item = self._report_item_preprocessor(report_item)
-        if not filtered_report_item:
+        # Do not export ignored report items, debug messages may be large
+        if (
+            not filtered_report_item
+            or filtered_report_item.severity.level in self._ignore_severities
+        ):
             return
-        report_item_dto = filtered_report_item.to_dto()
-        if report_item_dto.severity.level not in self._ignore_severities:
-            print_report(report_item_dto)
+        print_report(filtered_report_item.to_dto())
+
+    def is_debug_enabled(self) -> bool:
+        return ReportItemSeverity.DEBUG not in self._ignore_severities
 
     def _get_ignored_severities(
         self, suppressed_severity_list: Iterable[SeverityLevel]
@@ -25,6 +25,12 @@ resource_cmd = create_router(
         "standards": resource.resource_standards,
         "providers": resource.resource_providers,
         "agents": resource.resource_agents,
+        "agent-cache": create_router(
+            {
+                "clear": resource.resource_agent_cache_clear,
+            },
+            ["resource", "agent-cache"],
+        ),
         "update": resource.update_cmd,
         "meta": resource.meta_cmd,
         "delete": resource.resource_remove_cmd,
@@ -11,6 +11,7 @@ from typing import (
     Iterator,
     NewType,
     Optional,
+    Tuple,
 )
 
 from pcs.common.file_type_codes import FileTypeCode
@@ -32,6 +33,24 @@ class FileMetadata:
 
 FileAction = NewType("FileAction", str)
 
+FileStamp = Tuple[int, int, int, int]
+
+
+def get_file_stamp(path: str) -> Optional[FileStamp]:
+    """
+    Return data identifying a version of a file or None if it doesn't exist
+
+    The stamp changes whenever the file is modified or replaced, so it tells
+    whether data read from the file earlier are still up to date.
+
+    path -- path to the file
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
 
 class RawFileError(Exception):
     # So far there has been no need to have a separate exception for each
@@ -1,17 +1,28 @@
+import collections.abc
+from copy import deepcopy
 from dataclasses import (
+    MISSING,
     asdict,
     fields,
     is_dataclass,
 )
 from enum import Enum
+from functools import partial
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
+    List,
     NewType,
+    Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    get_args,
+    get_origin,
+    get_type_hints,
 )
 
 import dacite
@@ -52,96 +63,375 @@ def meta(name: str) -> Dict[str, str]:
 def _is_compatible_type(_type: Type, arg_index: int) -> bool:
     return (
         hasattr(_type, "__args__")
-        and len(_type.__args__) >= arg_index
+        and len(_type.__args__) > arg_index
         and is_dataclass(_type.__args__[arg_index])
     )
 
 
-def _convert_dict(
-    klass: Type[DataTransferObject], obj_dict: DtoPayload
-) -> DtoPayload:
-    new_dict = {}
-    for _field in fields(klass):
-        value = obj_dict[_field.name]
-        if is_dataclass(_field.type):
-            value = _convert_dict(_field.type, value)  # type: ignore
-        elif isinstance(value, list) and _is_compatible_type(_field.type, 0):
-            value = [
-                _convert_dict(_field.type.__args__[0], item) for item in value
-            ]
-        elif isinstance(value, dict) and _is_compatible_type(_field.type, 1):
-            value = {
-                item_key: _convert_dict(
-                    _field.type.__args__[1], item_val  # type: ignore
-                )
+# Converters of DTOs are built once per DTO class from its fields and cached.
+# Inspecting fields and types of DTOs for each conversion would take most of
+# the time spent converting large DTOs.
+
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _plain_value_to_dict(value: Any) -> Any:
+    # Same as the conversion done by dataclasses.asdict
+    if type(value) in _ATOMIC_TYPES or isinstance(value, Enum):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_plain_value_to_dict(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_plain_value_to_dict(item) for item in value)
+    if isinstance(value, dict):
+        return type(value)(
+            (_plain_value_to_dict(key), _plain_value_to_dict(item))
+            for key, item in value.items()
+        )
+    return deepcopy(value)
+
+
+def _get_field_to_dict_converter(_type: Type) -> Callable[[Any], Any]:
+    if is_dataclass(_type):
+        return lambda value: _get_to_dict_converter(_type)(value)
+    list_item_type = (
+        _type.__args__[0] if _is_compatible_type(_type, 0) else None
+    )
+    dict_item_type = (
+        _type.__args__[1] if _is_compatible_type(_type, 1) else None
+    )
+
+    def convert(value: Any) -> Any:
+        if list_item_type is not None and isinstance(value, list):
+            item_converter = _get_to_dict_converter(list_item_type)
+            return [item_converter(item) for item in value]
+        if dict_item_type is not None and isinstance(value, dict):
+            item_converter = _get_to_dict_converter(dict_item_type)
+            return {
+                item_key: item_converter(item_val)
                 for item_key, item_val in value.items()
             }
-        elif isinstance(value, Enum):
-            value = value.value
-        new_dict[_field.metadata.get(META_NAME, _field.name)] = value
-    return new_dict
+        if isinstance(value, Enum):
+            return value.value
+        return _plain_value_to_dict(value)
+
+    return convert
+
+
+_to_dict_converters: Dict[Type, Callable[[Any], DtoPayload]] = {}
+
+
+def _get_to_dict_converter(klass: Type) -> Callable[[Any], DtoPayload]:
+    if klass in _to_dict_converters:
+        return _to_dict_converters[klass]
+    field_list = [
+        (
+            _field.name,
+            _field.metadata.get(META_NAME, _field.name),
+            _get_field_to_dict_converter(_field.type),  # type: ignore
+        )
+        for _field in fields(klass)
+    ]
+
+    def convert(obj: Any) -> DtoPayload:
+        return {
+            new_name: convert_field(getattr(obj, name))
+            for name, new_name, convert_field in field_list
+        }
+
+    _to_dict_converters[klass] = convert
+    return convert
 
 
 def to_dict(obj: DataTransferObject) -> DtoPayload:
-    return _convert_dict(obj.__class__, asdict(obj))
+    return _get_to_dict_converter(obj.__class__)(obj)
 
 
 DTOTYPE = TypeVar("DTOTYPE", bound=DataTransferObject)
 
 
-def _convert_payload(klass: Type[DTOTYPE], data: DtoPayload) -> DtoPayload:
-    try:
-        new_dict = dict(data)
-    except ValueError as e:
-        raise PayloadConversionError() from e
+def _get_field_payload_converter(
+    _type: Type,
+) -> Optional[Callable[[Any], Any]]:
+    if is_dataclass(_type):
+        return lambda value: _get_payload_converter(_type)(value)
+    list_item_type = (
+        _type.__args__[0] if _is_compatible_type(_type, 0) else None
+    )
+    dict_item_type = (
+        _type.__args__[1] if _is_compatible_type(_type, 1) else None
+    )
+    if list_item_type is None and dict_item_type is None:
+        return None
+
+    def convert(value: Any) -> Any:
+        if list_item_type is not None and isinstance(value, list):
+            item_converter = _get_payload_converter(list_item_type)
+            return [item_converter(item) for item in value]
+        if dict_item_type is not None and isinstance(value, dict):
+            item_converter = _get_payload_converter(dict_item_type)
+            return {
+                item_key: item_converter(item_val)
+                for item_key, item_val in value.items()
+            }
+        return value
+
+    return convert
+
+
+_payload_converters: Dict[Type, Callable[[Any], DtoPayload]] = {}
+
+
+def _get_payload_converter(klass: Type) -> Callable[[Any], DtoPayload]:
+    if klass in _payload_converters:
+        return _payload_converters[klass]
+    # Fields with the same name in DTOs and payloads which do not contain
+    # other DTOs do not need to be converted.
+    field_list: List[Tuple[str, str, Optional[Callable[[Any], Any]]]] = []
     for _field in fields(klass):
         new_name = _field.metadata.get(META_NAME, _field.name)
-        if new_name not in data:
-            continue
-        value = data[new_name]
-        if is_dataclass(_field.type):
-            value = _convert_payload(_field.type, value)  # type: ignore
-        elif isinstance(value, list) and _is_compatible_type(_field.type, 0):
-            value = [
-                _convert_payload(_field.type.__args__[0], item)
-                for item in value
-            ]
-        elif isinstance(value, dict) and _is_compatible_type(_field.type, 1):
-            value = {
-                item_key: _convert_payload(
-                    _field.type.__args__[1], item_val  # type: ignore
-                )
-                for item_key, item_val in value.items()
+        convert_field = _get_field_payload_converter(
+            _field.type  # type: ignore
+        )
+        if convert_field is not None or new_name != _field.name:
+            field_list.append((_field.name, new_name, convert_field))
+
+    def convert(data: Any) -> DtoPayload:
+        try:
+            new_dict = dict(data)
+        except ValueError as e:
+            raise PayloadConversionError() from e
+        for name, new_name, convert_field in field_list:
+            if new_name not in data:
+                continue
+            value = data[new_name]
+            if convert_field is not None:
+                value = convert_field(value)
+            del new_dict[new_name]
+            new_dict[name] = value
+        return new_dict
+
+    _payload_converters[klass] = convert
+    return convert
+
+
+# NOTE: all enum types has to be listed here in key cast
+# see: https://github.com/konradhalas/dacite#casting
+_CAST_TYPES: List[Type[Any]] = [
+    types.CibRuleExpressionType,
+    types.CibRuleInEffectStatus,
+    types.CorosyncNodeAddressType,
+    types.CorosyncTransportType,
+    types.DrRole,
+    types.ResourceRelationType,
+    async_tasks_types.TaskFinishType,
+    async_tasks_types.TaskState,
+    async_tasks_types.TaskKillReason,
+    permissions_types.PermissionAccessType,
+    permissions_types.PermissionTargetType,
+]
+_DACITE_CONFIG = dacite.Config(cast=_CAST_TYPES)
+_DACITE_CONFIG_STRICT = dacite.Config(cast=_CAST_TYPES, strict=True)
+
+
+# Payloads are converted to DTOs by builders compiled once per DTO class. The
+# builders only support types used in DTOs: atomic types, enums, DTOs,
+# optional values, lists and dicts. DTOs with other types and payloads which
+# do not match their DTOs are handled by dacite, so that its validation errors
+# are reported.
+
+
+class _PayloadMismatch(Exception):
+    pass
+
+
+class _PayloadUnsupported(_PayloadMismatch):
+    pass
+
+
+_Builder = Callable[[Any], Any]
+_NONE_TYPE = type(None)
+_SEQUENCE_TYPES = (
+    list,
+    collections.abc.MutableSequence,
+    collections.abc.Sequence,
+    collections.abc.Collection,
+)
+_MAPPING_TYPES = (dict, collections.abc.Mapping)
+
+
+def _build_any(data: Any) -> Any:
+    return data
+
+
+def _get_atomic_builder(_type: Type) -> _Builder:
+    # ints are valid floats as described in PEP 484, same as in dacite
+    allowed_types: Union[Type, Tuple[Type, ...]] = (
+        (int, float) if _type is float else _type
+    )
+
+    def build(data: Any) -> Any:
+        if not isinstance(data, allowed_types):
+            raise _PayloadMismatch()
+        return data
+
+    return build
+
+
+def _build_unsupported(data: Any) -> Any:
+    raise _PayloadUnsupported()
+
+
+def _get_union_builder(args: Tuple[Any, ...], strict: bool) -> _Builder:
+    # Same as in dacite, the first type of the union which the data can be
+    # converted to is used. If that cannot be decided by the builders, dacite
+    # has to handle the payload.
+    member_builder_list = [
+        _get_type_builder(member, strict) or _build_unsupported
+        for member in args
+        if member is not _NONE_TYPE
+    ]
+    is_optional = _NONE_TYPE in args
+
+    def build(data: Any) -> Any:
+        if is_optional and data is None:
+            return None
+        for build_member in member_builder_list:
+            try:
+                return build_member(data)
+            except _PayloadUnsupported:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                continue
+        raise _PayloadMismatch()
+
+    return build
+
+
+def _get_type_builder(_type: Any, strict: bool) -> Optional[_Builder]:
+    # pylint: disable=too-many-return-statements
+    if _type is Any:
+        return _build_any
+    if _type in (str, int, float, bool):
+        return _get_atomic_builder(_type)
+    if getattr(_type, "__supertype__", None) in (str, int, float, bool):
+        # NewType
+        return _get_atomic_builder(_type.__supertype__)
+    if isinstance(_type, type) and issubclass(_type, Enum):
+        if any(issubclass(_type, cast_type) for cast_type in _CAST_TYPES):
+            return _type
+        return None
+    if isinstance(_type, type) and is_dataclass(_type):
+        return lambda data: _build_dto(_type, strict, data)
+
+    origin, args = get_origin(_type), get_args(_type)
+    if origin is Union:
+        return _get_union_builder(args, strict)
+    if origin in _SEQUENCE_TYPES and len(args) == 1:
+        build_list_item = _get_type_builder(args[0], strict)
+        if build_list_item is None:
+            return None
+        build_item: _Builder = build_list_item
+
+        def build_list(data: Any) -> Any:
+            if type(data) is not list:  # pylint: disable=unidiomatic-typecheck
+                raise _PayloadMismatch()
+            return [build_item(item) for item in data]
+
+        return build_list
+    if (
+        origin in _MAPPING_TYPES
+        and len(args) == 2
+        and (args[0] is Any or args[0] in (str, int))
+    ):
+        build_dict_key = _get_type_builder(args[0], strict)
+        build_dict_item = _get_type_builder(args[1], strict)
+        if build_dict_key is None or build_dict_item is None:
+            return None
+        build_key: _Builder = build_dict_key
+        build_value: _Builder = build_dict_item
+
+        def build_dict(data: Any) -> Any:
+            if type(data) is not dict:  # pylint: disable=unidiomatic-typecheck
+                raise _PayloadMismatch()
+            return {
+                build_key(key): build_value(item) for key, item in data.items()
             }
-        del new_dict[new_name]
-        new_dict[_field.name] = value
-    return new_dict
+
+        return build_dict
+    return None
+
+
+def _compile_dto_builder(klass: Type, strict: bool) -> Optional[_Builder]:
+    try:
+        type_hints = get_type_hints(klass)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    field_list: List[Tuple[str, _Builder, Optional[Callable[[], Any]]]] = []
+    for _field in fields(klass):
+        if not _field.init:
+            return None
+        field_type = type_hints[_field.name]
+        build_value = _get_type_builder(field_type, strict)
+        if build_value is None:
+            return None
+        get_default: Optional[Callable[[], Any]] = None
+        if _field.default is not MISSING:
+            get_default = partial(_build_any, _field.default)
+        elif _field.default_factory is not MISSING:
+            get_default = _field.default_factory
+        elif get_origin(field_type) is Union and _NONE_TYPE in get_args(
+            field_type
+        ):
+            get_default = partial(_build_any, None)
+        field_list.append((_field.name, build_value, get_default))
+    field_names = frozenset(name for name, _, _ in field_list)
+
+    def build(data: Any) -> Any:
+        if type(data) is not dict:  # pylint: disable=unidiomatic-typecheck
+            raise _PayloadMismatch()
+        if strict and not field_names.issuperset(data):
+            raise _PayloadMismatch()
+        init_values = {}
+        for name, build_value, get_default in field_list:
+            if name in data:
+                init_values[name] = build_value(data[name])
+            elif get_default is not None:
+                init_values[name] = get_default()
+            else:
+                raise _PayloadMismatch()
+        return klass(**init_values)
+
+    return build
+
+
+_dto_builders: Dict[Tuple[Type, bool], Optional[_Builder]] = {}
+
+
+def _build_dto(klass: Type, strict: bool, data: Any) -> Any:
+    if (klass, strict) not in _dto_builders:
+        _dto_builders[(klass, strict)] = _compile_dto_builder(klass, strict)
+    build = _dto_builders[(klass, strict)]
+    if build is None:
+        raise _PayloadMismatch()
+    return build(data)
 
 
 def from_dict(
     cls: Type[DTOTYPE], data: DtoPayload, strict: bool = False
 ) -> DTOTYPE:
+    payload = _get_payload_converter(cls)(data)
+    try:
+        return _build_dto(cls, strict, payload)
+    except Exception:  # pylint: disable=broad-except
+        # Let dacite build the DTO or report what is wrong with the payload.
+        pass
     return dacite.from_dict(
         data_class=cls,
-        data=_convert_payload(cls, data),
-        # NOTE: all enum types has to be listed here in key cast
-        # see: https://github.com/konradhalas/dacite#casting
-        config=dacite.Config(
-            cast=[
-                types.CibRuleExpressionType,
-                types.CibRuleInEffectStatus,
-                types.CorosyncNodeAddressType,
-                types.CorosyncTransportType,
-                types.DrRole,
-                types.ResourceRelationType,
-                async_tasks_types.TaskFinishType,
-                async_tasks_types.TaskState,
-                async_tasks_types.TaskKillReason,
-                permissions_types.PermissionAccessType,
-                permissions_types.PermissionTargetType,
-            ],
-            strict=strict,
-        ),
+        data=payload,
+        config=_DACITE_CONFIG_STRICT if strict else _DACITE_CONFIG,
     )
 
 
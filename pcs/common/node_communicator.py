@@ -1,7 +1,10 @@
 import base64
 import io
 import re
+import threading
+import time
 from collections import namedtuple
+from typing import Dict
 from urllib.parse import urlencode
 
 # We should ignore SIGPIPE when using pycurl.NOSIGNAL - see the libcurl tutorial
@@ -126,6 +129,16 @@ class Request:
         """
         self._current_dest = next(self._current_dest_iterator)
 
+    def use_dest(self, dest):
+        """
+        Use the specified host connection
+
+        Destination dest -- one of the host connections of the request target
+        """
+        if dest not in self._target.dest_list:
+            raise ValueError(f"Unknown destination {dest}")
+        self._current_dest = dest
+
     @property
     def url(self):
         """
@@ -170,6 +183,40 @@ class Request:
         return str("Request({0}, {1})").format(self._target, self._data)
 
 
+class ResponseTimings(
+    namedtuple(
+        "ResponseTimings", "name_lookup connect tls_handshake first_byte total"
+    )
+):
+    """
+    Times in seconds since a request start until the request reached its
+    phases. Connect and TLS handshake times are zero for a reused connection.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_handle(cls, handle):
+        """
+        Get timings of a request performed by a curl easy handle
+
+        pycurl.Curl handle -- curl easy handle of a finished request
+        """
+        return cls(
+            handle.getinfo(pycurl.NAMELOOKUP_TIME),
+            handle.getinfo(pycurl.CONNECT_TIME),
+            handle.getinfo(pycurl.APPCONNECT_TIME),
+            handle.getinfo(pycurl.STARTTRANSFER_TIME),
+            handle.getinfo(pycurl.TOTAL_TIME),
+        )
+
+    def to_text(self):
+        return (
+            "name lookup: {0:.3f}s, connect: {1:.3f}s, TLS handshake: "
+            "{2:.3f}s, first byte: {3:.3f}s, total: {4:.3f}s"
+        ).format(*self)
+
+
 class Response:
     """
     This class represents response for request which is available as instance
@@ -242,6 +289,10 @@ class Response:
             return None
         return self._handle.getinfo(pycurl.RESPONSE_CODE)
 
+    @property
+    def timings(self):
+        return ResponseTimings.from_handle(self._handle)
+
     def __repr__(self):
         return str(
             "Response({0} data='{1}' was_connected={2}) errno='{3}'"
@@ -264,7 +315,9 @@ class NodeCommunicatorFactory:
         self._request_timeout = request_timeout
 
     def get_communicator(self, request_timeout=None):
-        return self.get_simple_communicator(request_timeout=request_timeout)
+        return self.get_multiaddress_communicator(
+            request_timeout=request_timeout
+        )
 
     def get_simple_communicator(self, request_timeout=None):
         timeout = request_timeout if request_timeout else self._request_timeout
@@ -279,6 +332,31 @@ class NodeCommunicatorFactory:
         )
 
 
+_curl_share_storage = threading.local()
+
+
+def get_curl_share():
+    """
+    Return a curl share handle of the current thread
+
+    Easy handles using the share handle reuse open connections, TLS sessions
+    and resolved addresses, so that repeated requests to the same nodes do not
+    have to do a full TCP and TLS handshake each time. libcurl does not allow
+    connections to be shared between threads, therefore each thread has its
+    own share handle.
+    """
+    share = getattr(_curl_share_storage, "share", None)
+    if share is None:
+        share = pycurl.CurlShare()
+        share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+        share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+        # sharing connections is supported since libcurl 7.57.0
+        if hasattr(pycurl, "LOCK_DATA_CONNECT"):
+            share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_CONNECT)
+        _curl_share_storage.share = share
+    return share
+
+
 class Communicator:
     """
     This class provides simple interface for making parallel requests.
@@ -287,6 +365,10 @@ class Communicator:
     """
 
     curl_multi_select_timeout_default = 0.8  # in seconds
+    # Number of idle connections kept open for reuse. By default, libcurl
+    # keeps only 4 connections per running transfer, which closes most of the
+    # connections to a cluster once its last requests finish.
+    curl_max_connections = 128
 
     def __init__(self, communicator_logger, user, groups, request_timeout=None):
         self._logger = communicator_logger
@@ -296,7 +378,13 @@ class Communicator:
             if request_timeout is not None
             else settings.default_request_timeout
         )
+        # Tracing the communication is expensive, enable it only when the
+        # trace is going to be used.
+        self._debug = bool(communicator_logger.is_debug_enabled())
         self._multi_handle = pycurl.CurlMulti()
+        self._multi_handle.setopt(
+            pycurl.M_MAXCONNECTS, self.curl_max_connections
+        )
         self._is_running = False
         # This is used just for storing references of curl easy handles.
         # We need to have references for all the handles, so they don't be
@@ -319,6 +407,7 @@ class Communicator:
                 request,
                 self._auth_cookies,
                 self._request_timeout,
+                self._debug,
             )
             self._easy_handle_list.append(handle)
             self._multi_handle.add_handle(handle)
@@ -356,9 +445,12 @@ class Communicator:
 
         finished_count = 0
         while finished_count < len(self._easy_handle_list):
-            self.__multi_perform()
-            self.__wait_for_multi_handle()
-            response_list = self.__get_all_ready_responses()
+            self._multi_perform()
+            # Requests finished by perform would wait for activity of other
+            # requests if we waited for curl first.
+            response_list = self._get_all_ready_responses()
+            if not response_list:
+                self._wait_for_multi_handle()
             for response in response_list:
                 # free up memory for next usage of this Communicator instance
                 self._multi_handle.remove_handle(response.handle)
@@ -367,12 +459,12 @@ class Communicator:
                 # if something was added to the queue in the meantime, run it
                 # immediately, so we don't need to wait until all responses will
                 # be processed
-                self.__multi_perform()
+                self._multi_perform()
             finished_count += len(response_list)
         self._easy_handle_list = []
         self._is_running = False
 
-    def __get_all_ready_responses(self):
+    def _get_all_ready_responses(self):
         response_list = []
         repeat = True
         while repeat:
@@ -387,7 +479,7 @@ class Communicator:
             repeat = num_queued > 0
         return response_list
 
-    def __multi_perform(self):
+    def _multi_perform(self):
         # run all internal operation required by libcurl
         status, num_to_process = self._multi_handle.perform()
         # if perform returns E_CALL_MULTI_PERFORM it requires to call perform
@@ -396,8 +488,10 @@ class Communicator:
             status, num_to_process = self._multi_handle.perform()
         return num_to_process
 
-    def __wait_for_multi_handle(self):
+    def _wait_for_multi_handle(self, max_timeout=None):
         # try to wait until there is something to do for us
+        # max_timeout -- stop waiting after this time (in seconds) even if curl
+        #   has nothing to do
         need_to_wait = True
         while need_to_wait:
             timeout = self._multi_handle.timeout()
@@ -410,9 +504,46 @@ class Communicator:
                 # curl don't have timeout set, so we can use our default
                 else self.curl_multi_select_timeout_default
             )
+            if max_timeout is not None:
+                if max_timeout <= 0:
+                    return
+                timeout = min(timeout, max_timeout)
             # when value returned from select is -1, it timed out, so we can
             # wait
-            need_to_wait = self._multi_handle.select(timeout) == -1
+            need_to_wait = (
+                self._multi_handle.select(timeout) == -1 and max_timeout is None
+            )
+
+
+# Connecting to several addresses of a host in parallel requires libcurl to
+# tell us a connection has been established before a request is sent. That is
+# supported since libcurl 7.80.0 and pycurl 7.45.0.
+_PARALLEL_CONNECT_SUPPORTED = hasattr(pycurl, "PREREQFUNCTION")
+
+# Addresses which have worked last time, indexed by host labels. They are
+# shared by all communicators of a process, so that requests go straight to
+# a working address of a host.
+_preferred_dest_dict: Dict[str, Destination] = {}
+
+
+class _ConnectionRace:
+    """
+    Attempts to connect to the addresses of a request target
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.pending_dest_list = []
+        for dest in request.target.dest_list:
+            if dest not in self.pending_dest_list:
+                self.pending_dest_list.append(dest)
+        preferred_dest = _preferred_dest_dict.get(request.host_label)
+        if preferred_dest in self.pending_dest_list:
+            self.pending_dest_list.remove(preferred_dest)
+            self.pending_dest_list.insert(0, preferred_dest)
+        self.handle_list = []
+        self.next_attempt_time = None
+        self.winning_dest = None
 
 
 class MultiaddressCommunicator(Communicator):
@@ -421,9 +552,58 @@ class MultiaddressCommunicator(Communicator):
     it takes advantage of multiple hosts in RequestTarget. So if it is not
     possible to connect to target using first hostname, it will use next one
     until connection will be successful or there is no host left.
+
+    If a connection to an address is not established in a short time, the
+    next address is tried in parallel. The request is sent only through the
+    first established connection, so it is never run more than once. The
+    address which worked is tried first by following requests to the host.
     """
 
+    # time in seconds to wait for a connection to an address before trying
+    # the next address of the same host in parallel
+    connection_attempt_delay = 0.3
+
+    def __init__(self, communicator_logger, user, groups, request_timeout=None):
+        super().__init__(
+            communicator_logger, user, groups, request_timeout=request_timeout
+        )
+        self._race_list = []
+
+    def add_requests(self, request_list):
+        if not _PARALLEL_CONNECT_SUPPORTED:
+            super().add_requests(request_list)
+            return
+        for request in request_list:
+            race = _ConnectionRace(request)
+            self._race_list.append(race)
+            self.__start_attempt(race)
+
     def start_loop(self):
+        if not _PARALLEL_CONNECT_SUPPORTED:
+            yield from self.__start_sequential_loop()
+            return
+        if self._is_running:
+            raise AssertionError("Method start_loop already running")
+        self._is_running = True
+        for race in self._race_list:
+            self._logger.log_request_start(race.request)
+
+        while self._race_list:
+            self._multi_perform()
+            self.__start_delayed_attempts()
+            response_list = self._get_all_ready_responses()
+            if not response_list:
+                self._wait_for_multi_handle(self.__get_next_attempt_timeout())
+            for response in response_list:
+                finished_response = self.__process_response(response)
+                if finished_response is not None:
+                    yield finished_response
+                    # if something was added to the queue in the meantime,
+                    # run it immediately
+                    self._multi_perform()
+        self._is_running = False
+
+    def __start_sequential_loop(self):
         for response in super().start_loop():
             if response.was_connected:
                 yield response
@@ -437,8 +617,120 @@ class MultiaddressCommunicator(Communicator):
                 self._logger.log_no_more_addresses(response)
                 yield response
 
+    def __start_attempt(self, race, failed_response=None):
+        dest = race.pending_dest_list.pop(0)
+        race.request.use_dest(dest)
+        handle = _create_request_handle(
+            race.request,
+            self._auth_cookies,
+            self._request_timeout,
+            self._debug,
+        )
+        handle.setopt(pycurl.PREREQFUNCTION, _get_prereq_callback(race, dest))
+        handle.dest = dest
+        handle.connection_race = race
+        race.handle_list.append(handle)
+        race.next_attempt_time = (
+            time.monotonic() + self.connection_attempt_delay
+        )
+        self._multi_handle.add_handle(handle)
+        if failed_response is not None:
+            self._logger.log_retry(failed_response, failed_response.handle.dest)
+        if self._is_running:
+            self._logger.log_request_start(race.request)
+
+    def __start_delayed_attempts(self):
+        now = time.monotonic()
+        for race in self._race_list:
+            if (
+                race.winning_dest is None
+                and race.pending_dest_list
+                and race.next_attempt_time <= now
+            ):
+                self.__start_attempt(race)
+
+    def __get_next_attempt_timeout(self):
+        attempt_time_list = [
+            race.next_attempt_time
+            for race in self._race_list
+            if race.winning_dest is None and race.pending_dest_list
+        ]
+        if not attempt_time_list:
+            return None
+        return max(0, min(attempt_time_list) - time.monotonic())
+
+    def __process_response(self, response):
+        """
+        Process a finished connection attempt, return a response of the
+        request if the request has been finished
+
+        Response response -- response of a connection attempt
+        """
+        handle = response.handle
+        race = handle.connection_race
+        if handle not in race.handle_list:
+            # the attempt has been already cancelled
+            return None
+        race.handle_list.remove(handle)
+        self._multi_handle.remove_handle(handle)
+        if race.winning_dest is None and response.was_connected:
+            # the request has been finished, so it has been connected
+            race.winning_dest = handle.dest
+
+        if race.winning_dest == handle.dest:
+            return self.__finish_race(race, response)
+        if race.winning_dest is not None:
+            # the attempt has been aborted before sending the request, because
+            # another attempt has connected first
+            return None
+
+        self._logger.log_response(response)
+        if race.pending_dest_list:
+            self.__start_attempt(race, failed_response=response)
+            return None
+        if race.handle_list:
+            # wait for the attempts still in progress
+            return None
+        self._race_list.remove(race)
+        race.request.use_dest(handle.dest)
+        self._logger.log_no_more_addresses(response)
+        return response
+
+    def __finish_race(self, race, response):
+        # the request has been sent through the winning connection, cancel
+        # the other attempts
+        for handle in race.handle_list:
+            self._multi_handle.remove_handle(handle)
+        race.handle_list = []
+        self._race_list.remove(race)
+        race.request.use_dest(response.handle.dest)
+        if response.was_connected:
+            _preferred_dest_dict[race.request.host_label] = response.handle.dest
+        self._logger.log_response(response)
+        return response
+
+
+def _get_prereq_callback(race, dest):
+    # Called by curl when a connection has been established, before sending
+    # a request. Only the first connected attempt is allowed to send the
+    # request, so that the request is not run more than once.
+    def __prereq_callback(*_):
+        if race.winning_dest is None:
+            race.winning_dest = dest
+        if race.winning_dest == dest:
+            return pycurl.PREREQFUNC_OK
+        return pycurl.PREREQFUNC_ABORT
+
+    return __prereq_callback
+
 
 class CommunicatorLoggerInterface:
+    def is_debug_enabled(self):
+        """
+        Tell whether communication debug info is going to be logged
+        """
+        raise NotImplementedError()
+
     def log_request_start(self, request):
         raise NotImplementedError()
 
@@ -475,13 +767,14 @@ def _get_auth_cookies(user, group_list):
     return cookies
 
 
-def _create_request_handle(request, cookies, timeout):
+def _create_request_handle(request, cookies, timeout, debug=False):
     """
     Returns Curl object (easy handle) which is set up witc specified parameters.
 
     Request request -- request specification
     dict cookies -- cookies to add to request
     int timeout -- request timeout
+    bool debug -- if True, trace the communication into the debug buffer
     """
     # it is not possible to take this callback out of this function, because of
     # curl API
@@ -504,12 +797,14 @@ def _create_request_handle(request, cookies, timeout):
     debug_output = io.BytesIO()
     cookies.update(request.cookies)
     handle = pycurl.Curl()
+    handle.setopt(pycurl.SHARE, get_curl_share())
     handle.setopt(pycurl.PROTOCOLS, pycurl.PROTO_HTTPS)
     handle.setopt(pycurl.TIMEOUT, timeout)
     handle.setopt(pycurl.URL, request.url.encode("utf-8"))
     handle.setopt(pycurl.WRITEFUNCTION, output.write)
-    handle.setopt(pycurl.VERBOSE, 1)
-    handle.setopt(pycurl.DEBUGFUNCTION, __debug_callback)
+    if debug:
+        handle.setopt(pycurl.VERBOSE, 1)
+        handle.setopt(pycurl.DEBUGFUNCTION, __debug_callback)
     handle.setopt(pycurl.SSL_VERIFYHOST, 0)
     handle.setopt(pycurl.SSL_VERIFYPEER, 0)
     handle.setopt(pycurl.NOSIGNAL, 1)  # required for multi-threading
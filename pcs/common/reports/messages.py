@@ -5182,12 +5182,28 @@ class ClusterStartStarted(ReportItemMessage):
 
 @dataclass(frozen=True)
 class ClusterStartSuccess(ReportItemMessage):
+    """
+    Cluster has fully started on a node
+
+    node -- node name
+    startup_seconds -- time it took the node to start, if measured
+    """
+
     node: str
+    startup_seconds: Optional[int] = None
     _code = codes.CLUSTER_START_SUCCESS
 
     @property
     def message(self) -> str:
-        return f"{self.node}: Cluster started"
+        startup_time = (
+            ""
+            if self.startup_seconds is None
+            else (
+                f" in {self.startup_seconds} "
+                f"{format_plural(self.startup_seconds, 'second')}"
+            )
+        )
+        return f"{self.node}: Cluster started{startup_time}"
 
 
 @dataclass(frozen=True)
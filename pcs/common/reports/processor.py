@@ -1,4 +1,5 @@
 import abc
+import threading
 
 from .item import (
     ReportItem,
@@ -10,17 +11,30 @@ from .item import (
 class ReportProcessor(abc.ABC):
     def __init__(self) -> None:
         self._has_errors = False
+        # reports may come from several threads, e.g. from commands run
+        # concurrently
+        self._report_lock = threading.RLock()
 
     @property
     def has_errors(self) -> bool:
         return self._has_errors
 
     def report(self, report_item: ReportItem) -> "ReportProcessor":
-        if _is_error(report_item):
-            self._has_errors = True
-        self._do_report(report_item)
+        with self._report_lock:
+            if _is_error(report_item):
+                self._has_errors = True
+            self._do_report(report_item)
         return self
 
+    def is_debug_enabled(self) -> bool:
+        """
+        Tell whether debug reports are processed or dropped
+
+        Gathering data for debug reports may be expensive. Code creating them
+        may skip it, if the reports are going to be dropped anyway.
+        """
+        return True
+
     def report_list(self, report_list: ReportItemList) -> "ReportProcessor":
         for report_item in report_list:
             self.report(report_item)
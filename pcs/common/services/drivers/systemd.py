@@ -1,17 +1,37 @@
 import os.path
 import re
 from typing import (
+    Dict,
     List,
     Optional,
 )
 
-from pcs.common.types import StringIterable
+from pcs.common.types import (
+    StringIterable,
+    StringSequence,
+)
 
 from .. import errors
 from ..interfaces import (
     ExecutorInterface,
     ServiceManagerInterface,
 )
+from ..types import ServiceStatus
+
+# states for which 'systemctl is-enabled' returns 0
+_ENABLED_UNIT_FILE_STATES = frozenset(
+    (
+        "alias",
+        "enabled",
+        "enabled-runtime",
+        "generated",
+        "indirect",
+        "static",
+        "transient",
+    )
+)
+# states for which 'systemctl is-active' returns 0
+_ACTIVE_STATES = frozenset(("active", "reloading"))
 
 
 class SystemdDriver(ServiceManagerInterface):
@@ -109,6 +129,46 @@ class SystemdDriver(ServiceManagerInterface):
         )
         return result.retval == 0
 
+    def get_services_status(
+        self, service_list: StringSequence
+    ) -> Dict[str, ServiceStatus]:
+        if not service_list:
+            return {}
+        result = self._executor.run(
+            [
+                self._systemctl_bin,
+                "show",
+                "--property=UnitFileState,ActiveState",
+            ]
+            + [_format_service_name(service, None) for service in service_list]
+        )
+        if result.retval == 0:
+            # systemctl prints properties of each unit in the order in which
+            # the units were specified, units are separated by an empty line
+            unit_properties_list = _parse_show_output(result.stdout)
+            if len(unit_properties_list) == len(service_list):
+                return {
+                    service: ServiceStatus(
+                        enabled=(
+                            properties.get("UnitFileState")
+                            in _ENABLED_UNIT_FILE_STATES
+                        ),
+                        running=(
+                            properties.get("ActiveState") in _ACTIVE_STATES
+                        ),
+                    )
+                    for service, properties in zip(
+                        service_list, unit_properties_list
+                    )
+                }
+        return {
+            service: ServiceStatus(
+                enabled=self.is_enabled(service),
+                running=self.is_running(service),
+            )
+            for service in service_list
+        }
+
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
@@ -137,6 +197,19 @@ class SystemdDriver(ServiceManagerInterface):
         ) and os.path.isfile(self._systemctl_bin)
 
 
+def _parse_show_output(output: str) -> List[Dict[str, str]]:
+    unit_properties_list = []
+    for unit_output in re.split(r"\n\s*\n", output.strip()):
+        if not unit_output:
+            continue
+        properties = {}
+        for line in unit_output.splitlines():
+            name, _, value = line.partition("=")
+            properties[name.strip()] = value.strip()
+        unit_properties_list.append(properties)
+    return unit_properties_list
+
+
 def _format_service_name(service: str, instance: Optional[str]) -> str:
     instance_str = f"@{instance}" if instance else ""
     return f"{service}{instance_str}.service"
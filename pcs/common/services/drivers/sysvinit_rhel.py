@@ -1,14 +1,18 @@
 import os.path
 from typing import (
+    Dict,
     List,
     Optional,
 )
 
+from pcs.common.types import StringSequence
+
 from .. import errors
 from ..interfaces import (
     ExecutorInterface,
     ServiceManagerInterface,
 )
+from ..types import ServiceStatus
 
 
 class SysVInitRhelDriver(ServiceManagerInterface):
@@ -59,6 +63,17 @@ class SysVInitRhelDriver(ServiceManagerInterface):
             == 0
         )
 
+    def get_services_status(
+        self, service_list: StringSequence
+    ) -> Dict[str, ServiceStatus]:
+        return {
+            service: ServiceStatus(
+                enabled=self.is_enabled(service),
+                running=self.is_running(service),
+            )
+            for service in service_list
+        }
+
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
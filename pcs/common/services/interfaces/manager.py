@@ -1,8 +1,13 @@
 from typing import (
+    Dict,
     List,
     Optional,
 )
 
+from pcs.common.types import StringSequence
+
+from ..types import ServiceStatus
+
 
 class ServiceManagerInterface:
     def start(self, service: str, instance: Optional[str] = None) -> None:
@@ -65,6 +70,19 @@ class ServiceManagerInterface:
         """
         raise NotImplementedError()
 
+    def get_services_status(
+        self, service_list: StringSequence
+    ) -> Dict[str, ServiceStatus]:
+        """
+        service_list -- names of services to be checked
+
+        Returns enabled and running status of each specified service. Prefer
+        this to calling is_enabled and is_running for each service when more
+        services are to be checked, as the init system may be able to provide
+        status of all of them at once.
+        """
+        raise NotImplementedError()
+
     def is_installed(self, service: str) -> bool:
         """
         service -- name of service to be checked
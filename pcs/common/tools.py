@@ -2,6 +2,7 @@ import threading
 import uuid
 from collections import namedtuple
 from typing import (
+    Container,
     MutableSet,
     Optional,
     TypeVar,
@@ -11,8 +12,6 @@ from typing import (
 from lxml import etree
 from lxml.etree import _Element
 
-from pcs.common.types import StringCollection
-
 T = TypeVar("T", bound=type)
 
 
@@ -23,7 +22,7 @@ def get_all_subclasses(cls: T) -> MutableSet[T]:
     )
 
 
-def get_unique_uuid(already_used: StringCollection) -> str:
+def get_unique_uuid(already_used: Container[str]) -> str:
     is_duplicate = True
     while is_duplicate:
         candidate = str(uuid.uuid4())
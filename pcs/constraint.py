@@ -1,7 +1,6 @@
 import sys
 import xml.dom.minidom
 from collections import defaultdict
-from enum import Enum
 from os.path import isfile
 from xml.dom.minidom import parseString
 
@@ -31,7 +30,14 @@ from pcs.common.reports import ReportItem
 from pcs.common.reports.constraints import colocation as colocation_format
 from pcs.common.reports.constraints import order as order_format
 from pcs.common.str_tools import format_list
+from pcs.common.tools import xml_fromstring
+from pcs.common.types import CibRuleInEffectStatus
 from pcs.lib.cib.constraint.order import ATTRIB as order_attrib
+from pcs.lib.cib.references import (
+    CONSTRAINT_REFERENCE_ATTRIBUTES,
+    ReferenceIndex,
+)
+from pcs.lib.cib.rule import RuleInEffectEvalAllAtOnce
 from pcs.lib.node import get_existing_nodes_names
 from pcs.lib.pacemaker.values import (
     SCORE_INFINITY,
@@ -64,12 +70,6 @@ RULE_NOT_IN_EFFECT = "not yet in effect"
 RULE_UNKNOWN_STATUS = "unknown status"
 
 
-class CrmRuleReturnCode(Enum):
-    IN_EFFECT = 0
-    EXPIRED = 110
-    TO_BE_IN_EFFECT = 111
-
-
 def constraint_location_cmd(lib, argv, modifiers):
     if not argv:
         sub_cmd = "config"
@@ -348,6 +348,27 @@ def colocation_add(lib, argv, modifiers):
     utils.replace_cib_configuration(dom)
 
 
+def _find_duplicates_by_signature(
+    constraint_el_list, constraint_el, get_signature
+):
+    """
+    Return constraints with the same signature as the specified constraint
+
+    Each constraint is normalized once to its signature and the constraints
+    are grouped by the signatures, so that constraints do not have to be
+    compared to each other.
+
+    list constraint_el_list -- minidom constraints to look for duplicates in
+    constraint_el -- minidom constraint to find duplicates of
+    callable get_signature -- returns a hashable signature of a constraint
+    """
+    signature_map = defaultdict(list)
+    for other_el in constraint_el_list:
+        if other_el is not constraint_el:
+            signature_map[get_signature(other_el)].append(other_el)
+    return signature_map.get(get_signature(constraint_el), [])
+
+
 def colocation_find_duplicates(dom, constraint_el):
     """
     Commandline options: no options
@@ -371,14 +392,15 @@ def colocation_find_duplicates(dom, constraint_el):
             ),
         )
 
-    normalized_el = normalize(constraint_el)
-    return [
-        other_el
-        for other_el in dom.getElementsByTagName("rsc_colocation")
-        if not other_el.getElementsByTagName("resource_set")
-        and constraint_el is not other_el
-        and normalized_el == normalize(other_el)
-    ]
+    return _find_duplicates_by_signature(
+        [
+            other_el
+            for other_el in dom.getElementsByTagName("rsc_colocation")
+            if not other_el.getElementsByTagName("resource_set")
+        ],
+        constraint_el,
+        normalize,
+    )
 
 
 def order_rm(lib, argv, modifiers):
@@ -592,14 +614,15 @@ def order_find_duplicates(dom, constraint_el):
             constraint_el.getAttribute("then-action").lower() or DEFAULT_ACTION,
         )
 
-    normalized_el = normalize(constraint_el)
-    return [
-        other_el
-        for other_el in dom.getElementsByTagName("rsc_order")
-        if not other_el.getElementsByTagName("resource_set")
-        and constraint_el is not other_el
-        and normalized_el == normalize(other_el)
-    ]
+    return _find_duplicates_by_signature(
+        [
+            other_el
+            for other_el in dom.getElementsByTagName("rsc_order")
+            if not other_el.getElementsByTagName("resource_set")
+        ],
+        constraint_el,
+        normalize,
+    )
 
 
 def location_show(lib, argv, modifiers):
@@ -674,12 +697,16 @@ def location_lines(
     all_loc_constraints = constraintsElement.getElementsByTagName(
         "rsc_location"
     )
-    cib = utils.get_cib()
+    rule_evaluator = None
 
     if not isfile(settings.crm_rule):
         if verify_expiration:
             warn(CRM_RULE_MISSING_MSG)
         verify_expiration = False
+    if verify_expiration:
+        rule_evaluator = RuleInEffectEvalAllAtOnce(
+            xml_fromstring(utils.get_cib()), utils.cmd_runner()
+        )
 
     all_lines.append("Location Constraints:")
     for rsc_loc in all_loc_constraints:
@@ -775,7 +802,7 @@ def location_lines(
             )
         all_lines += _show_location_rules(
             ruleshash,
-            cib,
+            rule_evaluator,
             show_detail=showDetail,
             show_expired=show_expired,
             verify_expiration=verify_expiration,
@@ -798,7 +825,7 @@ def location_lines(
             miniruleshash[rsc] = ruleshash[rsc]
             rsc_lines += _show_location_rules(
                 miniruleshash,
-                cib,
+                rule_evaluator,
                 show_detail=showDetail,
                 show_expired=show_expired,
                 verify_expiration=verify_expiration,
@@ -849,7 +876,7 @@ def _hashtable_to_lines(hash_label, hash_type, hash_key, show_detail):
 
 def _show_location_rules(
     ruleshash,
-    cib,
+    rule_evaluator,
     show_detail,
     show_expired=False,
     verify_expiration=True,
@@ -902,7 +929,9 @@ def _show_location_rules(
             for rule in constrainthash[constraint_id]:
                 rule_status = RULE_UNKNOWN_STATUS
                 if verify_expiration:
-                    rule_status = _get_rule_status(rule.getAttribute("id"), cib)
+                    rule_status = _get_rule_status(
+                        rule.getAttribute("id"), rule_evaluator
+                    )
                     if rule_status != RULE_EXPIRED:
                         is_constraint_expired = False
 
@@ -948,17 +977,15 @@ def _verify_score(score):
         )
 
 
-def _get_rule_status(rule_id, cib):
-    _, _, retval = utils.cmd_runner().run(
-        [settings.crm_rule, "--check", "--rule", rule_id, "--xml-text", "-"],
-        cib,
-    )
+def _get_rule_status(rule_id, rule_evaluator):
     translation_map = {
-        CrmRuleReturnCode.IN_EFFECT.value: RULE_IN_EFFECT,
-        CrmRuleReturnCode.EXPIRED.value: RULE_EXPIRED,
-        CrmRuleReturnCode.TO_BE_IN_EFFECT.value: RULE_NOT_IN_EFFECT,
+        CibRuleInEffectStatus.IN_EFFECT: RULE_IN_EFFECT,
+        CibRuleInEffectStatus.EXPIRED: RULE_EXPIRED,
+        CibRuleInEffectStatus.NOT_YET_IN_EFFECT: RULE_NOT_IN_EFFECT,
     }
-    return translation_map.get(retval, RULE_UNKNOWN_STATUS)
+    return translation_map.get(
+        rule_evaluator.get_rule_status(rule_id), RULE_UNKNOWN_STATUS
+    )
 
 
 def location_prefer(lib, argv, modifiers):
@@ -1293,30 +1320,36 @@ def location_rule_find_duplicates(dom, constraint_el):
     Commandline options: no options
     """
 
-    def normalize(constraint_el):
+    def normalize_resource(constraint_el):
         if constraint_el.hasAttribute("rsc-pattern"):
-            rsc = (
+            return (
                 RESOURCE_TYPE_REGEXP,
                 constraint_el.getAttribute("rsc-pattern"),
             )
-        else:
-            rsc = (RESOURCE_TYPE_RESOURCE, constraint_el.getAttribute("rsc"))
-        return (
-            rsc,
-            [
-                rule_utils.ExportAsExpression().get_string(rule_el, True)
-                for rule_el in constraint_el.getElementsByTagName("rule")
-            ],
+        return (RESOURCE_TYPE_RESOURCE, constraint_el.getAttribute("rsc"))
+
+    def normalize_rules(constraint_el):
+        return tuple(
+            rule_utils.ExportAsExpression().get_string(rule_el, True)
+            for rule_el in constraint_el.getElementsByTagName("rule")
         )
 
-    normalized_el = normalize(constraint_el)
-    return [
-        other_el
-        for other_el in dom.getElementsByTagName("rsc_location")
-        if other_el.getElementsByTagName("rule")
-        and constraint_el is not other_el
-        and normalized_el == normalize(other_el)
-    ]
+    # Exporting rules is expensive, so only rules of constraints of the same
+    # resource are exported and compared.
+    candidate_list = _find_duplicates_by_signature(
+        [
+            other_el
+            for other_el in dom.getElementsByTagName("rsc_location")
+            if other_el.getElementsByTagName("rule")
+        ],
+        constraint_el,
+        normalize_resource,
+    )
+    if not candidate_list:
+        return []
+    return _find_duplicates_by_signature(
+        candidate_list, constraint_el, normalize_rules
+    )
 
 
 # Grabs the current constraints and returns the dom and constraint element
@@ -1419,9 +1452,13 @@ def constraint_ref(lib, argv, modifiers):
     if not argv:
         raise CmdLineInputError()
 
+    cib = utils.get_cib_lxml_readonly()
+    reference_index = ReferenceIndex(cib)
     for arg in argv:
         print("Resource: %s" % arg)
-        constraints, set_constraints = find_constraints_containing(arg)
+        constraints, set_constraints = find_constraints_containing(
+            arg, cib, reference_index=reference_index
+        )
         if not constraints and not set_constraints:
             print("  No Matches.")
         else:
@@ -1431,116 +1468,196 @@ def constraint_ref(lib, argv, modifiers):
                 print("  " + constraint)
 
 
+def _is_in_document(element):
+    while element.parentNode is not None:
+        element = element.parentNode
+    return element.nodeType == xml.dom.Node.DOCUMENT_NODE
+
+
+class DomReferenceIndex:
+    """
+    Index of constraints and tags referencing resources in a CIB dom
+
+    The index is built by a single pass over the CIB, so that references of
+    many resources can be found without searching the whole CIB for each of
+    them. Elements removed from the CIB after the index has been built are
+    not returned.
+    """
+
+    def __init__(self, dom):
+        self._constraints = defaultdict(list)
+        self._resource_refs = defaultdict(list)
+        self._obj_refs = defaultdict(list)
+        self._primitive_parents = {}
+        for element in dom.getElementsByTagName("*"):
+            tag = element.tagName
+            if tag in CONSTRAINT_REFERENCE_ATTRIBUTES:
+                for ref_id in dict.fromkeys(
+                    element.getAttribute(attr)
+                    for attr in CONSTRAINT_REFERENCE_ATTRIBUTES[tag]
+                ):
+                    if ref_id:
+                        self._constraints[ref_id].append(element)
+            elif tag == "resource_ref":
+                self._resource_refs[element.getAttribute("id")].append(element)
+            elif tag == "obj_ref":
+                self._obj_refs[element.getAttribute("id")].append(element)
+            elif tag == "primitive":
+                self._primitive_parents.setdefault(
+                    element.getAttribute("id"), element.parentNode
+                )
+
+    def get_constraints(self, resource_id):
+        """
+        Return constraints without resource sets referencing a resource
+
+        Constraints are ordered by their type: colocation, location, order
+        and ticket constraints.
+        """
+        tag_order = list(CONSTRAINT_REFERENCE_ATTRIBUTES)
+        return sorted(
+            [
+                element
+                for element in self._constraints.get(resource_id, [])
+                if _is_in_document(element)
+            ],
+            key=lambda element: tag_order.index(element.tagName),
+        )
+
+    def get_resource_refs(self, resource_id):
+        """
+        Return resource_ref elements in resource sets referencing a resource
+        """
+        return [
+            element
+            for element in self._resource_refs.get(resource_id, [])
+            if _is_in_document(element)
+        ]
+
+    def get_obj_refs(self, resource_id):
+        """
+        Return obj_ref elements in tags referencing a resource
+        """
+        return [
+            element
+            for element in self._obj_refs.get(resource_id, [])
+            if _is_in_document(element)
+        ]
+
+    def get_clone_id(self, resource_id):
+        """
+        Return id of a clone or a master, if the resource is its primitive
+        """
+        parent = self._primitive_parents.get(resource_id)
+        if parent is not None and parent.tagName in ("master", "clone"):
+            return parent.getAttribute("id")
+        return None
+
+
 def remove_constraints_containing(
-    resource_id, output=False, constraints_element=None, passed_dom=None
+    resource_id, output=False, passed_dom=None, reference_index=None
 ):
     """
     Commandline options:
       * -f - CIB file, effective only if passed_dom is None
     """
-    lib = utils.get_library_wrapper()
-    modifiers = utils.get_input_modifiers()
-    constraints, set_constraints = find_constraints_containing(
-        resource_id, passed_dom
+    dom = passed_dom if passed_dom else utils.get_cib_dom()
+    if reference_index is None:
+        reference_index = DomReferenceIndex(dom)
+    constraint_list, set_constraint_list = _find_constraints_containing(
+        resource_id, reference_index
     )
-    for c in constraints:
+    for constraint_el in constraint_list:
         if output:
-            print_to_stderr(f"Removing Constraint - {c}")
-        if constraints_element is not None:
-            constraint_rm(
-                lib,
-                [c],
-                modifiers,
-                True,
-                constraints_element,
-                passed_dom=passed_dom,
+            print_to_stderr(
+                f"Removing Constraint - {constraint_el.getAttribute('id')}"
             )
-        else:
-            constraint_rm(lib, [c], modifiers, passed_dom=passed_dom)
+        constraint_el.parentNode.removeChild(constraint_el)
 
-    if set_constraints:
-        (dom, constraintsElement) = getCurrentConstraints(passed_dom)
-        for c in constraintsElement.getElementsByTagName("resource_ref")[:]:
+    if set_constraint_list:
+        for c in reference_index.get_resource_refs(resource_id):
             # If resource id is in a set, remove it from the set, if the set
             # is empty, then we remove the set, if the parent of the set
             # is empty then we remove it
-            if c.getAttribute("id") == resource_id:
-                pn = c.parentNode
-                pn.removeChild(c)
-                if output:
-                    print_to_stderr(
-                        "Removing {} from set {}".format(
-                            resource_id, pn.getAttribute("id")
-                        )
+            pn = c.parentNode
+            pn.removeChild(c)
+            if output:
+                print_to_stderr(
+                    "Removing {} from set {}".format(
+                        resource_id, pn.getAttribute("id")
                     )
-                if pn.getElementsByTagName("resource_ref").length == 0:
+                )
+            if pn.getElementsByTagName("resource_ref").length == 0:
+                print_to_stderr("Removing set {}".format(pn.getAttribute("id")))
+                pn2 = pn.parentNode
+                pn2.removeChild(pn)
+                if pn2.getElementsByTagName("resource_set").length == 0:
+                    pn2.parentNode.removeChild(pn2)
                     print_to_stderr(
-                        "Removing set {}".format(pn.getAttribute("id"))
+                        "Removing constraint {}".format(pn2.getAttribute("id"))
                     )
-                    pn2 = pn.parentNode
-                    pn2.removeChild(pn)
-                    if pn2.getElementsByTagName("resource_set").length == 0:
-                        pn2.parentNode.removeChild(pn2)
-                        print_to_stderr(
-                            "Removing constraint {}".format(
-                                pn2.getAttribute("id")
-                            )
-                        )
-        if passed_dom:
-            return dom
+    if passed_dom:
+        return dom
+    if constraint_list or set_constraint_list:
         utils.replace_cib_configuration(dom)
     return None
 
 
-def find_constraints_containing(resource_id, passed_dom=None):
+def find_constraints_containing(resource_id, cib, reference_index=None):
     """
-    Commandline options:
-      * -f - CIB file, effective only if passed_dom is None
-    """
-    if passed_dom:
-        dom = passed_dom
-    else:
-        dom = utils.get_cib_dom()
-    constraints_found = []
-    set_constraints = []
-
-    resources = dom.getElementsByTagName("primitive")
-    resource_match = None
-    for res in resources:
-        if res.getAttribute("id") == resource_id:
-            resource_match = res
-            break
+    Return ids of constraints without and with resource sets referencing a
+    resource or its clone
 
-    if resource_match:
-        if resource_match.parentNode.tagName in ("master", "clone"):
-            constraints_found, set_constraints = find_constraints_containing(
-                resource_match.parentNode.getAttribute("id"), dom
-            )
+    Commandline options: no options
 
-    constraints = dom.getElementsByTagName("constraints")
-    if not constraints:
-        return [], []
-
-    constraints = constraints[0]
-    myConstraints = constraints.getElementsByTagName("rsc_colocation")
-    myConstraints += constraints.getElementsByTagName("rsc_location")
-    myConstraints += constraints.getElementsByTagName("rsc_order")
-    myConstraints += constraints.getElementsByTagName("rsc_ticket")
-    attr_to_match = ["rsc", "first", "then", "with-rsc", "first", "then"]
-    for c in myConstraints:
-        for attr in attr_to_match:
-            if c.getAttribute(attr) == resource_id:
-                constraints_found.append(c.getAttribute("id"))
-                break
+    str resource_id -- id of the resource
+    etree cib -- lxml tree of the CIB, it is not modified
+    ReferenceIndex reference_index -- index of the cib, created if not given
+    """
+    if reference_index is None:
+        reference_index = ReferenceIndex(cib)
+    id_list = [resource_id]
+    clone_list = cib.xpath(
+        "./configuration/resources/*[self::clone or self::master]"
+        "[./primitive[@id=$id]]",
+        id=resource_id,
+    )
+    if clone_list:
+        id_list.insert(0, str(clone_list[0].get("id", "")))
+    tag_order = list(CONSTRAINT_REFERENCE_ATTRIBUTES)
+    constraint_id_list = []
+    set_constraint_id_set = set()
+    for ref_id in id_list:
+        constraint_id_list.extend(
+            str(constraint_el.get("id", ""))
+            for constraint_el in sorted(
+                reference_index.get_plain_constraints(ref_id),
+                key=lambda element: tag_order.index(element.tag),
+            )
+        )
+        set_constraint_id_set.update(
+            str(constraint_el.get("id", ""))
+            for constraint_el in reference_index.get_set_constraints(ref_id)
+        )
+    return constraint_id_list, list(set_constraint_id_set)
 
-    setConstraints = constraints.getElementsByTagName("resource_ref")
-    for c in setConstraints:
-        if c.getAttribute("id") == resource_id:
-            set_constraints.append(c.parentNode.parentNode.getAttribute("id"))
 
-    # Remove duplicates
-    set_constraints = list(set(set_constraints))
-    return constraints_found, set_constraints
+def _find_constraints_containing(resource_id, reference_index):
+    constraint_list = []
+    set_constraint_list = []
+    clone_id = reference_index.get_clone_id(resource_id)
+    if clone_id:
+        constraint_list, set_constraint_list = _find_constraints_containing(
+            clone_id, reference_index
+        )
+    constraint_list = constraint_list + reference_index.get_constraints(
+        resource_id
+    )
+    set_constraint_list = set_constraint_list + [
+        resource_ref.parentNode.parentNode
+        for resource_ref in reference_index.get_resource_refs(resource_id)
+    ]
+    return constraint_list, set_constraint_list
 
 
 def remove_constraints_containing_node(dom, node, output=False):
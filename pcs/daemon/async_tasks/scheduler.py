@@ -1,15 +1,21 @@
 import multiprocessing as mp
+import os
+import queue
 import sys
-from collections import defaultdict
 from dataclasses import dataclass
-from logging import handlers
+from logging import LogRecord
 from multiprocessing.pool import worker as mp_worker_init  # type: ignore
-from queue import Empty
+from multiprocessing.queues import SimpleQueue
+from threading import Thread
 from typing import (
     Dict,
+    Iterable,
     List,
+    Optional,
 )
 
+from tornado.ioloop import IOLoop
+
 from pcs import settings
 from pcs.common.async_tasks.dto import TaskResultDto
 from pcs.common.async_tasks.types import TaskKillReason
@@ -28,6 +34,7 @@ from .worker.executor import (
     task_executor,
     worker_init,
 )
+from .worker.logging import QueueListener
 from .worker.types import Message
 
 
@@ -52,6 +59,17 @@ class SchedulerConfig:
     task_config: TaskConfig = TaskConfig()
 
 
+_MAX_RECEIVED_MESSAGES_PER_RUN = 1000
+
+# Tasks in the QUEUED state wait for a worker to pick them up, there is
+# nothing to be done with them by the scheduler
+_PROCESSED_TASK_STATES = (
+    TaskState.CREATED,
+    TaskState.EXECUTED,
+    TaskState.FINISHED,
+)
+
+
 class Scheduler:
     # pylint: disable=too-many-instance-attributes
     """
@@ -66,10 +84,24 @@ class Scheduler:
         """
         # pylint: disable=consider-using-with
         self._config = config
-        self._proc_pool_manager = mp.Manager()
-        self._worker_message_q = self._proc_pool_manager.Queue()
+        # Writing to the pipe allows the IOLoop to run the scheduler as soon
+        # as there is something to do instead of polling the message queue.
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        os.set_blocking(self._wakeup_write_fd, False)
+        # Workers are forked from the scheduler process and inherit pipes of
+        # the queues. Messages and log records are sent directly to the
+        # scheduler without any intermediate process.
+        self._worker_message_q: SimpleQueue[
+            Optional[Message]
+        ] = mp.SimpleQueue()
+        # Messages read from the workers' pipe, ready to be processed
+        self._received_message_q: queue.SimpleQueue[
+            Message
+        ] = queue.SimpleQueue()
+        self._message_reader = self._init_message_reader()
         self._logger = pcsd_logger
-        self._logging_q = self._proc_pool_manager.Queue()
+        self._logging_q: SimpleQueue[LogRecord] = mp.SimpleQueue()
         self._worker_log_listener = self._init_worker_logging()
         self._single_use_process_pool: List[mp.Process] = []
         self._proc_pool = mp.Pool(
@@ -79,20 +111,46 @@ class Scheduler:
             initargs=[self._worker_message_q, self._logging_q],
         )
         self._task_register: Dict[str, Task] = {}
+        # The same tasks as in the task register indexed by their state, so
+        # that the scheduler doesn't have to go through all the tasks
+        self._task_index: Dict[TaskState, Dict[str, Task]] = {
+            state: {} for state in TaskState
+        }
         self._logger.info("Scheduler was successfully initialized.")
         self._logger.debug(
             "Scheduler initialized with config: %s", self._config
         )
 
-    def _init_worker_logging(self) -> handlers.QueueListener:
-        q_listener = handlers.QueueListener(
-            self._logging_q,
+    def _init_worker_logging(self) -> QueueListener:
+        q_listener = QueueListener(
+            self._logging_q,  # type: ignore
             *self._logger.handlers,
             respect_handler_level=True,
         )
         q_listener.start()
         return q_listener
 
+    def _init_message_reader(self) -> Thread:
+        reader = Thread(
+            target=self._read_messages, name="pcsd worker messages", daemon=True
+        )
+        reader.start()
+        return reader
+
+    def _read_messages(self) -> None:
+        """
+        Pass messages from the workers to the scheduler, runs in a thread
+
+        Reading a message blocks until a worker has written all of it, which
+        must not block the IOLoop.
+        """
+        while True:
+            message = self._worker_message_q.get()
+            if message is None:
+                break
+            self._received_message_q.put(message)
+            self._wake_up()
+
     def get_task(self, task_ident: str, auth_user: AuthUser) -> TaskResultDto:
         """
         Fetches all information about task for the client
@@ -129,6 +187,7 @@ class Scheduler:
 
         self._logger.debug("User is killing a task %s.", task_ident)
         task.request_kill(TaskKillReason.USER)
+        self._wake_up()
 
     def new_task(self, command: Command, auth_user: AuthUser) -> str:
         """
@@ -136,11 +195,11 @@ class Scheduler:
         :param command: Command and its parameters
         :return: Task identifier
         """
-        task_ident = get_unique_uuid(tuple(self._task_register.keys()))
+        task_ident = get_unique_uuid(self._task_register)
 
-        self._task_register[task_ident] = Task(
-            task_ident, command, auth_user, self._config.task_config
-        )
+        task = Task(task_ident, command, auth_user, self._config.task_config)
+        self._task_register[task_ident] = task
+        self._task_index[task.state][task_ident] = task
         self._logger.debug(
             "New task %s created (command: %s, parameters: %s, api_v1_compatibility_mode: %s)",
             task_ident,
@@ -148,20 +207,53 @@ class Scheduler:
             command.command_dto.params,
             command.api_v1_compatible,
         )
+        self._wake_up()
         return task_ident
 
-    def _is_possibly_dead_locked(self) -> bool:
-        counter: Dict[TaskState, List[Task]] = defaultdict(list)
-        for task in self._task_register.values():
-            counter[task.state].append(task)
+    @property
+    def wakeup_fd(self) -> int:
+        """
+        File descriptor which becomes readable when the scheduler has new
+        messages or tasks to process
+        """
+        return self._wakeup_read_fd
+
+    def _wake_up(self) -> None:
+        try:
+            os.write(self._wakeup_write_fd, b"\0")
+        except BlockingIOError:
+            # The pipe is full, so the scheduler is going to be woken up anyway
+            pass
 
+    def _update_task_index(self, task: Task, previous_state: TaskState) -> None:
+        if task.state == previous_state:
+            return
+        del self._task_index[previous_state][task.task_ident]
+        self._task_index[task.state][task.task_ident] = task
+        if task.state == TaskState.EXECUTED:
+            self._logger.debug(
+                "Task %s waited %.3f seconds to be executed.",
+                task.task_ident,
+                task.get_time_since_created().total_seconds(),
+            )
+        elif task.state == TaskState.FINISHED:
+            self._logger.debug(
+                "Task %s finished %.3f seconds after it was created.",
+                task.task_ident,
+                task.get_time_since_created().total_seconds(),
+            )
+
+    def _is_possibly_dead_locked(self) -> bool:
+        executed_tasks = self._task_index[TaskState.EXECUTED].values()
         return (
-            len(counter[TaskState.CREATED]) + len(counter[TaskState.QUEUED]) > 0
+            len(self._task_index[TaskState.CREATED])
+            + len(self._task_index[TaskState.QUEUED])
+            > 0
             and (self._config.worker_count + len(self._single_use_process_pool))
-            <= len(counter[TaskState.EXECUTED])
+            <= len(executed_tasks)
             and all(
                 task.is_defunct(self._config.deadlock_threshold_timeout)
-                for task in counter[TaskState.EXECUTED]
+                for task in executed_tasks
             )
         )
 
@@ -184,11 +276,25 @@ class Scheduler:
             sys.exit(1)
         task.state = TaskState.QUEUED
 
-    async def _process_tasks(self) -> None:
-        for task in list(self._task_register.values()):
+    async def _process_tasks(
+        self, state_list: Iterable[TaskState] = _PROCESSED_TASK_STATES
+    ) -> None:
+        """
+        Process tasks in the specified states
+
+        state_list -- states of tasks to be processed
+        """
+        # Each task is processed once even if its state changes meanwhile
+        task_list = [
+            task
+            for state in state_list
+            for task in self._task_index[state].values()
+        ]
+        for task in task_list:
             await self._process_task(task)
 
     async def _process_task(self, task: Task) -> None:
+        previous_state = task.state
         if task.state == TaskState.CREATED:
             self._schedule_task(task)
         elif task.is_defunct():
@@ -197,8 +303,10 @@ class Scheduler:
             task.request_deletion()
         if task.state != TaskState.FINISHED and task.is_kill_requested():
             task.kill()
+        self._update_task_index(task, previous_state)
         if task.is_deletion_requested():
             del self._task_register[task.task_ident]
+            del self._task_index[task.state][task.task_ident]
 
     def _spawn_new_single_use_worker(self) -> None:
         # pylint: disable=protected-access
@@ -251,21 +359,43 @@ class Scheduler:
             self._spawn_new_single_use_worker()
         return received_total
 
+    def handle_wakeup(self, fd: int, events: int) -> None:
+        """
+        IOLoop handler of wakeup_fd, processes new messages and tasks
+
+        Only tasks which are waiting to be started or being executed are
+        processed. Timeouts and cleanup of tasks are handled by
+        perform_actions which is meant to be run periodically.
+        """
+        del fd, events
+        # Read all the notifications right away, otherwise the handler would
+        # be called again before the scheduler gets to process them
+        try:
+            while os.read(self._wakeup_read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        IOLoop.current().add_callback(self._process_wakeup)
+
+    async def _process_wakeup(self) -> None:
+        await self._receive_messages()
+        await self._process_tasks((TaskState.CREATED, TaskState.EXECUTED))
+
     async def _receive_messages(self) -> int:
         """
         Processes all incoming messages from workers
         :return: Number of received messages (useful for testing)
         """
-        # Unreliable message count, since this is the only consumer, there
-        # should not be less messages
         received_total = 0
-        for _ in range(self._worker_message_q.qsize()):
-            try:
-                message: Message = self._worker_message_q.get_nowait()
-            except Empty:
-                # This may happen when messages are on the way but not quite
-                # delivered yet. We'll get them later.
-                return received_total
+        while not self._received_message_q.empty():
+            if received_total >= _MAX_RECEIVED_MESSAGES_PER_RUN:
+                # Do not block the IOLoop for too long when workers produce
+                # lots of messages, process the rest in the next run
+                self._wake_up()
+                break
+            # There is only one consumer, so the queue cannot become empty
+            # before a message is read
+            message: Message = self._received_message_q.get_nowait()
             received_total += 1
             if not isinstance(message, Message):
                 self._logger.error(
@@ -283,6 +413,7 @@ class Scheduler:
                     message.task_ident,
                 )
                 continue
+            previous_state = task.state
             try:
                 task.receive_message(message)
             except UnknownMessageError as exc:
@@ -292,6 +423,7 @@ class Scheduler:
                     exc.payload_type,
                 )
                 task.request_kill(TaskKillReason.INTERNAL_MESSAGING_ERROR)
+            self._update_task_index(task, previous_state)
         return received_total
 
     def _return_task(self, task_ident: str) -> Task:
@@ -310,5 +442,9 @@ class Scheduler:
         Cleanly terminates the scheduler
         """
         self._worker_log_listener.stop()
+        self._worker_message_q.put(None)
+        self._message_reader.join()
         self._proc_pool.terminate()
+        os.close(self._wakeup_read_fd)
+        os.close(self._wakeup_write_fd)
         self._logger.info("Scheduler is correctly terminated.")
@@ -77,6 +77,7 @@ class Task(ImplementsToDto):
         self._state: TaskState = TaskState.CREATED
         self._task_finish_type: TaskFinishType = TaskFinishType.UNFINISHED
         self._kill_reason: Optional[TaskKillReason] = None
+        self._created_at = datetime.datetime.now()
         self._last_message_at: Optional[datetime.datetime] = None
         self._execution_started_at: Optional[datetime.datetime] = None
         self._worker_pid: int = -1
@@ -119,6 +120,12 @@ class Task(ImplementsToDto):
     def auth_user(self) -> AuthUser:
         return self._auth_user
 
+    def get_time_since_created(self) -> datetime.timedelta:
+        """
+        Return time elapsed since the task was created
+        """
+        return datetime.datetime.now() - self._created_at
+
     def wait_until_finished(self) -> Awaitable[Any]:
         return self._finished_event.wait()
 
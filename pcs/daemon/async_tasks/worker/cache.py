@@ -0,0 +1,84 @@
+import dataclasses
+import inspect
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pcs.common.file import (
+    FileStamp,
+    get_file_stamp,
+)
+from pcs.common.host import PcsKnownHost
+from pcs.lib.file.instance import FileInstance
+from pcs.utils import read_known_hosts_file_not_cached
+
+# Workers are long-lived processes running many tasks. Data which would be the
+# same for all the tasks are prepared once in each worker and reused.
+
+_known_hosts_cache: Optional[
+    Tuple[FileStamp, Mapping[str, PcsKnownHost]]
+] = None
+
+
+def read_known_hosts_cached() -> Mapping[str, PcsKnownHost]:
+    """
+    Return known hosts, read the known-hosts file only if it has changed
+
+    The returned data are shared between tasks, they must not be modified.
+    """
+    # pylint: disable=global-statement
+    global _known_hosts_cache
+    known_hosts_file = FileInstance.for_known_hosts().raw_file
+    # Get the stamp before reading the file. If the file is changed in
+    # between, it is read again next time.
+    stamp = get_file_stamp(known_hosts_file.metadata.path)
+    if (
+        stamp is not None
+        and _known_hosts_cache is not None
+        and _known_hosts_cache[0] == stamp
+    ):
+        return _known_hosts_cache[1]
+    known_hosts = read_known_hosts_file_not_cached()  # type: ignore
+    _known_hosts_cache = None if stamp is None else (stamp, known_hosts)
+    return known_hosts
+
+
+@lru_cache(maxsize=None)
+def get_params_dataclass(command_name: str, cmd: Callable[..., Any]) -> type:
+    """
+    Return a dataclass describing parameters of a library command
+
+    Dacite validates command parameters against a command signature. It works
+    only with dataclasses, so one is created dynamically from the signature.
+
+    command_name -- name of the command, used as the name of the dataclass
+    cmd -- library command, its first parameter (env) is not included
+    """
+    return dataclasses.make_dataclass(
+        f"{command_name}_params",
+        [
+            _param_to_field_tuple(param)
+            for param in list(inspect.signature(cmd).parameters.values())[1:]
+        ],
+    )
+
+
+def _param_to_field_tuple(
+    param: inspect.Parameter,
+) -> Union[Tuple[str, Any], Tuple[str, Any, dataclasses.Field]]:
+    field_type = Any
+    if param.annotation != inspect.Parameter.empty:
+        field_type = param.annotation
+    if param.default != inspect.Parameter.empty:
+        return (
+            param.name,
+            field_type,
+            dataclasses.field(default=param.default),
+        )
+    return (param.name, field_type)
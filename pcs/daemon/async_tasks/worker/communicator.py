@@ -1,12 +1,23 @@
-import multiprocessing as mp
+from logging import LogRecord
+from multiprocessing.queues import SimpleQueue
 from threading import Lock
+from typing import Any
 
 from .types import Message
 
 
 class WorkerCommunicator:
-    def __init__(self, queue: mp.Queue):
+    """
+    Sends messages and log records from a worker to the scheduler
+
+    Writing to a queue holds a lock shared by all processes using the queue.
+    Terminating the worker while it holds the lock would block the other
+    workers forever, so termination is deferred until the write is done.
+    """
+
+    def __init__(self, queue: SimpleQueue, logging_queue: SimpleQueue):
         self._queue = queue
+        self._logging_queue = logging_queue
         self._lock = Lock()
         self._terminate = False
 
@@ -18,7 +29,13 @@ class WorkerCommunicator:
         return self._lock.locked()
 
     def put(self, msg: Message) -> None:
+        self._put(self._queue, msg)
+
+    def put_log_record(self, record: LogRecord) -> None:
+        self._put(self._logging_queue, record)
+
+    def _put(self, queue: SimpleQueue, item: Any) -> None:
         with self._lock:
-            self._queue.put(msg)
+            queue.put(item)
         if self._terminate:
             raise SystemExit(0)
@@ -1,18 +1,12 @@
 # pylint: disable=global-statement
-import dataclasses
-import inspect
-import multiprocessing as mp
 import os
 import signal
 from logging import (
     Logger,
     getLogger,
 )
-from typing import (
-    Any,
-    Tuple,
-    Union,
-)
+from multiprocessing.queues import SimpleQueue
+from typing import Any
 
 import dacite
 
@@ -28,8 +22,11 @@ from pcs.lib.auth.types import AuthUser
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
 from pcs.lib.permissions.checker import PermissionsChecker
-from pcs.utils import read_known_hosts_file_not_cached
 
+from .cache import (
+    get_params_dataclass,
+    read_known_hosts_cached,
+)
 from .command_mapping import (
     API_V1_COMPATIBILITY_MODE,
     COMMAND_MAP,
@@ -58,19 +55,19 @@ def _sigterm_handler(sig_num: int, frame: Any) -> None:
         raise SystemExit(0)
 
 
-def worker_init(message_q: mp.Queue, logging_q: mp.Queue) -> None:
+def worker_init(message_q: SimpleQueue, logging_q: SimpleQueue) -> None:
     """
     Runs in every new worker process after its creation
-    :param message_q: Queue instance for sending messages to the scheduler
-    :param logging_q: Queue instance for sending log records to the scheduler
+    :param message_q: Queue for sending messages to the scheduler
+    :param logging_q: Queue for sending log records to the scheduler
     """
-    # Create and configure new logger
-    logger = setup_worker_logger(logging_q)
-    logger.info("Worker initialized.")
-
     # Let task_executor use worker_com for sending messages to the scheduler
     global worker_com
-    worker_com = WorkerCommunicator(message_q)
+    worker_com = WorkerCommunicator(message_q, logging_q)
+
+    # Create and configure new logger
+    logger = setup_worker_logger(worker_com)
+    logger.info("Worker initialized.")
 
     def ignore_signals(sig_num, frame):  # type: ignore
         # pylint: disable=unused-argument
@@ -142,7 +139,7 @@ def task_executor(task: WorkerCommand) -> None:
     env = LibraryEnvironment(  # type: ignore
         logger,
         WorkerReportProcessor(worker_com, task.task_ident),
-        known_hosts_getter=read_known_hosts_file_not_cached,
+        known_hosts_getter=read_known_hosts_cached,
         user_login=auth_user.username,
         user_groups=auth_user.groups,
         request_timeout=request_timeout,
@@ -167,20 +164,10 @@ def task_executor(task: WorkerCommand) -> None:
             raise LibraryError(
                 reports.ReportItem.error(reports.messages.NotAuthorized())
             )
-        # Dacite will validate command.params against command signature.
-        # Dacite works only with dataclasses so we need to dynamically create
-        # one
+        # Dacite will validate command.params against command signature
         try:
             data = dto.from_dict(
-                dataclasses.make_dataclass(
-                    f"{command_name}_params",
-                    [
-                        _param_to_field_tuple(param)
-                        for param in list(
-                            inspect.signature(cmd.cmd).parameters.values()
-                        )[1:]
-                    ],
-                ),
+                get_params_dataclass(command_name, cmd.cmd),
                 command_dto.params,
                 strict=True,
             ).__dict__  # type: ignore
@@ -237,18 +224,3 @@ def task_executor(task: WorkerCommand) -> None:
     )
     logger.info("Task %s finished.", task.task_ident)
     _pause_worker()
-
-
-def _param_to_field_tuple(
-    param: inspect.Parameter,
-) -> Union[Tuple[str, Any], Tuple[str, Any, dataclasses.Field]]:
-    field_type = Any
-    if param.annotation != inspect.Parameter.empty:
-        field_type = param.annotation
-    if param.default != inspect.Parameter.empty:
-        return (
-            param.name,
-            field_type,
-            dataclasses.field(default=param.default),
-        )
-    return (param.name, field_type)
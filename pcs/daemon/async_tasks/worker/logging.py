@@ -1,6 +1,11 @@
 import logging
-import multiprocessing as mp
+import logging.handlers
 import os
+from typing import Any
+
+from pcs.daemon.log import pcsd as pcsd_log
+
+from .communicator import WorkerCommunicator
 
 WORKER_LOGGER = "pcs_worker"
 
@@ -35,16 +40,50 @@ class Logger(logging.Logger):
         )
 
 
-def setup_worker_logger(queue: mp.Queue) -> logging.Logger:
+class QueueHandler(logging.handlers.QueueHandler):
+    """
+    Sends log records to the scheduler by WorkerCommunicator
+
+    A record is written to the underlying pipe before the logging call
+    returns, so no record is lost when the worker is paused or terminated.
+    """
+
+    def __init__(self, worker_com: WorkerCommunicator):
+        super().__init__(None)  # type: ignore
+        self._worker_com = worker_com
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._worker_com.put_log_record(record)
+
+
+class QueueListener(logging.handlers.QueueListener):
+    """
+    Receives log records sent by QueueHandler
+    """
+
+    def dequeue(self, block: bool) -> Any:
+        del block
+        return self.queue.get()
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # type: ignore
+
+
+def setup_worker_logger(worker_com: WorkerCommunicator) -> logging.Logger:
     """
     Creates and configures worker's logger
     :return: Logger instance
     """
     logging.setLoggerClass(Logger)
     logger = logging.getLogger(WORKER_LOGGER)
-    logger.setLevel(logging.DEBUG)
+    # Workers are forked from pcsd and inherit its log level. Debug messages
+    # are dropped by pcsd unless it runs in debug mode, so do not create them
+    # in workers at all, as gathering data for them may be expensive.
+    logger.setLevel(
+        logging.DEBUG if pcsd_log.isEnabledFor(logging.DEBUG) else logging.INFO
+    )
 
-    queue_handler = logging.handlers.QueueHandler(queue)  # type: ignore
+    queue_handler = QueueHandler(worker_com)
     logger.addHandler(queue_handler)
 
     return logger
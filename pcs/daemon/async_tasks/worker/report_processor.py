@@ -29,3 +29,6 @@ class WorkerReportProcessor(pcs_reports.ReportProcessor):
             self._worker_communicator.put(
                 Message(self._task_ident, report_item.to_dto())
             )
+
+    def is_debug_enabled(self) -> bool:
+        return self._debug_enabled
@@ -0,0 +1,231 @@
+"""
+Running pcs commands on behalf of the ruby part of pcsd
+
+Starting a new pcs process for each action of the ruby daemon means importing
+pcs over and over again, which takes a considerable amount of time. An executor
+process imports pcs once and forks a child process for each command instead.
+The ruby daemon sends commands to the executor via a unix socket.
+"""
+import importlib
+import json
+import os
+import pkgutil
+import signal
+import socketserver
+import stat
+import sys
+import tempfile
+import traceback
+from multiprocessing import Process
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+)
+
+from pcs.common.types import StringSequence
+from pcs.daemon import log
+
+CMD_PCS = "pcs"
+CMD_PCS_INTERNAL = "pcs_internal"
+# Environment variables the ruby daemon is allowed to set for a command
+ALLOWED_ENVIRONMENT = ("CIB_user", "CIB_user_groups")
+
+
+class InvalidRequest(Exception):
+    pass
+
+
+def _get_entry_points() -> Dict[str, Callable[[], Any]]:
+    # pylint: disable=import-outside-toplevel
+    import pcs.app
+    import pcs.cli.routing
+    import pcs.lib.commands
+    import pcs.pcs_internal
+
+    # pcs imports command implementations only when they are run. Import them
+    # in advance, so that children running the commands do not have to.
+    for package in (pcs.cli.routing, pcs.lib.commands):
+        for module_info in pkgutil.walk_packages(
+            package.__path__, f"{package.__name__}."
+        ):
+            importlib.import_module(module_info.name)
+
+    return {
+        CMD_PCS: pcs.app.main,
+        CMD_PCS_INTERNAL: pcs.pcs_internal.main,
+    }
+
+
+def parse_request(request_data: bytes) -> Dict[str, Any]:
+    """
+    Parse and validate a request sent by the ruby daemon
+
+    request_data -- json object with keys: cmd (name of a program to run),
+        args (list of command line arguments), stdin (string or null),
+        environment (object with environment variables)
+    """
+    try:
+        request = json.loads(request_data)
+    except ValueError as e:
+        raise InvalidRequest(f"Unable to parse request: {e}") from e
+    if not isinstance(request, dict):
+        raise InvalidRequest("Request is not an object")
+    if request.get("cmd") not in (CMD_PCS, CMD_PCS_INTERNAL):
+        raise InvalidRequest(f"Unknown command '{request.get('cmd')}'")
+    args = request.get("args", [])
+    if not isinstance(args, list) or not all(
+        isinstance(arg, str) for arg in args
+    ):
+        raise InvalidRequest("Arguments are not a list of strings")
+    stdin = request.get("stdin")
+    if stdin is not None and not isinstance(stdin, str):
+        raise InvalidRequest("Stdin is not a string")
+    environment = request.get("environment", {})
+    if not isinstance(environment, dict) or not all(
+        name in ALLOWED_ENVIRONMENT
+        and (value is None or isinstance(value, str))
+        for name, value in environment.items()
+    ):
+        raise InvalidRequest("Invalid environment variables")
+    return dict(
+        cmd=request["cmd"], args=args, stdin=stdin, environment=environment
+    )
+
+
+def run_command(
+    entry_point: Callable[[], Any],
+    program_name: str,
+    args: StringSequence,
+    stdin: Optional[str],
+    environment: Mapping[str, Optional[str]],
+) -> Dict[str, Any]:
+    """
+    Run a pcs entry point as if it was a new process, return its outcome
+
+    The process-wide stdin, stdout, stderr and environment are replaced, so
+    this is meant to be run in a child process dedicated to the command.
+
+    entry_point -- main function of a pcs program
+    program_name -- name of the program
+    args -- command line arguments
+    stdin -- standard input of the command
+    environment -- environment variables to set, None means unset a variable
+    """
+    # pylint: disable=consider-using-with, unspecified-encoding
+    stdin_file, stdout_file, stderr_file = [
+        tempfile.TemporaryFile() for _ in range(3)
+    ]
+    try:
+        stdin_file.write((stdin or "").encode())
+        stdin_file.seek(0)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Redirect the file descriptors, so that the output of external
+        # processes run by the command is captured as well.
+        os.dup2(stdin_file.fileno(), 0)
+        os.dup2(stdout_file.fileno(), 1)
+        os.dup2(stderr_file.fileno(), 2)
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", closefd=False)
+
+        for name, value in environment.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        os.environ["LC_ALL"] = "C"
+        sys.argv = [program_name] + list(args)
+
+        exit_code = _run_entry_point(entry_point)
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        stdout_file.seek(0)
+        stderr_file.seek(0)
+        return dict(
+            exit_code=exit_code,
+            stdout=stdout_file.read().decode(errors="replace"),
+            stderr=stderr_file.read().decode(errors="replace"),
+        )
+    finally:
+        for file in (stdin_file, stdout_file, stderr_file):
+            file.close()
+
+
+def _run_entry_point(entry_point: Callable[[], Any]) -> int:
+    # pylint: disable=broad-except
+    try:
+        entry_point()
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        sys.stderr.write(f"{e.code}\n")
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    entry_points: Dict[str, Callable[[], Any]] = {}
+
+    def handle(self) -> None:
+        try:
+            request = parse_request(self.rfile.read())
+        except InvalidRequest as e:
+            response: Dict[str, Any] = dict(error=str(e))
+        else:
+            response = run_command(
+                self.entry_points[request["cmd"]],
+                request["cmd"],
+                request["args"],
+                request["stdin"],
+                request["environment"],
+            )
+        self.wfile.write(json.dumps(response).encode())
+
+
+class _ExecutorServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    def server_bind(self) -> None:
+        try:
+            if stat.S_ISSOCK(os.stat(self.server_address).st_mode):
+                os.remove(self.server_address)
+        except FileNotFoundError:
+            pass
+        # only root can connect to the socket
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+
+def _serve(socket_path: str) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    _RequestHandler.entry_points = _get_entry_points()
+    with _ExecutorServer(socket_path, _RequestHandler) as server:
+        server.serve_forever()
+
+
+def start(socket_path: str) -> Process:
+    """
+    Start an executor process listening on a unix socket
+
+    socket_path -- path of the unix socket to listen on
+    """
+    process = Process(target=_serve, args=(socket_path,), daemon=True)
+    process.start()
+    log.pcsd.info(
+        "Started pcs command executor (socket '%s', pid %s)",
+        socket_path,
+        process.pid,
+    )
+    return process
@@ -1,6 +1,7 @@
 import os
 import signal
 import socket
+from multiprocessing import Process
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +14,7 @@ from tornado.web import Application
 
 from pcs import settings
 from pcs.daemon import (
+    cli_executor,
     log,
     ruby_pcsd,
     session,
@@ -44,6 +46,7 @@ from pcs.lib.auth.provider import AuthProvider
 class SignalInfo:
     # pylint: disable=too-few-public-methods
     async_scheduler: Optional[Scheduler] = None
+    cli_executor: Optional[Process] = None
     server_manage = None
     ioloop_started = False
 
@@ -55,6 +58,8 @@ def handle_signal(incoming_signal, frame):
         SignalInfo.server_manage.stop()
     if SignalInfo.async_scheduler:
         SignalInfo.async_scheduler.terminate_nowait()
+    if SignalInfo.cli_executor:
+        SignalInfo.cli_executor.terminate()
     if SignalInfo.ioloop_started:
         IOLoop.current().stop()
     raise SystemExit(0)
@@ -141,6 +146,12 @@ def main():
     if env.PCSD_DEBUG:
         log.enable_debug()
 
+    # Start the executor before anything else, so that it does not inherit
+    # sockets and worker processes of the daemon.
+    SignalInfo.cli_executor = cli_executor.start(
+        settings.pcsd_cli_executor_socket
+    )
+
     async_scheduler = Scheduler(
         SchedulerConfig(
             worker_count=env.PCSD_WORKER_COUNT,
@@ -162,10 +173,11 @@ def main():
         settings.pcsd_ruby_socket,
         debug=env.PCSD_DEBUG,
     )
+    session_storage = session.Storage(env.PCSD_SESSION_LIFETIME)
     make_app = configure_app(
         async_scheduler,
         auth_provider,
-        session.Storage(env.PCSD_SESSION_LIFETIME),
+        session_storage,
         ruby_pcsd_wrapper,
         sync_config_lock,
         env.PCSD_STATIC_FILES_DIR,
@@ -206,6 +218,15 @@ def main():
         callback_time=env.PCSD_CHECK_INTERVAL_MS,
     ).start()
     ioloop = IOLoop.current()
+    ioloop.add_handler(
+        async_scheduler.wakeup_fd, async_scheduler.handle_wakeup, IOLoop.READ
+    )
+    # Sessions are dropped when accessing the storage as well. Dropping them
+    # periodically keeps the storage small when pcsd is not being used.
+    PeriodicCallback(
+        session_storage.drop_expired,
+        callback_time=settings.gui_session_cleanup_interval_seconds * 1000,
+    ).start()
     ioloop.add_callback(sign_ioloop_started)
     if systemd.is_systemd() and env.NOTIFY_SOCKET:
         ioloop.add_callback(systemd.notify, env.NOTIFY_SOCKET)
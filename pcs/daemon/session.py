@@ -1,3 +1,4 @@
+import heapq
 from time import time as now
 from typing import Optional
 
@@ -28,6 +29,13 @@ class Session:
         self.refresh()
         return self.__sid
 
+    @property
+    def last_access(self) -> float:
+        """
+        Return the time of last access without refreshing the session.
+        """
+        return self.__last_access
+
     def refresh(self) -> None:
         """
         Set the time of last access to now.
@@ -41,6 +49,12 @@ class Session:
 class Storage:
     def __init__(self, lifetime_seconds: int) -> None:
         self.__sessions: dict[str, Session] = {}
+        # Min-heap of (time of last access, sid). Sessions are refreshed
+        # without the storage being notified, so the time stored in the heap
+        # is the lowest possible time of the last access of a session. It is
+        # checked and updated once the session is at the top of the heap.
+        # Entries of destroyed sessions are removed lazily the same way.
+        self.__expiry_heap: list[tuple[float, str]] = []
         self.__lifetime_seconds = lifetime_seconds
 
     def get(self, sid: str) -> Optional[Session]:
@@ -51,13 +65,24 @@ class Storage:
         return session
 
     def drop_expired(self) -> None:
-        obsolete_sid_list = [
-            sid
-            for sid, session in self.__sessions.items()
-            if session.was_unused_last(self.__lifetime_seconds)
-        ]
-        for sid in obsolete_sid_list:
-            self.destroy(sid)
+        """
+        Remove sessions unused for longer than their lifetime.
+
+        Only sessions which may have expired are visited, so the cost does not
+        grow with the number of sessions in the storage.
+        """
+        while (
+            self.__expiry_heap
+            and now() > self.__expiry_heap[0][0] + self.__lifetime_seconds
+        ):
+            _, sid = heapq.heappop(self.__expiry_heap)
+            session = self.__sessions.get(sid)
+            if session is None:
+                continue
+            if session.was_unused_last(self.__lifetime_seconds):
+                del self.__sessions[sid]
+            else:
+                heapq.heappush(self.__expiry_heap, (session.last_access, sid))
 
     def destroy(self, sid: str) -> None:
         if sid in self.__sessions:
@@ -65,7 +90,8 @@ class Storage:
 
     def login(self, username: str) -> Session:
         self.drop_expired()
-        sid = get_unique_uuid(tuple(self.__sessions.keys()))
+        sid = get_unique_uuid(self.__sessions)
         session = Session(sid, username)
         self.__sessions[sid] = session
+        heapq.heappush(self.__expiry_heap, (session.last_access, sid))
         return session
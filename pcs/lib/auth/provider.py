@@ -7,6 +7,7 @@ from typing import (
 )
 
 from pcs.common.file import RawFileError
+from pcs.lib.file.facade_cache import get_file_facade_cache
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.json import JsonParserException
 from pcs.lib.interface.config import ParserErrorException
@@ -17,7 +18,7 @@ from .config.parser import ParserError
 from .pam import authenticate_user
 from .tools import (
     UserGroupsError,
-    get_user_groups,
+    get_user_groups_cached,
 )
 from .types import AuthUser
 
@@ -30,12 +31,16 @@ class AuthProvider:
     def __init__(self, logger: logging.Logger) -> None:
         self._logger = logger
         self._config_file_instance = FileInstance.for_pcs_users_config()
+        self._facade_cache = get_file_facade_cache()
 
     def _get_facade(self) -> Facade:
         try:
             if not self._config_file_instance.raw_file.exists():
                 return Facade([])
-            return cast(Facade, self._config_file_instance.read_to_facade())
+            return cast(
+                Facade,
+                self._facade_cache.read_to_facade(self._config_file_instance),
+            )
         except ParserError as e:
             self._logger.error(
                 "Unable to parse file '%s': %s",
@@ -105,7 +110,7 @@ class AuthProvider:
 
     def login_user(self, username: str) -> Optional[AuthUser]:
         try:
-            groups = get_user_groups(username)
+            groups = get_user_groups_cached(username)
         except UserGroupsError:
             self._logger.error(
                 "Unable to determine groups of user '%s'", username
@@ -1,7 +1,14 @@
 import grp
 import pwd
+import threading
+import time
+from typing import (
+    Dict,
+    NamedTuple,
+)
 
-from pcs.common.tools import StringCollection
+from pcs import settings
+from pcs.common.types import StringCollection
 
 from .types import (
     AuthUser,
@@ -13,6 +20,15 @@ class UserGroupsError(Exception):
     pass
 
 
+class _UserGroupsCacheEntry(NamedTuple):
+    expires_at: float
+    groups: tuple[str, ...]
+
+
+_user_groups_cache: Dict[str, _UserGroupsCacheEntry] = {}
+_user_groups_cache_lock = threading.Lock()
+
+
 def get_user_groups(username: str) -> list[str]:
     try:
         return [
@@ -29,6 +45,34 @@ def get_user_groups(username: str) -> list[str]:
         raise UserGroupsError from e
 
 
+def get_user_groups_cached(username: str) -> list[str]:
+    """
+    Get groups of a user, reuse recently obtained groups of the user
+
+    Group membership is provided by the system and there is no way to get
+    notified about its changes. Therefore, groups of a user are cached for a
+    short time defined in settings.
+    """
+    now = time.monotonic()
+    with _user_groups_cache_lock:
+        entry = _user_groups_cache.get(username)
+    if entry is not None and entry.expires_at > now:
+        return list(entry.groups)
+    groups = get_user_groups(username)
+    with _user_groups_cache_lock:
+        _user_groups_cache[username] = _UserGroupsCacheEntry(
+            now + settings.user_groups_cache_lifetime_seconds, tuple(groups)
+        )
+        # drop expired entries so the cache does not grow indefinitely
+        for cached_username in [
+            cached_username
+            for cached_username, cached_entry in _user_groups_cache.items()
+            if cached_entry.expires_at <= now
+        ]:
+            del _user_groups_cache[cached_username]
+    return groups
+
+
 def get_effective_user(
     authenticated_user: AuthUser,
     effective_user_candidate: DesiredUser,
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from pcs.common.tools import StringCollection
+from pcs.common.types import StringCollection
 
 from . import const
 
@@ -4,10 +4,12 @@ from lxml import etree
 
 from pcs.common import reports
 from pcs.lib.cib.tools import (
+    add_to_id_index,
     check_new_id_applicable,
     does_id_exist,
     find_element_by_tag_and_id,
     find_unique_id,
+    remove_element,
 )
 from pcs.lib.errors import LibraryError
 
@@ -116,6 +118,7 @@ def create_role(acl_section, role_id, description=None):
     role = etree.SubElement(acl_section, TAG_ROLE, id=role_id)
     if description:
         role.set("description", description)
+    add_to_id_index(role)
     return role
 
 
@@ -128,12 +131,12 @@ def remove_role(acl_section, role_id, autodelete_users_groups=False):
     autodelete_users_group -- if True remove targets with no role after removing
     """
     acl_role = find_role(acl_section, role_id)
-    acl_role.getparent().remove(acl_role)
+    remove_element(acl_role)
     for role_el in acl_section.xpath(".//role[@id=$role_id]", role_id=role_id):
         role_parent = role_el.getparent()
         role_parent.remove(role_el)
         if autodelete_users_groups and role_parent.find(".//role") is None:
-            role_parent.getparent().remove(role_parent)
+            remove_element(role_parent)
 
 
 def _assign_role(acl_section, role_id, target_el):
@@ -209,7 +212,7 @@ def unassign_role(target_el, role_id, autodelete_target=False):
     for assigned_role in assigned_role_list:
         target_el.remove(assigned_role)
     if autodelete_target and target_el.find("./role") is None:
-        target_el.getparent().remove(target_el)
+        remove_element(target_el)
 
 
 def provide_role(acl_section, role_id):
@@ -251,7 +254,9 @@ def create_group(acl_section, group_id):
     group_id -- id of new group
     """
     check_new_id_applicable(acl_section, "ACL group", group_id)
-    return etree.SubElement(acl_section, TAG_GROUP, id=group_id)
+    group = etree.SubElement(acl_section, TAG_GROUP, id=group_id)
+    add_to_id_index(group)
+    return group
 
 
 def remove_target(acl_section, target_id):
@@ -263,7 +268,7 @@ def remove_target(acl_section, target_id):
     target_id -- id of target element to remove
     """
     target = find_target(acl_section, target_id)
-    target.getparent().remove(target)
+    remove_element(target)
 
 
 def remove_group(acl_section, group_id):
@@ -275,7 +280,7 @@ def remove_group(acl_section, group_id):
     group_id -- id of group element to remove
     """
     group = find_group(acl_section, group_id)
-    group.getparent().remove(group)
+    remove_element(group)
 
 
 def add_permissions_to_role(role_el, permission_info_list):
@@ -300,6 +305,7 @@ def add_permissions_to_role(role_el, permission_info_list):
         )
         perm.set("kind", permission)
         perm.set(area_type_attribute_map[scope_type], scope)
+        add_to_id_index(perm)
 
 
 def remove_permission(acl_section, permission_id):
@@ -310,7 +316,7 @@ def remove_permission(acl_section, permission_id):
     permission_id -- id of permission element to be removed
     """
     permission = _find(TAG_PERMISSION, acl_section, permission_id)
-    permission.getparent().remove(permission)
+    remove_element(permission)
 
 
 def get_role_list(acl_section):
@@ -431,7 +437,7 @@ def remove_permissions_referencing(tree, reference):
     for permission in tree.xpath(
         ".//acl_permission[@reference=$reference]", reference=reference
     ):
-        permission.getparent().remove(permission)
+        remove_element(permission)
 
 
 def dom_remove_permissions_referencing(dom, reference):
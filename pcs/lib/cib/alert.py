@@ -7,10 +7,12 @@ from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
 from pcs.lib.cib.nvpair import get_nvset
 from pcs.lib.cib.tools import (
+    add_to_id_index,
     check_new_id_applicable,
     find_element_by_tag_and_id,
     find_unique_id,
     get_alerts,
+    remove_element,
     validate_id_does_not_exist,
 )
 from pcs.lib.errors import LibraryError
@@ -98,6 +100,7 @@ def create_alert(tree, alert_id, path, description=""):
     if description:
         alert.set("description", description)
 
+    add_to_id_index(alert)
     return alert
 
 
@@ -128,7 +131,7 @@ def remove_alert(tree, alert_id):
     alert_id -- id of alert which should be removed
     """
     alert = find_alert(get_alerts(tree), alert_id)
-    alert.getparent().remove(alert)
+    remove_element(alert)
 
 
 def add_recipient(
@@ -169,6 +172,7 @@ def add_recipient(
     if description:
         recipient.attrib["description"] = description
 
+    add_to_id_index(recipient)
     return recipient
 
 
@@ -215,7 +219,7 @@ def remove_recipient(tree, recipient_id):
     recipient_id -- id of recipient to be removed
     """
     recipient = find_recipient(get_alerts(tree), recipient_id)
-    recipient.getparent().remove(recipient)
+    remove_element(recipient)
 
 
 def get_all_recipients(alert):
@@ -1,9 +1,11 @@
+from collections import defaultdict
 from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
-    cast,
+    Tuple,
 )
 
 from lxml.etree import (
@@ -15,6 +17,7 @@ from pcs.common import reports
 from pcs.lib.cib import resource
 from pcs.lib.cib.constraint import resource_set
 from pcs.lib.cib.tools import (
+    add_to_id_index,
     find_element_by_tag_and_id,
     find_unique_id,
 )
@@ -117,39 +120,70 @@ def create_id(cib, type_prefix, resource_set_list):
     return find_unique_id(cib, "{0}_set_{1}".format(type_prefix, id_part))
 
 
-def have_duplicate_resource_sets(element, other_element):
-    def get_id_set_list(element):
+def get_resource_sets_signature(
+    element: _Element,
+) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Return a hashable representation of resource sets of a constraint
+
+    element -- constraint with resource sets
+    """
+    return tuple(
+        tuple(resource_set.get_resource_id_set_list(resource_set_item))
+        for resource_set_item in element.findall(".//resource_set")
+    )
+
+
+class DuplicateConstraintIndex:
+    """
+    Constraints of one type grouped by their signatures
+
+    Constraints with equal signatures are duplicates. The signature of each
+    constraint is computed once when the index is built.
+    """
+
+    def __init__(
+        self,
+        constraint_section: _Element,
+        tag_name: str,
+        get_signature: Callable[[_Element], Hashable],
+    ):
+        """
+        constraint_section -- element constraints
+        tag_name -- type of constraints to index
+        get_signature -- returns a signature of a constraint
+        """
+        self._get_signature = get_signature
+        self._index: Dict[Hashable, List[_Element]] = defaultdict(list)
+        for element in constraint_section.iterchildren(tag_name):
+            self._index[get_signature(element)].append(element)
+
+    def get_duplicates(self, element: _Element) -> List[_Element]:
+        """
+        Return indexed constraints which are duplicates of the constraint
+
+        element -- constraint to find duplicates of
+        """
         return [
-            resource_set.get_resource_id_set_list(resource_set_item)
-            for resource_set_item in element.findall(".//resource_set")
+            duplicate_element
+            for duplicate_element in self._index.get(
+                self._get_signature(element), []
+            )
+            if duplicate_element is not element
         ]
 
-    return get_id_set_list(element) == get_id_set_list(other_element)
-
 
 def check_is_without_duplication(
     report_processor: reports.ReportProcessor,
     constraint_section: _Element,
     element: _Element,
-    are_duplicate: Callable[[_Element, _Element], bool],
+    get_signature: Callable[[_Element], Hashable],
     export_element: Callable[[_Element], Dict[str, Any]],
     duplication_allowed: bool = False,
 ) -> None:
-    duplicate_element_list = [
-        duplicate_element
-        for duplicate_element in cast(
-            # The xpath method has a complicated return value, but we know our
-            # xpath expression returns only elements.
-            List[_Element],
-            constraint_section.xpath(
-                ".//*[local-name()=$tag_name]", tag_name=element.tag
-            ),
-        )
-        if (
-            element is not duplicate_element
-            and are_duplicate(element, duplicate_element)
-        )
-    ]
+    duplicate_element_list = DuplicateConstraintIndex(
+        constraint_section, str(element.tag), get_signature
+    ).get_duplicates(element)
     if not duplicate_element_list:
         return
 
@@ -188,6 +222,7 @@ def create_with_set(constraint_section, tag_name, options, resource_set_list):
         )
     element = SubElement(constraint_section, tag_name)
     element.attrib.update(options)
+    add_to_id_index(element)
     if tag_name == "rsc_order":
         all_resource_ids = []
         for resource_set_item in resource_set_list:
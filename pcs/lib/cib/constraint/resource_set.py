@@ -10,6 +10,7 @@ from pcs.lib import validate
 from pcs.lib.cib.resource import group
 from pcs.lib.cib.resource.common import get_parent_resource
 from pcs.lib.cib.tools import (
+    add_to_id_index,
     are_new_role_names_supported,
     find_unique_id,
     get_elements_by_ids,
@@ -76,6 +77,7 @@ def create(parent, resource_set):
     for _id in resource_set["ids"]:
         etree.SubElement(element, "resource_ref").attrib["id"] = _id
 
+    add_to_id_index(element)
     return element
 
 
@@ -1,5 +1,8 @@
 from functools import partial
-from typing import Callable
+from typing import (
+    Callable,
+    Hashable,
+)
 
 from lxml.etree import (
     SubElement,
@@ -17,7 +20,7 @@ from pcs.lib.booth.config_validators import validate_ticket_name
 from pcs.lib.cib import tools
 from pcs.lib.cib.constraint import constraint
 from pcs.lib.errors import LibraryError
-from pcs.lib.xml_tools import remove_when_pointless
+from pcs.lib.xml_tools import is_element_useful
 
 TAG_NAME = "rsc_ticket"
 DESCRIPTION = "constraint id"
@@ -173,6 +176,7 @@ def prepare_options_plain(
 def create_plain(constraint_section, options):
     element = SubElement(constraint_section, TAG_NAME)
     element.attrib.update(options)
+    tools.add_to_id_index(element)
     return element
 
 
@@ -184,7 +188,7 @@ def remove_plain(constraint_section, ticket_key, resource_id):
     )
 
     for ticket_element in ticket_element_list:
-        ticket_element.getparent().remove(ticket_element)
+        tools.remove_element(ticket_element)
 
     return len(ticket_element_list) > 0
 
@@ -203,35 +207,34 @@ def remove_with_resource_set(constraint_section, ticket_key, resource_id):
         # pylint: disable=len-as-condition
         if not len(set_element):
             ticket_element = set_element.getparent()
-            ticket_element.remove(set_element)
+            tools.remove_element(set_element)
             # We do not care about attributes since without an attribute "rsc"
             # they are pointless. Attribute "rsc" is mutually exclusive with
             # resource_set (see rng) so it cannot be in this ticket_element.
-            remove_when_pointless(ticket_element, attribs_important=False)
+            if not is_element_useful(ticket_element, attribs_important=False):
+                tools.remove_element(ticket_element)
 
     return len(ref_element_list) > 0
 
 
-def get_duplicit_checker_callback(
+def get_duplicit_signature_callback(
     new_roles_supported: bool,
-) -> Callable[[_Element, _Element], bool]:
-    def are_duplicate_plain(element: _Element, other_element: _Element) -> bool:
-        def convert_role(_el):
-            return pacemaker.role.get_value_for_cib(
-                _el.attrib.get("rsc-role", ""), new_roles_supported
-            )
-
-        if convert_role(element) != convert_role(other_element):
-            return False
-        return all(
-            element.attrib.get(name, "") == other_element.attrib.get(name, "")
-            for name in ("ticket", "rsc")
+) -> Callable[[_Element], Hashable]:
+    def get_signature_plain(element: _Element) -> Hashable:
+        return (
+            pacemaker.role.get_value_for_cib(
+                const.PcmkRoleType(str(element.attrib.get("rsc-role", ""))),
+                new_roles_supported,
+            ),
+            element.attrib.get("ticket", ""),
+            element.attrib.get("rsc", ""),
         )
 
-    return are_duplicate_plain
+    return get_signature_plain
 
 
-def are_duplicate_with_resource_set(element, other_element):
-    return element.attrib["ticket"] == other_element.attrib[
-        "ticket"
-    ] and constraint.have_duplicate_resource_sets(element, other_element)
+def get_signature_with_resource_set(element: _Element) -> Hashable:
+    return (
+        element.attrib["ticket"],
+        constraint.get_resource_sets_signature(element),
+    )
@@ -24,7 +24,11 @@ from pcs.common.reports import has_errors
 from pcs.common.reports.item import ReportItem
 from pcs.common.types import StringCollection
 from pcs.lib.cib.resource.stonith import is_stonith_resource
-from pcs.lib.cib.tools import find_unique_id
+from pcs.lib.cib.tools import (
+    add_to_id_index,
+    find_unique_id,
+    remove_element,
+)
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.state import _Element as StateElement
 from pcs.lib.pacemaker.values import (
@@ -95,7 +99,7 @@ def remove_all_levels(topology_el):
     # message.
     # https://bugzilla.redhat.com/show_bug.cgi?id=1642514
     for level_el in topology_el.findall("fencing-level"):
-        level_el.getparent().remove(level_el)
+        remove_element(level_el)
 
 
 def remove_levels_by_params(
@@ -159,7 +163,7 @@ def remove_levels_by_params(
     if has_errors(report_list):
         return report_list
     for el in level_el_list:
-        el.getparent().remove(el)
+        remove_element(el)
     return report_list
 
 
@@ -186,7 +190,7 @@ def remove_device_from_all_levels(topology_el, device_id):
         if new_devices:
             level_el.set("devices", ",".join(new_devices))
         else:
-            level_el.getparent().remove(level_el)
+            remove_element(level_el)
 
 
 def export(topology_el):
@@ -422,6 +426,7 @@ def _append_level_element(tree, level, target_type, target_value, devices):
         "id",
         find_unique_id(tree, sanitize_id("fl-{0}-{1}".format(id_part, level))),
     )
+    add_to_id_index(level_el)
     return level_el
 
 
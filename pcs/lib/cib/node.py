@@ -7,7 +7,10 @@ from lxml.etree import _Element
 from pcs.common import reports
 from pcs.common.reports.item import ReportItem
 from pcs.lib.cib.nvpair import update_nvset
-from pcs.lib.cib.tools import get_nodes
+from pcs.lib.cib.tools import (
+    add_to_id_index,
+    get_nodes,
+)
 from pcs.lib.errors import LibraryError
 from pcs.lib.xml_tools import (
     append_when_useful,
@@ -62,6 +65,7 @@ def update_node_instance_attrs(
     update_nvset(attrs_el, attrs, id_provider)
     append_when_useful(node_el, attrs_el)
     append_when_useful(cib_nodes, node_el)
+    add_to_id_index(node_el)
 
 
 def get_node_names(cib: _Element) -> Set[str]:
@@ -8,7 +8,12 @@ from typing import (
 from lxml import etree
 from lxml.etree import _Element
 
-from pcs.lib.cib.tools import create_subelement_id
+from pcs.lib.cib.tools import (
+    add_to_id_index,
+    create_subelement_id,
+    remove_element,
+    remove_from_id_index,
+)
 from pcs.lib.xml_tools import (
     append_when_useful,
     get_sub_element,
@@ -27,12 +32,14 @@ def _append_new_nvpair(nvset_element, name, value, id_provider):
     string value is value attribute of new nvpair
     IdProvider id_provider -- elements' ids generator
     """
-    etree.SubElement(
-        nvset_element,
-        "nvpair",
-        id=create_subelement_id(nvset_element, name, id_provider),
-        name=name,
-        value=value,
+    add_to_id_index(
+        etree.SubElement(
+            nvset_element,
+            "nvpair",
+            id=create_subelement_id(nvset_element, name, id_provider),
+            name=name,
+            value=value,
+        )
     )
 
 
@@ -53,9 +60,12 @@ def set_nvpair_in_nvset(nvset_element, name, value, id_provider):
     else:
         nvpair = nvpair_list[0]
         if value:
+            # the value of a remote-node nvpair is indexed as an id
+            remove_from_id_index(nvpair)
             nvpair.set("value", value)
+            add_to_id_index(nvpair)
         else:
-            nvset_element.remove(nvpair)
+            remove_element(nvpair)
 
 
 def arrange_first_nvset(
@@ -91,6 +101,7 @@ def arrange_first_nvset(
     )
     update_nvset(nvset_element, nvpair_dict, id_provider)
     append_when_useful(context_element, nvset_element, index=0)
+    add_to_id_index(nvset_element)
 
 
 def append_new_nvset(
@@ -116,6 +127,7 @@ def append_new_nvset(
         context_element.append(nvset_element)
     else:
         append_when_useful(context_element, nvset_element)
+    add_to_id_index(nvset_element)
 
 
 append_new_instance_attributes = partial(
@@ -32,12 +32,12 @@ from pcs.lib.cib.tools import (
     ElementSearcher,
     IdProvider,
     Version,
+    add_to_id_index,
     create_subelement_id,
+    remove_element,
+    remove_from_id_index,
 )
-from pcs.lib.xml_tools import (
-    export_attributes,
-    remove_one_element,
-)
+from pcs.lib.xml_tools import export_attributes
 
 NvsetTag = NewType("NvsetTag", str)
 NVSET_INSTANCE = NvsetTag("instance_attributes")
@@ -251,6 +251,7 @@ def nvset_append_new(
         rule_to_cib(nvset_el, id_provider, cib_schema_version, nvset_rule)
     for name, value in nvpair_dict.items():
         _set_nvpair(nvset_el, id_provider, name, value)
+    add_to_id_index(nvset_el)
     return nvset_el
 
 
@@ -261,7 +262,7 @@ def nvset_remove(nvset_el_list: Iterable[_Element]) -> None:
     nvset_el_list -- nvset elements to be removed
     """
     for nvset_el in nvset_el_list:
-        remove_one_element(nvset_el)
+        remove_element(nvset_el)
 
 
 def nvset_update(
@@ -306,25 +307,30 @@ def _set_nvpair(
 
     if not nvpair_el_list:
         if value != "":
-            etree.SubElement(
-                nvset_element,
-                "nvpair",
-                {
-                    "id": create_subelement_id(
-                        nvset_element,
-                        # limit id length to prevent excessively long ids
-                        name[:20],
-                        id_provider,
-                    ),
-                    "name": name,
-                    "value": value,
-                },
+            add_to_id_index(
+                etree.SubElement(
+                    nvset_element,
+                    "nvpair",
+                    {
+                        "id": create_subelement_id(
+                            nvset_element,
+                            # limit id length to prevent excessively long ids
+                            name[:20],
+                            id_provider,
+                        ),
+                        "name": name,
+                        "value": value,
+                    },
+                )
             )
         return
 
     if value != "":
+        # the value of a remote-node nvpair is indexed as an id
+        remove_from_id_index(nvpair_el_list[0])
         nvpair_el_list[0].attrib["value"] = value
+        add_to_id_index(nvpair_el_list[0])
     else:
-        nvset_element.remove(nvpair_el_list[0])
+        remove_element(nvpair_el_list[0])
     for nvpair_el in nvpair_el_list[1:]:
-        nvset_element.remove(nvpair_el)
+        remove_element(nvpair_el)
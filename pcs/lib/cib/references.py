@@ -0,0 +1,94 @@
+from collections import defaultdict
+from typing import (
+    Dict,
+    List,
+    Set,
+    cast,
+)
+
+from lxml.etree import _Element
+
+from pcs.lib.cib.tools import get_constraints
+from pcs.lib.xml_tools import get_root
+
+# attributes of constraints without resource sets referencing resources or tags
+CONSTRAINT_REFERENCE_ATTRIBUTES = {
+    "rsc_colocation": ("rsc", "with-rsc"),
+    "rsc_location": ("rsc",),
+    "rsc_order": ("first", "then"),
+    "rsc_ticket": ("rsc",),
+}
+
+
+class ReferenceIndex:
+    """
+    Index of constraints referencing resources and tags in a CIB
+
+    The index is built by a single pass over the constraints section, so that
+    finding references of many ids does not require searching the section
+    again for each id. The index is not updated when the CIB changes,
+    it is meant to be built after the CIB has been loaded or modified.
+    """
+
+    def __init__(self, cib: _Element):
+        """
+        cib -- a CIB to index, any element of the CIB is accepted
+        """
+        cib = get_root(cib)
+        self._constraints: Dict[str, List[_Element]] = defaultdict(list)
+        self._set_constraints: Set[_Element] = set()
+
+        for constraint_el in get_constraints(cib).iterchildren(
+            *CONSTRAINT_REFERENCE_ATTRIBUTES
+        ):
+            ref_id_list = [
+                str(ref_id)
+                for ref_id in cast(
+                    List[str],
+                    constraint_el.xpath("./resource_set/resource_ref/@id"),
+                )
+            ]
+            if ref_id_list:
+                self._set_constraints.add(constraint_el)
+            else:
+                ref_id_list = [
+                    str(constraint_el.get(attr))
+                    for attr in CONSTRAINT_REFERENCE_ATTRIBUTES[
+                        str(constraint_el.tag)
+                    ]
+                    if constraint_el.get(attr) is not None
+                ]
+            for ref_id in dict.fromkeys(ref_id_list):
+                self._constraints[ref_id].append(constraint_el)
+
+    def get_constraints(self, ref_id: str) -> List[_Element]:
+        """
+        Return constraints referencing the specified id in document order
+
+        ref_id -- id of a resource or a tag
+        """
+        return list(self._constraints.get(ref_id, []))
+
+    def get_plain_constraints(self, ref_id: str) -> List[_Element]:
+        """
+        Return constraints without resource sets referencing the specified id
+
+        ref_id -- id of a resource or a tag
+        """
+        return [
+            constraint_el
+            for constraint_el in self._constraints.get(ref_id, [])
+            if constraint_el not in self._set_constraints
+        ]
+
+    def get_set_constraints(self, ref_id: str) -> List[_Element]:
+        """
+        Return constraints with resource sets referencing the specified id
+
+        ref_id -- id of a resource or a tag
+        """
+        return [
+            constraint_el
+            for constraint_el in self._constraints.get(ref_id, [])
+            if constraint_el in self._set_constraints
+        ]
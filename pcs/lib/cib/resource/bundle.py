@@ -21,7 +21,12 @@ from pcs.lib.cib.nvpair import (
     arrange_first_meta_attributes,
 )
 from pcs.lib.cib.resource.primitive import TAG as TAG_PRIMITIVE
-from pcs.lib.cib.tools import ElementSearcher
+from pcs.lib.cib.tools import (
+    ElementSearcher,
+    add_to_id_index,
+    remove_element,
+    remove_from_id_index,
+)
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.values import sanitize_id
 from pcs.lib.tools import get_optional_value
@@ -250,6 +255,7 @@ def append_new(
         _append_storage(bundle_element, id_provider, bundle_id, storage_map)
     if meta_attributes:
         append_new_meta_attributes(bundle_element, meta_attributes, id_provider)
+    add_to_id_index(bundle_element)
     return bundle_element
 
 
@@ -308,6 +314,7 @@ def reset_to_minimal(bundle_element):
     # Like any function that manipulates with cib, this also assumes prior
     # validation that container is supported.
     for child in list(bundle_element):
+        remove_from_id_index(child)
         if child.tag in ["network", "storage"]:
             reset_element(child)
         if child.tag == META_ATTRIBUTES_TAG:
@@ -316,6 +323,7 @@ def reset_to_minimal(bundle_element):
             # GENERIC_CONTAINER_TYPES elements require the "image" attribute to
             # be set.
             reset_element(child, keep_attrs=["image"])
+        add_to_id_index(child)
 
 
 def _get_report_unsupported_container(bundle_el):
@@ -428,6 +436,7 @@ def update(
                 network_element, id_provider, bundle_id, port_map_options
             )
     append_when_useful(bundle_el, network_element)
+    add_to_id_index(network_element)
 
     storage_element = get_sub_element(
         bundle_el, "storage", append_if_missing=False
@@ -443,6 +452,7 @@ def update(
                 storage_element, id_provider, bundle_id, storage_map_options
             )
     append_when_useful(bundle_el, storage_element)
+    add_to_id_index(storage_element)
 
     if meta_attributes:
         arrange_first_meta_attributes(bundle_el, meta_attributes, id_provider)
@@ -912,7 +922,7 @@ def _get_container_element(bundle_el):
 def _remove_map_elements(element_list, id_to_remove_list):
     for el in element_list:
         if el.get("id", "") in id_to_remove_list:
-            el.getparent().remove(el)
+            remove_element(el)
 
 
 def _options_to_remove(options):
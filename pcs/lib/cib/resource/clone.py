@@ -28,7 +28,10 @@ from pcs.lib.cib import (
 )
 from pcs.lib.cib.const import TAG_RESOURCE_CLONE as TAG_CLONE
 from pcs.lib.cib.const import TAG_RESOURCE_MASTER as TAG_MASTER
-from pcs.lib.cib.tools import IdProvider
+from pcs.lib.cib.tools import (
+    IdProvider,
+    add_to_id_index,
+)
 from pcs.lib.pacemaker.values import (
     is_true,
     validate_id,
@@ -172,6 +175,7 @@ def append_new(
     if options:
         nvpair.append_new_meta_attributes(clone_element, options, id_provider)
 
+    add_to_id_index(clone_element)
     return clone_element
 
 
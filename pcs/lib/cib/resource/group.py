@@ -15,6 +15,7 @@ from pcs.lib.cib import (
     rule,
 )
 from pcs.lib.cib.const import TAG_RESOURCE_GROUP as TAG
+from pcs.lib.cib.tools import add_to_id_index
 
 
 def is_group(resource_el: _Element) -> bool:
@@ -22,7 +23,9 @@ def is_group(resource_el: _Element) -> bool:
 
 
 def append_new(resources_section: _Element, group_id: str) -> _Element:
-    return SubElement(resources_section, TAG, id=group_id)
+    group_element = SubElement(resources_section, TAG, id=group_id)
+    add_to_id_index(group_element)
+    return group_element
 
 
 def get_inner_resources(
@@ -12,7 +12,10 @@ from pcs.lib.cib.nvpair import (
     get_meta_attribute_value,
     has_meta_attribute,
 )
-from pcs.lib.cib.tools import does_id_exist
+from pcs.lib.cib.tools import (
+    does_id_exist,
+    remove_element,
+)
 
 # TODO pcs currently does not care about multiple meta_attributes and here
 # we don't care as well
@@ -155,8 +158,7 @@ def unset_guest(resource_element):
         )
     )
     for nvpair in guest_nvpair_list:
-        meta_attributes = nvpair.getparent()
-        meta_attributes.remove(nvpair)
+        remove_element(nvpair)
 
 
 def get_node_name_from_options(meta_options, default=None):
@@ -5,6 +5,8 @@ from typing import (
 
 from lxml.etree import _Element
 
+from pcs.lib.cib.tools import remove_element
+
 from . import (
     clone,
     group,
@@ -67,6 +69,6 @@ def move_resources_to_group(
                     clone.is_any_clone(old_grandparent)
                     and old_great_grandparent is not None
                 ):
-                    old_great_grandparent.remove(old_grandparent)
+                    remove_element(old_grandparent)
                 else:
-                    old_grandparent.remove(old_parent)
+                    remove_element(old_parent)
@@ -42,6 +42,7 @@ from pcs.lib.cib.resource.types import (
     ResourceOperationIn,
 )
 from pcs.lib.cib.tools import (
+    add_to_id_index,
     create_subelement_id,
     does_id_exist,
 )
@@ -446,6 +447,7 @@ def append_new_operation(operations_element, id_provider, options):
             op_element, nvpair_attribute_map, id_provider
         )
 
+    add_to_id_index(op_element)
     return op_element
 
 
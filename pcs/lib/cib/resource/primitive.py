@@ -35,6 +35,7 @@ from pcs.lib.cib.resource.operations import prepare as prepare_operations
 from pcs.lib.cib.resource.types import ResourceOperationIn
 from pcs.lib.cib.tools import (
     IdProvider,
+    add_to_id_index,
     are_new_role_names_supported,
     does_id_exist,
     find_element_by_tag_and_id,
@@ -291,6 +292,7 @@ def append_new(
         primitive_element, id_provider, operation_list if operation_list else []
     )
 
+    add_to_id_index(primitive_element)
     return primitive_element
 
 
@@ -20,6 +20,7 @@ from pcs.common.pacemaker.resource.relations import (
     ResourceRelationType,
 )
 from pcs.lib.cib import tools
+from pcs.lib.cib.references import ReferenceIndex
 from pcs.lib.cib.resource import common
 
 IdRelationMap = Mapping[str, RelationEntityDto]
@@ -139,7 +140,7 @@ class ResourceRelationsFetcher:
     def __init__(self, cib: _Element):
         self._cib = cib
         self._resources_section = tools.get_resources(self._cib)
-        self._constraints_section = tools.get_constraints(self._cib)
+        self._reference_index = ReferenceIndex(self._cib)
 
     def get_relations(
         self, resource_id: str
@@ -215,28 +216,22 @@ class ResourceRelationsFetcher:
         return relations
 
     def _get_ordering_coinstraints(self, resource_id: str) -> List[_Element]:
-        return cast(
-            List[_Element],
-            self._constraints_section.xpath(
-                """
-                .//rsc_order[
-                    not (descendant::resource_set)
-                    and
-                    (@first=$resource_id or @then=$resource_id)
-                ]
-                """,
-                resource_id=resource_id,
-            ),
-        )
+        return [
+            constraint_el
+            for constraint_el in self._reference_index.get_plain_constraints(
+                resource_id
+            )
+            if constraint_el.tag == "rsc_order"
+        ]
 
     def _get_ordering_set_constraints(self, resource_id: str) -> List[_Element]:
-        return cast(
-            List[_Element],
-            self._constraints_section.xpath(
-                ".//rsc_order[./resource_set/resource_ref[@id=$resource_id]]",
-                resource_id=resource_id,
-            ),
-        )
+        return [
+            constraint_el
+            for constraint_el in self._reference_index.get_set_constraints(
+                resource_id
+            )
+            if constraint_el.tag == "rsc_order"
+        ]
 
 
 def _get_resource_relation_type(res_el: _Element) -> ResourceRelationType:
@@ -1,8 +1,19 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+    cast,
+)
+
 from lxml.etree import _Element
 
 from pcs.common.types import CibRuleInEffectStatus
 from pcs.lib.external import CommandRunner
-from pcs.lib.pacemaker.live import get_rule_in_effect_status
+from pcs.lib.pacemaker.live import (
+    get_rule_in_effect_status,
+    get_rules_in_effect_status,
+    is_rule_in_effect_status_check_of_more_rules_supported,
+)
 from pcs.lib.xml_tools import etree_to_str
 
 
@@ -49,8 +60,49 @@ class RuleInEffectEvalOneByOne(RuleInEffectEval):
         return get_rule_in_effect_status(self._runner, self._cib_xml, rule_id)
 
 
-# TODO Implement this once the pacemaker tool is capable of evaluating more
-# than one rule per go. If we can eval all rules by running the tool once, it
-# would be a significant speedup comparing to running the tool for each rule.
-# class RuleInEffectEvalAllAtOnce(RuleInEffectEval):
-#     pass
+class RuleInEffectEvalAllAtOnce(RuleInEffectEval):
+    """
+    Evaluate all rules in a CIB by running a pacemaker tool once. The rules are
+    evaluated when a status of any rule is requested for the first time.
+
+    If the pacemaker tool is not capable of evaluating more than one rule per
+    go or its output cannot be processed, rules are evaluated one by one.
+    """
+
+    def __init__(self, cib: _Element, runner: CommandRunner):
+        """
+        cib -- the whole cib containing the rule expressions
+        runner -- a class for running external processes
+        """
+        self._runner = runner
+        self._cib = cib
+        self._cib_xml = etree_to_str(cib)
+        self._status_map: Optional[Dict[str, CibRuleInEffectStatus]] = None
+        self._eval_one_by_one = False
+
+    def get_rule_status(self, rule_id: str) -> CibRuleInEffectStatus:
+        if self._status_map is None:
+            self._status_map = {}
+            status_map = None
+            if is_rule_in_effect_status_check_of_more_rules_supported(
+                self._runner
+            ):
+                # Only top level rules are displayed, their sub-rules are
+                # never asked for.
+                status_map = get_rules_in_effect_status(
+                    self._runner,
+                    self._cib_xml,
+                    cast(
+                        List[str],
+                        self._cib.xpath(".//rule[not(parent::rule)]/@id"),
+                    ),
+                )
+            if status_map is None:
+                self._eval_one_by_one = True
+            else:
+                self._status_map = status_map
+        if self._eval_one_by_one and rule_id not in self._status_map:
+            self._status_map[rule_id] = get_rule_in_effect_status(
+                self._runner, self._cib_xml, rule_id
+            )
+        return self._status_map.get(rule_id, CibRuleInEffectStatus.UNKNOWN)
@@ -24,11 +24,14 @@ from pcs.common.types import (
     StringIterable,
     StringSequence,
 )
+from pcs.lib.cib.references import ReferenceIndex
 from pcs.lib.cib.resource.common import find_resources
 from pcs.lib.cib.tools import (
     ElementSearcher,
     IdProvider,
+    add_to_id_index,
     get_configuration_elements_by_id,
+    remove_element,
 )
 from pcs.lib.pacemaker.values import validate_id
 from pcs.lib.xml_tools import (
@@ -173,11 +176,9 @@ def validate_remove_tag(
             )
         ]
     report_list = []
+    reference_index = ReferenceIndex(constraint_section)
     for tag_id in to_remove_tag_list:
-        constraint_list = find_constraints_referencing_tag(
-            constraint_section,
-            tag_id,
-        )
+        constraint_list = reference_index.get_constraints(tag_id)
         if constraint_list:
             report_list.append(
                 ReportItem.error(
@@ -477,51 +478,6 @@ class ValidateTagUpdateByIds:
         return xpath_result[0] if xpath_result else None
 
 
-def find_constraints_referencing_tag(
-    constraints_section: _Element,
-    tag_id: str,
-) -> List[_Element]:
-    """
-    Find constraint elements which are referencing specified tag.
-
-    constraints_section -- element constraints
-    tag_id -- tag id
-    """
-    constraint_list = constraints_section.xpath(
-        """
-        ./rsc_colocation[
-            not (descendant::resource_set)
-            and
-            (@rsc=$tag_id or @with-rsc=$tag_id)
-        ]
-        |
-        ./rsc_location[
-            not (descendant::resource_set)
-            and
-            @rsc=$tag_id
-        ]
-        |
-        ./rsc_order[
-            not (descendant::resource_set)
-            and
-            (@first=$tag_id or @then=$tag_id)
-        ]
-        |
-        ./rsc_ticket[
-            not (descendant::resource_set)
-            and
-            @rsc=$tag_id
-        ]
-        |
-        (./rsc_colocation|./rsc_location|./rsc_order|./rsc_ticket)[
-            ./resource_set/resource_ref[@id=$tag_id]
-        ]
-        """,
-        tag_id=tag_id,
-    )
-    return cast(List[_Element], constraint_list)
-
-
 def find_tag_elements_by_ids(
     tags_section: _Element,
     tag_id_list: StringIterable,
@@ -559,6 +515,7 @@ def create_tag(
     tag_el = etree.SubElement(tags_section, TAG_TAG, id=tag_id)
     for ref_id in idref_list:
         etree.SubElement(tag_el, TAG_OBJREF, id=ref_id)
+    add_to_id_index(tag_el)
     return tag_el
 
 
@@ -571,7 +528,7 @@ def remove_tag(
     tag_elements -- tag elements to be removed
     """
     for tag in tag_elements:
-        remove_one_element(tag)
+        remove_element(tag)
 
 
 def remove_obj_ref(obj_ref_list: Iterable[_Element]) -> None:
@@ -593,7 +550,7 @@ def remove_obj_ref(obj_ref_list: Iterable[_Element]) -> None:
         remove_one_element(obj_ref)
     for tag in tag_elements:
         if len(tag.findall(TAG_OBJREF)) == 0:
-            remove_one_element(tag)
+            remove_element(tag)
 
 
 def add_obj_ref(
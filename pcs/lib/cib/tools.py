@@ -1,12 +1,18 @@
 import re
+import weakref
+from collections import defaultdict
 from typing import (
+    Dict,
+    Iterator,
     List,
+    Optional,
     Pattern,
     Set,
     Tuple,
     cast,
 )
 
+from lxml import etree
 from lxml.etree import (
     _Element,
     _ElementTree,
@@ -211,6 +217,216 @@ class ElementSearcher:
                 return
 
 
+_ID_INDEX_IGNORED_TAGS = frozenset(
+    ("acl_target", "role", "obj_ref", "resource_ref")
+)
+
+
+class IdIndex:
+    """
+    Index of ids used in a CIB, provides fast lookups of existing ids
+
+    The index is built when an id is looked up for the first time. The
+    library modifies CIB directly by lxml calls. Functions adding elements to
+    the CIB or removing elements from it tell the index about that by calling
+    add_to_id_index and remove_from_id_index. Found elements are still checked
+    to be placed in the CIB and to have the searched id, elements failing the
+    check are dropped from the index. Ids not found in the index are searched
+    for in the CIB, so that elements the index has not been told about are
+    found as well. Only found elements are cached.
+    """
+
+    def __init__(self, cib: _Element):
+        """
+        cib -- root element of a CIB to index
+        """
+        self._cib = cib
+        self._index: Optional[Dict[str, List[_Element]]] = None
+
+    @property
+    def cib(self) -> _Element:
+        return self._cib
+
+    def add_element(self, element: _Element) -> None:
+        """
+        Index an element added to the CIB and all its descendants
+
+        element -- added element
+        """
+        if self._index is not None:
+            self._add_subtree(self._index, element, include_root=True)
+
+    def remove_element(self, element: _Element) -> None:
+        """
+        Drop an element removed from the CIB and all its descendants
+
+        element -- removed element
+        """
+        if self._index is None:
+            return
+        for element_id, indexed_element in self._iter_subtree(
+            element, include_root=True
+        ):
+            element_list = self._index.get(element_id, [])
+            if indexed_element in element_list:
+                element_list.remove(indexed_element)
+            if not element_list:
+                self._index.pop(element_id, None)
+
+    def get_elements(self, element_id: str) -> List[_Element]:
+        """
+        Return configuration elements with the specified id
+
+        element_id -- id to find
+        """
+        if self._index is None:
+            self._index = defaultdict(list)
+            for section in self._cib:
+                if isinstance(section.tag, str) and section.tag != "status":
+                    self._add_subtree(self._index, section, include_root=False)
+        element_list = self._index.get(element_id, [])
+        valid_element_list = [
+            element
+            for element in element_list
+            if self._is_indexed_element_valid(element, element_id)
+        ]
+        if not valid_element_list:
+            valid_element_list = _find_configuration_elements_by_id(
+                self._cib, element_id
+            )
+        if valid_element_list:
+            self._index[element_id] = valid_element_list
+        else:
+            self._index.pop(element_id, None)
+        return list(valid_element_list)
+
+    @classmethod
+    def _add_subtree(
+        cls,
+        index: Dict[str, List[_Element]],
+        element: _Element,
+        include_root: bool,
+    ) -> None:
+        for element_id, indexed_element in cls._iter_subtree(
+            element, include_root
+        ):
+            element_list = index[element_id]
+            if indexed_element not in element_list:
+                element_list.append(indexed_element)
+
+    @staticmethod
+    def _iter_subtree(
+        element: _Element, include_root: bool
+    ) -> Iterator[Tuple[str, _Element]]:
+        if include_root:
+            element_iterator = element.iter(etree.Element)
+        else:
+            element_iterator = element.iterdescendants(etree.Element)
+        for descendant in element_iterator:
+            if descendant.tag not in _ID_INDEX_IGNORED_TAGS:
+                element_id = descendant.get("id")
+                if element_id is not None:
+                    yield element_id, descendant
+            # pacemaker creates an implicit resource for the pacemaker_remote
+            # connection named by the remote-node meta attribute
+            if descendant.tag == "nvpair" and descendant.get("name") == (
+                "remote-node"
+            ):
+                nvset = descendant.getparent()
+                primitive = nvset.getparent() if nvset is not None else None
+                if (
+                    nvset is not None
+                    and nvset.tag == "meta_attributes"
+                    and primitive is not None
+                    and primitive.tag == "primitive"
+                ):
+                    yield str(descendant.get("value", "")), primitive
+
+    def _is_indexed_element_valid(
+        self, element: _Element, element_id: str
+    ) -> bool:
+        if element.get("id") != element_id and not (
+            element.tag == "primitive"
+            and element.xpath(
+                "meta_attributes/nvpair[@name='remote-node' and @value=$id]",
+                id=element_id,
+            )
+        ):
+            return False
+        ancestor_list = list(element.iterancestors())
+        return (
+            len(ancestor_list) >= 2
+            and ancestor_list[-1] is self._cib
+            and ancestor_list[-2].tag != "status"
+        )
+
+
+# Indexes are owned by their users, e.g. LibraryEnvironment, this only allows
+# to find an index of a CIB. Keys are ids of CIB root elements, which stay
+# unique as long as the index referencing the root element exists.
+_id_index_registry: "weakref.WeakValueDictionary[int, IdIndex]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def index_ids(cib: _Element) -> IdIndex:
+    """
+    Speed up lookups of existing ids in a CIB by indexing its ids
+
+    The index is used as long as the returned object is referenced.
+
+    cib -- any element of a CIB
+    """
+    root = get_root(cib)
+    id_index = IdIndex(root)
+    _id_index_registry[id(root)] = id_index
+    return id_index
+
+
+def _get_id_index(tree: _Element) -> Optional[IdIndex]:
+    root = get_root(tree)
+    id_index = _id_index_registry.get(id(root))
+    if id_index is not None and id_index.cib is root:
+        return id_index
+    return None
+
+
+def add_to_id_index(element: _Element) -> None:
+    """
+    Let the id index of a CIB know an element has been added to the CIB
+
+    element -- element added to the CIB, its descendants are added as well
+    """
+    id_index = _get_id_index(element)
+    if id_index is not None:
+        id_index.add_element(element)
+
+
+def remove_from_id_index(element: _Element) -> None:
+    """
+    Let the id index of a CIB know an element is going to be removed
+
+    Call this before the element is removed from the CIB.
+
+    element -- element to be removed, its descendants are removed as well
+    """
+    id_index = _get_id_index(element)
+    if id_index is not None:
+        id_index.remove_element(element)
+
+
+def remove_element(element: _Element) -> None:
+    """
+    Remove an element from a CIB and from the CIB's id index
+
+    element -- element to be removed
+    """
+    parent = element.getparent()
+    if parent is not None:
+        remove_from_id_index(element)
+        parent.remove(element)
+
+
 def get_configuration_elements_by_id(
     tree: _Element, check_id: str
 ) -> List[_Element]:
@@ -223,6 +439,15 @@ def get_configuration_elements_by_id(
         searched
     check_id -- id to find
     """
+    id_index = _get_id_index(tree)
+    if id_index is not None:
+        return id_index.get_elements(check_id)
+    return _find_configuration_elements_by_id(tree, check_id)
+
+
+def _find_configuration_elements_by_id(
+    tree: _Element, check_id: str
+) -> List[_Element]:
     # do not search in /cib/status, it may contain references to previously
     # existing and deleted resources and thus preventing creating them again
 
@@ -20,8 +20,8 @@ from pcs.lib.cib import (
 )
 from pcs.lib.cib.rule import (
     RuleInEffectEval,
+    RuleInEffectEvalAllAtOnce,
     RuleInEffectEvalDummy,
-    RuleInEffectEvalOneByOne,
     RuleParseError,
     has_node_attr_expr_with_type_integer,
     has_rsc_or_op_expression,
@@ -221,7 +221,7 @@ def _get_rule_evaluator(
 ) -> RuleInEffectEval:
     if evaluate_expired:
         if has_rule_in_effect_status_tool():
-            return RuleInEffectEvalOneByOne(cib, runner)
+            return RuleInEffectEvalAllAtOnce(cib, runner)
         report_processor.report(
             ReportItem.warning(
                 reports.messages.RuleInEffectStatusDetectionNotSupported()
@@ -5,6 +5,7 @@ import time
 from typing import (
     Any,
     Collection,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -73,7 +74,10 @@ from pcs.lib.communication.sbd import (
     EnableSbdService,
     SetSbdConfig,
 )
-from pcs.lib.communication.tools import AllSameDataMixin
+from pcs.lib.communication.tools import (
+    AllSameDataMixin,
+    RunRemotelyPipeline,
+)
 from pcs.lib.communication.tools import run as run_com
 from pcs.lib.communication.tools import run_and_raise
 from pcs.lib.corosync import (
@@ -340,10 +344,15 @@ def setup(
     # Validation done. If errors occurred, an exception has been raised and we
     # don't get below this line.
 
+    # Prepare the nodes for the cluster. The steps do not depend on results of
+    # the other nodes, so each node proceeds to the next step as soon as its
+    # previous step succeeds. If a step fails on a node, the other nodes may
+    # have already done the following steps of the pipeline.
+    com_cmd_list: List[AllSameDataMixin] = []
+
     # Destroy cluster on all nodes.
     com_cmd = cluster.Destroy(env.report_processor)
-    com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    com_cmd_list.append(com_cmd)
 
     # Distribute auth tokens.
     com_cmd = UpdateKnownHosts(
@@ -353,8 +362,7 @@ def setup(
         ),
         known_hosts_to_remove=[],
     )
-    com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    com_cmd_list.append(com_cmd)
 
     # TODO This should be in the file distribution call but so far we don't
     # have a call which allows to save and delete files at the same time.
@@ -362,9 +370,16 @@ def setup(
         env.report_processor,
         {"pcsd settings": {"type": "pcsd_settings"}},
     )
-    com_cmd.set_targets(target_list)
-    run_and_raise(env.get_node_communicator(), com_cmd)
+    com_cmd_list.append(com_cmd)
 
+    for com_cmd in com_cmd_list:
+        com_cmd.set_targets(target_list)
+    run_and_raise(
+        env.get_node_communicator(), RunRemotelyPipeline(com_cmd_list)
+    )
+
+    # Keys and certificates are sent only once all the nodes have been
+    # prepared, so that no node gets them if the preparation failed.
     if not no_keys_sync:
         # Distribute configuration files except corosync.conf. Sending
         # corosync.conf serves as a "commit" as its presence on a node marks the
@@ -388,13 +403,6 @@ def setup(
 
         # Distribute and reload pcsd SSL certificate
         if sync_ssl_certs:
-            report_processor.report(
-                ReportItem.info(
-                    reports.messages.PcsdSslCertAndKeyDistributionStarted(
-                        sorted([target.label for target in target_list])
-                    )
-                )
-            )
             # Local certificate and key cannot be used because the local node
             # may not be a part of the new cluter at all.
             ssl_key_raw = ssl.generate_key()
@@ -1187,11 +1195,14 @@ def add_nodes(
                     device_list=new_node["devices"],
                 ),
             )
-        run_and_raise(env.get_node_communicator(), com_cmd_sbd_cfg)
 
+        # each node enables sbd as soon as it has accepted its sbd config
         com_cmd = EnableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
+        run_and_raise(
+            env.get_node_communicator(),
+            RunRemotelyPipeline([com_cmd_sbd_cfg, com_cmd]),
+        )
     else:
         com_cmd = DisableSbdService(env.report_processor)
         com_cmd.set_targets(new_nodes_target_list)
@@ -1304,27 +1315,8 @@ def add_nodes(
                 )
             )
 
-    # stop here if one of the files could not be loaded and it was not forced
-    if report_processor.has_errors:
-        raise LibraryError()
-
-    if files_action:
-        com_cmd = DistributeFilesWithoutForces(
-            env.report_processor, files_action
-        )
-        com_cmd.set_targets(new_nodes_target_list)
-        run_and_raise(env.get_node_communicator(), com_cmd)
-
-    # Distribute and reload pcsd SSL certificate
+    # pcsd SSL certificate and key
     if sync_ssl_certs:
-        report_processor.report(
-            ReportItem.info(
-                reports.messages.PcsdSslCertAndKeyDistributionStarted(
-                    sorted([target.label for target in new_nodes_target_list])
-                )
-            )
-        )
-
         try:
             with open(settings.pcsd_cert_location, "r") as file:
                 ssl_cert = file.read()
@@ -1353,9 +1345,20 @@ def add_nodes(
                     )
                 )
             )
-        if report_processor.has_errors:
-            raise LibraryError()
 
+    # stop here if one of the files could not be loaded and it was not forced
+    if report_processor.has_errors:
+        raise LibraryError()
+
+    if files_action:
+        com_cmd = DistributeFilesWithoutForces(
+            env.report_processor, files_action
+        )
+        com_cmd.set_targets(new_nodes_target_list)
+        run_and_raise(env.get_node_communicator(), com_cmd)
+
+    # Distribute and reload pcsd SSL certificate
+    if sync_ssl_certs:
         com_cmd = SendPcsdSslCertAndKey(env.report_processor, ssl_cert, ssl_key)
         com_cmd.set_targets(new_nodes_target_list)
         run_and_raise(env.get_node_communicator(), com_cmd)
@@ -1427,6 +1430,7 @@ def _start_cluster(
     timeout = int(
         settings.default_request_timeout * math.ceil(len(target_list) / 8.0)
     )
+    started_at = time.time()
     com_cmd = StartCluster(report_processor)
     com_cmd.set_targets(target_list)
     run_and_raise(
@@ -1435,11 +1439,19 @@ def _start_cluster(
     if wait_timeout is not False:
         if report_processor.report_list(
             _wait_for_pacemaker_to_start(
-                communicator_factory.get_communicator(),
+                # Nodes respond once pacemaker has started on them, so the
+                # requests must not time out sooner.
+                communicator_factory.get_communicator(
+                    request_timeout=(
+                        settings.node_startup_wait_request_seconds
+                        + settings.default_request_timeout
+                    )
+                ),
                 report_processor,
                 target_list,
                 # wait_timeout is either None or a timeout
                 timeout=wait_timeout,
+                started_at=started_at,
             )
         ).has_errors:
             raise LibraryError()
@@ -1450,7 +1462,21 @@ def _wait_for_pacemaker_to_start(
     report_processor: ReportProcessor,
     target_list,
     timeout=None,
+    started_at=None,
 ):
+    """
+    Wait for pacemaker to fully start on nodes, return reports of failures
+
+    Nodes are asked to respond once pacemaker has started on them. Nodes
+    running older pcsd, which respond right away, and nodes which could not be
+    connected are checked again after an interval.
+
+    node_communicator -- communicator with request timeout long enough for the
+        nodes to wait for pacemaker
+    target_list -- nodes to wait for
+    timeout -- time to wait in seconds, defaults to 15 minutes
+    started_at -- time when the nodes were started, to report their startup time
+    """
     timeout = 60 * 15 if timeout is None else timeout
     interval = 2
     stop_at = time.time() + timeout
@@ -1469,11 +1495,14 @@ def _wait_for_pacemaker_to_start(
                 ReportItem.error(reports.messages.WaitForNodeStartupTimedOut())
             )
             break
-        time.sleep(interval)
-        com_cmd = CheckPacemakerStarted(report_processor)
+        com_cmd = CheckPacemakerStarted(
+            report_processor, wait_until=stop_at, started_at=started_at
+        )
         com_cmd.set_targets(target_list)
         target_list = run_com(node_communicator, com_cmd)
         has_errors = has_errors or com_cmd.has_errors
+        if target_list:
+            time.sleep(interval)
 
     if error_report_list or has_errors:
         error_report_list.append(
@@ -127,7 +127,7 @@ def set_properties(
     cluster_properties -- dictionary of cluster property names and values
     force_flags -- list of flags codes
     """
-    cib = env.get_cib()
+    cib = env.get_cib(load_status=False)
     id_provider = IdProvider(cib)
     force = reports.codes.FORCE in force_flags
     cluster_property_set_el = (
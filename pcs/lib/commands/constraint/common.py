@@ -20,7 +20,7 @@ def create_with_set(
     constraint_options,
     resource_in_clone_alowed=False,
     duplication_alowed=False,
-    duplicate_check=None,
+    get_duplicate_signature=None,
 ):
     """
     string tag_name is constraint tag name
@@ -34,10 +34,10 @@ def create_with_set(
     bool resource_in_clone_alowed flag for allowing to reference id which is
         in tag clone or master
     bool duplication_alowed flag for allowing create duplicate element
-    callable duplicate_check takes two elements and decide if they are
-        duplicates
+    callable get_duplicate_signature takes an element and returns its
+        hashable signature, elements with equal signatures are duplicates
     """
-    cib = env.get_cib()
+    cib = env.get_cib(load_status=False)
 
     find_valid_resource_id = partial(
         constraint.find_valid_resource_id,
@@ -59,14 +59,14 @@ def create_with_set(
         ],
     )
 
-    if not duplicate_check:
-        duplicate_check = constraint.have_duplicate_resource_sets
+    if not get_duplicate_signature:
+        get_duplicate_signature = constraint.get_resource_sets_signature
 
     constraint.check_is_without_duplication(
         env.report_processor,
         constraint_section,
         constraint_element,
-        are_duplicate=duplicate_check,
+        get_signature=get_duplicate_signature,
         export_element=constraint.export_with_set,
         duplication_allowed=duplication_alowed,
     )
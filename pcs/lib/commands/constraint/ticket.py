@@ -23,7 +23,7 @@ create_with_set = partial(
     common.create_with_set,
     ticket.TAG_NAME,
     ticket.prepare_options_with_set,
-    duplicate_check=ticket.are_duplicate_with_resource_set,
+    get_duplicate_signature=ticket.get_signature_with_resource_set,
 )
 
 
@@ -45,7 +45,7 @@ def create(
     callable duplicate_check takes two elements and decide if they are
         duplicates
     """
-    cib = env.get_cib()
+    cib = env.get_cib(load_status=False)
 
     options = ticket.prepare_options_plain(
         cib,
@@ -64,7 +64,7 @@ def create(
         env.report_processor,
         constraint_section,
         constraint_element,
-        are_duplicate=ticket.get_duplicit_checker_callback(
+        get_signature=ticket.get_duplicit_signature_callback(
             are_new_role_names_supported(constraint_section)
         ),
         export_element=constraint.export_plain,
@@ -81,7 +81,7 @@ def remove(env, ticket_key, resource_id):
     ref is removed. If resource is alone in resource set whole constraint is
     removed.
     """
-    constraint_section = get_constraints(env.get_cib())
+    constraint_section = get_constraints(env.get_cib(load_status=False))
     any_plain_removed = ticket.remove_plain(
         constraint_section, ticket_key, resource_id
     )
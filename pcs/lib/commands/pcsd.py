@@ -77,14 +77,6 @@ def synchronize_ssl_certificate(env: LibraryEnvironment, skip_offline=False):
     if report_processor.has_errors:
         raise LibraryError()
 
-    env.report_processor.report(
-        ReportItem.info(
-            reports.messages.PcsdSslCertAndKeyDistributionStarted(
-                sorted([target.label for target in target_list])
-            )
-        )
-    )
-
     com_cmd = SendPcsdSslCertAndKey(env.report_processor, ssl_cert, ssl_key)
     com_cmd.set_targets(target_list)
     run_and_raise(env.get_node_communicator(), com_cmd)
@@ -1,4 +1,5 @@
 # pylint: disable=too-many-lines
+import time
 from contextlib import contextmanager
 from functools import partial
 from typing import (
@@ -27,6 +28,7 @@ from pcs.common.interface import dto
 from pcs.common.pacemaker.resource.list import ListCibResourcesDto
 from pcs.common.reports import ReportItemList
 from pcs.common.reports.item import ReportItem
+from pcs.common.str_tools import format_list
 from pcs.common.tools import (
     Version,
     timeout_to_seconds,
@@ -67,12 +69,14 @@ from pcs.lib.pacemaker.live import (
     resource_move,
     resource_unmove_unban,
     simulate_cib,
+    try_wait_for_idle,
 )
 from pcs.lib.pacemaker.state import (
     ResourceNotFound,
     ensure_resource_state,
     get_resource_state,
     info_resource_state,
+    is_resource_in_expected_state,
     is_resource_managed,
 )
 from pcs.lib.pacemaker.values import (
@@ -107,7 +111,7 @@ def resource_environment(
     required_cib_version=None,
 ):
     wait_timeout = env.ensure_wait_satisfiable(wait)
-    yield get_resources(env.get_cib(required_cib_version))
+    yield get_resources(env.get_cib(required_cib_version, load_status=False))
     _push_cib_wait(
         env, wait_timeout, wait_for_resource_ids, resource_state_reporter
     )
@@ -146,6 +150,82 @@ def _push_cib_wait(
     )
 
 
+def _push_cib_wait_for_resources(
+    env: LibraryEnvironment,
+    wait_timeout: int,
+    resource_ids: StringCollection,
+    expected_running: bool,
+) -> None:
+    """
+    Push a CIB and wait for specified resources to get to the expected state
+
+    Unlike waiting for the whole cluster to settle down, only the specified
+    resources are watched. Changes of unrelated resources do not prolong the
+    wait. Results are reported for each resource as soon as it is done. If the
+    cluster settles down before all the resources are done, the remaining
+    resources will not get to the expected state and their state is reported.
+
+    wait_timeout -- wait timeout in seconds, if less than 0 wait will be
+        skipped, if 0 wait until the cluster settles down
+    resource_ids -- ids of resources to wait for
+    expected_running -- True if the resources are expected to run
+    """
+    env.push_cib()
+    if wait_timeout < 0:
+        return
+    interval = 1
+    stop_at = time.monotonic() + wait_timeout
+    env.report_processor.report(
+        ReportItem.info(reports.messages.WaitForIdleStarted(wait_timeout))
+    )
+    pending_ids = list(resource_ids)
+    cluster_idle = False
+    while True:
+        state = env.get_cluster_state()
+        still_pending_ids = []
+        for res_id in pending_ids:
+            if is_resource_in_expected_state(state, res_id, expected_running):
+                env.report_processor.report(
+                    ensure_resource_state(expected_running, state, res_id)
+                )
+            else:
+                still_pending_ids.append(res_id)
+        pending_ids = still_pending_ids
+        if not pending_ids:
+            break
+        if cluster_idle:
+            # No action is pending in the cluster, the resources are not going
+            # to change their state.
+            env.report_processor.report_list(
+                [
+                    ensure_resource_state(expected_running, state, res_id)
+                    for res_id in pending_ids
+                ]
+            )
+            break
+        if wait_timeout > 0 and time.monotonic() >= stop_at:
+            env.report_processor.report_list(
+                [
+                    ensure_resource_state(expected_running, state, res_id)
+                    for res_id in pending_ids
+                ]
+                + [
+                    ReportItem.error(
+                        reports.messages.WaitForIdleTimedOut(
+                            "Resources not in the expected state: {0}".format(
+                                format_list(pending_ids)
+                            )
+                        )
+                    )
+                ]
+            )
+            break
+        # pause before the next check of the resources
+        cluster_idle = try_wait_for_idle(env.cmd_runner(), interval)
+    if env.report_processor.has_errors:
+        raise LibraryError()
+
+
 def _ensure_disabled_after_wait(disabled_after_wait):
     def inner(state, resource_id):
         return ensure_resource_state(
@@ -399,7 +479,11 @@ def create(
         to validate instance attributes
     """
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner,
+        env.report_processor,
+        env.get_resource_agent_metadata_cache(),
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -504,7 +588,11 @@ def create_as_clone(
         to validate instance attributes
     """
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner,
+        env.report_processor,
+        env.get_resource_agent_metadata_cache(),
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -650,7 +738,11 @@ def create_in_group(
         to validate instance attributes
     """
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner,
+        env.report_processor,
+        env.get_resource_agent_metadata_cache(),
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -793,7 +885,11 @@ def create_into_bundle(
         to validate instance attributes
     """
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner,
+        env.report_processor,
+        env.get_resource_agent_metadata_cache(),
+    )
     resource_agent = _get_agent_facade(
         env.report_processor,
         runner,
@@ -1199,11 +1295,8 @@ def disable(
     """
     wait_timeout = env.ensure_wait_satisfiable(wait)
     _disable_validate_and_edit_cib(env, env.get_cib(), resource_or_tag_ids)
-    _push_cib_wait(
-        env,
-        wait_timeout,
-        resource_or_tag_ids,
-        _ensure_disabled_after_wait(True),
+    _push_cib_wait_for_resources(
+        env, wait_timeout, resource_or_tag_ids, expected_running=False
     )
 
 
@@ -1277,11 +1370,11 @@ def disable_safe(
         if env.report_processor.has_errors:
             raise LibraryError()
 
-    _push_cib_wait(
+    _push_cib_wait_for_resources(
         env,
         wait_timeout,
-        disabled_resource_id_set,
-        _ensure_disabled_after_wait(True),
+        sorted(disabled_resource_id_set),
+        expected_running=False,
     )
 
 
@@ -1356,11 +1449,11 @@ def enable(
         )
     ).has_errors:
         raise LibraryError()
-    _push_cib_wait(
+    _push_cib_wait_for_resources(
         env,
         wait_timeout,
         [str(el.get("id", "")) for el in resource_el_list],
-        _ensure_disabled_after_wait(False),
+        expected_running=True,
     )
 
 
@@ -7,6 +7,7 @@ from typing import (
     cast,
 )
 
+from pcs import settings
 from pcs.common.interface.dto import to_dict
 from pcs.common.pacemaker.resource.operations import (
     OCF_CHECK_LEVEL_INSTANCE_ATTRIBUTE_NAME,
@@ -31,6 +32,7 @@ from pcs.lib.resource_agent import (
     ResourceAgentError,
     ResourceAgentFacadeFactory,
     ResourceAgentMetadata,
+    ResourceAgentMetadataCache,
     ResourceAgentMetadataDto,
     ResourceAgentName,
     ResourceAgentNameDto,
@@ -115,6 +117,7 @@ def list_agents(
     return _complete_agent_list(
         runner,
         lib_env.report_processor,
+        lib_env.get_resource_agent_metadata_cache(),
         sorted(agent_names, key=lambda item: item.full_name),
         describe,
         search,
@@ -211,38 +214,52 @@ def _agent_metadata_to_dict(
 def _complete_agent_list(
     runner: CommandRunner,
     report_processor: ReportProcessor,
+    metadata_cache: Optional[ResourceAgentMetadataCache],
     agent_names: Iterable[ResourceAgentName],
     describe: bool,
     search: Optional[str],
 ) -> List[Dict[str, Any]]:
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
     search_lower = search.lower() if search else None
+    agent_names = [
+        name
+        for name in agent_names
+        if not search_lower or search_lower in name.full_name.lower()
+    ]
+    if not describe:
+        return [
+            _agent_metadata_to_dict(name_to_void_metadata(name))
+            for name in agent_names
+        ]
+
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, report_processor, metadata_cache
+    )
     agent_list = []
-    for name in agent_names:
-        if search_lower and search_lower not in name.full_name.lower():
-            continue
-        try:
-            metadata = (
-                agent_factory.facade_from_parsed_name(name).metadata
-                if describe
-                else name_to_void_metadata(name)
-            )
-            agent_list.append(_agent_metadata_to_dict(metadata, describe))
-        except ResourceAgentError as e:
+    for _, facade_or_error in agent_factory.facades_from_parsed_names(
+        agent_names, settings.resource_agent_metadata_load_workers
+    ):
+        if isinstance(facade_or_error, ResourceAgentError):
             report_processor.report(
                 resource_agent_error_to_report_item(
-                    e, ReportItemSeverity.warning()
+                    facade_or_error, ReportItemSeverity.warning()
                 )
             )
+            continue
+        agent_list.append(
+            _agent_metadata_to_dict(facade_or_error.metadata, describe)
+        )
     return agent_list
 
 
 def _get_agent_metadata(
     runner: CommandRunner,
     report_processor: ReportProcessor,
+    metadata_cache: Optional[ResourceAgentMetadataCache],
     agent_name: ResourceAgentNameDto,
 ) -> ResourceAgentMetadata:
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, report_processor, metadata_cache
+    )
     try:
         return agent_factory.facade_from_parsed_name(
             ResourceAgentName.from_dto(agent_name)
@@ -263,6 +280,7 @@ def get_agent_metadata(
     return _get_agent_metadata(
         lib_env.cmd_runner(),
         lib_env.report_processor,
+        lib_env.get_resource_agent_metadata_cache(),
         agent_name,
     ).to_dto()
 
@@ -279,7 +297,9 @@ def describe_agent(
     """
     runner = lib_env.cmd_runner()
     report_processor = lib_env.report_processor
-    agent_factory = ResourceAgentFacadeFactory(runner, report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner, report_processor, lib_env.get_resource_agent_metadata_cache()
+    )
     try:
         found_name = (
             split_resource_agent_name(agent_name)
@@ -305,7 +325,10 @@ def get_agent_default_operations(
     report_list, operation_list = uniquify_operations_intervals(
         get_default_operations(
             _get_agent_metadata(
-                lib_env.cmd_runner(), lib_env.report_processor, agent_name
+                lib_env.cmd_runner(),
+                lib_env.report_processor,
+                lib_env.get_resource_agent_metadata_cache(),
+                agent_name,
             ),
             necessary_only,
         )
@@ -325,3 +348,12 @@ def get_structured_agent_name(
     except ResourceAgentError as e:
         lib_env.report_processor.report(resource_agent_error_to_report_item(e))
         raise LibraryError() from e
+
+
+def clear_metadata_cache(lib_env: LibraryEnvironment) -> None:
+    """
+    Remove all cached resource and stonith agents metadata
+    """
+    metadata_cache = lib_env.get_resource_agent_metadata_cache()
+    if metadata_cache is not None:
+        metadata_cache.clear()
@@ -1,9 +1,18 @@
 import os.path
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+)
 from typing import (
+    Any,
+    Callable,
     Iterable,
     List,
     Mapping,
     NamedTuple,
+    Optional,
+    TypeVar,
     cast,
 )
 
@@ -14,7 +23,6 @@ from pcs.common import (
     file_type_codes,
     reports,
 )
-from pcs.common.node_communicator import Communicator
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
 from pcs.common.services.interfaces import ServiceManagerInterface
@@ -33,6 +41,7 @@ from pcs.lib.cib.tools import (
 )
 from pcs.lib.communication.nodes import CheckReachability
 from pcs.lib.communication.tools import run as run_communication
+from pcs.lib.corosync.config_facade import ConfigFacade as CorosyncConfigFacade
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
 from pcs.lib.node import get_existing_nodes_names
@@ -45,6 +54,8 @@ from pcs.lib.pacemaker.live import (
 from pcs.lib.resource_agent.const import STONITH_ACTION_REPLACED_BY
 from pcs.lib.sbd import get_sbd_service_name
 
+T = TypeVar("T")
+
 
 class _ServiceStatus(NamedTuple):
     service: str
@@ -63,6 +74,37 @@ def pacemaker_status_xml(env: LibraryEnvironment) -> str:
     raise LibraryError(output=stdout)
 
 
+class _SequentialExecutor(Executor):
+    """
+    Run each submitted call in the calling thread right away. Once a call
+    fails, calls submitted after it are not run and their futures are
+    cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._failed = False
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> "Future[T]":
+        future: "Future[T]" = Future()
+        if self._failed:
+            future.cancel()
+            return future
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:  # pylint: disable=broad-except
+            self._failed = True
+            future.set_exception(e)
+        return future
+
+
+def _get_probe_executor() -> Executor:
+    if settings.cluster_status_probe_workers < 2:
+        return _SequentialExecutor()
+    return ThreadPoolExecutor(max_workers=settings.cluster_status_probe_workers)
+
+
 def full_cluster_status_plaintext(
     env: LibraryEnvironment,
     hide_inactive_resources: bool = False,
@@ -103,45 +145,63 @@ def full_cluster_status_plaintext(
     runner = env.cmd_runner()
     report_processor = env.report_processor
     live = env.is_cib_live and env.is_corosync_conf_live
+    service_manager = env.service_manager if live else None
+    corosync_conf: Optional[CorosyncConfigFacade] = None
+    node_name_list: List[str] = []
+    node_reachability: Mapping[str, str] = {}
     is_sbd_running = False
 
-    # load status, cib, corosync.conf
-    status_text, warning_list = get_cluster_status_text(
-        runner, hide_inactive_resources, verbose
-    )
-    corosync_conf = None
-    # If we are live on a remote node, we have no corosync.conf.
-    # TODO Use the new file framework so the path is not exposed.
-    if not live or os.path.exists(settings.corosync_conf_file):
-        corosync_conf = env.get_corosync_conf()
-    cib = env.get_cib()
-    if verbose:
-        (
-            ticket_status_text,
-            ticket_status_stderr,
-            ticket_status_retval,
-        ) = get_ticket_status_text(runner)
-    # get extra info if live
-    if live:
-        service_manager = env.service_manager
-        try:
-            is_sbd_running = service_manager.is_running(
-                get_sbd_service_name(service_manager)
+    # Getting cluster status, ticket status, local services status and nodes
+    # reachability means running external processes and sending requests to
+    # nodes. These do not depend on each other, so they run concurrently. The
+    # environment is not thread-safe, so everything else, including loading
+    # CIB and corosync.conf, is done in the calling thread meanwhile.
+    with _get_probe_executor() as executor:
+        status_future = executor.submit(
+            get_cluster_status_text, runner, hide_inactive_resources, verbose
+        )
+        if verbose:
+            ticket_future = executor.submit(get_ticket_status_text, runner)
+        if service_manager:
+            services_future = executor.submit(
+                _get_local_services_status, service_manager
             )
-        except LibraryError:
-            pass
-        local_services_status = _get_local_services_status(service_manager)
-        if verbose and corosync_conf:
+        # If we are live on a remote node, we have no corosync.conf.
+        # TODO Use the new file framework so the path is not exposed.
+        if not live or os.path.exists(settings.corosync_conf_file):
+            corosync_conf = env.get_corosync_conf()
+        if live and verbose and corosync_conf:
             node_name_list, node_names_report_list = get_existing_nodes_names(
                 corosync_conf
             )
             report_processor.report_list(node_names_report_list)
-            node_reachability = _get_node_reachability(
-                env.get_node_target_factory(),
+            reachability_future = executor.submit(
+                run_communication,
                 env.get_node_communicator(),
-                report_processor,
-                node_name_list,
+                _get_node_reachability_cmd(
+                    env.get_node_target_factory(),
+                    report_processor,
+                    node_name_list,
+                ),
             )
+        cib = env.get_cib()
+    status_text, warning_list = status_future.result()
+    if verbose:
+        (
+            ticket_status_text,
+            ticket_status_stderr,
+            ticket_status_retval,
+        ) = ticket_future.result()
+    if service_manager:
+        local_services_status = services_future.result()
+        sbd_service_name = get_sbd_service_name(service_manager)
+        is_sbd_running = any(
+            status.running
+            for status in local_services_status
+            if status.service == sbd_service_name
+        )
+    if live and verbose and corosync_conf:
+        node_reachability = reachability_future.result()
 
     # check stonith configuration
     warning_list = list(warning_list)
@@ -293,20 +353,22 @@ def _get_local_services_status(
         ("pcsd", True),
         (get_sbd_service_name(service_manager), False),
     ]
-    service_status_list = []
-    for service, display_always in service_def:
-        try:
-            service_status_list.append(
-                _ServiceStatus(
-                    service,
-                    display_always,
-                    service_manager.is_enabled(service),
-                    service_manager.is_running(service),
-                )
-            )
-        except LibraryError:
-            pass
-    return service_status_list
+    try:
+        services_status = service_manager.get_services_status(
+            [service for service, _ in service_def]
+        )
+    except LibraryError:
+        return []
+    return [
+        _ServiceStatus(
+            service,
+            display_always,
+            services_status[service].enabled,
+            services_status[service].running,
+        )
+        for service, display_always in service_def
+        if service in services_status
+    ]
 
 
 def _format_local_services_status(
@@ -323,12 +385,11 @@ def _format_local_services_status(
     ]
 
 
-def _get_node_reachability(
+def _get_node_reachability_cmd(
     node_target_factory: NodeTargetLibFactory,
-    node_communicator: Communicator,
     report_processor: ReportProcessor,
     node_name_list: StringSequence,
-) -> Mapping[str, str]:
+) -> CheckReachability:
     # we are not interested in reports telling the user which nodes are
     # unknown since we display that info in the list of nodes
     (
@@ -337,7 +398,7 @@ def _get_node_reachability(
     ) = node_target_factory.get_target_list_with_reports(node_name_list)
     com_cmd = CheckReachability(report_processor)
     com_cmd.set_targets(target_list)
-    return run_communication(node_communicator, com_cmd)
+    return com_cmd
 
 
 def _format_node_reachability(
@@ -142,7 +142,11 @@ def create(
         to validate instance attributes
     """
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner,
+        env.report_processor,
+        env.get_resource_agent_metadata_cache(),
+    )
     stonith_agent = _get_agent_facade(
         env.report_processor,
         agent_factory,
@@ -231,7 +235,11 @@ def create_in_group(
         to validate instance attributes
     """
     runner = env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner,
+        env.report_processor,
+        env.get_resource_agent_metadata_cache(),
+    )
     stonith_agent = _get_agent_facade(
         env.report_processor,
         agent_factory,
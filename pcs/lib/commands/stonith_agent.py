@@ -39,6 +39,7 @@ def list_agents(
     return _complete_agent_list(
         runner,
         lib_env.report_processor,
+        lib_env.get_resource_agent_metadata_cache(),
         sorted(
             _get_agent_names(runner, StandardProviderTuple("stonith")),
             key=lambda item: item.full_name,
@@ -59,7 +60,11 @@ def describe_agent(
     agent_name -- name of the agent (not containing "stonith:" prefix)
     """
     runner = lib_env.cmd_runner()
-    agent_factory = ResourceAgentFacadeFactory(runner, lib_env.report_processor)
+    agent_factory = ResourceAgentFacadeFactory(
+        runner,
+        lib_env.report_processor,
+        lib_env.get_resource_agent_metadata_cache(),
+    )
     try:
         if ":" in agent_name:
             raise InvalidResourceAgentName(agent_name)
@@ -1,7 +1,13 @@
 import json
+import math
+import time
 
+from pcs import settings
 from pcs.common import reports
-from pcs.common.node_communicator import RequestData
+from pcs.common.node_communicator import (
+    Request,
+    RequestData,
+)
 from pcs.common.reports import ReportItemSeverity
 from pcs.common.reports import codes as report_codes
 from pcs.common.reports.item import ReportItem
@@ -15,6 +21,7 @@ from pcs.lib.communication.tools import (
     SkipOfflineMixin,
 )
 from pcs.lib.node_communication import response_to_report_item
+from pcs.lib.pacemaker.live import is_node_status_started
 
 
 class GetOnlineTargets(
@@ -419,10 +426,45 @@ class EnableCluster(
 class CheckPacemakerStarted(
     AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase
 ):
+    """
+    Check that pacemaker has fully started on nodes
+
+    If a deadline is specified, nodes are asked to respond once pacemaker has
+    started on them or the deadline passed, each node is asked again right
+    away until then. Nodes not capable of waiting for pacemaker to start and
+    nodes which could not be connected are returned from on_complete so that
+    they can be checked again later.
+    """
+
     _not_yet_started_target_list = None
 
+    def __init__(self, report_processor, wait_until=None, started_at=None):
+        """
+        wait_until -- time (as in time.time) until nodes should wait for
+            pacemaker to start, do not wait if None
+        started_at -- time (as in time.time) when the nodes were started, used
+            to report startup time of the nodes
+        """
+        super().__init__(report_processor)
+        self._wait_until = wait_until
+        self._started_at = started_at
+
     def _get_request_data(self):
-        return RequestData("remote/pacemaker_node_status")
+        if self._wait_until is None:
+            return RequestData("remote/pacemaker_node_status")
+        # Waiting is limited in each request, so that the request does not
+        # time out and nodes which crashed are detected.
+        wait = min(
+            max(0, math.ceil(self._wait_until - time.time())),
+            settings.node_startup_wait_request_seconds,
+        )
+        return RequestData(
+            "remote/pacemaker_node_status", [("wait", str(wait))]
+        )
+
+    def _prepare_initial_requests(self):
+        request_data = self._get_request_data()
+        return [Request(target, request_data) for target in self._target_list]
 
     def _process_response(self, response):
         report = response_to_report_item(response)
@@ -430,18 +472,26 @@ class CheckPacemakerStarted(
         if report is None:
             try:
                 parsed_response = json.loads(response.data)
-                # If the node is offline, we only get the "offline" key. Asking
-                # for any other in that case results in KeyError which is not
-                # what we want.
-                if parsed_response.get(
-                    "pending", True
-                ) or not parsed_response.get("online", False):
+                if not is_node_status_started(parsed_response):
+                    if (
+                        parsed_response.get("waited", False)
+                        and self._wait_until is not None
+                        and time.time() < self._wait_until
+                    ):
+                        return [Request(target, self._get_request_data())]
                     self._not_yet_started_target_list.append(target)
-                    return
+                    return None
                 report = ReportItem.info(
-                    reports.messages.ClusterStartSuccess(target.label)
+                    reports.messages.ClusterStartSuccess(
+                        target.label,
+                        (
+                            None
+                            if self._started_at is None
+                            else round(time.time() - self._started_at)
+                        ),
+                    )
                 )
-            except (json.JSONDecodeError, KeyError):
+            except (json.JSONDecodeError, AttributeError):
                 report = ReportItem.error(
                     reports.messages.InvalidResponseFormat(target.label)
                 )
@@ -453,6 +503,7 @@ class CheckPacemakerStarted(
                     response, severity=ReportItemSeverity.WARNING
                 )
         self._report(report)
+        return None
 
     def before(self):
         self._not_yet_started_target_list = []
@@ -551,6 +602,15 @@ class SendPcsdSslCertAndKey(
             reports.messages.PcsdSslCertAndKeySetSuccess(node_label)
         )
 
+    def before(self):
+        self._report(
+            ReportItem.info(
+                reports.messages.PcsdSslCertAndKeyDistributionStarted(
+                    sorted(self._target_label_list)
+                )
+            )
+        )
+
 
 def _force(force_code, is_forced):
     if is_forced:
@@ -79,6 +79,104 @@ def run_and_raise(communicator, cmd):
     return to_return
 
 
+class RunRemotelyPipeline(CommunicationCommandInterface):
+    """
+    Communication command running a sequence of communication commands on each
+    target independently. Once a request of a command to a target finishes, a
+    request of the next command is sent to the target right away, without
+    waiting for the other targets to finish the command.
+
+    Once an error occurs in any of the commands, no more requests are sent.
+    Responses of requests which have been sent already are processed normally.
+    Method before() of a command is called when the first request of the
+    command is about to be sent. Commands which have not sent any request are
+    not run at all.
+
+    The commands are supposed to send at most one initial request to each
+    target and any further requests only to the target which responded.
+    Requests of a command to a target must not depend on results of the command
+    on other targets, so commands with the one-by-one strategy cannot be used
+    in a pipeline.
+    """
+
+    def __init__(self, cmd_list):
+        """
+        list cmd_list -- CommunicationCommandInterface objects to run in order
+        """
+        self._cmd_list = list(cmd_list)
+        self._started_cmd_list = [False] * len(self._cmd_list)
+        self._request_map_list = []
+        # index of a command currently running on a target
+        self._target_cmd_index = {}
+        # number of unfinished requests of the current command of a target
+        self._target_pending = {}
+
+    def _next_request_list(self, target_label, cmd_index):
+        for index in range(cmd_index, len(self._cmd_list)):
+            request = self._request_map_list[index].get(target_label)
+            if request is None:
+                continue
+            if not self._started_cmd_list[index]:
+                self._started_cmd_list[index] = True
+                self._cmd_list[index].before()
+            self._target_cmd_index[target_label] = index
+            self._target_pending[target_label] = 1
+            return [request]
+        return []
+
+    def get_initial_request_list(self):
+        self._request_map_list = [
+            {
+                request.target.label: request
+                for request in cmd.get_initial_request_list()
+            }
+            for cmd in self._cmd_list
+        ]
+        request_list = []
+        for target_label in dict.fromkeys(
+            target_label
+            for request_map in self._request_map_list
+            for target_label in request_map
+        ):
+            request_list.extend(self._next_request_list(target_label, 0))
+        return request_list
+
+    def on_response(self, response):
+        target_label = response.request.target.label
+        cmd_index = self._target_cmd_index[target_label]
+        extra_request_list = list(
+            self._cmd_list[cmd_index].on_response(response) or []
+        )
+        self._target_pending[target_label] += len(extra_request_list) - 1
+        if self._target_pending[target_label] > 0 or self.has_errors:
+            return extra_request_list
+        return extra_request_list + self._next_request_list(
+            target_label, cmd_index + 1
+        )
+
+    def on_complete(self):
+        """
+        Return a list of values returned by on_complete of the commands which
+        have been run
+        """
+        return [
+            cmd.on_complete()
+            for cmd, started in zip(self._cmd_list, self._started_cmd_list)
+            if started
+        ]
+
+    def before(self):
+        pass
+
+    @property
+    def has_errors(self):
+        return any(
+            cmd.has_errors
+            for cmd, started in zip(self._cmd_list, self._started_cmd_list)
+            if started
+        )
+
+
 class RunRemotelyBase(CommunicationCommandInterface):
     """
     Abstract class for communication commands. This class provides methods for
@@ -25,6 +25,10 @@ from pcs.common.services.interfaces import ServiceManagerInterface
 from pcs.common.tools import Version
 from pcs.common.types import StringIterable
 from pcs.lib.booth.env import BoothEnv
+from pcs.lib.cib.tools import (
+    IdIndex,
+    index_ids,
+)
 from pcs.lib.communication import qdevice
 from pcs.lib.communication.corosync import (
     CheckCorosyncOffline,
@@ -55,12 +59,21 @@ from pcs.lib.pacemaker.live import (
     ensure_cib_version,
     get_cib,
     get_cib_xml,
+    get_cib_xml_without_status,
     get_cluster_status_dom,
     push_cib_diff_xml,
     replace_cib_configuration,
     wait_for_idle,
 )
+from pcs.lib.pacemaker.patchset import (
+    PatchsetError,
+    create_patchset_xml,
+)
 from pcs.lib.pacemaker.values import get_valid_timeout_seconds
+from pcs.lib.resource_agent import (
+    ResourceAgentMetadataCache,
+    get_metadata_cache,
+)
 from pcs.lib.services import get_service_manager
 from pcs.lib.tools import create_tmp_cib
 from pcs.lib.xml_tools import etree_to_str
@@ -123,6 +136,7 @@ class LibraryEnvironment:
         self._cib_data_tmp_file: Optional[Any] = None  # TODO proper type hint
         self.__loaded_cib_diff_source: Optional[str] = None
         self.__loaded_cib_to_modify: Optional[_Element] = None
+        self.__cib_id_index: Optional[IdIndex] = None
         self._communicator_factory = NodeCommunicatorFactory(
             LibCommunicatorLogger(self.logger, self.report_processor),
             self.user_login,
@@ -162,11 +176,23 @@ class LibraryEnvironment:
         self,
         minimal_version: Optional[Version] = None,
         nice_to_have_version: Optional[Version] = None,
+        load_status: bool = True,
     ) -> _Element:
+        """
+        Load CIB to be modified and pushed later by push_cib
+
+        minimal_version -- upgrade the CIB to this version or fail
+        nice_to_have_version -- upgrade the CIB to this version if possible
+        load_status -- if False, the status section of the loaded CIB is empty
+        """
         if self.__loaded_cib_diff_source is not None:
             raise AssertionError("CIB has already been loaded")
 
-        self.__loaded_cib_diff_source = get_cib_xml(self.cmd_runner())
+        self.__loaded_cib_diff_source = (
+            get_cib_xml(self.cmd_runner())
+            if load_status
+            else get_cib_xml_without_status(self.cmd_runner())
+        )
         self.__loaded_cib_to_modify = get_cib(self.__loaded_cib_diff_source)
 
         if (
@@ -198,6 +224,7 @@ class LibraryEnvironment:
                         )
                     self._cib_upgrade_reported = True
 
+        self.__cib_id_index = index_ids(self.__loaded_cib_to_modify)
         return self.__loaded_cib_to_modify
 
     @property
@@ -278,16 +305,28 @@ class LibraryEnvironment:
         )
 
     def __main_push_cib_diff(self, cmd_runner):
-        cib_diff_xml = diff_cibs_xml(
-            cmd_runner,
-            self.report_processor,
-            self.__loaded_cib_diff_source,
-            etree_to_str(self.__loaded_cib_to_modify),
-        )
+        try:
+            cib_diff_xml = create_patchset_xml(
+                self.__loaded_cib_diff_source, self.__loaded_cib_to_modify
+            )
+        except PatchsetError as e:
+            # The native implementation does not cover everything crm_diff
+            # does, e.g. comments in the CIB. Let crm_diff handle such CIBs.
+            self.logger.debug(
+                "Unable to create CIB diff natively, using crm_diff: %s", e
+            )
+            cib_diff_xml = diff_cibs_xml(
+                cmd_runner,
+                self.report_processor,
+                self.__loaded_cib_diff_source,
+                etree_to_str(self.__loaded_cib_to_modify),
+            )
         if cib_diff_xml:
             push_cib_diff_xml(cmd_runner, cib_diff_xml)
 
     def __do_push_cib(self, push_strategy, wait_timeout: int) -> None:
+        # the pushed CIB is not going to be modified anymore
+        self.__cib_id_index = None
         push_strategy()
         self._cib_upgrade_reported = False
         self.__loaded_cib_diff_source = None
@@ -508,6 +547,11 @@ class LibraryEnvironment:
                 self._known_hosts = {}
         return self._known_hosts
 
+    def get_resource_agent_metadata_cache(
+        self,
+    ) -> Optional[ResourceAgentMetadataCache]:
+        return get_metadata_cache()
+
     def get_booth_env(self, name: Optional[str]) -> BoothEnv:
         if self.__loaded_booth_env is None:
             self.__loaded_booth_env = BoothEnv(name, self._booth_files_data)
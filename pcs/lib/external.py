@@ -1,8 +1,10 @@
+import logging
 import signal
 import subprocess
 from logging import Logger
 from shlex import quote as shell_quote
 from typing import (
+    AnyStr,
     Dict,
     Mapping,
     Optional,
@@ -61,31 +63,34 @@ class CommandRunner:
         env_vars.update(dict(env_extend) if env_extend else {})
 
         log_args = " ".join([shell_quote(x) for x in args])
-        self._logger.debug(
-            "Running: {args}\nEnvironment:{env_vars}{stdin_string}".format(
-                args=log_args,
-                stdin_string=(
-                    ""
-                    if not stdin_string
-                    else (
-                        "\n--Debug Input Start--\n{0}\n--Debug Input End--"
-                    ).format(stdin_string)
-                ),
-                env_vars=(
-                    ""
-                    if not env_vars
-                    else (
-                        "\n"
-                        + "\n".join(
-                            [
-                                "  {0}={1}".format(key, val)
-                                for key, val in sorted(env_vars.items())
-                            ]
+        # Payloads may be large, e.g. a whole CIB. Do not format them unless
+        # they are really going to be logged.
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Running: {args}\nEnvironment:{env_vars}{stdin_string}".format(
+                    args=log_args,
+                    stdin_string=(
+                        ""
+                        if not stdin_string
+                        else (
+                            "\n--Debug Input Start--\n{0}\n--Debug Input End--"
+                        ).format(_truncate_log_payload(stdin_string))
+                    ),
+                    env_vars=(
+                        ""
+                        if not env_vars
+                        else (
+                            "\n"
+                            + "\n".join(
+                                [
+                                    "  {0}={1}".format(key, val)
+                                    for key, val in sorted(env_vars.items())
+                                ]
+                            )
                         )
-                    )
-                ),
+                    ),
+                )
             )
-        )
         self._reporter.report(
             ReportItem.debug(
                 reports.messages.RunExternalProcessStarted(
@@ -130,15 +135,19 @@ class CommandRunner:
                 )
             ) from e
 
-        self._logger.debug(
-            (
-                "Finished running: {args}\nReturn value: {retval}"
-                + "\n--Debug Stdout Start--\n{out_std}\n--Debug Stdout End--"
-                + "\n--Debug Stderr Start--\n{out_err}\n--Debug Stderr End--"
-            ).format(
-                args=log_args, retval=retval, out_std=out_std, out_err=out_err
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                (
+                    "Finished running: {args}\nReturn value: {retval}"
+                    + "\n--Debug Stdout Start--\n{out_std}\n--Debug Stdout End--"
+                    + "\n--Debug Stderr Start--\n{out_err}\n--Debug Stderr End--"
+                ).format(
+                    args=log_args,
+                    retval=retval,
+                    out_std=_truncate_log_payload(out_std),
+                    out_err=_truncate_log_payload(out_err),
+                )
             )
-        )
         self._reporter.report(
             ReportItem.debug(
                 reports.messages.RunExternalProcessFinished(
@@ -152,6 +161,18 @@ class CommandRunner:
         return out_std, out_err, retval
 
 
+def _truncate_log_payload(payload: AnyStr) -> AnyStr:
+    max_length = settings.external_process_log_payload_max_length
+    if not max_length or len(payload) <= max_length:
+        return payload
+    truncated_note = "\n--Truncated {0} of {1} characters--".format(
+        len(payload) - max_length, len(payload)
+    )
+    if isinstance(payload, bytes):
+        return payload[:max_length] + truncated_note.encode()
+    return payload[:max_length] + truncated_note
+
+
 def kill_services(runner, services):
     """
     Kill specified services in local system
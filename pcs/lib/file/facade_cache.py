@@ -0,0 +1,73 @@
+import threading
+from typing import (
+    Dict,
+    NamedTuple,
+)
+
+from pcs.common.file import (
+    FileStamp,
+    get_file_stamp,
+)
+from pcs.lib.file.instance import FileInstance
+from pcs.lib.file.raw_file import RealFile
+from pcs.lib.interface.config import FacadeInterface
+
+
+class _CacheEntry(NamedTuple):
+    stamp: FileStamp
+    facade: FacadeInterface
+
+
+class FileFacadeCache:
+    """
+    In-memory cache of facades of parsed config files
+
+    A facade is reused until its file is changed, which is detected by
+    checking the file's inode, size and modification times. Facades returned
+    from the cache are shared, they must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _CacheEntry] = {}
+
+    def read_to_facade(self, file_instance: FileInstance) -> FacadeInterface:
+        """
+        Read a file and return its facade, reuse a cached facade if possible
+
+        file_instance -- the file to be read, only real files are cached
+        """
+        if not isinstance(file_instance.raw_file, RealFile):
+            return file_instance.read_to_facade()
+        path = file_instance.raw_file.metadata.path
+        # Get the stamp before reading the file. If the file is changed in
+        # between, the new content is cached with the old stamp and it is read
+        # again next time, which is correct.
+        stamp = get_file_stamp(path)
+        if stamp is None:
+            return file_instance.read_to_facade()
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry.stamp == stamp:
+            return entry.facade
+        facade = file_instance.read_to_facade()
+        with self._lock:
+            self._entries[path] = _CacheEntry(stamp, facade)
+        return facade
+
+    def clear(self) -> None:
+        """
+        Remove all cached facades
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+_file_facade_cache = FileFacadeCache()
+
+
+def get_file_facade_cache() -> FileFacadeCache:
+    """
+    Return the cache shared by all its users in the current process
+    """
+    return _file_facade_cache
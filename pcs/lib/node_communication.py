@@ -1,3 +1,4 @@
+import logging
 import os
 
 from pcs import settings
@@ -25,6 +26,11 @@ class LibCommunicatorLogger(CommunicatorLoggerInterface):
         self._logger = logger
         self._reporter = reporter
 
+    def is_debug_enabled(self):
+        return self._reporter.is_debug_enabled() or self._logger.isEnabledFor(
+            logging.DEBUG
+        )
+
     def log_request_start(self, request):
         msg = "Sending HTTP Request to: {url}"
         if request.data:
@@ -44,7 +50,8 @@ class LibCommunicatorLogger(CommunicatorLoggerInterface):
             self._log_response_successful(response)
         else:
             self._log_response_failure(response)
-        self._log_debug(response)
+        if self.is_debug_enabled():
+            self._log_debug(response)
 
     def _log_response_successful(self, response):
         url = response.request.url
@@ -95,7 +102,9 @@ class LibCommunicatorLogger(CommunicatorLoggerInterface):
 
     def _log_debug(self, response):
         url = response.request.url
-        debug_data = response.debug
+        debug_data = "{trace}* Timings: {timings}\n".format(
+            trace=response.debug, timings=response.timings.to_text()
+        )
         self._logger.debug(
             (
                 "Communication debug info for calling: {url}\n"
@@ -1,6 +1,8 @@
 import os.path
 import re
+import time
 from typing import (
+    Any,
     Dict,
     List,
     Mapping,
@@ -40,6 +42,8 @@ __EXITCODE_NOT_CONNECTED = 102
 __EXITCODE_CIB_SCOPE_VALID_BUT_NOT_PRESENT = 105
 __EXITCODE_WAIT_TIMEOUT = 124
 __RESOURCE_REFRESH_OPERATION_COUNT_THRESHOLD = 100
+# how often the status of the local node is checked when waiting for it to start
+__NODE_STARTUP_CHECK_INTERVAL = 1
 
 
 class PacemakerNotConnectedException(LibraryError):
@@ -174,6 +178,29 @@ def get_cib_xml(runner: CommandRunner, scope: Optional[str] = None) -> str:
     return stdout
 
 
+def get_cib_xml_without_status(runner: CommandRunner) -> str:
+    """
+    Return CIB with an empty status section
+
+    The status section holds operation history of resources and it is usually
+    the largest part of the CIB. Commands working only with the configuration
+    section save loading, parsing and diffing the status this way.
+    """
+    stdout, stderr, retval = runner.run(
+        [__exec("cibadmin"), "--local", "--query", "--no-children"]
+    )
+    if retval != 0:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.CibLoadError(join_multilines([stderr, stdout]))
+            )
+        )
+    cib = get_cib(stdout)
+    cib.append(get_cib(get_cib_xml(runner, scope="configuration")))
+    etree.SubElement(cib, "status")
+    return etree_to_str(cib)
+
+
 def parse_cib_xml(xml: str) -> _Element:
     return xml_fromstring(xml)
 
@@ -473,6 +500,33 @@ def wait_for_idle(runner: CommandRunner, timeout: int) -> None:
         )
 
 
+def try_wait_for_idle(runner: CommandRunner, timeout: int) -> bool:
+    """
+    Wait for the cluster to settle down, return False if it did not in time
+
+    runner -- preconfigured object for running external programs
+    timeout -- waiting timeout in seconds, must be a positive integer
+    """
+    stdout, stderr, retval = runner.run(
+        [
+            __exec("crm_resource"),
+            "--wait",
+            "--timeout={0}".format(timeout),
+        ]
+    )
+    if retval == __EXITCODE_WAIT_TIMEOUT:
+        return False
+    if retval != 0:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.WaitForIdleError(
+                    join_multilines([stderr, stdout])
+                )
+            )
+        )
+    return True
+
+
 ### nodes
 
 
@@ -527,6 +581,37 @@ def get_local_node_status(runner):
     )
 
 
+def is_node_status_started(node_status: Mapping[str, Any]) -> bool:
+    """
+    Check if a node status returned by get_local_node_status is fully started
+
+    node_status -- status of a node
+    """
+    # If the node is offline, the status only contains the "offline" key.
+    return bool(
+        node_status.get("online", False)
+        and not node_status.get("pending", True)
+    )
+
+
+def wait_for_local_node_started(
+    runner: CommandRunner, timeout: int
+) -> Dict[str, Any]:
+    """
+    Return status of the local node once it is fully started or timeout elapsed
+
+    runner -- preconfigured object for running external programs
+    timeout -- maximal time to wait in seconds
+    """
+    stop_at = time.monotonic() + timeout
+    while True:
+        node_status = get_local_node_status(runner)
+        remaining = stop_at - time.monotonic()
+        if is_node_status_started(node_status) or remaining <= 0:
+            return node_status
+        time.sleep(min(__NODE_STARTUP_CHECK_INTERVAL, remaining))
+
+
 def remove_node(runner, node_name):
     stdout, stderr, retval = runner.run(
         [
@@ -738,6 +823,15 @@ def has_rule_in_effect_status_tool() -> bool:
     return os.path.isfile(__exec("crm_rule"))
 
 
+_RULE_CHECK_RETURN_CODES = {
+    0: CibRuleInEffectStatus.IN_EFFECT,
+    110: CibRuleInEffectStatus.EXPIRED,
+    111: CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+    # 105:non-existent
+    # 112: undetermined (rule is too complicated for current implementation)
+}
+
+
 def get_rule_in_effect_status(
     runner: CommandRunner, cib_xml: str, rule_id: str
 ) -> CibRuleInEffectStatus:
@@ -748,21 +842,59 @@ def get_rule_in_effect_status(
     cib_xml -- CIB containing rules
     rule_id -- ID of the rule to be checked
     """
-    # TODO Once crm_rule is capable of evaluating more than one rule per go, we
-    # should make use of it. Running the tool for each rule may really slow pcs
-    # down.
-    translation_map = {
-        0: CibRuleInEffectStatus.IN_EFFECT,
-        110: CibRuleInEffectStatus.EXPIRED,
-        111: CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
-        # 105:non-existent
-        # 112: undetermined (rule is too complicated for current implementation)
-    }
     dummy_stdout, dummy_stderr, retval = runner.run(
         [__exec("crm_rule"), "--check", "--rule", rule_id, "--xml-text", "-"],
         stdin_string=cib_xml,
     )
-    return translation_map.get(retval, CibRuleInEffectStatus.UNKNOWN)
+    return _RULE_CHECK_RETURN_CODES.get(retval, CibRuleInEffectStatus.UNKNOWN)
+
+
+def is_rule_in_effect_status_check_of_more_rules_supported(
+    runner: CommandRunner,
+) -> bool:
+    return _is_in_pcmk_tool_help(
+        runner,
+        "crm_rule",
+        ["--output-as", "may be specified multiple times"],
+    )
+
+
+def get_rules_in_effect_status(
+    runner: CommandRunner, cib_xml: str, rule_id_list: StringSequence
+) -> Optional[Dict[str, CibRuleInEffectStatus]]:
+    """
+    Figure out if rules are in effect, expired or not yet in effect by running
+    the pacemaker tool only once. Rules missing in the returned dict have an
+    unknown status. Return None if the output of the tool cannot be processed.
+
+    runner -- a class for running external processes
+    cib_xml -- CIB containing rules
+    rule_id_list -- IDs of the rules to be checked
+    """
+    if not rule_id_list:
+        return {}
+    cmd = [__exec("crm_rule"), "--check", "--output-as", "xml"]
+    for rule_id in rule_id_list:
+        cmd.extend(["--rule", rule_id])
+    cmd.extend(["--xml-text", "-"])
+    stdout, dummy_stderr, dummy_retval = runner.run(cmd, stdin_string=cib_xml)
+    # The tool exits with a code related to one of the rules, so the overall
+    # return code doesn't tell us anything. Each rule has its own code in the
+    # xml output.
+    try:
+        dom = _get_api_result_dom(stdout)
+    except (etree.XMLSyntaxError, etree.DocumentInvalid):
+        return None
+    result = {}
+    for rule_check_el in dom.iterfind(".//rule-check"):
+        try:
+            retval = int(str(rule_check_el.get("rc")))
+        except ValueError:
+            continue
+        result[
+            str(rule_check_el.get("rule-id"))
+        ] = _RULE_CHECK_RETURN_CODES.get(retval, CibRuleInEffectStatus.UNKNOWN)
+    return result
 
 
 def _get_api_result_dom(xml: str) -> _Element:
@@ -0,0 +1,373 @@
+"""
+Creating and applying CIB patchsets in the pacemaker's diff format version 2
+
+A patchset is equivalent to the output of 'crm_diff --no-version' and is meant
+to be pushed to a cluster by 'cibadmin --patch'. Creating a patchset natively
+saves serializing both CIBs to temporary files and running crm_diff over them.
+"""
+import re
+from bisect import bisect_left
+from copy import deepcopy
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs.common.tools import xml_fromstring
+
+# Version attributes are left out the same way 'crm_diff --no-version' does
+# it. Pacemaker increments the version when applying the patchset.
+_VERSION_ATTRS = ("admin_epoch", "epoch", "num_updates")
+_PATH_STEP_RE = re.compile(r"^(?P<tag>[^\[]+)(?:\[@id='(?P<id>[^']*)'\])?$")
+
+_ChildKey = Tuple[str, Optional[str]]
+
+
+class PatchsetError(Exception):
+    """
+    A patchset cannot be created or applied
+    """
+
+
+def create_patchset_xml(cib_old_xml: str, cib_new: _Element) -> str:
+    """
+    Return a verified patchset transforming one CIB to another, "" if equal
+
+    Raise PatchsetError if the patchset cannot be created or if applying it
+    to the original CIB does not result in the modified CIB.
+
+    cib_old_xml -- original CIB
+    cib_new -- modified CIB
+    """
+    patchset = create_patchset(xml_fromstring(cib_old_xml), cib_new)
+    if patchset is None:
+        return ""
+    # Make sure the patchset does what it is supposed to do before pushing it
+    # to a cluster. Apply it to a fresh copy of the original CIB, so that the
+    # patchset creation is not affected by the check.
+    cib_patched = xml_fromstring(cib_old_xml)
+    apply_patchset(cib_patched, patchset)
+    if create_patchset(cib_patched, cib_new) is not None:
+        raise PatchsetError("Patched CIB does not match the modified CIB")
+    return etree.tostring(patchset, encoding="unicode")
+
+
+def create_patchset(cib_old: _Element, cib_new: _Element) -> Optional[_Element]:
+    """
+    Return a patchset transforming one CIB to another, None if they are equal
+
+    Raise PatchsetError if the CIBs contain XML constructs not supported by
+    the native implementation, such as comments or text content.
+
+    cib_old -- original CIB
+    cib_new -- modified CIB
+    """
+    if cib_old.tag != cib_new.tag:
+        raise PatchsetError("CIB root elements differ")
+    builder = _PatchsetBuilder()
+    builder.diff_element(cib_old, cib_new, "/" + _path_step(cib_new), True)
+    return builder.get_patchset()
+
+
+def apply_patchset(cib: _Element, patchset: _Element) -> None:
+    """
+    Apply a patchset to a CIB the same way pacemaker does it
+
+    cib -- CIB to be modified in place
+    patchset -- patchset in the pacemaker's diff format version 2
+    """
+    if patchset.get("format") != "2":
+        raise PatchsetError("Unsupported patchset format")
+    # Creating and moving elements is done after all other changes in the
+    # order of their positions. Elements to be moved are temporarily put at
+    # the end of their parents.
+    delayed_changes: List[Tuple[int, _Element, _Element]] = []
+    for change in patchset.iterchildren("change"):
+        operation = change.get("operation")
+        target = _find_by_path(cib, str(change.get("path")))
+        if target is None:
+            if operation == "delete":
+                continue
+            raise PatchsetError(f"Path not found: {change.get('path')}")
+        if operation == "delete":
+            _remove_element(target)
+        elif operation == "modify":
+            result = change.find("change-result")
+            if result is None or len(result) == 0:
+                raise PatchsetError("Modify change without a result")
+            new_attrs: Dict[str, str] = dict(result[0].attrib)  # type: ignore
+            if target.getparent() is None:
+                for name in _VERSION_ATTRS:
+                    if name in target.attrib:
+                        new_attrs[name] = str(target.get(name))
+            target.attrib.clear()
+            for name, value in new_attrs.items():
+                target.set(name, value)
+        elif operation in ("create", "move"):
+            delayed_changes.append(
+                (int(str(change.get("position"))), change, target)
+            )
+            if operation == "move":
+                parent = target.getparent()
+                if parent is None:
+                    raise PatchsetError("Unable to move the root element")
+                parent.append(target)
+        else:
+            raise PatchsetError(f"Unknown operation: {operation}")
+
+    delayed_changes.sort(key=lambda item: item[0])
+    for position, change, target in delayed_changes:
+        if change.get("operation") == "create":
+            _insert_element(target, position, deepcopy(change[0]))
+        else:
+            _move_element(target, position)
+
+
+def _path_step(element: _Element) -> str:
+    element_id = element.get("id")
+    if element_id is None:
+        return str(element.tag)
+    return f"{element.tag}[@id='{element_id}']"
+
+
+def _find_by_path(cib: _Element, path: str) -> Optional[_Element]:
+    step_list = path.split("/")[1:]
+    if not step_list:
+        return None
+    element: Optional[_Element] = None
+    for step in step_list:
+        match = _PATH_STEP_RE.match(step)
+        if not match:
+            return None
+        tag, element_id = match.group("tag"), match.group("id")
+        candidates = [cib] if element is None else element.iterchildren(tag)
+        element = None
+        for candidate in candidates:
+            if candidate.tag == tag and (
+                element_id is None or candidate.get("id") == element_id
+            ):
+                element = candidate
+                break
+        if element is None:
+            return None
+    return element
+
+
+def _remove_element(element: _Element) -> None:
+    parent = element.getparent()
+    if parent is None:
+        raise PatchsetError("Unable to remove the root element")
+    # keep the whitespace following the element
+    previous = element.getprevious()
+    if element.tail:
+        if previous is not None:
+            previous.tail = (previous.tail or "") + element.tail
+        else:
+            parent.text = (parent.text or "") + element.tail
+    parent.remove(element)
+
+
+def _insert_element(parent: _Element, position: int, element: _Element) -> None:
+    element.tail = None
+    if position < len(parent):
+        parent.insert(position, element)
+    else:
+        parent.append(element)
+
+
+def _move_element(element: _Element, position: int) -> None:
+    parent = element.getparent()
+    if parent is None:
+        raise PatchsetError("Unable to move the root element")
+    current_position = parent.index(element)
+    if position != current_position:
+        index = position + 1 if position > current_position else position
+        if index < len(parent):
+            parent[index].addprevious(element)
+        else:
+            parent.append(element)
+    if parent.index(element) != position:
+        raise PatchsetError(
+            f"Unable to move element {_path_step(element)} to position "
+            f"{position}"
+        )
+
+
+def _get_children(element: _Element) -> Dict[_ChildKey, Tuple[int, _Element]]:
+    """
+    Return children of an element indexed by their tag and id
+
+    Raise PatchsetError if the children cannot be identified unambiguously
+    by paths used in patchsets.
+    """
+    if element.text and element.text.strip():
+        raise PatchsetError(f"Text content in {_path_step(element)}")
+    children: Dict[_ChildKey, Tuple[int, _Element]] = {}
+    for index, child in enumerate(element):
+        if not isinstance(child.tag, str):
+            raise PatchsetError(
+                f"Comment or processing instruction in {_path_step(element)}"
+            )
+        if child.tail and child.tail.strip():
+            raise PatchsetError(f"Text content in {_path_step(element)}")
+        child_id = child.get("id")
+        if child_id is not None and ("'" in child_id or "/" in child_id):
+            raise PatchsetError(f"Unsupported id '{child_id}'")
+        key = (child.tag, child_id)
+        if key in children:
+            raise PatchsetError(f"Ambiguous element {_path_step(child)}")
+        children[key] = (index, child)
+    return children
+
+
+def _get_unmoved_indexes(old_index_list: Sequence[int]) -> List[bool]:
+    """
+    Mark items which keep their relative order, the rest has to be moved
+
+    The longest increasing subsequence of the old positions of the elements is
+    kept in place, which minimizes the number of moves.
+
+    old_index_list -- old positions of elements in the order of their new
+        positions
+    """
+    tail_values: List[int] = []
+    tail_items: List[int] = []
+    predecessors: List[int] = []
+    for item, value in enumerate(old_index_list):
+        pos = bisect_left(tail_values, value)
+        predecessors.append(tail_items[pos - 1] if pos > 0 else -1)
+        if pos == len(tail_values):
+            tail_values.append(value)
+            tail_items.append(item)
+        else:
+            tail_values[pos] = value
+            tail_items[pos] = item
+    unmoved = [False] * len(old_index_list)
+    item = tail_items[-1] if tail_items else -1
+    while item >= 0:
+        unmoved[item] = True
+        item = predecessors[item]
+    return unmoved
+
+
+class _PatchsetBuilder:
+    def __init__(self) -> None:
+        self._delete_changes: List[_Element] = []
+        self._changes: List[_Element] = []
+
+    def get_patchset(self) -> Optional[_Element]:
+        if not self._delete_changes and not self._changes:
+            return None
+        patchset = etree.Element("diff", format="2")
+        patchset.extend(self._delete_changes)
+        patchset.extend(self._changes)
+        return patchset
+
+    def diff_element(
+        self,
+        old: _Element,
+        new: _Element,
+        path: str,
+        is_root: bool = False,
+    ) -> None:
+        self._diff_attributes(old, new, path, is_root)
+
+        old_children = _get_children(old)
+        new_children = _get_children(new)
+        for key, (index, old_child) in old_children.items():
+            if key not in new_children:
+                self._delete_changes.append(
+                    etree.Element(
+                        "change",
+                        operation="delete",
+                        path=f"{path}/{_path_step(old_child)}",
+                        position=str(index),
+                    )
+                )
+
+        kept_keys = [key for key in new_children if key in old_children]
+        unmoved = dict(
+            zip(
+                kept_keys,
+                _get_unmoved_indexes(
+                    [old_children[key][0] for key in kept_keys]
+                ),
+            )
+        )
+        for key, (position, new_child) in new_children.items():
+            if key not in old_children:
+                change = etree.Element(
+                    "change",
+                    operation="create",
+                    path=path,
+                    position=str(position),
+                )
+                created = deepcopy(new_child)
+                created.tail = None
+                change.append(created)
+                self._changes.append(change)
+                continue
+            old_child = old_children[key][1]
+            child_path = f"{path}/{_path_step(new_child)}"
+            if not _is_equal(old_child, new_child):
+                self.diff_element(old_child, new_child, child_path)
+            if not unmoved[key]:
+                self._changes.append(
+                    etree.Element(
+                        "change",
+                        operation="move",
+                        path=child_path,
+                        position=str(position),
+                    )
+                )
+
+    def _diff_attributes(
+        self, old: _Element, new: _Element, path: str, is_root: bool
+    ) -> None:
+        old_attrs: Dict[str, str] = dict(old.attrib)  # type: ignore
+        new_attrs: Dict[str, str] = dict(new.attrib)  # type: ignore
+        if is_root:
+            for name in _VERSION_ATTRS:
+                old_attrs.pop(name, None)
+                new_attrs.pop(name, None)
+        change_list = []
+        for name, value in new_attrs.items():
+            if old_attrs.get(name) != value:
+                change_list.append(
+                    etree.Element(
+                        "change-attr", name=name, operation="set", value=value
+                    )
+                )
+        for name in old_attrs:
+            if name not in new_attrs:
+                change_list.append(
+                    etree.Element("change-attr", name=name, operation="unset")
+                )
+        if not change_list:
+            return
+        change = etree.Element("change", operation="modify", path=path)
+        etree.SubElement(change, "change-list").extend(change_list)
+        etree.SubElement(
+            etree.SubElement(change, "change-result"), str(new.tag), new_attrs
+        )
+        self._changes.append(change)
+
+
+def _is_equal(old: _Element, new: _Element) -> bool:
+    # An element on the path to a change is compared at each level of the
+    # recursion. Its attributes and number of children are compared first, so
+    # that a changed element is usually told apart without serializing it.
+    if len(old) != len(new) or old.attrib != new.attrib:
+        return False
+    # Serializing is done in C and is much faster than comparing elements one
+    # by one in python. It is only a shortcut for the most common case of an
+    # unchanged subtree, whitespace differences are dealt with by recursion.
+    return etree.tostring(old, with_tail=False) == etree.tostring(
+        new, with_tail=False
+    )
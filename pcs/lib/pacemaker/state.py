@@ -250,6 +250,37 @@ def ensure_resource_state(expected_running, cluster_state, resource_id):
     )
 
 
+def is_resource_in_expected_state(cluster_state, resource_id, expected_running):
+    """
+    Check if a resource got to the expected state and has no pending actions
+
+    A resource is running once all its instances are running, e.g. all
+    instances of a clone or all replicas of a bundle. A resource is not running
+    once none of its instances is running.
+
+    etree cluster_state -- status of the cluster
+    string resource_id -- id of the resource
+    bool expected_running -- True if the resource is expected to run
+    """
+    primitive_el_list = _get_primitives_for_state_check(
+        cluster_state, resource_id, expected_running
+    )
+    if any(element.get("pending") for element in primitive_el_list):
+        return False
+    running_count = len(
+        [
+            element
+            for element in primitive_el_list
+            if element.get("role") in const.PCMK_ROLES_RUNNING
+        ]
+    )
+    if expected_running:
+        return bool(primitive_el_list) and running_count == len(
+            primitive_el_list
+        )
+    return running_count == 0
+
+
 def ensure_resource_running(cluster_state, resource_id):
     return ensure_resource_state(
         expected_running=True,
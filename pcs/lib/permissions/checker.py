@@ -12,6 +12,7 @@ from pcs.lib.auth.const import (
     SUPERUSER,
 )
 from pcs.lib.auth.types import AuthUser
+from pcs.lib.file.facade_cache import get_file_facade_cache
 from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.json import JsonParserException
 from pcs.lib.interface.config import ParserErrorException
@@ -61,6 +62,7 @@ class PermissionsChecker:
     def __init__(self, logger: logging.Logger) -> None:
         self._logger = logger
         self._config_file_instance = FileInstance.for_pcs_settings_config()
+        self._facade_cache = get_file_facade_cache()
 
     def _get_facade(self) -> FacadeV2:
         if not self._config_file_instance.raw_file.exists():
@@ -82,7 +84,10 @@ class PermissionsChecker:
                 )
             )
         try:
-            return cast(FacadeV2, self._config_file_instance.read_to_facade())
+            return cast(
+                FacadeV2,
+                self._facade_cache.read_to_facade(self._config_file_instance),
+            )
         except ParserError as e:
             self._logger.error(
                 "Unable to parse file '%s': %s",
@@ -6,6 +6,10 @@ from pcs.common.resource_agent.dto import (
     ResourceAgentParameterDto,
 )
 
+from .cache import (
+    ResourceAgentMetadataCache,
+    get_metadata_cache,
+)
 from .error import (
     AgentNameGuessFoundMoreThanOne,
     AgentNameGuessFoundNone,
@@ -0,0 +1,213 @@
+import dataclasses
+import hashlib
+import json
+import os
+import os.path
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import dacite
+
+from pcs import settings
+from pcs.common.file import get_file_stamp
+
+from .types import (
+    ResourceAgentMetadata,
+    ResourceAgentName,
+)
+
+_ENTRY_SUFFIX = ".json"
+
+
+def _get_agent_file_path(name: ResourceAgentName) -> Optional[str]:
+    """
+    Return path to a file implementing an agent or None if it's not known
+
+    name -- name of the agent
+    """
+    if os.path.sep in name.type or (
+        name.provider and os.path.sep in name.provider
+    ):
+        return None
+    if name.standard == "ocf" and name.provider:
+        return os.path.join(
+            settings.ocf_resource_agents_dir, name.provider, name.type
+        )
+    if name.is_stonith:
+        return os.path.join(settings.fence_agent_binaries, name.type)
+    # Agents of other standards are provided by init scripts, systemd units
+    # and so on. Their metadata are generated by pacemaker and are cheap to
+    # get, so there is no need to cache them.
+    return None
+
+
+class ResourceAgentMetadataCache:
+    """
+    Persistent on-disk cache of parsed resource / stonith agents metadata
+
+    Each entry is bound to the agent file and to the pacemaker tool providing
+    the metadata. Once any of them changes, the entry is considered stale. The
+    cache works on the best effort basis, any failure to read or write it is
+    equivalent to a cache miss.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int) -> None:
+        """
+        cache_dir -- directory to store cache entries in
+        max_entries -- number of entries to keep, least recently used
+            entries are evicted first
+        """
+        self._cache_dir = cache_dir
+        self._max_entries = max_entries
+
+    def get(self, name: ResourceAgentName) -> Optional[ResourceAgentMetadata]:
+        """
+        Return cached metadata of an agent or None if they are not cached
+
+        name -- name of the agent
+        """
+        key = self._get_key(name)
+        if key is None:
+            return None
+        entry_path = self._get_entry_path(name)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+            if entry.get("key") != key:
+                return None
+            metadata = dacite.from_dict(
+                ResourceAgentMetadata, entry["metadata"]
+            )
+            # mark the entry as recently used for the eviction
+            os.utime(entry_path)
+        except (OSError, ValueError, KeyError, TypeError, dacite.DaciteError):
+            return None
+        return metadata
+
+    def put(
+        self, name: ResourceAgentName, metadata: ResourceAgentMetadata
+    ) -> None:
+        """
+        Store metadata of an agent
+
+        name -- name of the agent
+        metadata -- parsed metadata of the agent
+        """
+        key = self._get_key(name)
+        if key is None:
+            return
+        try:
+            os.makedirs(self._cache_dir, mode=0o755, exist_ok=True)
+            # pylint: disable=consider-using-with
+            tmp_file = tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self._cache_dir,
+                prefix=".tmp",
+                delete=False,
+            )
+        except OSError:
+            return
+        try:
+            with tmp_file:
+                json.dump(
+                    dict(key=key, metadata=dataclasses.asdict(metadata)),
+                    tmp_file,
+                )
+            os.chmod(tmp_file.name, 0o644)
+            os.replace(tmp_file.name, self._get_entry_path(name))
+        except (OSError, TypeError, ValueError):
+            # do not leave partially written entries behind
+            try:
+                os.remove(tmp_file.name)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def clear(self) -> int:
+        """
+        Remove all entries from the cache, return number of removed entries
+        """
+        removed = 0
+        for entry_path in self._list_entries():
+            try:
+                os.remove(entry_path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def _get_key(self, name: ResourceAgentName) -> Optional[Dict[str, Any]]:
+        agent_path = _get_agent_file_path(name)
+        if agent_path is None:
+            return None
+        agent_stamp = get_file_stamp(agent_path)
+        if agent_stamp is None:
+            return None
+        # Stamp of the pacemaker tool changes with pacemaker updates. Checking
+        # the file is much cheaper than running pacemaker to get its version.
+        pacemaker_stamp = get_file_stamp(settings.crm_resource_binary)
+        if pacemaker_stamp is None:
+            return None
+        # lists, so that the key equals the key loaded from a json file
+        return dict(
+            agent=name.full_name,
+            agent_file=list(agent_stamp),
+            pacemaker=list(pacemaker_stamp),
+            pcs_version=settings.pcs_version,
+        )
+
+    def _get_entry_path(self, name: ResourceAgentName) -> str:
+        return os.path.join(
+            self._cache_dir,
+            hashlib.sha256(name.full_name.encode("utf-8")).hexdigest()
+            + _ENTRY_SUFFIX,
+        )
+
+    def _list_entries(self) -> List[str]:
+        try:
+            file_names = os.listdir(self._cache_dir)
+        except OSError:
+            return []
+        return [
+            os.path.join(self._cache_dir, file_name)
+            for file_name in file_names
+            if file_name.endswith(_ENTRY_SUFFIX)
+        ]
+
+    def _evict(self) -> None:
+        entry_list = self._list_entries()
+        if len(entry_list) <= self._max_entries:
+            return
+        entry_mtime_list = []
+        for entry_path in entry_list:
+            try:
+                entry_mtime_list.append(
+                    (os.stat(entry_path).st_mtime_ns, entry_path)
+                )
+            except OSError:
+                pass
+        entry_mtime_list.sort()
+        for _, entry_path in entry_mtime_list[
+            : len(entry_mtime_list) - self._max_entries
+        ]:
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+
+def get_metadata_cache() -> ResourceAgentMetadataCache:
+    """
+    Return the agent metadata cache shared by pcs and pcsd
+    """
+    return ResourceAgentMetadataCache(
+        settings.resource_agent_metadata_cache_dir,
+        settings.resource_agent_metadata_cache_max_entries,
+    )
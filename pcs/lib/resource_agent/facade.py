@@ -1,11 +1,15 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace as dc_replace
 from typing import (
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
+    Tuple,
+    Union,
 )
 
 from pcs.common import reports
@@ -14,6 +18,7 @@ from pcs.lib import validate
 from pcs.lib.external import CommandRunner
 
 from . import const
+from .cache import ResourceAgentMetadataCache
 from .error import (
     ResourceAgentError,
     resource_agent_error_to_report_item,
@@ -199,10 +204,20 @@ class ResourceAgentFacadeFactory:
     """
 
     def __init__(
-        self, runner: CommandRunner, report_processor: reports.ReportProcessor
+        self,
+        runner: CommandRunner,
+        report_processor: reports.ReportProcessor,
+        metadata_cache: Optional[ResourceAgentMetadataCache] = None,
     ) -> None:
+        """
+        runner -- external processes runner
+        report_processor -- tool for warning reporting
+        metadata_cache -- if set, agents metadata are loaded from and stored
+            to the cache
+        """
         self._runner = runner
         self._report_processor = report_processor
+        self._metadata_cache = metadata_cache
         self._fenced_metadata: Optional[ResourceAgentMetadata] = None
 
     def facade_from_parsed_name(
@@ -213,11 +228,45 @@ class ResourceAgentFacadeFactory:
 
         name -- agent name to get a facade for
         """
-        return self._facade_from_metadata(
-            ocf_version_to_ocf_unified(
-                parse_metadata(name, load_metadata(self._runner, name))
-            )
-        )
+        return self._facade_from_metadata(self._get_agent_metadata(name))
+
+    def facades_from_parsed_names(
+        self, name_list: Iterable[ResourceAgentName], max_workers: int = 1
+    ) -> Iterator[
+        Tuple[ResourceAgentName, Union[ResourceAgentFacade, ResourceAgentError]]
+    ]:
+        """
+        Create ResourceAgentFacade for each of specified agents
+
+        Metadata of up to max_workers agents are loaded concurrently. Facades
+        are yielded in the order of the specified names as soon as they are
+        ready. An error is yielded instead of a facade for agents whose
+        metadata cannot be loaded.
+
+        name_list -- names of agents to get facades for
+        max_workers -- how many agents' metadata to load at once
+        """
+
+        def load_metadata_or_error(
+            name: ResourceAgentName,
+        ) -> Union[ResourceAgentMetadata, ResourceAgentError]:
+            try:
+                return self._get_agent_metadata(name)
+            except ResourceAgentError as e:
+                return e
+
+        name_list = list(name_list)
+        if max_workers < 2 or len(name_list) < 2:
+            for name in name_list:
+                yield name, self._facade_or_error(load_metadata_or_error(name))
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(name_list))
+        ) as executor:
+            for name, metadata_or_error in zip(
+                name_list, executor.map(load_metadata_or_error, name_list)
+            ):
+                yield name, self._facade_or_error(metadata_or_error)
 
     def void_facade_from_parsed_name(
         self, name: ResourceAgentName
@@ -249,6 +298,30 @@ class ResourceAgentFacadeFactory:
             )
         return ResourceAgentFacade(metadata, additional_parameters)
 
+    def _facade_or_error(
+        self,
+        metadata_or_error: Union[ResourceAgentMetadata, ResourceAgentError],
+    ) -> Union[ResourceAgentFacade, ResourceAgentError]:
+        # Facades are created in the calling thread, so that fenced metadata
+        # are loaded and cached only once.
+        if isinstance(metadata_or_error, ResourceAgentError):
+            return metadata_or_error
+        return self._facade_from_metadata(metadata_or_error)
+
+    def _get_agent_metadata(
+        self, name: ResourceAgentName
+    ) -> ResourceAgentMetadata:
+        if self._metadata_cache is not None:
+            cached_metadata = self._metadata_cache.get(name)
+            if cached_metadata is not None:
+                return cached_metadata
+        metadata = ocf_version_to_ocf_unified(
+            parse_metadata(name, load_metadata(self._runner, name))
+        )
+        if self._metadata_cache is not None:
+            self._metadata_cache.put(name, metadata)
+        return metadata
+
     def _get_fake_agent_metadata(
         self, agent_name: FakeAgentName
     ) -> ResourceAgentMetadata:
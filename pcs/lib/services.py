@@ -1,4 +1,5 @@
 from typing import (
+    Dict,
     List,
     Optional,
 )
@@ -64,6 +65,14 @@ class _NoOpDriver(services.interfaces.ServiceManagerInterface):
     def is_running(self, service: str, instance: Optional[str] = None) -> bool:
         return False
 
+    def get_services_status(
+        self, service_list: StringSequence
+    ) -> Dict[str, services.types.ServiceStatus]:
+        return {
+            service: services.types.ServiceStatus(enabled=False, running=False)
+            for service in service_list
+        }
+
     def is_installed(self, service: str) -> bool:
         return True
 
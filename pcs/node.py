@@ -6,7 +6,10 @@ from pcs.cli.common.errors import (
     ERR_NODE_LIST_AND_ALL_MUTUALLY_EXCLUSIVE,
     CmdLineInputError,
 )
-from pcs.cli.common.parse_args import prepare_options
+from pcs.cli.common.parse_args import (
+    prepare_options,
+    wait_to_timeout,
+)
 
 
 def node_attribute_cmd(lib, argv, modifiers):
@@ -176,11 +179,25 @@ def print_node_utilization(filter_node=None, filter_name=None):
 def node_pacemaker_status(lib, argv, modifiers):
     """
     Internal pcs-pcsd command
+
+    Options:
+      * --wait - wait at most the specified time for the local node to fully
+        start before returning its status
     """
     del lib
     del argv
-    del modifiers
-    print(json.dumps(lib_pacemaker.get_local_node_status(utils.cmd_runner())))
+    modifiers.ensure_only_supported("--wait")
+    runner = utils.cmd_runner()
+    if not modifiers.is_specified("--wait"):
+        print(json.dumps(lib_pacemaker.get_local_node_status(runner)))
+        return
+    node_status = lib_pacemaker.wait_for_local_node_started(
+        runner, wait_to_timeout(modifiers.get("--wait"))
+    )
+    # Let the caller know the node has already waited, so that it can ask
+    # again right away if the node has not started yet.
+    node_status["waited"] = True
+    print(json.dumps(node_status))
 
 
 def attribute_show_cmd(filter_node=None, filter_attr=None):
@@ -19,6 +19,7 @@ from pcs.common.interface import dto
 from pcs.common.reports import (
     ReportItem,
     ReportItemList,
+    ReportItemSeverity,
     ReportProcessor,
 )
 from pcs.lib.errors import LibraryError
@@ -58,10 +59,8 @@ def get_cli_env(
     env = Env()
     env.user, env.groups = utils.get_cib_user_groups()
     env.known_hosts_getter = utils.read_known_hosts_file
-    # Debug messages always go to the processor. The parameter only affects if
-    # they will be printed to stdout. We are not printing the messages. Instead
-    # we get all the messages the processor got. So the value of the parameter
-    # does not matter.
+    # We are not printing the messages. Instead we get all the messages the
+    # processor got, except debug messages.
     env.report_processor = LibraryReportProcessor()
     env.request_timeout = (
         options.request_timeout or settings.default_request_timeout
@@ -73,7 +72,13 @@ class LibraryReportProcessor(ReportProcessor):
     processed_items: ReportItemList = []
 
     def _do_report(self, report_item: ReportItem) -> None:
-        self.processed_items.append(report_item)
+        # Pcsd drops debug messages as they may contain sensitive info. Do not
+        # collect and send them at all, they may be large.
+        if report_item.severity.level != ReportItemSeverity.DEBUG:
+            self.processed_items.append(report_item)
+
+    def is_debug_enabled(self) -> bool:
+        return False
 
 
 def main() -> None:
@@ -965,6 +965,18 @@ def resource_agents(lib, argv, modifiers):
         )
 
 
+def resource_agent_cache_clear(
+    lib: Any, argv: List[str], modifiers: InputModifiers
+) -> None:
+    """
+    Options: no options
+    """
+    modifiers.ensure_only_supported()
+    if argv:
+        raise CmdLineInputError()
+    lib.resource_agent.clear_metadata_cache()
+
+
 def update_cmd(lib: Any, argv: List[str], modifiers: InputModifiers) -> None:
     """
     Options:
@@ -1688,7 +1700,9 @@ def _get_resource_agent_facade(
     resource_agent: lib_ra.ResourceAgentName,
 ) -> lib_ra.ResourceAgentFacade:
     return lib_ra.ResourceAgentFacadeFactory(
-        utils.cmd_runner(), utils.get_report_processor()
+        utils.cmd_runner(),
+        utils.get_report_processor(),
+        lib_ra.get_metadata_cache(),
     ).facade_from_parsed_name(resource_agent)
 
 
@@ -1999,21 +2013,23 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                 )
             )
 
-    dom = utils.get_cib_dom(cib_xml)
     # if resource is a clone or a master, work with its child instead
-    cloned_resource = utils.dom_get_clone_ms_resource(dom, resource_id)
-    if cloned_resource:
-        resource_id = cloned_resource.getAttribute("id")
+    cloned_resource_list = xml_etree.xpath(
+        "(//clone|//master)[@id=$id]/*[self::group or self::primitive]",
+        id=resource_id,
+    )
+    if cloned_resource_list:
+        resource_id = str(cloned_resource_list[0].get("id", ""))
 
-    bundle_el = utils.dom_get_bundle(dom, resource_id)
-    if bundle_el is not None:
-        primitive_el = utils.dom_get_resource_bundle(bundle_el)
+    bundle_list = xml_etree.xpath("//bundle[@id=$id]", id=resource_id)
+    if bundle_list:
+        primitive_el = bundle_list[0].find("./primitive")
         if primitive_el is None:
             print_to_stderr("Deleting bundle '{0}'".format(resource_id))
         else:
             print_to_stderr(
                 "Deleting bundle '{0}' and its inner resource '{1}'".format(
-                    resource_id, primitive_el.getAttribute("id")
+                    resource_id, primitive_el.get("id", "")
                 )
             )
 
@@ -2040,7 +2056,7 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
             print_to_stderr("Stopped")
 
         if primitive_el is not None:
-            resource_remove(primitive_el.getAttribute("id"))
+            resource_remove(str(primitive_el.get("id", "")))
         utils.replace_cib_configuration(
             remove_resource_references(utils.get_cib_dom(), resource_id, output)
         )
@@ -2061,8 +2077,12 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
         print_to_stderr(
             f"Removing group: {resource_id} (and all resources within group)"
         )
-        group = utils.get_cib_xpath('//group[@id="' + resource_id + '"]')
-        group_dom = parseString(group)
+        group_primitive_id_list = [
+            str(primitive_el.get("id", ""))
+            for primitive_el in utils.get_cib_lxml_readonly().xpath(
+                "//group[@id=$id]/primitive", id=resource_id
+            )
+        ]
         print_to_stderr(f"Stopping all resources in group: {resource_id}...")
         resource_disable([resource_id])
         if "--force" not in utils.pcs_options and not utils.usefile:
@@ -2070,10 +2090,7 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
             if retval != 0 and "unrecognized option '--wait'" in output:
                 output = ""
                 retval = 0
-                for res in reversed(
-                    group_dom.documentElement.getElementsByTagName("primitive")
-                ):
-                    res_id = res.getAttribute("id")
+                for res_id in reversed(group_primitive_id_list):
                     res_stopped = False
                     for _ in range(15):
                         time.sleep(1)
@@ -2084,10 +2101,7 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                         break
             stopped = True
             state = utils.getClusterState()
-            for res in group_dom.documentElement.getElementsByTagName(
-                "primitive"
-            ):
-                res_id = res.getAttribute("id")
+            for res_id in group_primitive_id_list:
                 if utils.resource_running_on(res_id, state)["is_running"]:
                     stopped = False
                     break
@@ -2099,8 +2113,8 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
                 if retval != 0 and output:
                     msg.append("\n" + output)
                 utils.err("\n".join(msg).strip())
-        for res in group_dom.documentElement.getElementsByTagName("primitive"):
-            resource_remove(res.getAttribute("id"))
+        for res_id in group_primitive_id_list:
+            resource_remove(res_id)
         sys.exit(0)
 
     # now we know resource is not a group, a clone, a master nor a bundle
@@ -2111,13 +2125,11 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
         utils.err("Resource '{0}' does not exist.".format(resource_id))
 
     group_xpath = '//group/primitive[@id="' + resource_id + '"]/..'
-    group = utils.get_cib_xpath(group_xpath)
+    group_list = utils.get_cib_lxml_readonly().xpath(group_xpath)
     num_resources_in_group = 0
 
-    if group != "":
-        num_resources_in_group = len(
-            parseString(group).documentElement.getElementsByTagName("primitive")
-        )
+    if group_list:
+        num_resources_in_group = len(group_list[0].findall("./primitive"))
 
     if (
         "--force" not in utils.pcs_options
@@ -2163,7 +2175,7 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
             utils.replace_cib_configuration(dom)
             dom = utils.get_cib_dom()
 
-    if group == "" or num_resources_in_group > 1:
+    if not group_list or num_resources_in_group > 1:
         master_xpath = f'//master/primitive[@id="{resource_id}"]/..'
         clone_xpath = f'//clone/primitive[@id="{resource_id}"]/..'
         if utils.get_cib_xpath(clone_xpath) != "":
@@ -2199,41 +2211,33 @@ def resource_remove(resource_id, output=True, is_remove_remote_context=False):
             f'//master/group/primitive[@id="{resource_id}"]/../..'
         )
         top_clone_xpath = f'//clone/group/primitive[@id="{resource_id}"]/../..'
-        top_master = utils.get_cib_xpath(top_master_xpath)
-        top_clone = utils.get_cib_xpath(top_clone_xpath)
-        if top_master != "":
+        cib = utils.get_cib_lxml_readonly()
+        top_master_list = cib.xpath(top_master_xpath)
+        top_clone_list = cib.xpath(top_clone_xpath)
+        if top_master_list:
             to_remove_xpath = top_master_xpath
             msg = "and group and M/S"
-            to_remove_dom = parseString(top_master).getElementsByTagName(
-                "master"
-            )
-            to_remove_id = to_remove_dom[0].getAttribute("id")
+            to_remove_id = str(top_master_list[0].get("id", ""))
             utils.replace_cib_configuration(
                 remove_resource_references(
                     utils.get_cib_dom(),
-                    to_remove_dom[0]
-                    .getElementsByTagName("group")[0]
-                    .getAttribute("id"),
+                    str(top_master_list[0].find("./group").get("id", "")),
                 )
             )
-        elif top_clone != "":
+        elif top_clone_list:
             to_remove_xpath = top_clone_xpath
             msg = "and group and clone"
-            to_remove_dom = parseString(top_clone).getElementsByTagName("clone")
-            to_remove_id = to_remove_dom[0].getAttribute("id")
+            to_remove_id = str(top_clone_list[0].get("id", ""))
             utils.replace_cib_configuration(
                 remove_resource_references(
                     utils.get_cib_dom(),
-                    to_remove_dom[0]
-                    .getElementsByTagName("group")[0]
-                    .getAttribute("id"),
+                    str(top_clone_list[0].find("./group").get("id", "")),
                 )
             )
         else:
             to_remove_xpath = group_xpath
             msg = "and group"
-            to_remove_dom = parseString(group).getElementsByTagName("group")
-            to_remove_id = to_remove_dom[0].getAttribute("id")
+            to_remove_id = str(group_list[0].get("id", ""))
 
         utils.replace_cib_configuration(
             remove_resource_references(
@@ -2289,25 +2293,27 @@ def stonith_level_rm_device(cib_dom, stn_id):
 
 
 def remove_resource_references(
-    dom, resource_id, output=False, constraints_element=None
+    dom, resource_id, output=False, reference_index=None
 ):
     """
     Commandline options: no options
     NOTE: -f - will be used only if dom will be None
     """
-    for obj_ref in dom.getElementsByTagName("obj_ref"):
-        if obj_ref.getAttribute("id") == resource_id:
-            tag = obj_ref.parentNode
-            tag.removeChild(obj_ref)
-            if tag.getElementsByTagName("obj_ref").length == 0:
-                remove_resource_references(
-                    dom,
-                    tag.getAttribute("id"),
-                    output=output,
-                )
-                tag.parentNode.removeChild(tag)
+    if reference_index is None:
+        reference_index = constraint.DomReferenceIndex(dom)
+    for obj_ref in reference_index.get_obj_refs(resource_id):
+        tag = obj_ref.parentNode
+        tag.removeChild(obj_ref)
+        if tag.getElementsByTagName("obj_ref").length == 0:
+            remove_resource_references(
+                dom,
+                tag.getAttribute("id"),
+                output=output,
+                reference_index=reference_index,
+            )
+            tag.parentNode.removeChild(tag)
     constraint.remove_constraints_containing(
-        resource_id, output, constraints_element, dom
+        resource_id, output, dom, reference_index
     )
     stonith_level_rm_device(dom, resource_id)
     lib_acl.dom_remove_permissions_referencing(dom, resource_id)
@@ -1001,6 +1001,11 @@ Commands:
     agents [standard[:provider]]
         List available agents optionally filtered by standard and provider.
 
+    agent-cache clear
+        Remove all cached resource and stonith agents metadata. Metadata are
+        cached to speed up commands working with agents. Cached metadata are
+        refreshed automatically once an agent or pacemaker is updated.
+
 {update_syntax}
 {update_desc}
 
@@ -17,14 +17,18 @@ import xml.etree.ElementTree as ET
 from functools import lru_cache
 from io import BytesIO
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
+    Optional,
     Tuple,
 )
 from urllib.parse import urlencode
 from xml.dom.minidom import Document as DomDocument
 from xml.dom.minidom import parseString
 
+from lxml import etree
+
 import pcs.cli.booth.env
 import pcs.lib.corosync.config_parser as corosync_conf_parser
 from pcs import (
@@ -50,6 +54,10 @@ from pcs.common import file_type_codes
 from pcs.common import pacemaker as common_pacemaker
 from pcs.common import pcs_pycurl as pycurl
 from pcs.common.host import PcsKnownHost
+from pcs.common.node_communicator import (
+    ResponseTimings,
+    get_curl_share,
+)
 from pcs.common.pacemaker.resource.operations import (
     OCF_CHECK_LEVEL_INSTANCE_ATTRIBUTE_NAME,
 )
@@ -64,7 +72,6 @@ from pcs.common.tools import (
 )
 from pcs.common.types import StringSequence
 from pcs.lib.corosync.config_facade import ConfigFacade as corosync_conf_facade
-from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import (
     CommandRunner,
@@ -79,6 +86,10 @@ from pcs.lib.pacemaker.values import validate_id
 from pcs.lib.services import get_service_manager as _get_service_manager
 from pcs.lib.services import service_exception_to_report
 
+if TYPE_CHECKING:
+    # importing the library environment is slow, import it only when needed
+    from pcs.lib.env import LibraryEnvironment
+
 # pylint: disable=invalid-name
 # pylint: disable=too-many-branches
 # pylint: disable=too-many-locals
@@ -93,6 +104,107 @@ filename = ""
 pcs_options: Dict[Any, Any] = {}
 
 
+class _CibSnapshot:
+    """
+    CIB queried by the legacy commands, kept until something may change it
+    """
+
+    def __init__(self, source: Optional[str], cib_xml: str) -> None:
+        # CIB file or None for the live CIB
+        self.source = source
+        self.cib_xml = cib_xml
+        self._tree: Optional[etree._Element] = None
+
+    @property
+    def tree(self) -> etree._Element:
+        """
+        CIB parsed by lxml, shared by all readers so it must not be modified
+        """
+        if self._tree is None:
+            self._tree = etree.fromstring(self.cib_xml.encode())
+        return self._tree
+
+    def xpath_query(self, xpath_query: str) -> str:
+        """
+        Return elements matching an xpath the same way 'cibadmin --xpath' does
+        """
+        try:
+            result_list = self.tree.xpath(xpath_query)
+        except etree.XPathError:
+            return ""
+        if not isinstance(result_list, list):
+            return ""
+        element_list = []
+        for result in result_list:
+            if isinstance(result, etree._Element):
+                element_list.append(result)
+            # cibadmin returns the parent element for attribute and text nodes
+            elif isinstance(result, etree._ElementUnicodeResult):
+                parent = result.getparent()
+                if parent is not None:
+                    element_list.append(parent)
+        if not element_list:
+            return ""
+        if len(element_list) == 1:
+            return etree.tostring(
+                element_list[0], encoding="unicode", with_tail=False
+            )
+        return "<xpath-query>{0}</xpath-query>".format(
+            "".join(
+                etree.tostring(element, encoding="unicode", with_tail=False)
+                for element in element_list
+            )
+        )
+
+
+# Legacy commands read the CIB many times during one run of pcs. The CIB is
+# kept, so that cibadmin does not have to be run for each of the reads.
+_cib_snapshot: Optional[_CibSnapshot] = None
+
+
+def _get_cib_snapshot() -> Optional[_CibSnapshot]:
+    """
+    Commandline options:
+      * -f - CIB file
+    """
+    # pylint: disable=global-statement
+    global _cib_snapshot
+    source = filename if usefile else None
+    if _cib_snapshot is None or _cib_snapshot.source != source:
+        output, retval = run(["cibadmin", "-l", "-Q"])
+        if retval != 0:
+            return None
+        _cib_snapshot = _CibSnapshot(source, output)
+    return _cib_snapshot
+
+
+def invalidate_cib_snapshot() -> None:
+    """
+    Drop the kept CIB, it is queried again when it is needed next time
+    """
+    # pylint: disable=global-statement
+    global _cib_snapshot
+    _cib_snapshot = None
+
+
+def _is_cib_query(args: StringSequence) -> bool:
+    """
+    Check if running a command keeps the CIB unchanged for sure
+    """
+    command = os.path.basename(args[0]) if args else ""
+    if command == "cibadmin":
+        return "-Q" in args or "--query" in args
+    return command == "crm_mon"
+
+
+def _cib_snapshot_middleware(next_in_line, env, *args, **kwargs):
+    # library commands may change the CIB
+    try:
+        return next_in_line(env, *args, **kwargs)
+    finally:
+        invalidate_cib_snapshot()
+
+
 def getValidateWithVersion(dom) -> Version:
     """
     Commandline options: no options
@@ -545,6 +657,8 @@ def sendHTTPRequest(
         request=request,
         port=port,
     )
+    # the remote node may change the CIB of the cluster
+    invalidate_cib_snapshot()
     if "--debug" in pcs_options:
         print_to_stderr(f"Sending HTTP Request to: {url}\nData: {data}")
 
@@ -571,12 +685,14 @@ def sendHTTPRequest(
     timeout = pcs_options.get("--request-timeout", timeout)
 
     handler = pycurl.Curl()
+    handler.setopt(pycurl.SHARE, get_curl_share())
     handler.setopt(pycurl.PROTOCOLS, pycurl.PROTO_HTTPS)
     handler.setopt(pycurl.URL, url.encode("utf-8"))
     handler.setopt(pycurl.WRITEFUNCTION, output.write)
-    handler.setopt(pycurl.VERBOSE, 1)
     handler.setopt(pycurl.NOSIGNAL, 1)  # required for multi-threading
-    handler.setopt(pycurl.DEBUGFUNCTION, __debug_callback)
+    if "--debug" in pcs_options:
+        handler.setopt(pycurl.VERBOSE, 1)
+        handler.setopt(pycurl.DEBUGFUNCTION, __debug_callback)
     handler.setopt(pycurl.TIMEOUT_MS, int(timeout * 1000))
     handler.setopt(pycurl.SSL_VERIFYHOST, 0)
     handler.setopt(pycurl.SSL_VERIFYPEER, 0)
@@ -600,13 +716,15 @@ def sendHTTPRequest(
                 "Communication debug info for calling: {url}\n"
                 "--Debug Communication Output Start--\n"
                 "{debug_comm_output}\n"
-                "--Debug Communication Output End--".format(
+                "--Debug Communication Output End--\n"
+                "Timings: {timings}".format(
                     response_code=response_code,
                     response_data=response_data,
                     url=url,
                     debug_comm_output=debug_output.getvalue().decode(
                         "utf-8", "ignore"
                     ),
+                    timings=ResponseTimings.from_handle(handler).to_text(),
                 )
             )
 
@@ -847,6 +965,8 @@ def run(
     if usefile:
         env_var["CIB_file"] = filename
         touch_cib_file(filename)
+    if not _is_cib_query(args):
+        invalidate_cib_snapshot()
 
     command = args[0]
     if command[0:3] == "crm" or command in [
@@ -916,11 +1036,18 @@ def cmd_runner():
         env_vars["CIB_file"] = filename
     env_vars.update(os.environ)
     env_vars["LC_ALL"] = "C"
-    return CommandRunner(
+    return _LegacyCommandRunner(
         logging.getLogger("pcs"), get_report_processor(), env_vars
     )
 
 
+class _LegacyCommandRunner(CommandRunner):
+    def run(self, args, *other_args, **kwargs):
+        if not _is_cib_query(args):
+            invalidate_cib_snapshot()
+        return super().run(args, *other_args, **kwargs)
+
+
 def run_pcsdcli(command, data=None):
     """
     Commandline options:
@@ -1162,11 +1289,7 @@ def does_exist(xpath_query):
     Commandline options:
       * -f - CIB file
     """
-    args = ["cibadmin", "-Q", "--xpath", xpath_query]
-    dummy_output, retval = run(args)
-    if retval != 0:
-        return False
-    return True
+    return get_cib_xpath(xpath_query) != ""
 
 
 def get_group_children(group_id):
@@ -1646,11 +1769,10 @@ def get_cib_xpath(xpath_query):
     Commandline options:
       * -f - CIB file
     """
-    args = ["cibadmin", "-Q", "--xpath", xpath_query]
-    output, retval = run(args)
-    if retval != 0:
+    snapshot = _get_cib_snapshot()
+    if snapshot is None:
         return ""
-    return output
+    return snapshot.xpath_query(xpath_query)
 
 
 def get_cib(scope=None):
@@ -1658,9 +1780,12 @@ def get_cib(scope=None):
     Commandline options:
       * -f - CIB file
     """
-    command = ["cibadmin", "-l", "-Q"]
-    if scope:
-        command.append("--scope=%s" % scope)
+    if not scope:
+        snapshot = _get_cib_snapshot()
+        if snapshot is None:
+            err("unable to get cib")
+        return snapshot.cib_xml
+    command = ["cibadmin", "-l", "-Q", "--scope=%s" % scope]
     output, retval = run(command)
     if retval != 0:
         if retval == 105 and scope:
@@ -1670,6 +1795,22 @@ def get_cib(scope=None):
     return output
 
 
+def get_cib_lxml_readonly() -> etree._Element:
+    """
+    Return the CIB parsed by lxml without parsing it again for each call
+
+    The tree is shared by all callers, it must not be modified. Use
+    get_cib_dom or get_cib_etree to get a CIB to modify.
+
+    Commandline options:
+      * -f - CIB file
+    """
+    snapshot = _get_cib_snapshot()
+    if snapshot is None:
+        raise reports_output.error("unable to get cib")
+    return snapshot.tree
+
+
 def get_cib_dom(cib_xml=None):
     """
     Commandline options:
@@ -2662,7 +2803,7 @@ def get_utilization_str(element, filter_name=None):
     return " ".join(output)
 
 
-def get_lib_env() -> LibraryEnvironment:
+def get_lib_env() -> "LibraryEnvironment":
     """
     Commandline options:
       * -f - CIB file
@@ -2693,6 +2834,9 @@ def get_lib_env() -> LibraryEnvironment:
         except IOError as e:
             err("Unable to read %s: %s" % (conf, e.strerror))
 
+    # pylint: disable=import-outside-toplevel
+    from pcs.lib.env import LibraryEnvironment
+
     return LibraryEnvironment(
         logging.getLogger("pcs"),
         get_report_processor(),
@@ -2746,7 +2890,10 @@ def get_middleware_factory():
       * -f
     """
     return middleware.create_middleware_factory(
-        cib=middleware.cib(filename if usefile else None, touch_cib_file),
+        cib=middleware.build(
+            middleware.cib(filename if usefile else None, touch_cib_file),
+            _cib_snapshot_middleware,
+        ),
         corosync_conf_existing=middleware.corosync_conf_existing(
             pcs_options.get("--corosync_conf", None)
         ),
@@ -0,0 +1,53 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.cli.reports.processor import ReportProcessorToConsole
+from pcs.common import reports
+from pcs.common.reports.item import ReportItem
+
+
+def _fixture_debug_item():
+    return ReportItem.debug(
+        reports.messages.RunExternalProcessFinished(
+            "a_command", 0, "stdout", "stderr"
+        )
+    )
+
+
+@mock.patch("pcs.cli.reports.processor.print_report")
+class ReportProcessorToConsoleTest(TestCase):
+    def test_debug_ignored(self, mock_print):
+        report_item = _fixture_debug_item()
+        with mock.patch.object(report_item, "to_dto") as mock_to_dto:
+            ReportProcessorToConsole().report(report_item)
+        mock_to_dto.assert_not_called()
+        mock_print.assert_not_called()
+
+    def test_debug_printed(self, mock_print):
+        report_item = _fixture_debug_item()
+        ReportProcessorToConsole(debug=True).report(report_item)
+        mock_print.assert_called_once_with(report_item.to_dto())
+
+    def test_suppressed_severity(self, mock_print):
+        processor = ReportProcessorToConsole()
+        processor.suppress_reports_of_severity(
+            [reports.ReportItemSeverity.WARNING]
+        )
+        processor.report(
+            ReportItem.warning(reports.messages.CibUpgradeSuccessful())
+        )
+        processor.report(
+            ReportItem.info(reports.messages.CibUpgradeSuccessful())
+        )
+        mock_print.assert_called_once()
+        self.assertEqual(
+            mock_print.call_args[0][0].severity.level,
+            reports.ReportItemSeverity.INFO,
+        )
+
+    def test_is_debug_enabled(self, mock_print):
+        del mock_print
+        self.assertFalse(ReportProcessorToConsole().is_debug_enabled())
+        self.assertTrue(ReportProcessorToConsole(debug=True).is_debug_enabled())
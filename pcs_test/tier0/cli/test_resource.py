@@ -4,10 +4,17 @@ from unittest import (
     TestCase,
     mock,
 )
+from xml.dom.minidom import parseString
 
-from pcs import resource
+from lxml import etree
+
+from pcs import (
+    constraint,
+    resource,
+)
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.reports.processor import ReportItemSeverity
+from pcs.lib.cib.references import ReferenceIndex
 
 from pcs_test.tools.assertions import (
     AssertPcsMixin,
@@ -1235,3 +1242,103 @@ class ResourceUnmanage(TestCase):
         self.resource.unmanage.assert_called_once_with(
             ["R1", "R2"], with_monitor=True
         )
+
+
+class RemoveResourceReferences(TestCase):
+    def setUp(self):
+        self.cib_xml = """
+            <cib>
+              <configuration>
+                <resources>
+                  <clone id="A-clone">
+                    <primitive id="A"/>
+                  </clone>
+                  <primitive id="B"/>
+                  <primitive id="C"/>
+                </resources>
+                <constraints>
+                  <rsc_order id="O1" first="A" then="B"/>
+                  <rsc_colocation id="C1" rsc="B" with-rsc="A"/>
+                  <rsc_location id="L1" rsc="A-clone" node="n1" score="10"/>
+                  <rsc_colocation id="C2" rsc="T" with-rsc="C"/>
+                  <rsc_order id="OS1">
+                    <resource_set id="OS1-set1">
+                      <resource_ref id="A"/>
+                      <resource_ref id="B"/>
+                    </resource_set>
+                    <resource_set id="OS1-set2">
+                      <resource_ref id="A"/>
+                    </resource_set>
+                  </rsc_order>
+                  <rsc_ticket id="TS1" ticket="ticket">
+                    <resource_set id="TS1-set">
+                      <resource_ref id="A"/>
+                    </resource_set>
+                  </rsc_ticket>
+                </constraints>
+                <tags>
+                  <tag id="T">
+                    <obj_ref id="A"/>
+                  </tag>
+                  <tag id="T2">
+                    <obj_ref id="A"/>
+                    <obj_ref id="C"/>
+                  </tag>
+                </tags>
+              </configuration>
+            </cib>
+        """
+        self.dom = parseString(self.cib_xml)
+        patcher = mock.patch("pcs.constraint.print_to_stderr")
+        self.mock_print = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_ids(self, tag):
+        return [
+            element.getAttribute("id")
+            for element in self.dom.getElementsByTagName(tag)
+        ]
+
+    def test_find_constraints(self):
+        cib = etree.fromstring(self.cib_xml)
+        index = ReferenceIndex(cib)
+        constraints, set_constraints = constraint.find_constraints_containing(
+            "A", cib, reference_index=index
+        )
+        self.assertEqual(constraints, ["L1", "C1", "O1"])
+        self.assertEqual(sorted(set_constraints), ["OS1", "TS1"])
+        self.assertEqual(
+            constraint.find_constraints_containing(
+                "C", cib, reference_index=index
+            ),
+            (["C2"], []),
+        )
+        self.assertEqual(
+            constraint.find_constraints_containing("X", cib), ([], [])
+        )
+
+    def test_remove_references(self):
+        resource.remove_resource_references(self.dom, "A", output=True)
+        self.assertEqual(self.get_ids("rsc_order"), ["OS1"])
+        self.assertEqual(self.get_ids("rsc_colocation"), [])
+        self.assertEqual(self.get_ids("rsc_location"), [])
+        self.assertEqual(self.get_ids("rsc_ticket"), [])
+        self.assertEqual(self.get_ids("resource_set"), ["OS1-set1"])
+        self.assertEqual(self.get_ids("resource_ref"), ["B"])
+        self.assertEqual(self.get_ids("tag"), ["T2"])
+        self.assertEqual(self.get_ids("obj_ref"), ["C"])
+        self.mock_print.assert_has_calls(
+            [
+                mock.call("Removing Constraint - C2"),
+                mock.call("Removing Constraint - L1"),
+                mock.call("Removing Constraint - C1"),
+                mock.call("Removing Constraint - O1"),
+                mock.call("Removing A from set OS1-set1"),
+                mock.call("Removing A from set OS1-set2"),
+                mock.call("Removing set OS1-set2"),
+                mock.call("Removing A from set TS1-set"),
+                mock.call("Removing set TS1-set"),
+                mock.call("Removing constraint TS1"),
+            ]
+        )
+        self.assertEqual(self.mock_print.call_count, 10)
@@ -7,9 +7,13 @@ from dataclasses import (
 from typing import (
     Any,
     List,
+    Optional,
+    Set,
 )
 from unittest import TestCase
 
+import dacite
+
 import pcs
 from pcs.common.interface.dto import (
     DataTransferObject,
@@ -17,7 +21,10 @@ from pcs.common.interface.dto import (
     meta,
     to_dict,
 )
-from pcs.common.types import CorosyncNodeAddressType
+from pcs.common.types import (
+    CorosyncNodeAddressType,
+    StringSequence,
+)
 
 
 def _import_all(_path):
@@ -132,3 +139,81 @@ class UnexpectedTypes(TestCase):
         self.assertEqual(
             dict(field_a="a", field_b={1: "1", 2: "2"}), to_dict(dto)
         )
+
+
+@dataclass
+class DtoWithOptional(DataTransferObject):
+    field_a: float
+    field_b: StringSequence
+    field_c: Optional[MyDto1] = None
+    field_d: List[str] = field(default_factory=list)
+
+
+@dataclass
+class DtoWithSet(DataTransferObject):
+    field_a: Set[str]
+
+
+class FromDict(TestCase):
+    def test_defaults(self):
+        self.assertEqual(
+            DtoWithOptional(1, ["a", "b"]),
+            from_dict(DtoWithOptional, dict(field_a=1, field_b=["a", "b"])),
+        )
+
+    def test_optional_none(self):
+        self.assertEqual(
+            DtoWithOptional(1.5, ("a",), None, ["x"]),
+            from_dict(
+                DtoWithOptional,
+                dict(field_a=1.5, field_b=("a",), field_c=None, field_d=["x"]),
+            ),
+        )
+
+    def test_extra_keys_ignored(self):
+        self.assertEqual(
+            MyDto1(1, 2, 3),
+            from_dict(
+                MyDto1, {"field_a": 1, "field-b": 2, "field_c": 3, "x": 4}
+            ),
+        )
+
+    def test_extra_keys_strict(self):
+        with self.assertRaises(dacite.UnexpectedDataError):
+            from_dict(
+                MyDto1,
+                {"field_a": 1, "field-b": 2, "field_c": 3, "x": 4},
+                strict=True,
+            )
+
+    def test_missing_key(self):
+        with self.assertRaises(dacite.MissingValueError):
+            from_dict(MyDto1, {"field_a": 1, "field_c": 3})
+
+    def test_wrong_type(self):
+        with self.assertRaises(dacite.WrongTypeError):
+            from_dict(MyDto1, {"field_a": 1, "field-b": "2", "field_c": 3})
+
+    def test_wrong_type_nested(self):
+        with self.assertRaises(dacite.WrongTypeError):
+            from_dict(
+                DtoWithOptional,
+                dict(field_a=1, field_b=["a"], field_d=["x", 1]),
+            )
+
+    def test_invalid_enum_value(self):
+        with self.assertRaises(ValueError):
+            from_dict(
+                MyDto2,
+                {
+                    "field_d": 0,
+                    "field-e": {"field_a": 1, "field-b": 2, "field_c": 3},
+                    "field_f": "IPv5",
+                },
+            )
+
+    def test_unsupported_type(self):
+        self.assertEqual(
+            DtoWithSet({"a", "b"}),
+            from_dict(DtoWithSet, dict(field_a={"a", "b"})),
+        )
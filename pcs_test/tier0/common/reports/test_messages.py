@@ -3851,6 +3851,18 @@ class ClusterStartSuccess(NameBuildTest):
             "node1: Cluster started", reports.ClusterStartSuccess("node1")
         )
 
+    def test_startup_time(self):
+        self.assert_message_from_report(
+            "node1: Cluster started in 12 seconds",
+            reports.ClusterStartSuccess("node1", 12),
+        )
+
+    def test_startup_time_singular(self):
+        self.assert_message_from_report(
+            "node1: Cluster started in 1 second",
+            reports.ClusterStartSuccess("node1", 1),
+        )
+
 
 class ServiceNotInstalled(NameBuildTest):
     def test_multiple_services(self):
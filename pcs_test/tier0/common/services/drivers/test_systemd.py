@@ -6,7 +6,10 @@ from unittest import (
 from pcs.common.services import errors
 from pcs.common.services.drivers import SystemdDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import (
+    ExecutorResult,
+    ServiceStatus,
+)
 
 
 def service_name(service, instance=None):
@@ -190,6 +193,88 @@ class IsRunningTest(Base):
         )
 
 
+class GetServicesStatusTest(Base):
+    def setUp(self):
+        super().setUp()
+        self.service_list = ["service1", "service2", "service3"]
+        self.show_cmd = [
+            self.binary,
+            "show",
+            "--property=UnitFileState,ActiveState",
+            "service1.service",
+            "service2.service",
+            "service3.service",
+        ]
+
+    def test_success(self):
+        self.mock_executor.run.return_value = ExecutorResult(
+            0,
+            (
+                "UnitFileState=enabled\n"
+                "ActiveState=active\n"
+                "\n"
+                "ActiveState=reloading\n"
+                "UnitFileState=disabled\n"
+                "\n"
+                "UnitFileState=\n"
+                "ActiveState=inactive\n"
+            ),
+            "",
+        )
+        self.assertEqual(
+            self.driver.get_services_status(self.service_list),
+            {
+                "service1": ServiceStatus(enabled=True, running=True),
+                "service2": ServiceStatus(enabled=False, running=True),
+                "service3": ServiceStatus(enabled=False, running=False),
+            },
+        )
+        self.mock_executor.run.assert_called_once_with(self.show_cmd)
+
+    def test_no_services(self):
+        self.assertEqual(self.driver.get_services_status([]), {})
+        self.mock_executor.run.assert_not_called()
+
+    def _assert_fallback(self, show_result):
+        self.mock_executor.run.side_effect = [
+            show_result,
+            ExecutorResult(0, "enabled", ""),
+            ExecutorResult(3, "inactive", ""),
+            ExecutorResult(1, "disabled", ""),
+            ExecutorResult(0, "active", ""),
+            ExecutorResult(1, "", "error"),
+            ExecutorResult(1, "", "error"),
+        ]
+        self.assertEqual(
+            self.driver.get_services_status(self.service_list),
+            {
+                "service1": ServiceStatus(enabled=True, running=False),
+                "service2": ServiceStatus(enabled=False, running=True),
+                "service3": ServiceStatus(enabled=False, running=False),
+            },
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call(self.show_cmd),
+                mock.call([self.binary, "is-enabled", "service1.service"]),
+                mock.call([self.binary, "is-active", "service1.service"]),
+                mock.call([self.binary, "is-enabled", "service2.service"]),
+                mock.call([self.binary, "is-active", "service2.service"]),
+                mock.call([self.binary, "is-enabled", "service3.service"]),
+                mock.call([self.binary, "is-active", "service3.service"]),
+            ],
+        )
+
+    def test_failure(self):
+        self._assert_fallback(ExecutorResult(1, "", "error"))
+
+    def test_unexpected_output(self):
+        self._assert_fallback(
+            ExecutorResult(0, "UnitFileState=enabled\nActiveState=active\n", "")
+        )
+
+
 class IsInstalledTest(Base):
     def test_installed(self):
         output = (
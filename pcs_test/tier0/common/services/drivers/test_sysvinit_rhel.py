@@ -6,7 +6,10 @@ from unittest import (
 from pcs.common.services import errors
 from pcs.common.services.drivers import SysVInitRhelDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import (
+    ExecutorResult,
+    ServiceStatus,
+)
 
 
 class Base(TestCase):
@@ -182,6 +185,32 @@ class IsRunningTest(Base):
         )
 
 
+class GetServicesStatusTest(Base):
+    def test_success(self):
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(0, "on", ""),
+            ExecutorResult(3, "is stopped", ""),
+            ExecutorResult(1, "off", ""),
+            ExecutorResult(0, "is running", ""),
+        ]
+        self.assertEqual(
+            self.driver.get_services_status(["service1", "service2"]),
+            {
+                "service1": ServiceStatus(enabled=True, running=False),
+                "service2": ServiceStatus(enabled=False, running=True),
+            },
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call([self.chkconfig_bin, "service1"]),
+                mock.call([self.service_bin, "service1", "status"]),
+                mock.call([self.chkconfig_bin, "service2"]),
+                mock.call([self.service_bin, "service2", "status"]),
+            ],
+        )
+
+
 class IsInstalledTest(Base):
     def test_installed(self):
         output = (
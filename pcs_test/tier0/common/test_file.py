@@ -11,6 +11,7 @@ from pcs.common.file import (
     FileMetadata,
     RawFile,
     RawFileError,
+    get_file_stamp,
 )
 
 from pcs_test.tools.misc import (
@@ -56,6 +57,22 @@ class RawFileExists(TestCase):
         mock_exists.assert_called_once_with(FILE_PATH)
 
 
+class GetFileStamp(TestCase):
+    def test_file_exists(self):
+        stat = mock.Mock(
+            st_ino=1, st_size=2, st_mtime_ns=3, st_ctime_ns=4, spec=[]
+        )
+        with patch_file("os.stat", return_value=stat) as mock_stat:
+            self.assertEqual(get_file_stamp(FILE_PATH), (1, 2, 3, 4))
+        mock_stat.assert_called_once_with(FILE_PATH)
+
+    def test_file_missing(self):
+        with patch_file(
+            "os.stat", side_effect=FileNotFoundError(errno.ENOENT, "")
+        ):
+            self.assertIsNone(get_file_stamp(FILE_PATH))
+
+
 @patch_file("fcntl.flock")
 class RawFileRead(TestCase):
     def assert_read_in_correct_mode(self, mock_flock, raw_file, mode):
@@ -1,4 +1,5 @@
 import io
+import threading
 from unittest import (
     TestCase,
     mock,
@@ -267,12 +268,53 @@ class ResponseTest(TestCase):
         self.assertIsNone(response.response_code)
 
 
+class ResponseTimingsTest(TestCase):
+    def setUp(self):
+        self.handle = MockCurl(
+            {
+                pycurl.NAMELOOKUP_TIME: 0.001,
+                pycurl.CONNECT_TIME: 0.0025,
+                pycurl.APPCONNECT_TIME: 0.012,
+                pycurl.STARTTRANSFER_TIME: 0.2,
+                pycurl.TOTAL_TIME: 0.2104,
+            }
+        )
+
+    def test_from_handle(self):
+        self.assertEqual(
+            lib.ResponseTimings(0.001, 0.0025, 0.012, 0.2, 0.2104),
+            lib.ResponseTimings.from_handle(self.handle),
+        )
+
+    def test_to_text(self):
+        self.assertEqual(
+            (
+                "name lookup: 0.001s, connect: 0.003s, TLS handshake: "
+                "0.012s, first byte: 0.200s, total: 0.210s"
+            ),
+            lib.ResponseTimings.from_handle(self.handle).to_text(),
+        )
+
+
+class GetCurlShare(TestCase):
+    def test_same_share_in_thread(self):
+        self.assertIs(lib.get_curl_share(), lib.get_curl_share())
+
+    def test_share_per_thread(self):
+        share_list = []
+        thread = threading.Thread(
+            target=lambda: share_list.append(lib.get_curl_share())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(lib.get_curl_share(), share_list[0])
+
+
 @mock.patch("pcs.common.node_communicator.pycurl.Curl")
 class CreateRequestHandleTest(TestCase):
     # pylint: disable=no-member, protected-access
     _common_opts = {
         pycurl.PROTOCOLS: pycurl.PROTO_HTTPS,
-        pycurl.VERBOSE: 1,
         pycurl.SSL_VERIFYHOST: 0,
         pycurl.SSL_VERIFYPEER: 0,
         pycurl.NOSIGNAL: 1,
@@ -299,9 +341,10 @@ class CreateRequestHandleTest(TestCase):
             "name1": "val1",
             "name2": "val2",
         }
-        handle = lib._create_request_handle(request, cookies, 1)
+        handle = lib._create_request_handle(request, cookies, 1, debug=True)
         expected_opts = {
             pycurl.TIMEOUT: 1,
+            pycurl.VERBOSE: 1,
             pycurl.URL: request.url.encode("utf-8"),
             pycurl.COOKIE: "name1=val1;name2=val2;token=token_val".encode(
                 "utf-8"
@@ -332,6 +375,7 @@ class CreateRequestHandleTest(TestCase):
         expected_opts = {
             pycurl.TIMEOUT: 10,
             pycurl.URL: request.url.encode("utf-8"),
+            pycurl.SHARE: lib.get_curl_share(),
         }
         expected_opts.update(self._common_opts)
         self.assertLessEqual(
@@ -339,6 +383,8 @@ class CreateRequestHandleTest(TestCase):
         )
         self.assertFalse(pycurl.COOKIE in handle.opts)
         self.assertFalse(pycurl.COPYPOSTFIELDS in handle.opts)
+        self.assertFalse(pycurl.VERBOSE in handle.opts)
+        self.assertFalse(pycurl.DEBUGFUNCTION in handle.opts)
         self.assertIs(request, handle.request_obj)
         self.assertEqual("", handle.output_buffer.getvalue().decode("utf-8"))
         self.assertEqual("", handle.debug_buffer.getvalue().decode("utf-8"))
@@ -359,6 +405,15 @@ class CommunicatorBaseTest(TestCase):
         self.mock_com_log = mock.MagicMock(
             spec_set=lib.CommunicatorLoggerInterface
         )
+        self.mock_com_log.is_debug_enabled.return_value = False
+        self.clock = 0
+        # pylint: disable=protected-access
+        for patcher in [
+            mock.patch.dict(lib._preferred_dest_dict, clear=True),
+            mock.patch("time.monotonic", lambda: self.clock),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
     def get_communicator(self):
         return lib.Communicator(self.mock_com_log, None, None)
@@ -385,7 +440,7 @@ class CommunicatorSimpleTest(CommunicatorBaseTest):
         self.assertIs(handle, response.handle)
         self.assertIs(request, response.request)
         mock_create_handle.assert_called_once_with(
-            request, {}, settings.default_request_timeout
+            request, {}, settings.default_request_timeout, False
         )
         return response
 
@@ -425,7 +480,7 @@ class CommunicatorMultiTest(CommunicatorBaseTest):
     )
     def test_call_start_loop_multiple_times(self, _, mock_create_handle):
         com = self.get_communicator()
-        mock_create_handle.side_effect = lambda request, _, __: MockCurl(
+        mock_create_handle.side_effect = lambda request, *_: MockCurl(
             request=request
         )
         com.add_requests([fixture_request(i) for i in range(2)])
@@ -471,7 +526,8 @@ class CommunicatorMultiTest(CommunicatorBaseTest):
         for i in range(len(request_list)):
             self.assertEqual(i != 1, response_list[i].was_connected)
         logger_calls = (
-            [mock.call.log_request_start(request_list[i]) for i in range(3)]
+            [mock.call.is_debug_enabled()]
+            + [mock.call.log_request_start(request_list[i]) for i in range(3)]
             + [
                 mock.call.log_response(response_list[0]),
                 mock.call.log_request_start(request_list[3]),
@@ -520,7 +576,7 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
             expected_response_list.append(response)
             return response
 
-        def _mock_create_request_handle(request, _, __):
+        def _mock_create_request_handle(request, *_):
             counter["counter"] += 1
             return (
                 MockCurl(request=request)
@@ -555,12 +611,13 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
         self.assertEqual(3, len(expected_response_list))
         mock_create_handle.assert_has_calls(
             [
-                mock.call(request, {}, settings.default_request_timeout)
+                mock.call(request, {}, settings.default_request_timeout, False)
                 for _ in range(3)
             ]
         )
         logger_calls = (
-            fixture_logger_request_retry_calls(
+            [mock.call.is_debug_enabled()]
+            + fixture_logger_request_retry_calls(
                 expected_response_list[0], Destination("host0", None)
             )
             + fixture_logger_request_retry_calls(
@@ -587,7 +644,7 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
 
         mock_con_failure.side_effect = _con_failure
         com = self.get_multiaddress_communicator()
-        mock_create_handle.side_effect = lambda request, _, __: MockCurl(
+        mock_create_handle.side_effect = lambda request, *_: MockCurl(
             error=(pycurl.E_SEND_ERROR, "reason"),
             request=request,
         )
@@ -612,12 +669,13 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
         self.assertEqual(4, len(expected_response_list))
         mock_create_handle.assert_has_calls(
             [
-                mock.call(request, {}, settings.default_request_timeout)
+                mock.call(request, {}, settings.default_request_timeout, False)
                 for _ in range(3)
             ]
         )
         logger_calls = (
-            fixture_logger_request_retry_calls(
+            [mock.call.is_debug_enabled()]
+            + fixture_logger_request_retry_calls(
                 expected_response_list[0], Destination("host0", None)
             )
             + fixture_logger_request_retry_calls(
@@ -635,3 +693,154 @@ class MultiaddressCommunicatorTest(CommunicatorBaseTest):
         self.assertEqual(logger_calls, self.mock_com_log.mock_calls)
         # pylint: disable=no-member, protected-access
         com._multi_handle.assert_no_handle_left()
+
+
+class MultiaddressCommunicatorSequentialTest(MultiaddressCommunicatorTest):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(lib, "_PARALLEL_CONNECT_SUPPORTED", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class MockCurlConnecting(MockCurl):
+    """
+    Curl handle which establishes a connection before performing a request
+    """
+
+    def perform(self):
+        if (
+            self.opts[pycurl.PREREQFUNCTION]("", "", 0, 0)
+            == pycurl.PREREQFUNC_ABORT
+        ):
+            self._error = (pycurl.E_ABORTED_BY_CALLBACK, "aborted")
+            return
+        super().perform()
+
+
+@mock.patch("pcs.common.node_communicator._create_request_handle")
+class MultiaddressCommunicatorRaceTest(CommunicatorBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.request = self.fixture_request()
+
+    @staticmethod
+    def fixture_request():
+        return lib.Request(
+            lib.RequestTarget(
+                "label", dest_list=_addr_list_to_dest(["host0", "host1"])
+            ),
+            lib.RequestData("action"),
+        )
+
+    @staticmethod
+    def fixture_create_handle(handle_dict, dest_log):
+        def _create_handle(request, *_):
+            dest_log.append(request.dest.addr)
+            handle = handle_dict[request.dest.addr]
+            handle.request_obj = request
+            return handle
+
+        return _create_handle
+
+    @mock.patch(
+        "pcs.common.node_communicator.pycurl.CurlMulti",
+        side_effect=lambda: MockCurlMulti([2]),
+    )
+    def test_first_connected_wins(self, _, mock_create_handle):
+        dest_log = []
+        mock_create_handle.side_effect = self.fixture_create_handle(
+            dict(host0=MockCurlConnecting(), host1=MockCurlConnecting()),
+            dest_log,
+        )
+        com = self.get_multiaddress_communicator()
+        com.add_requests([self.request])
+        # the first address does not connect in time, so the second address
+        # is tried in parallel
+        self.clock = 1
+        response_list = list(com.start_loop())
+        self.assertEqual(["host0", "host1"], dest_log)
+        self.assertEqual(1, len(response_list))
+        response = response_list[0]
+        self.assertTrue(response.was_connected)
+        self.assertIs(self.request, response.request)
+        self.assertEqual(Destination("host0", None), self.request.dest)
+        self.assertEqual(
+            [
+                mock.call.is_debug_enabled(),
+                mock.call.log_request_start(self.request),
+                mock.call.log_request_start(self.request),
+                mock.call.log_response(response),
+            ],
+            self.mock_com_log.mock_calls,
+        )
+        # pylint: disable=no-member, protected-access
+        com._multi_handle.assert_no_handle_left()
+
+    @mock.patch(
+        "pcs.common.node_communicator.pycurl.CurlMulti",
+        side_effect=lambda: MockCurlMulti([1, 1]),
+    )
+    def test_working_address_preferred(self, _, mock_create_handle):
+        dest_log = []
+        mock_create_handle.side_effect = self.fixture_create_handle(
+            dict(
+                host0=MockCurl(error=(pycurl.E_COULDNT_CONNECT, "reason")),
+                host1=MockCurlConnecting(),
+            ),
+            dest_log,
+        )
+        com = self.get_multiaddress_communicator()
+        com.add_requests([self.request])
+        response_list = list(com.start_loop())
+        self.assertEqual(["host0", "host1"], dest_log)
+        self.assertEqual(1, len(response_list))
+        self.assertTrue(response_list[0].was_connected)
+        self.assertEqual(Destination("host1", None), self.request.dest)
+
+        dest_log.clear()
+        mock_create_handle.side_effect = self.fixture_create_handle(
+            dict(host1=MockCurlConnecting()), dest_log
+        )
+        request = self.fixture_request()
+        com = self.get_multiaddress_communicator()
+        com.add_requests([request])
+        response_list = list(com.start_loop())
+        self.assertEqual(["host1"], dest_log)
+        self.assertEqual(1, len(response_list))
+        self.assertTrue(response_list[0].was_connected)
+        self.assertEqual(Destination("host1", None), request.dest)
+
+    @mock.patch(
+        "pcs.common.node_communicator.pycurl.CurlMulti",
+        side_effect=lambda: MockCurlMulti([1]),
+    )
+    def test_no_retry_after_connected(self, _, mock_create_handle):
+        dest_log = []
+        mock_create_handle.side_effect = self.fixture_create_handle(
+            dict(
+                host0=MockCurlConnecting(
+                    error=(pycurl.E_OPERATION_TIMEDOUT, "timeout")
+                )
+            ),
+            dest_log,
+        )
+        com = self.get_multiaddress_communicator()
+        com.add_requests([self.request])
+        response_list = list(com.start_loop())
+        # the request may have been processed by the host, it must not be
+        # sent again via another address
+        self.assertEqual(["host0"], dest_log)
+        self.assertEqual(1, len(response_list))
+        response = response_list[0]
+        self.assertFalse(response.was_connected)
+        self.assertEqual(
+            [
+                mock.call.is_debug_enabled(),
+                mock.call.log_request_start(self.request),
+                mock.call.log_response(response),
+            ],
+            self.mock_com_log.mock_calls,
+        )
+        # pylint: disable=protected-access
+        self.assertEqual({}, lib._preferred_dest_dict)
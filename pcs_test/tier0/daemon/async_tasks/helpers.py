@@ -63,6 +63,7 @@ class SchedulerTestWrapper:
     logging_queue = None
 
     def prepare_scheduler(self):
+        # pylint: disable=protected-access
         # Instance attributes are not created in the mock, this includes handler
         # list which is needed by QueueListener
         self.logger_mock = mock.patch(
@@ -74,21 +75,20 @@ class SchedulerTestWrapper:
         # self.worker_com = mp.Queue()
         self.worker_com = Queue()
         self.logging_queue = Queue()
-        # Manager has to be mocked because it creates a new process
         # There are two queue calls, first is for worker message queue, second
         # is for the logging queue
-        mock.patch(
-            "multiprocessing.Manager"
-        ).start().return_value.Queue.side_effect = [
+        mock.patch("multiprocessing.SimpleQueue").start().side_effect = [
             self.worker_com,
             self.logging_queue,
-            # mp.Queue(),
         ]
         self.mp_pool_mock = (
             mock.patch("multiprocessing.Pool", spec=mp.Pool)
             .start()
             .return_value
         ) = mock.Mock()
+        # The thread reading messages from workers is not started, messages
+        # are put to the queue of received messages directly instead
+        mock.patch("pcs.daemon.async_tasks.scheduler.Thread").start()
         # This might be needed when logger is called by get_logger, but is it?
         self.scheduler = scheduler.Scheduler(
             scheduler.SchedulerConfig(
@@ -97,6 +97,7 @@ class SchedulerTestWrapper:
                 task_config=TaskConfig(deletion_timeout=0),
             )
         )
+        self.scheduler._received_message_q = self.worker_com
 
     def _create_tasks(self, count, start_from=0):
         """Creates tasks with task_ident from id0 to idN"""
@@ -121,6 +122,7 @@ class SchedulerBaseTestCase(SchedulerTestWrapper, TestCase):
     def setUp(self):
         SchedulerTestWrapper.prepare_scheduler(self)
         super().setUp()
+        self.addCleanup(self.scheduler.terminate_nowait)
         self.addCleanup(mock.patch.stopall)
 
 
@@ -128,6 +130,7 @@ class SchedulerBaseAsyncTestCase(SchedulerTestWrapper, AsyncTestCase):
     def setUp(self):
         SchedulerTestWrapper.prepare_scheduler(self)
         super().setUp()
+        self.addCleanup(self.scheduler.terminate_nowait)
         self.addCleanup(mock.patch.stopall)
 
 
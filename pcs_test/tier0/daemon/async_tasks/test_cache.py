@@ -0,0 +1,92 @@
+import dataclasses
+import os
+from typing import (
+    Any,
+    Optional,
+)
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.daemon.async_tasks.worker import cache
+
+from pcs_test.tools.misc import get_tmp_file
+
+
+def _command(env, name: str, count: Optional[int] = None, force=False):
+    # pylint: disable=unused-argument
+    pass
+
+
+class GetParamsDataclass(TestCase):
+    def setUp(self):
+        cache.get_params_dataclass.cache_clear()
+        self.addCleanup(cache.get_params_dataclass.cache_clear)
+
+    def test_fields(self):
+        params = cache.get_params_dataclass("command", _command)
+        self.assertEqual(params.__name__, "command_params")
+        self.assertEqual(
+            [
+                (field.name, field.type, field.default)
+                for field in dataclasses.fields(params)
+            ],
+            [
+                ("name", str, dataclasses.MISSING),
+                ("count", Optional[int], None),
+                ("force", Any, False),
+            ],
+        )
+
+    def test_reused(self):
+        self.assertIs(
+            cache.get_params_dataclass("command", _command),
+            cache.get_params_dataclass("command", _command),
+        )
+
+
+@mock.patch("pcs.daemon.async_tasks.worker.cache.FileInstance")
+@mock.patch(
+    "pcs.daemon.async_tasks.worker.cache.read_known_hosts_file_not_cached"
+)
+class ReadKnownHostsCached(TestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.known_hosts_file = get_tmp_file("tier0_worker_known_hosts")
+        self.addCleanup(self.known_hosts_file.close)
+        self.known_hosts_file.write("known hosts")
+        self.known_hosts_file.flush()
+        self.addCleanup(setattr, cache, "_known_hosts_cache", None)
+        cache._known_hosts_cache = None
+
+    def _set_path(self, mock_file_instance, path):
+        mock_file_instance.for_known_hosts.return_value.raw_file.metadata.path = (
+            path
+        )
+
+    def test_file_read_once(self, mock_read, mock_file_instance):
+        self._set_path(mock_file_instance, self.known_hosts_file.name)
+        mock_read.return_value = {"node1": "host1"}
+        self.assertEqual(cache.read_known_hosts_cached(), {"node1": "host1"})
+        self.assertEqual(cache.read_known_hosts_cached(), {"node1": "host1"})
+        mock_read.assert_called_once_with()
+
+    def test_file_changed(self, mock_read, mock_file_instance):
+        self._set_path(mock_file_instance, self.known_hosts_file.name)
+        mock_read.side_effect = [{"node1": "host1"}, {"node2": "host2"}]
+        self.assertEqual(cache.read_known_hosts_cached(), {"node1": "host1"})
+        self.known_hosts_file.write("changed known hosts")
+        self.known_hosts_file.flush()
+        self.assertEqual(cache.read_known_hosts_cached(), {"node2": "host2"})
+        self.assertEqual(mock_read.call_count, 2)
+
+    def test_file_missing(self, mock_read, mock_file_instance):
+        path = self.known_hosts_file.name
+        self._set_path(mock_file_instance, path)
+        mock_read.return_value = {}
+        self.known_hosts_file.close()
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(cache.read_known_hosts_cached(), {})
+        self.assertEqual(cache.read_known_hosts_cached(), {})
+        self.assertEqual(mock_read.call_count, 2)
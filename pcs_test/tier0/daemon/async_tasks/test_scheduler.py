@@ -1,8 +1,14 @@
 # pylint: disable=protected-access
 import dataclasses
+import logging
+import multiprocessing as mp
+import os
+import queue
 from queue import Empty
+from threading import Thread
 from unittest import mock
 
+from tornado import gen
 from tornado.testing import gen_test
 
 from pcs.common.async_tasks.dto import (
@@ -15,22 +21,28 @@ from pcs.common.async_tasks.types import (
     TaskKillReason,
     TaskState,
 )
-from pcs.common.reports import ReportItem
+from pcs.common.reports import (
+    ReportItem,
+    ReportItemContext,
+)
 from pcs.common.reports.messages import CibUpgradeSuccessful
 from pcs.daemon.async_tasks import scheduler
 from pcs.daemon.async_tasks.task import (
     Task,
     TaskConfig,
 )
+from pcs.daemon.async_tasks.worker.communicator import WorkerCommunicator
 from pcs.daemon.async_tasks.worker.executor import task_executor
 from pcs.daemon.async_tasks.worker.types import (
     Message,
     TaskExecuted,
+    TaskFinished,
 )
 
 from .helpers import (
     ANOTHER_AUTH_USER,
     AUTH_USER,
+    MockOsKillMixin,
     SchedulerBaseAsyncTestCase,
     SchedulerBaseTestCase,
 )
@@ -182,6 +194,106 @@ class ReceiveMessagesTest(SchedulerBaseAsyncTestCase):
         with self.assertRaises(Empty):
             self.worker_com.get_nowait()
 
+    @mock.patch(
+        "pcs.daemon.async_tasks.scheduler._MAX_RECEIVED_MESSAGES_PER_RUN", 2
+    )
+    @gen_test
+    async def test_limit_messages_per_run(self):
+        self._create_tasks(1)
+        os.read(self.scheduler.wakeup_fd, 4096)
+        for _ in range(3):
+            self.worker_com.put(
+                Message("id0", ReportItem.info(CibUpgradeSuccessful()).to_dto())
+            )
+        self.assertEqual(await self.scheduler._receive_messages(), 2)
+        self.assertTrue(os.read(self.scheduler.wakeup_fd, 4096))
+        self.assertEqual(await self.scheduler._receive_messages(), 1)
+
+
+class ReceiveMessagesThroughPipeTest(
+    MockOsKillMixin, SchedulerBaseAsyncTestCase
+):
+    WORKER_COUNT = 4
+    REPORT_COUNT = 2500
+
+    def setUp(self):
+        super().setUp()
+        self._init_mock_os_kill()
+        # multiprocessing.SimpleQueue and the reader thread are mocked by the
+        # test case, the scheduler stops the reader thread when terminating
+        self.message_q = mp.get_context().SimpleQueue()
+        self.logging_q = mp.get_context().SimpleQueue()
+        self.scheduler._worker_message_q = self.message_q
+        self.scheduler._received_message_q = queue.SimpleQueue()
+        self.scheduler._message_reader = Thread(
+            target=self.scheduler._read_messages
+        )
+        self.scheduler._message_reader.start()
+
+    def _worker(self, task_ident):
+        worker_com = WorkerCommunicator(self.message_q, self.logging_q)
+        worker_com.put(Message(task_ident, TaskExecuted(WORKER1_PID)))
+        for i in range(self.REPORT_COUNT):
+            worker_com.put(
+                Message(
+                    task_ident,
+                    ReportItem.info(
+                        CibUpgradeSuccessful(),
+                        context=ReportItemContext(str(i)),
+                    ).to_dto(),
+                )
+            )
+            worker_com.put_log_record(
+                logging.makeLogRecord({"msg": f"{task_ident} {i}"})
+            )
+        worker_com.put(
+            Message(task_ident, TaskFinished(TaskFinishType.SUCCESS, "result"))
+        )
+
+    @gen_test(timeout=60)
+    async def test_all_reports_received(self):
+        self._create_tasks(self.WORKER_COUNT)
+        task_list = list(self.scheduler._task_register.values())
+        worker_list = [
+            Thread(target=self._worker, args=(task.task_ident,))
+            for task in task_list
+        ]
+        log_record_list = []
+        # log records are not read by the scheduler in this test
+        log_reader = Thread(
+            target=lambda: log_record_list.extend(
+                self.logging_q.get()
+                for _ in range(self.WORKER_COUNT * self.REPORT_COUNT)
+            )
+        )
+        log_reader.start()
+        for worker in worker_list:
+            worker.start()
+        received = 0
+        while any(task.state != TaskState.FINISHED for task in task_list):
+            received += await self.scheduler._receive_messages()
+            await gen.sleep(0)
+        for worker in worker_list:
+            worker.join()
+        log_reader.join()
+        self.assertEqual(received, self.WORKER_COUNT * (self.REPORT_COUNT + 2))
+        for task in task_list:
+            task_dto = task.to_dto()
+            self.assertEqual(
+                [report.context.node for report in task_dto.reports],
+                [str(i) for i in range(self.REPORT_COUNT)],
+            )
+            self.assertEqual(task_dto.result, "result")
+        for task in task_list:
+            self.assertEqual(
+                [
+                    record.msg
+                    for record in log_record_list
+                    if record.msg.startswith(task.task_ident + " ")
+                ],
+                [f"{task.task_ident} {i}" for i in range(self.REPORT_COUNT)],
+            )
+
 
 class ProcessTasksTest(SchedulerBaseAsyncTestCase):
     @gen_test
@@ -263,13 +375,16 @@ class DeadlockDetectionTest(SchedulerBaseTestCase):
             task.state = state
         return task
 
+    def _add_tasks(self, *task_list):
+        for task in task_list:
+            self.scheduler._task_register[task.task_ident] = task
+            self.scheduler._task_index[task.state][task.task_ident] = task
+
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: False)
     def test_threshold_not_achieved(self):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2")
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2)
-        }
+        self._add_tasks(task1, task2)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", get_generator([True, False]))
@@ -277,9 +392,7 @@ class DeadlockDetectionTest(SchedulerBaseTestCase):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.EXECUTED)
         task3 = self._create_task("3")
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3)
-        }
+        self._add_tasks(task1, task2, task3)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -287,27 +400,21 @@ class DeadlockDetectionTest(SchedulerBaseTestCase):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.EXECUTED)
         task3 = self._create_task("3", TaskState.FINISHED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3)
-        }
+        self._add_tasks(task1, task2, task3)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
     def test_new_tasks_waiting(self):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.CREATED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2)
-        }
+        self._add_tasks(task1, task2)
         self.assertTrue(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
     def test_queued_tasks_waiting(self):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.QUEUED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2)
-        }
+        self._add_tasks(task1, task2)
         self.assertTrue(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -315,9 +422,7 @@ class DeadlockDetectionTest(SchedulerBaseTestCase):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.QUEUED)
         task3 = self._create_task("3", TaskState.CREATED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3)
-        }
+        self._add_tasks(task1, task2, task3)
         self.assertTrue(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -329,9 +434,7 @@ class DeadlockDetectionTest(SchedulerBaseTestCase):
         task2 = self._create_task("2", TaskState.QUEUED)
         task3 = self._create_task("3", TaskState.CREATED)
         task4 = self._create_task("4", TaskState.EXECUTED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3, task4)
-        }
+        self._add_tasks(task1, task2, task3, task4)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -344,7 +447,73 @@ class DeadlockDetectionTest(SchedulerBaseTestCase):
         task2 = self._create_task("2", TaskState.QUEUED)
         task3 = self._create_task("3", TaskState.CREATED)
         task4 = self._create_task("4", TaskState.EXECUTED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3, task4)
-        }
+        self._add_tasks(task1, task2, task3, task4)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
+
+
+class WakeupTest(SchedulerBaseAsyncTestCase):
+    def _assert_woken_up(self):
+        self.assertTrue(os.read(self.scheduler.wakeup_fd, 4096))
+
+    def _assert_not_woken_up(self):
+        with self.assertRaises(BlockingIOError):
+            os.read(self.scheduler.wakeup_fd, 4096)
+
+    def test_not_woken_up(self):
+        self._assert_not_woken_up()
+
+    def test_new_task(self):
+        self._create_tasks(1)
+        self._assert_woken_up()
+
+    def test_kill_task(self):
+        self._create_tasks(1)
+        self._assert_woken_up()
+        self.scheduler.kill_task("id0", AUTH_USER)
+        self._assert_woken_up()
+
+    @mock.patch("pcs.daemon.async_tasks.scheduler.IOLoop")
+    def test_handle_wakeup(self, mock_ioloop):
+        self._create_tasks(3)
+        self.scheduler.handle_wakeup(self.scheduler.wakeup_fd, 0)
+        self._assert_not_woken_up()
+        mock_ioloop.current.return_value.add_callback.assert_called_once_with(
+            self.scheduler._process_wakeup
+        )
+
+    @gen_test
+    async def test_process_wakeup(self):
+        self._create_tasks(3)
+        await self.scheduler._process_wakeup()
+        self.assertEqual(self.mp_pool_mock.apply_async.call_count, 3)
+        self.worker_com.put(Message("id0", TaskExecuted(WORKER1_PID)))
+        await self.scheduler._process_wakeup()
+        self.assertEqual(
+            {
+                state: list(tasks.keys())
+                for state, tasks in self.scheduler._task_index.items()
+            },
+            {
+                TaskState.CREATED: [],
+                TaskState.QUEUED: ["id1", "id2"],
+                TaskState.EXECUTED: ["id0"],
+                TaskState.FINISHED: [],
+            },
+        )
+
+    @gen_test
+    async def test_process_wakeup_does_not_delete_tasks(self):
+        self._create_tasks(1)
+        task = self.scheduler._task_register["id0"]
+        task.request_kill(TaskKillReason.USER)
+        await self.scheduler._process_wakeup()
+        self.assertEqual(task.state, TaskState.FINISHED)
+        task.request_deletion()
+        await self.scheduler._process_wakeup()
+        self.assertEqual(list(self.scheduler._task_register), ["id0"])
+        await self.scheduler.perform_actions()
+        self.assertEqual(self.scheduler._task_register, {})
+        self.assertEqual(
+            self.scheduler._task_index,
+            {state: {} for state in TaskState},
+        )
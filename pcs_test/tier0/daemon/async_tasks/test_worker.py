@@ -1,3 +1,4 @@
+import logging
 from multiprocessing import Queue
 from unittest import (
     TestCase,
@@ -12,6 +13,8 @@ from pcs.common.async_tasks.dto import (
 )
 from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.async_tasks.worker import executor
+from pcs.daemon.async_tasks.worker.communicator import WorkerCommunicator
+from pcs.daemon.async_tasks.worker.logging import QueueHandler
 from pcs.daemon.async_tasks.worker.types import (
     Message,
     TaskExecuted,
@@ -200,3 +203,57 @@ class TestExecutor(MockOsKillMixin, TestCase):
         self.assertIsInstance(payload, TaskFinished)
         self.assertEqual(types.TaskFinishType.SUCCESS, payload.task_finish_type)
         self.assertEqual(RESULT, payload.result)
+
+
+class TestWorkerCommunicator(TestCase):
+    def setUp(self):
+        self.queue = mock.Mock(spec_set=["put"])
+        self.logging_queue = mock.Mock(spec_set=["put"])
+        self.worker_com = WorkerCommunicator(self.queue, self.logging_queue)
+
+    def test_put(self):
+        message = Message(TASK_IDENT, TaskExecuted(WORKER_PID))
+        self.queue.put.side_effect = lambda _: self.assertTrue(
+            self.worker_com.is_locked
+        )
+        self.worker_com.put(message)
+        self.queue.put.assert_called_once_with(message)
+        self.logging_queue.put.assert_not_called()
+        self.assertFalse(self.worker_com.is_locked)
+
+    def test_put_log_record(self):
+        record = logging.makeLogRecord({"msg": "message"})
+        self.logging_queue.put.side_effect = lambda _: self.assertTrue(
+            self.worker_com.is_locked
+        )
+        self.worker_com.put_log_record(record)
+        self.logging_queue.put.assert_called_once_with(record)
+        self.queue.put.assert_not_called()
+        self.assertFalse(self.worker_com.is_locked)
+
+    def test_terminate_after_put(self):
+        message = Message(TASK_IDENT, TaskExecuted(WORKER_PID))
+        self.worker_com.set_terminate()
+        with self.assertRaises(SystemExit):
+            self.worker_com.put(message)
+        self.queue.put.assert_called_once_with(message)
+        self.assertFalse(self.worker_com.is_locked)
+
+    def test_terminate_after_put_log_record(self):
+        record = logging.makeLogRecord({"msg": "message"})
+        self.worker_com.set_terminate()
+        with self.assertRaises(SystemExit):
+            self.worker_com.put_log_record(record)
+        self.logging_queue.put.assert_called_once_with(record)
+        self.assertFalse(self.worker_com.is_locked)
+
+
+class TestQueueHandler(TestCase):
+    def test_record_sent_by_worker_com(self):
+        worker_com = mock.Mock(spec_set=["put_log_record"])
+        logger = logging.Logger("test")
+        logger.addHandler(QueueHandler(worker_com))
+        logger.info("message %s", "arg")
+        worker_com.put_log_record.assert_called_once()
+        record = worker_com.put_log_record.call_args[0][0]
+        self.assertEqual(record.getMessage(), "message arg")
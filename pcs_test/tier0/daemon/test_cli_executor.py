@@ -0,0 +1,163 @@
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import threading
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.daemon import cli_executor
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+class ParseRequest(TestCase):
+    def assert_invalid(self, request, message):
+        with self.assertRaises(cli_executor.InvalidRequest) as cm:
+            cli_executor.parse_request(json.dumps(request).encode())
+        self.assertEqual(str(cm.exception), message)
+
+    def test_valid(self):
+        self.assertEqual(
+            cli_executor.parse_request(
+                json.dumps(
+                    dict(
+                        cmd="pcs",
+                        args=["resource", "config"],
+                        stdin=None,
+                        environment=dict(CIB_user="user", CIB_user_groups=None),
+                    )
+                ).encode()
+            ),
+            dict(
+                cmd="pcs",
+                args=["resource", "config"],
+                stdin=None,
+                environment=dict(CIB_user="user", CIB_user_groups=None),
+            ),
+        )
+
+    def test_defaults(self):
+        self.assertEqual(
+            cli_executor.parse_request(b'{"cmd": "pcs_internal"}'),
+            dict(cmd="pcs_internal", args=[], stdin=None, environment={}),
+        )
+
+    def test_not_json(self):
+        with self.assertRaises(cli_executor.InvalidRequest):
+            cli_executor.parse_request(b"pcs status")
+
+    def test_not_object(self):
+        self.assert_invalid(["pcs"], "Request is not an object")
+
+    def test_unknown_command(self):
+        self.assert_invalid(dict(cmd="rm"), "Unknown command 'rm'")
+
+    def test_invalid_args(self):
+        self.assert_invalid(
+            dict(cmd="pcs", args=["status", 1]),
+            "Arguments are not a list of strings",
+        )
+
+    def test_invalid_stdin(self):
+        self.assert_invalid(
+            dict(cmd="pcs", stdin=["data"]), "Stdin is not a string"
+        )
+
+    def test_not_allowed_environment(self):
+        self.assert_invalid(
+            dict(cmd="pcs", environment=dict(PATH="/tmp")),
+            "Invalid environment variables",
+        )
+
+
+def _fake_pcs():
+    print(" ".join(sys.argv))
+    print(os.environ.get("CIB_user"), os.environ.get("CIB_user_groups"))
+    print(sys.stdin.read().strip())
+    sys.stdout.flush()
+    subprocess.run(["echo", "external"], check=True)
+    sys.stderr.write("error\n")
+    sys.exit(3)
+
+
+def _fake_pcs_internal():
+    raise RuntimeError("crash")
+
+
+class Executor(TestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        tmp_dir = get_tmp_dir("tier0_cli_executor")
+        self.addCleanup(tmp_dir.cleanup)
+        self.socket_path = os.path.join(tmp_dir.name, "socket")
+        patcher = mock.patch.object(
+            cli_executor._RequestHandler,
+            "entry_points",
+            {
+                cli_executor.CMD_PCS: _fake_pcs,
+                cli_executor.CMD_PCS_INTERNAL: _fake_pcs_internal,
+            },
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # pylint: disable=protected-access
+        server = cli_executor._ExecutorServer(
+            self.socket_path, cli_executor._RequestHandler
+        )
+        self.addCleanup(server.server_close)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.shutdown)
+
+    def send(self, request):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps(request).encode())
+            sock.shutdown(socket.SHUT_WR)
+            response = b""
+            while True:
+                data = sock.recv(4096)
+                if not data:
+                    break
+                response += data
+        return json.loads(response)
+
+    def test_socket_mode(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+
+    def test_run_command(self):
+        self.assertEqual(
+            self.send(
+                dict(
+                    cmd="pcs",
+                    args=["resource", "config"],
+                    stdin="input\n",
+                    environment=dict(CIB_user="hacluster", CIB_user_groups="a"),
+                )
+            ),
+            dict(
+                exit_code=3,
+                stdout="pcs resource config\nhacluster a\ninput\nexternal\n",
+                stderr="error\n",
+            ),
+        )
+        # the environment of the executor is not affected
+        self.assertNotEqual(os.environ.get("CIB_user"), "hacluster")
+
+    def test_command_crashed(self):
+        response = self.send(dict(cmd="pcs_internal"))
+        self.assertEqual(response["exit_code"], 1)
+        self.assertEqual(response["stdout"], "")
+        self.assertIn("RuntimeError: crash", response["stderr"])
+
+    def test_invalid_request(self):
+        self.assertEqual(
+            self.send(dict(cmd="crm_mon")),
+            dict(error="Unknown command 'crm_mon'"),
+        )
@@ -1,5 +1,8 @@
 from contextlib import contextmanager
-from unittest import TestCase
+from unittest import (
+    TestCase,
+    mock,
+)
 
 from pcs.daemon import session
 from pcs.daemon.session import Session
@@ -75,6 +78,41 @@ class StorageTest(TestCase, PatchSessionMixin):
         self.storage.login(USER)
         self.assertIsNone(self.storage.get(session1.sid))
 
+    def test_does_not_drop_refreshed_session(self):
+        session1 = self.storage.login(USER)
+        self.now.return_value = 8
+        session1.refresh()
+        self.now.return_value = 12
+        self.storage.drop_expired()
+        self.assertIs(self.storage.get(session1.sid), session1)
+        self.now.return_value = 22.1
+        self.storage.drop_expired()
+        self.assertIsNone(self.storage.get(session1.sid))
+
+    def test_can_login_after_destroying_session(self):
+        session1 = self.storage.login(USER)
+        self.storage.destroy(session1.sid)
+        self.now.return_value = 11
+        session2 = self.storage.login(USER)
+        self.assertIs(self.storage.get(session2.sid), session2)
+
+    def test_drops_expired_sessions_without_visiting_others(self):
+        expired_sid_list = []
+        for _ in range(3):
+            expired_sid_list.append(self.storage.login(USER).sid)
+        self.now.return_value = 5
+        active_sid_list = [self.storage.login(USER).sid for _ in range(100)]
+        self.now.return_value = 12
+        with mock.patch.object(
+            Session, "was_unused_last", autospec=True, return_value=True
+        ) as was_unused_last:
+            self.storage.drop_expired()
+        self.assertEqual(len(was_unused_last.mock_calls), 3)
+        for sid in expired_sid_list:
+            self.assertIsNone(self.storage.get(sid))
+        for sid in active_sid_list:
+            self.assertIsNotNone(self.storage.get(sid))
+
     def test_can_login_new_session(self):
         session1 = self.storage.login(USER)
         self.assertIsNotNone(session1)
@@ -211,7 +211,7 @@ class AuthProviderUpdateFacadeTest(TestCase):
 
 
 @mock.patch.object(AuthProvider, "_get_facade", lambda _self: _FACADE)
-@mock.patch("pcs.lib.auth.provider.get_user_groups")
+@mock.patch("pcs.lib.auth.provider.get_user_groups_cached")
 class AuthProviderLoginByTokenTest(TestCase):
     def setUp(self):
         self.logger = mock.Mock(spec_set=Logger)
@@ -237,7 +237,7 @@ class AuthProviderLoginByTokenTest(TestCase):
 
 
 @mock.patch("pcs.lib.auth.provider.authenticate_user")
-@mock.patch("pcs.lib.auth.provider.get_user_groups")
+@mock.patch("pcs.lib.auth.provider.get_user_groups_cached")
 class AuthProviderLoginByUsernamePasswordTest(TestCase):
     def setUp(self):
         self.logger = mock.Mock(spec_set=Logger)
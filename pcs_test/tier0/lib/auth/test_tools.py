@@ -0,0 +1,55 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.lib.auth import tools
+
+
+@mock.patch("pcs.settings.user_groups_cache_lifetime_seconds", 10)
+@mock.patch("pcs.lib.auth.tools.time.monotonic")
+@mock.patch("pcs.lib.auth.tools.get_user_groups")
+class GetUserGroupsCached(TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(tools._user_groups_cache, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached(self, groups_mock, time_mock):
+        groups_mock.return_value = ["haclient", "user1"]
+        time_mock.side_effect = [100, 109]
+        self.assertEqual(
+            tools.get_user_groups_cached("user1"), ["haclient", "user1"]
+        )
+        self.assertEqual(
+            tools.get_user_groups_cached("user1"), ["haclient", "user1"]
+        )
+        groups_mock.assert_called_once_with("user1")
+
+    def test_expired(self, groups_mock, time_mock):
+        groups_mock.side_effect = [["haclient", "user1"], ["user1"]]
+        time_mock.side_effect = [100, 110]
+        self.assertEqual(
+            tools.get_user_groups_cached("user1"), ["haclient", "user1"]
+        )
+        self.assertEqual(tools.get_user_groups_cached("user1"), ["user1"])
+        self.assertEqual(
+            groups_mock.mock_calls, [mock.call("user1"), mock.call("user1")]
+        )
+
+    def test_users_cached_separately(self, groups_mock, time_mock):
+        groups_mock.side_effect = [["user1"], ["user2"]]
+        time_mock.side_effect = [100, 101, 102]
+        self.assertEqual(tools.get_user_groups_cached("user1"), ["user1"])
+        self.assertEqual(tools.get_user_groups_cached("user2"), ["user2"])
+        self.assertEqual(tools.get_user_groups_cached("user1"), ["user1"])
+        self.assertEqual(
+            groups_mock.mock_calls, [mock.call("user1"), mock.call("user2")]
+        )
+
+    def test_error_not_cached(self, groups_mock, time_mock):
+        groups_mock.side_effect = [tools.UserGroupsError(), ["user1"]]
+        time_mock.side_effect = [100, 101]
+        with self.assertRaises(tools.UserGroupsError):
+            tools.get_user_groups_cached("user1")
+        self.assertEqual(tools.get_user_groups_cached("user1"), ["user1"])
@@ -231,28 +231,40 @@ class CreateIdTest(TestCase):
         mock_find_id.assert_called_once_with("cib", "PREFIX_set_AABBCC")
 
 
-def fixture_constraint_section(return_value):
-    constraint_section = mock.MagicMock()
-    constraint_section.xpath = mock.MagicMock()
-    constraint_section.xpath.return_value = return_value
-    return constraint_section
+def fixture_constraint_section():
+    return etree.fromstring(
+        """
+        <constraints>
+          <constraint_type id="duplicate_element" sig="A"/>
+          <constraint_type id="other_element" sig="B"/>
+          <other_type id="other_type_element" sig="A"/>
+        </constraints>
+        """
+    )
+
+
+def get_signature(element):
+    return element.get("sig")
 
 
 class CheckIsWithoutDuplicationTest(TestCase):
-    def test_raises_when_duplicate_element_found(self):
-        element = mock.MagicMock()
-        element.tag = "constraint_type"
+    def setUp(self):
+        self.constraint_section = fixture_constraint_section()
+        self.element = etree.SubElement(
+            self.constraint_section,
+            "constraint_type",
+            {"id": "new_element", "sig": "A"},
+        )
 
+    def test_raises_when_duplicate_element_found(self):
         report_processor = MockLibraryReportProcessor()
         assert_raise_library_error(
             lambda: constraint.check_is_without_duplication(
                 report_processor,
-                fixture_constraint_section(
-                    [etree.Element("tag", {"id": "duplicate_element"})]
-                ),
-                element,
-                are_duplicate=lambda e1, e2: True,
-                export_element=constraint.export_with_set,
+                self.constraint_section,
+                self.element,
+                get_signature=get_signature,
+                export_element=constraint.export_plain,
             )
         )
         assert_report_item_list_equal(
@@ -264,8 +276,10 @@ class CheckIsWithoutDuplicationTest(TestCase):
                     {
                         "constraint_info_list": [
                             {
-                                "resource_sets": [],
-                                "options": {"id": "duplicate_element"},
+                                "options": {
+                                    "id": "duplicate_element",
+                                    "sig": "A",
+                                },
                             }
                         ],
                         "constraint_type": "constraint_type",
@@ -282,34 +296,27 @@ class CheckIsWithoutDuplicationTest(TestCase):
             ],
         )
 
-    @mock.patch("pcs.lib.cib.constraint.constraint.export_with_set")
-    def test_success_when_no_duplication_found(self, export_with_set):
-        export_with_set.return_value = "exported_duplicate_element"
-        element = mock.MagicMock()
-        element.tag = "constraint_type"
-        # no exception raised
+    def test_success_when_no_duplication_found(self):
+        self.element.set("sig", "C")
         report_processor = MockLibraryReportProcessor()
+        # no exception raised
         constraint.check_is_without_duplication(
             report_processor,
-            fixture_constraint_section([]),
-            element,
-            are_duplicate=lambda e1, e2: True,
-            export_element=constraint.export_with_set,
+            self.constraint_section,
+            self.element,
+            get_signature=get_signature,
+            export_element=constraint.export_plain,
         )
+        assert_report_item_list_equal(report_processor.report_item_list, [])
 
     def test_report_when_duplication_allowed(self):
-        element = mock.MagicMock()
-        element.tag = "constraint_type"
-
         report_processor = MockLibraryReportProcessor()
         constraint.check_is_without_duplication(
             report_processor,
-            fixture_constraint_section(
-                [etree.Element("tag", {"id": "duplicate_element"})]
-            ),
-            element,
-            are_duplicate=lambda e1, e2: True,
-            export_element=constraint.export_with_set,
+            self.constraint_section,
+            self.element,
+            get_signature=get_signature,
+            export_element=constraint.export_plain,
             duplication_allowed=True,
         )
         assert_report_item_list_equal(
@@ -321,8 +328,10 @@ class CheckIsWithoutDuplicationTest(TestCase):
                     {
                         "constraint_info_list": [
                             {
-                                "resource_sets": [],
-                                "options": {"id": "duplicate_element"},
+                                "options": {
+                                    "id": "duplicate_element",
+                                    "sig": "A",
+                                },
                             }
                         ],
                         "constraint_type": "constraint_type",
@@ -339,6 +348,49 @@ class CheckIsWithoutDuplicationTest(TestCase):
         )
 
 
+class DuplicateConstraintIndexTest(TestCase):
+    def test_get_duplicates(self):
+        constraint_section = fixture_constraint_section()
+        etree.SubElement(
+            constraint_section,
+            "constraint_type",
+            {"id": "another_duplicate", "sig": "A"},
+        )
+        index = constraint.DuplicateConstraintIndex(
+            constraint_section, "constraint_type", get_signature
+        )
+        element = constraint_section.find("./*[@id='duplicate_element']")
+        self.assertEqual(
+            [el.get("id") for el in index.get_duplicates(element)],
+            ["another_duplicate"],
+        )
+        self.assertEqual(
+            index.get_duplicates(etree.Element("constraint_type", sig="C")),
+            [],
+        )
+
+
+class GetResourceSetsSignatureTest(TestCase):
+    def test_signature(self):
+        element = etree.fromstring(
+            """
+            <rsc_order>
+              <resource_set id="set1" sequential="false">
+                <resource_ref id="A"/>
+                <resource_ref id="B"/>
+              </resource_set>
+              <resource_set id="set2">
+                <resource_ref id="C"/>
+              </resource_set>
+            </rsc_order>
+            """
+        )
+        self.assertEqual(
+            constraint.get_resource_sets_signature(element),
+            (("A", "B"), ("C",)),
+        )
+
+
 class CreateWithSetTest(TestCase):
     def test_put_new_constraint_to_constraint_section(self):
         constraint_section = etree.Element("constraints")
@@ -348,7 +348,7 @@ class Element:
         return self
 
 
-class AreDuplicatePlain(TestCase):
+class GetDuplicitSignaturePlain(TestCase):
     def setUp(self):
         self.first = Element(
             {
@@ -365,79 +365,69 @@ class AreDuplicatePlain(TestCase):
             }
         )
 
-    def test_returns_true_for_duplicate_elements(self):
-        self.assertTrue(
-            ticket.get_duplicit_checker_callback(False)(self.first, self.second)
+    def assert_duplicates(self, are_duplicates, new_roles_supported=False):
+        get_signature = ticket.get_duplicit_signature_callback(
+            new_roles_supported
+        )
+        self.assertEqual(
+            get_signature(self.first) == get_signature(self.second),
+            are_duplicates,
         )
 
+    def test_returns_true_for_duplicate_elements(self):
+        self.assert_duplicates(True)
+
     def test_returns_false_for_different_ticket(self):
-        self.assertFalse(
-            ticket.get_duplicit_checker_callback(False)(
-                self.first, self.second.update({"ticket": "X"})
-            )
-        )
+        self.second.update({"ticket": "X"})
+        self.assert_duplicates(False)
 
     def test_returns_false_for_different_resource(self):
-        self.assertFalse(
-            ticket.get_duplicit_checker_callback(False)(
-                self.first, self.second.update({"rsc": "Y"})
-            )
-        )
+        self.second.update({"rsc": "Y"})
+        self.assert_duplicates(False)
 
     def test_returns_false_for_different_role(self):
-        self.assertFalse(
-            ticket.get_duplicit_checker_callback(False)(
-                self.first, self.second.update({"rsc-role": "Z"})
-            )
-        )
+        self.second.update({"rsc-role": "Z"})
+        self.assert_duplicates(False)
 
     def test_returns_false_for_different_elements(self):
         self.second.update({"ticket": "X", "rsc": "Y", "rsc-role": "Z"})
-        self.assertFalse(
-            ticket.get_duplicit_checker_callback(False)(self.first, self.second)
-        )
+        self.assert_duplicates(False)
 
     def test_returns_true_for_equivalent_new_role(self):
-        self.assertTrue(
-            ticket.get_duplicit_checker_callback(False)(
-                self.first,
-                self.second.update({"rsc-role": const.PCMK_ROLE_PROMOTED}),
-            )
-        )
+        self.second.update({"rsc-role": const.PCMK_ROLE_PROMOTED})
+        self.assert_duplicates(True)
 
     def test_returns_true_for_equivalent_new_role_new_roles_supported(self):
-        self.assertTrue(
-            ticket.get_duplicit_checker_callback(True)(
-                self.first,
-                self.second.update({"rsc-role": const.PCMK_ROLE_PROMOTED}),
-            )
-        )
+        self.second.update({"rsc-role": const.PCMK_ROLE_PROMOTED})
+        self.assert_duplicates(True, new_roles_supported=True)
 
 
 @mock.patch(
-    "pcs.lib.cib.constraint.ticket.constraint.have_duplicate_resource_sets"
+    "pcs.lib.cib.constraint.ticket.constraint.get_resource_sets_signature"
 )
-class AreDuplicateWithResourceSet(TestCase):
-    def test_returns_true_for_duplicate_elements(
-        self, mock_have_duplicate_resource_sets
+class GetSignatureWithResourceSet(TestCase):
+    def test_returns_equal_for_duplicate_elements(
+        self, mock_get_resource_sets_signature
     ):
-        mock_have_duplicate_resource_sets.return_value = True
-        self.assertTrue(
-            ticket.are_duplicate_with_resource_set(
-                Element({"ticket": "ticket-key"}),
-                Element({"ticket": "ticket-key"}),
-            )
+        mock_get_resource_sets_signature.return_value = (("A",),)
+        self.assertEqual(
+            ticket.get_signature_with_resource_set(
+                Element({"ticket": "ticket-key"})
+            ),
+            ticket.get_signature_with_resource_set(
+                Element({"ticket": "ticket-key"})
+            ),
         )
 
-    def test_returns_false_for_different_elements(
-        self, mock_have_duplicate_resource_sets
+    def test_returns_different_for_different_elements(
+        self, mock_get_resource_sets_signature
     ):
-        mock_have_duplicate_resource_sets.return_value = True
-        self.assertFalse(
-            ticket.are_duplicate_with_resource_set(
-                Element({"ticket": "ticket-key"}),
-                Element({"ticket": "X"}),
-            )
+        mock_get_resource_sets_signature.return_value = (("A",),)
+        self.assertNotEqual(
+            ticket.get_signature_with_resource_set(
+                Element({"ticket": "ticket-key"})
+            ),
+            ticket.get_signature_with_resource_set(Element({"ticket": "X"})),
         )
 
 
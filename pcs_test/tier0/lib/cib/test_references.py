@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from lxml import etree
+
+from pcs.lib.cib.references import ReferenceIndex
+
+
+def _ids(element_list):
+    return [element.get("id") for element in element_list]
+
+
+class ReferenceIndexTest(TestCase):
+    def setUp(self):
+        self.cib = etree.fromstring(
+            """
+            <cib>
+              <configuration>
+                <resources/>
+                <constraints>
+                  <rsc_order id="O1" first="A" then="B"/>
+                  <rsc_colocation id="C1" rsc="B" with-rsc="B"/>
+                  <rsc_location id="L1" rsc="A" node="node1" score="10"/>
+                  <rsc_location id="L2" rsc-pattern="A.*" node="n" score="1"/>
+                  <rsc_ticket id="T1" rsc="T" ticket="ticket"/>
+                  <rsc_order id="OS1">
+                    <resource_set id="OS1-set1">
+                      <resource_ref id="A"/>
+                      <resource_ref id="C"/>
+                    </resource_set>
+                    <resource_set id="OS1-set2">
+                      <resource_ref id="A"/>
+                    </resource_set>
+                  </rsc_order>
+                  <rsc_colocation id="C2" rsc="A" with-rsc="C"/>
+                </constraints>
+                <tags>
+                  <tag id="T">
+                    <obj_ref id="A"/>
+                    <obj_ref id="B"/>
+                  </tag>
+                  <tag id="T2">
+                    <obj_ref id="A"/>
+                  </tag>
+                </tags>
+              </configuration>
+              <status/>
+            </cib>
+            """
+        )
+        self.index = ReferenceIndex(self.cib)
+
+    def test_constraints(self):
+        self.assertEqual(
+            _ids(self.index.get_constraints("A")), ["O1", "L1", "OS1", "C2"]
+        )
+        self.assertEqual(_ids(self.index.get_constraints("B")), ["O1", "C1"])
+        self.assertEqual(_ids(self.index.get_constraints("T")), ["T1"])
+        self.assertEqual(_ids(self.index.get_constraints("X")), [])
+
+    def test_plain_constraints(self):
+        self.assertEqual(
+            _ids(self.index.get_plain_constraints("A")), ["O1", "L1", "C2"]
+        )
+        self.assertEqual(_ids(self.index.get_plain_constraints("C")), ["C2"])
+
+    def test_set_constraints(self):
+        self.assertEqual(_ids(self.index.get_set_constraints("A")), ["OS1"])
+        self.assertEqual(_ids(self.index.get_set_constraints("C")), ["OS1"])
+        self.assertEqual(_ids(self.index.get_set_constraints("B")), [])
+
+    def test_any_element_of_cib(self):
+        index = ReferenceIndex(self.cib.find("./configuration/constraints"))
+        self.assertEqual(_ids(index.get_constraints("B")), ["O1", "C1"])
@@ -5,6 +5,7 @@ from lxml import etree
 
 from pcs.common import reports
 from pcs.lib.cib import tag as lib
+from pcs.lib.cib.references import ReferenceIndex
 from pcs.lib.cib.tools import (
     IdProvider,
     get_constraints,
@@ -705,13 +706,10 @@ class ValidateRemoveTag(ValidateCommonConstraintsTestData):
         )
 
 
-class FindConstraintsReferencingTag(ValidateCommonConstraintsTestData):
+class ReferenceIndexTagConstraints(ValidateCommonConstraintsTestData):
     @staticmethod
     def call_find_constraints_referencing_tag(tree, tag_id):
-        return lib.find_constraints_referencing_tag(
-            get_constraints(tree),
-            tag_id,
-        )
+        return ReferenceIndex(get_constraints(tree)).get_constraints(tag_id)
 
     def assert_constraint_id(self, tag_id):
         one_constraint_list = self.call_find_constraints_referencing_tag(
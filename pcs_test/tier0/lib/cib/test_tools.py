@@ -274,6 +274,188 @@ class FindUniqueIdTest(CibToolsTest):
         )
 
 
+class IdIndex(TestCase):
+    def setUp(self):
+        self.cib = etree.fromstring(
+            """
+            <cib>
+                <configuration>
+                    <resources>
+                        <primitive id="R1">
+                            <meta_attributes id="R1-meta">
+                                <nvpair id="R1-meta-remote" name="remote-node"
+                                    value="node1"
+                                />
+                            </meta_attributes>
+                        </primitive>
+                        <primitive id="R2"/>
+                        <group id="G"/>
+                    </resources>
+                    <tags>
+                        <tag id="T">
+                            <obj_ref id="R1"/>
+                            <obj_ref id="R3"/>
+                        </tag>
+                    </tags>
+                    <acls>
+                        <acl_target id="target1"/>
+                    </acls>
+                </configuration>
+                <status>
+                    <lrm_resource id="R4"/>
+                </status>
+            </cib>
+            """
+        )
+        self.id_index = lib.index_ids(self.cib)
+        self.resources = self.cib.find("configuration/resources")
+        patcher = mock.patch(
+            "pcs.lib.cib.tools._find_configuration_elements_by_id",
+            wraps=lib._find_configuration_elements_by_id,
+        )
+        self.mock_find = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_found_without_search(self):
+        self.assertIs(
+            lib.get_element_by_id(self.cib, "R2"),
+            self.resources.find("primitive[@id='R2']"),
+        )
+        self.assertEqual(
+            lib.get_configuration_elements_by_id(self.cib, "node1"),
+            [self.resources.find("primitive[@id='R1']")],
+        )
+        self.assertTrue(lib.does_id_exist(self.cib, "R1-meta-remote"))
+        self.mock_find.assert_not_called()
+
+    def test_not_found_searched(self):
+        for element_id in ("R3", "R4", "target1", "X"):
+            with self.subTest(element_id=element_id):
+                self.assertFalse(lib.does_id_exist(self.cib, element_id))
+        self.assertEqual(
+            self.mock_find.mock_calls,
+            [
+                mock.call(self.cib, element_id)
+                for element_id in ("R3", "R4", "target1", "X")
+            ],
+        )
+
+    def test_find_unique_id(self):
+        self.assertEqual(lib.find_unique_id(self.cib, "R1-meta"), "R1-meta-1")
+        self.mock_find.assert_called_once_with(self.cib, "R1-meta-1")
+
+    def test_index_built_on_first_lookup(self):
+        primitive = etree.SubElement(self.resources, "primitive", id="R5")
+        self.assertIs(lib.get_element_by_id(self.cib, "R5"), primitive)
+        self.mock_find.assert_not_called()
+
+    def test_not_indexed_element_found_and_cached(self):
+        self.assertFalse(lib.does_id_exist(self.cib, "R5"))
+        primitive = etree.SubElement(self.resources, "primitive", id="R5")
+        self.assertIs(lib.get_element_by_id(self.cib, "R5"), primitive)
+        self.assertIs(lib.get_element_by_id(self.cib, "R5"), primitive)
+        self.assertEqual(
+            self.mock_find.mock_calls,
+            [mock.call(self.cib, "R5"), mock.call(self.cib, "R5")],
+        )
+
+    def test_added_element(self):
+        self.assertFalse(lib.does_id_exist(self.cib, "R5"))
+        primitive = etree.SubElement(self.resources, "primitive", id="R5")
+        etree.SubElement(
+            etree.SubElement(primitive, "meta_attributes", id="R5-meta"),
+            "nvpair",
+            id="R5-meta-remote",
+            name="remote-node",
+            value="node2",
+        )
+        lib.add_to_id_index(primitive)
+        self.assertIs(lib.get_element_by_id(self.cib, "R5"), primitive)
+        self.assertIs(lib.get_element_by_id(self.cib, "node2"), primitive)
+        self.assertTrue(lib.does_id_exist(self.cib, "R5-meta-remote"))
+        self.mock_find.assert_called_once_with(self.cib, "R5")
+
+    def test_added_element_with_allocated_id(self):
+        provider = lib.IdProvider(self.cib)
+        for _ in range(3):
+            lib.add_to_id_index(
+                etree.SubElement(
+                    self.resources, "primitive", id=provider.allocate_id("R2")
+                )
+            )
+        self.assertEqual(
+            lib.find_unique_id(self.cib, "R2"),
+            "R2-4",
+        )
+        # only the free ids are searched for
+        self.assertEqual(
+            self.mock_find.mock_calls,
+            [mock.call(self.cib, f"R2-{i}") for i in range(1, 5)],
+        )
+
+    def test_added_detached_element(self):
+        primitive = etree.Element("primitive", id="R5")
+        lib.add_to_id_index(primitive)
+        self.assertFalse(lib.does_id_exist(self.cib, "R5"))
+        self.resources.append(primitive)
+        lib.add_to_id_index(primitive)
+        self.assertIs(lib.get_element_by_id(self.cib, "R5"), primitive)
+
+    def test_removed_element(self):
+        lib.remove_element(self.resources.find("primitive[@id='R1']"))
+        for element_id in ("R1", "R1-meta", "R1-meta-remote", "node1"):
+            with self.subTest(element_id=element_id):
+                self.assertFalse(lib.does_id_exist(self.cib, element_id))
+        self.assertIsNone(self.resources.find("primitive[@id='R1']"))
+
+    def test_removed_remote_node(self):
+        lib.remove_element(self.resources.find(".//nvpair"))
+        self.assertFalse(lib.does_id_exist(self.cib, "node1"))
+        self.assertTrue(lib.does_id_exist(self.cib, "R1"))
+
+    def test_changed_remote_node(self):
+        nvpair = self.resources.find(".//nvpair")
+        lib.remove_from_id_index(nvpair)
+        nvpair.set("value", "node2")
+        lib.add_to_id_index(nvpair)
+        self.assertFalse(lib.does_id_exist(self.cib, "node1"))
+        self.assertTrue(lib.does_id_exist(self.cib, "node2"))
+        self.mock_find.assert_called_once_with(self.cib, "node1")
+
+    def test_moved_element(self):
+        primitive = self.resources.find("primitive[@id='R2']")
+        self.resources.find("group").append(primitive)
+        self.assertIs(lib.get_element_by_id(self.cib, "R2"), primitive)
+        self.mock_find.assert_not_called()
+
+    def test_removed_element_not_reported(self):
+        self.resources.remove(self.resources.find("primitive[@id='R2']"))
+        self.assertFalse(lib.does_id_exist(self.cib, "R2"))
+
+    def test_changed_id_not_reported(self):
+        self.resources.find("primitive[@id='R2']").set("id", "R5")
+        self.assertFalse(lib.does_id_exist(self.cib, "R2"))
+
+    def test_moved_to_status(self):
+        self.cib.find("status").append(
+            self.resources.find("primitive[@id='R2']")
+        )
+        self.assertFalse(lib.does_id_exist(self.cib, "R2"))
+
+    def test_other_tree_not_indexed(self):
+        tree = etree.fromstring(
+            "<cib><configuration><resources><primitive id='R1'/>"
+            "</resources></configuration></cib>"
+        )
+        self.assertTrue(lib.does_id_exist(tree, "R1"))
+        self.mock_find.assert_called_once_with(tree, "R1")
+
+    def test_released_index(self):
+        del self.id_index
+        self.assertTrue(lib.does_id_exist(self.cib, "R1"))
+        self.mock_find.assert_called_once_with(self.cib, "R1")
+
+
 class CreateSubelementId(TestCase):
     def test_create_plain_id_when_no_conflicting_id_there(self):
         context = etree.fromstring('<cib><a id="b"/></cib>')
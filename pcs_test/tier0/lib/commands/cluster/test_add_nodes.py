@@ -549,16 +549,26 @@ class LocalConfig:
         local_prefix = "local.pcsd_ssl_cert_sync."
         pcsd_ssl_cert = "pcsd ssl cert"
         pcsd_ssl_key = "pcsd ssl key"
+        # the certificate and key are read along with the other files, before
+        # the files are distributed
+        files_sync_call = "local.files_sync.http.files.put_files_requests"
+        read_before = (
+            files_sync_call
+            if files_sync_call in self.config.calls.names
+            else None
+        )
         (
             self.config.fs.open(
                 settings.pcsd_cert_location,
                 mock.mock_open(read_data=pcsd_ssl_cert)(),
                 name=f"{local_prefix}fs.open.pcsd_ssl_cert",
+                before=read_before,
             )
             .fs.open(
                 settings.pcsd_key_location,
                 mock.mock_open(read_data=pcsd_ssl_key)(),
                 name=f"{local_prefix}fs.open.pcsd_ssl_key",
+                before=read_before,
             )
             .http.host.send_pcsd_cert(
                 cert=pcsd_ssl_cert, key=pcsd_ssl_key, node_labels=node_labels
@@ -847,10 +857,15 @@ class AddNodesSuccessMinimal(TestCase):
         (
             self.config.http.host.start_cluster(
                 node_labels=self.new_nodes
-            ).http.host.check_pacemaker_started(self.new_nodes)
+            ).http.host.check_pacemaker_started(
+                self.new_nodes,
+                wait=1,
+            )
         )
 
-        with mock.patch("time.sleep", lambda secs: None):
+        with mock.patch("time.sleep", lambda secs: None), mock.patch(
+            "time.time", lambda: 0
+        ):
             cluster.add_nodes(
                 self.env_assist.get_env(),
                 # [{"name": "node4"}],
@@ -875,6 +890,7 @@ class AddNodesSuccessMinimal(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=0,
                 )
                 for node in self.new_nodes
             ]
@@ -974,9 +990,14 @@ class AddNodesSuccessMinimal(TestCase):
         (
             self.config.http.host.enable_cluster(node_labels=self.new_nodes)
             .http.host.start_cluster(node_labels=self.new_nodes)
-            .http.host.check_pacemaker_started(self.new_nodes)
+            .http.host.check_pacemaker_started(
+                self.new_nodes,
+                wait=1,
+            )
         )
-        with mock.patch("time.sleep", lambda secs: None):
+        with mock.patch("time.sleep", lambda secs: None), mock.patch(
+            "time.time", lambda: 0
+        ):
             cluster.add_nodes(
                 self.env_assist.get_env(),
                 [{"name": node} for node in self.new_nodes],
@@ -1011,6 +1032,7 @@ class AddNodesSuccessMinimal(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=0,
                 )
                 for node in self.new_nodes
             ]
@@ -1996,14 +2018,6 @@ class FailurePcsdSslCertSync(TestCase):
             .fs.isdir(settings.booth_config_dir, return_value=False)
             .local.no_file_sync()
         )
-        self.expected_reports.extend(
-            [
-                fixture.info(
-                    reports.codes.PCSD_SSL_CERT_AND_KEY_DISTRIBUTION_STARTED,
-                    node_name_list=self.new_nodes,
-                )
-            ]
-        )
 
     def _add_nodes_with_lib_error(self):
         self.env_assist.assert_raise_library_error(
@@ -2079,6 +2093,12 @@ class FailurePcsdSslCertSync(TestCase):
 
         self.env_assist.assert_reports(
             self.expected_reports
+            + [
+                fixture.info(
+                    reports.codes.PCSD_SSL_CERT_AND_KEY_DISTRIBUTION_STARTED,
+                    node_name_list=self.new_nodes,
+                )
+            ]
             + [
                 fixture.info(
                     reports.codes.PCSD_SSL_CERT_AND_KEY_SET_SUCCESS,
@@ -477,11 +477,15 @@ class SetupSuccessMinimal(TestCase):
         )
 
     @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", lambda: 0)
     def test_start_wait(self):
         (
             self.config.http.host.start_cluster(
                 NODE_LIST
-            ).http.host.check_pacemaker_started(NODE_LIST)
+            ).http.host.check_pacemaker_started(
+                NODE_LIST,
+                wait=1,
+            )
         )
         cluster.setup(
             self.env_assist.get_env(),
@@ -506,6 +510,7 @@ class SetupSuccessMinimal(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=0,
                 )
                 for node in NODE_LIST
             ]
@@ -545,11 +550,15 @@ class SetupSuccessMinimal(TestCase):
         )
 
     @mock.patch("time.sleep", lambda secs: None)
+    @mock.patch("time.time", lambda: 0)
     def test_enable_start_wait(self):
         (
             self.config.http.host.enable_cluster(NODE_LIST)
             .http.host.start_cluster(NODE_LIST)
-            .http.host.check_pacemaker_started(NODE_LIST)
+            .http.host.check_pacemaker_started(
+                NODE_LIST,
+                wait=1,
+            )
         )
         cluster.setup(
             self.env_assist.get_env(),
@@ -585,6 +594,7 @@ class SetupSuccessMinimal(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=0,
                 )
                 for node in NODE_LIST
             ]
@@ -2300,6 +2310,7 @@ class SetupWithWait(TestCase):
         self.config.http.host.check_pacemaker_started(
             pacemaker_started_node_list=NODE_LIST[:1],
             pacemaker_not_started_node_list=NODE_LIST[1:],
+            wait=0,
         )
         self.env_assist.assert_raise_library_error(
             lambda: cluster.setup(
@@ -2326,6 +2337,7 @@ class SetupWithWait(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=4,
                 )
                 for node in NODE_LIST[:1]
             ]
@@ -2370,18 +2382,22 @@ class SetupWithWait(TestCase):
             self.config.http.host.check_pacemaker_started(
                 pacemaker_started_node_list=NODE_LIST[:1],
                 pacemaker_not_started_node_list=NODE_LIST[1:],
+                wait=18,
             )
             .http.host.check_pacemaker_started(
                 pacemaker_not_started_node_list=NODE_LIST[1:],
+                wait=15,
                 name="pcmk_status_check_1",
             )
             .http.host.check_pacemaker_started(
                 pacemaker_started_node_list=NODE_LIST[1:2],
                 pacemaker_not_started_node_list=NODE_LIST[2:],
+                wait=13,
                 name="pcmk_status_check_2",
             )
             .http.host.check_pacemaker_started(
                 pacemaker_started_node_list=NODE_LIST[2:3],
+                wait=10,
                 name="pcmk_status_check_3",
             )
         )
@@ -2390,7 +2406,7 @@ class SetupWithWait(TestCase):
             CLUSTER_NAME,
             [dict(name=node, addrs=None) for node in NODE_LIST],
             start=True,
-            wait=5,
+            wait=20,
         )
         self.env_assist.assert_reports(
             reports_success_minimal_fixture()
@@ -2408,8 +2424,103 @@ class SetupWithWait(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=startup_seconds,
                 )
-                for node in NODE_LIST
+                for node, startup_seconds in zip(NODE_LIST, [4, 9, 12])
+            ]
+        )
+
+    @mock.patch("time.sleep")
+    @mock.patch("time.time", get_time_mock())
+    def test_nodes_waiting_for_start(self, mock_sleep):
+        started = json.dumps(dict(pending=False, online=True))
+        not_started = json.dumps(dict(pending=True, online=False, waited=True))
+        self.config.http.host.check_pacemaker_started(
+            communication_list=[
+                [
+                    dict(label=NODE_LIST[0], output=started),
+                    dict(label=NODE_LIST[1], output=not_started),
+                    dict(label=NODE_LIST[2], output=not_started),
+                ],
+                [dict(label=NODE_LIST[1], output=started)],
+                [dict(label=NODE_LIST[2], output=started)],
+            ],
+            wait=settings.node_startup_wait_request_seconds,
+        )
+        cluster.setup(
+            self.env_assist.get_env(),
+            CLUSTER_NAME,
+            [dict(name=node, addrs=None) for node in NODE_LIST],
+            start=True,
+            wait=100,
+        )
+        mock_sleep.assert_not_called()
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_START_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_STARTED,
+                    node_name_list=NODE_LIST,
+                ),
+            ]
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_START_SUCCESS,
+                    node=node,
+                    startup_seconds=startup_seconds,
+                )
+                for node, startup_seconds in zip(NODE_LIST, [4, 9, 10])
+            ]
+        )
+
+    @mock.patch("time.sleep")
+    @mock.patch("time.time", get_time_mock())
+    def test_nodes_waiting_for_start_timed_out(self, mock_sleep):
+        not_started = json.dumps(dict(pending=True, online=False, waited=True))
+        self.config.http.host.check_pacemaker_started(
+            communication_list=[
+                [
+                    dict(label=NODE_LIST[0], output=not_started),
+                    dict(label=NODE_LIST[1], output=not_started),
+                    dict(label=NODE_LIST[2], output=not_started),
+                ],
+                [
+                    dict(
+                        label=NODE_LIST[0],
+                        output=not_started,
+                        param_list=[("wait", "0")],
+                    )
+                ],
+            ],
+            wait=2,
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                [dict(name=node, addrs=None) for node in NODE_LIST],
+                start=True,
+                wait=4,
+            )
+        )
+        mock_sleep.assert_called_once_with(2)
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()
+            + [
+                fixture.info(
+                    reports.codes.CLUSTER_START_STARTED,
+                    host_name_list=sorted(NODE_LIST),
+                ),
+                fixture.info(
+                    reports.codes.WAIT_FOR_NODE_STARTUP_STARTED,
+                    node_name_list=NODE_LIST,
+                ),
+                fixture.error(reports.codes.WAIT_FOR_NODE_STARTUP_TIMED_OUT),
+                fixture.error(reports.codes.WAIT_FOR_NODE_STARTUP_ERROR),
             ]
         )
 
@@ -2436,6 +2547,7 @@ class SetupWithWait(TestCase):
                     dict(label=NODE_LIST[1], output="not json"),
                     node_not_started,
                 ],
+                wait=3,
             )
             .http.host.check_pacemaker_started(
                 communication_list=[
@@ -2445,10 +2557,12 @@ class SetupWithWait(TestCase):
                     ),
                     node_not_started,
                 ],
+                wait=1,
                 name="pcmk_status_check_2",
             )
             .http.host.check_pacemaker_started(
                 pacemaker_started_node_list=NODE_LIST[2:3],
+                wait=0,
                 name="pcmk_status_check_3",
             )
         )
@@ -2483,6 +2597,7 @@ class SetupWithWait(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=8,
                 )
                 for node in NODE_LIST[2:3]
             ]
@@ -2522,9 +2637,11 @@ class SetupWithWait(TestCase):
                         ),
                     ),
                 ],
+                wait=2,
             ).http.host.check_pacemaker_started(
                 pacemaker_started_node_list=[NODE_LIST[0]],
                 pacemaker_not_started_node_list=[NODE_LIST[2]],
+                wait=0,
                 name="pcmk_status_check_1",
             )
         )
@@ -2534,7 +2651,7 @@ class SetupWithWait(TestCase):
                 CLUSTER_NAME,
                 [dict(name=node, addrs=None) for node in NODE_LIST],
                 start=True,
-                wait=2,
+                wait=4,
             )
         )
         self.env_assist.assert_reports(
@@ -2563,6 +2680,7 @@ class SetupWithWait(TestCase):
                 fixture.info(
                     reports.codes.CLUSTER_START_SUCCESS,
                     node=node,
+                    startup_seconds=6,
                 )
                 for node in NODE_LIST[:1]
             ]
@@ -3149,6 +3267,145 @@ class Failures(RemoveCallsMixin, TestCase):
             + self._get_failure_reports("remote/cluster_destroy")
         )
 
+    def test_distribution_known_hosts_failure_other_nodes_proceed(self):
+        # Nodes proceed to the next step without waiting for the other nodes.
+        # Once a node fails, no more steps are started.
+        self._remove_calls(8)
+        (
+            self.config.http.host.update_known_hosts(
+                communication_list=[dict(label=node) for node in NODE_LIST[:-1]]
+                + [
+                    dict(
+                        label=NODE_LIST[-1],
+                        response_code=400,
+                        output=REASON,
+                    )
+                ],
+                to_add_hosts=NODE_LIST,
+            ).http.files.remove_files(
+                node_labels=NODE_LIST[:-1],
+                pcsd_settings=True,
+            )
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                [dict(name=node, addrs=None) for node in NODE_LIST],
+            ),
+            [],
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()[:-16]
+            + [
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node=NODE_LIST[-1],
+                    command="remote/known_hosts_change",
+                    reason=REASON,
+                ),
+                fixture.info(
+                    reports.codes.FILES_REMOVE_FROM_NODES_STARTED,
+                    file_list=["pcsd settings"],
+                    node_list=NODE_LIST,
+                ),
+            ]
+            + [
+                fixture.info(
+                    reports.codes.FILE_REMOVE_FROM_NODE_SUCCESS,
+                    node=node,
+                    file_description="pcsd settings",
+                )
+                for node in NODE_LIST[:-1]
+            ]
+        )
+
+    def test_cluster_destroy_failure_no_keys_sent(self):
+        # The other nodes may proceed to the following steps of the node
+        # preparation. Keys are not sent to any node once a node failed.
+        self._remove_calls(10)
+        (
+            self.config.http.host.cluster_destroy(
+                communication_list=[dict(label=node) for node in NODE_LIST[:-1]]
+                + [
+                    dict(
+                        label=NODE_LIST[-1],
+                        response_code=400,
+                        output=REASON,
+                    )
+                ],
+            ).http.host.update_known_hosts(
+                node_labels=NODE_LIST[:-1],
+                to_add_hosts=NODE_LIST,
+            )
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                [dict(name=node, addrs=None) for node in NODE_LIST],
+            ),
+            [],
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()[:-19]
+            + [
+                fixture.info(reports.codes.CLUSTER_DESTROY_SUCCESS, node=node)
+                for node in NODE_LIST[:-1]
+            ]
+            + [
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node=NODE_LIST[-1],
+                    command="remote/cluster_destroy",
+                    reason=REASON,
+                ),
+            ]
+        )
+
+    def test_removing_files_failure_no_keys_sent(self):
+        # Keys are distributed only after all the nodes have been prepared,
+        # the nodes which finished the preparation do not get them.
+        self._remove_calls(6)
+        self.config.http.files.remove_files(
+            communication_list=[dict(label=node) for node in NODE_LIST[:-1]]
+            + [
+                dict(
+                    label=NODE_LIST[-1],
+                    response_code=400,
+                    output=REASON,
+                )
+            ],
+            pcsd_settings=True,
+        )
+        self.env_assist.assert_raise_library_error(
+            lambda: cluster.setup(
+                self.env_assist.get_env(),
+                CLUSTER_NAME,
+                [dict(name=node, addrs=None) for node in NODE_LIST],
+            ),
+            [],
+        )
+        self.env_assist.assert_reports(
+            reports_success_minimal_fixture()[:-15]
+            + [
+                fixture.info(
+                    reports.codes.FILE_REMOVE_FROM_NODE_SUCCESS,
+                    node=node,
+                    file_description="pcsd settings",
+                )
+                for node in NODE_LIST[:-1]
+            ]
+            + [
+                fixture.error(
+                    reports.codes.NODE_COMMUNICATION_COMMAND_UNSUCCESSFUL,
+                    node=NODE_LIST[-1],
+                    command="remote/remove_file",
+                    reason=REASON,
+                ),
+            ]
+        )
+
 
 @mock.patch("pcs.lib.commands.cluster.generate_uuid", lambda: CLUSTER_UUID)
 @mock.patch(
@@ -50,6 +50,7 @@ class SetUpMixin:
         self.config.runner.cib.load(
             filename=self.initial_cib_filename,
             resources=self.initial_resources,
+            load_status=False,
         )
 
 
@@ -58,10 +59,17 @@ class UpgradeMixin(FixturesMixin):
 
     def test_cib_upgrade(self):
         (
+            # the whole CIB is loaded after an upgrade
             self.config.runner.cib.load(
+                filename=self.initial_cib_filename,
+                resources=self.initial_resources,
+                instead="runner.cib.load",
+            )
+            .runner.cib.load(
                 name="load_cib_old_version",
                 filename=self.old_version_cib_filename,
                 before="runner.cib.load",
+                load_status=False,
             )
             .runner.cib.upgrade(before="runner.cib.load")
             .env.push_cib(resources=self.fixture_resources_bundle_simple)
@@ -44,7 +44,7 @@ class Basics(TestCase):
         self.env_assist, self.config = get_env_tools(test_case=self)
 
     def test_nonexisting_id(self):
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(self.env_assist.get_env(), "B1"),
             [
@@ -69,7 +69,8 @@ class Basics(TestCase):
                 <resources>
                     <primitive id="B1" />
                 </resources>
-            """
+            """,
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(self.env_assist.get_env(), "B1"),
@@ -97,7 +98,8 @@ class Basics(TestCase):
                             <docker image="pcs:test" />
                         </bundle>
                     </resources>
-                """
+                """,
+                load_status=False,
             ).env.push_cib()
         )
         resource.bundle_update(self.env_assist.get_env(), "B1")
@@ -179,7 +181,8 @@ class ContainerParametrized(TestCase):
                     </resources>
                 """.format(
                     container_type=self.container_type
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources="""
                     <resources>
@@ -205,7 +208,8 @@ class ContainerParametrized(TestCase):
 
     def _test_cannot_remove_required_options(self):
         self.config.runner.cib.load(
-            resources=fixture_resources_minimal(self.container_type)
+            resources=fixture_resources_minimal(self.container_type),
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
@@ -233,7 +237,8 @@ class ContainerParametrized(TestCase):
 
     def _test_unknow_option(self):
         self.config.runner.cib.load(
-            resources=fixture_resources_minimal(self.container_type)
+            resources=fixture_resources_minimal(self.container_type),
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
@@ -265,7 +270,8 @@ class ContainerParametrized(TestCase):
     def _test_unknow_option_forced(self):
         (
             self.config.runner.cib.load(
-                resources=fixture_resources_minimal(self.container_type)
+                resources=fixture_resources_minimal(self.container_type),
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_extra_option)
         )
         resource.bundle_update(
@@ -298,7 +304,8 @@ class ContainerParametrized(TestCase):
     def _test_unknown_option_remove(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_extra_option
+                resources=self.fixture_cib_extra_option,
+                load_status=False,
             ).env.push_cib(
                 resources=fixture_resources_minimal(self.container_type)
             )
@@ -314,7 +321,8 @@ class ContainerParametrized(TestCase):
 
     def _test_options_error(self):
         self.config.runner.cib.load(
-            resources=fixture_resources_minimal(self.container_type)
+            resources=fixture_resources_minimal(self.container_type),
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
@@ -384,7 +392,8 @@ class ContainerParametrized(TestCase):
         # even when not forced.
         (
             self.config.runner.cib.load(
-                resources=fixture_resources_minimal(self.container_type)
+                resources=fixture_resources_minimal(self.container_type),
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_masters)
         )
         resource.bundle_update(
@@ -399,7 +408,8 @@ class ContainerParametrized(TestCase):
     def _test_deprecated_options_remove(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_masters
+                resources=self.fixture_cib_masters,
+                load_status=False,
             ).env.push_cib(
                 resources=fixture_resources_minimal(self.container_type)
             )
@@ -415,7 +425,8 @@ class ContainerParametrized(TestCase):
     def _test_delete_masters_and_promoted_max(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_masters
+                resources=self.fixture_cib_masters,
+                load_status=False,
             ).env.push_cib(
                 resources=fixture_resources_minimal(self.container_type)
             )
@@ -430,7 +441,11 @@ class ContainerParametrized(TestCase):
         )
 
     def _test_masters_set_after_promoted_max(self):
-        (self.config.runner.cib.load(resources=self.fixture_cib_promoted_max))
+        (
+            self.config.runner.cib.load(
+                resources=self.fixture_cib_promoted_max, load_status=False
+            )
+        )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
                 self.env_assist.get_env(),
@@ -460,7 +475,8 @@ class ContainerParametrized(TestCase):
     def _test_masters_set_after_promoted_max_with_remove(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_promoted_max
+                resources=self.fixture_cib_promoted_max,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_masters)
         )
         resource.bundle_update(
@@ -474,7 +490,11 @@ class ContainerParametrized(TestCase):
         self.env_assist.assert_reports([self.fixture_report_deprecated_masters])
 
     def _test_promoted_max_set_after_masters(self):
-        (self.config.runner.cib.load(resources=self.fixture_cib_masters))
+        (
+            self.config.runner.cib.load(
+                resources=self.fixture_cib_masters, load_status=False
+            )
+        )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
                 self.env_assist.get_env(),
@@ -503,7 +523,8 @@ class ContainerParametrized(TestCase):
     def _test_promoted_max_set_after_masters_with_remove(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_masters
+                resources=self.fixture_cib_masters,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_promoted_max)
         )
         resource.bundle_update(
@@ -556,7 +577,8 @@ class ContainerUnknown(TestCase):
                         </storage>
                     </bundle>
                 </resources>
-            """
+            """,
+            load_status=False,
         )
 
     def test_no_container_options_minimal(self):
@@ -707,7 +729,8 @@ class Network(TestCase):
     def test_add_network(self):
         (
             self.config.runner.cib.load(
-                resources=fixture_resources_minimal()
+                resources=fixture_resources_minimal(),
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_interface)
         )
         resource.bundle_update(
@@ -721,7 +744,8 @@ class Network(TestCase):
     def test_remove_network_keep_empty(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_interface
+                resources=self.fixture_cib_interface,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_network_empty)
         )
 
@@ -745,7 +769,8 @@ class Network(TestCase):
                             </network>
                         </bundle>
                     </resources>
-                """
+                """,
+                load_status=False,
             ).env.push_cib(
                 resources="""
                     <resources>
@@ -779,7 +804,8 @@ class Network(TestCase):
                             />
                         </bundle>
                     </resources>
-                """
+                """,
+                load_status=False,
             ).env.push_cib(
                 resources="""
                     <resources>
@@ -801,7 +827,11 @@ class Network(TestCase):
         )
 
     def test_unknow_option(self):
-        (self.config.runner.cib.load(resources=self.fixture_cib_interface))
+        (
+            self.config.runner.cib.load(
+                resources=self.fixture_cib_interface, load_status=False
+            )
+        )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
                 self.env_assist.get_env(),
@@ -832,7 +862,8 @@ class Network(TestCase):
     def test_unknow_option_forced(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_interface
+                resources=self.fixture_cib_interface,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_extra_option)
         )
         resource.bundle_update(
@@ -864,7 +895,8 @@ class Network(TestCase):
     def test_unknown_option_remove(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_extra_option
+                resources=self.fixture_cib_extra_option,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_interface)
         )
         resource.bundle_update(
@@ -922,7 +954,8 @@ class PortMap(TestCase):
     def test_add_network(self):
         (
             self.config.runner.cib.load(
-                resources=fixture_resources_minimal()
+                resources=fixture_resources_minimal(),
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_port_80)
         )
         resource.bundle_update(
@@ -938,7 +971,8 @@ class PortMap(TestCase):
     def test_remove_network_keep_empty(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_port_80
+                resources=self.fixture_cib_port_80,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_network_empty)
         )
         resource.bundle_update(
@@ -961,7 +995,8 @@ class PortMap(TestCase):
                             </network>
                         </bundle>
                     </resources>
-                """
+                """,
+                load_status=False,
             ).env.push_cib(
                 resources="""
                     <resources>
@@ -984,7 +1019,8 @@ class PortMap(TestCase):
     def test_add(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_port_80
+                resources=self.fixture_cib_port_80,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_port_80_8080)
         )
         resource.bundle_update(
@@ -1000,7 +1036,8 @@ class PortMap(TestCase):
     def test_remove(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_port_80_8080
+                resources=self.fixture_cib_port_80_8080,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_port_80)
         )
         resource.bundle_update(
@@ -1012,7 +1049,9 @@ class PortMap(TestCase):
         )
 
     def test_remove_missing(self):
-        self.config.runner.cib.load(resources=self.fixture_cib_port_80)
+        self.config.runner.cib.load(
+            resources=self.fixture_cib_port_80, load_status=False
+        )
 
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
@@ -1099,7 +1138,8 @@ class StorageMap(TestCase):
     def test_add_storage(self):
         (
             self.config.runner.cib.load(
-                resources=fixture_resources_minimal()
+                resources=fixture_resources_minimal(),
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_storage_1)
         )
         resource.bundle_update(
@@ -1116,7 +1156,8 @@ class StorageMap(TestCase):
     def test_remove_storage_keep_empty(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_storage_1
+                resources=self.fixture_cib_storage_1,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_storage_empty)
         )
         resource.bundle_update(
@@ -1130,7 +1171,8 @@ class StorageMap(TestCase):
     def test_add(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_storage_1
+                resources=self.fixture_cib_storage_1,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_storage_1_2)
         )
         resource.bundle_update(
@@ -1147,7 +1189,8 @@ class StorageMap(TestCase):
     def test_remove(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_storage_1_2
+                resources=self.fixture_cib_storage_1_2,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_cib_storage_1)
         )
 
@@ -1160,7 +1203,11 @@ class StorageMap(TestCase):
         )
 
     def test_remove_missing(self):
-        (self.config.runner.cib.load(resources=self.fixture_cib_storage_1))
+        (
+            self.config.runner.cib.load(
+                resources=self.fixture_cib_storage_1, load_status=False
+            )
+        )
         self.env_assist.assert_raise_library_error(
             lambda: resource.bundle_update(
                 self.env_assist.get_env(),
@@ -1223,7 +1270,8 @@ class Meta(TestCase):
     def test_add_meta_element(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_no_meta
+                resources=self.fixture_no_meta,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_meta_stopped)
         )
         resource.bundle_update(
@@ -1237,7 +1285,8 @@ class Meta(TestCase):
     def test_keep_meta_element(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_meta_stopped
+                resources=self.fixture_meta_stopped,
+                load_status=False,
             ).env.push_cib(resources=self.fixture_empty_meta)
         )
         resource.bundle_update(
@@ -1280,9 +1329,9 @@ class Meta(TestCase):
             </resources>
         """
         (
-            self.config.runner.cib.load(resources=fixture_cib_pre).env.push_cib(
-                resources=fixture_cib_post
-            )
+            self.config.runner.cib.load(
+                resources=fixture_cib_pre, load_status=False
+            ).env.push_cib(resources=fixture_cib_post)
         )
         resource.bundle_update(
             self.env_assist.get_env(),
@@ -1346,7 +1395,8 @@ class Wait(TestCase):
         self.env_assist, self.config = get_env_tools(test_case=self)
         (
             self.config.runner.cib.load(
-                resources=self.fixture_cib_pre
+                resources=self.fixture_cib_pre,
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_bundle_simple, wait=TIMEOUT
             )
@@ -1433,7 +1483,8 @@ class WithPrimitive(TestCase):
     def test_already_not_accessible(self):
         (
             self.config.runner.cib.load(
-                resources=self.fixture_resources_pre.format(network="")
+                resources=self.fixture_resources_pre.format(network=""),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network='<network host-interface="int"/>'
@@ -1453,7 +1504,8 @@ class WithPrimitive(TestCase):
             self.config.runner.cib.load(
                 resources=self.fixture_resources_pre.format(
                     network='<network control-port="1234"/>'
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network='<network ip-range-start="192.168.100.200"/>'
@@ -1474,7 +1526,8 @@ class WithPrimitive(TestCase):
             self.config.runner.cib.load(
                 resources=self.fixture_resources_pre.format(
                     network='<network ip-range-start="192.168.100.200"/>'
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network='<network control-port="1234"/>'
@@ -1500,7 +1553,8 @@ class WithPrimitive(TestCase):
                             control-port="1234"
                         />
                     """
-                )
+                ),
+                load_status=False,
             )
         )
         self.env_assist.assert_raise_library_error(
@@ -1534,7 +1588,8 @@ class WithPrimitive(TestCase):
                             control-port="1234"
                         />
                     """
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network="<network />"
@@ -1570,7 +1625,8 @@ class WithPrimitive(TestCase):
                             control-port="1234"
                         />
                     """
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network='<network control-port="1234"/>'
@@ -1595,7 +1651,8 @@ class WithPrimitive(TestCase):
                             control-port="1234"
                         />
                     """
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network='<network ip-range-start="192.168.100.200"/>'
@@ -1615,7 +1672,8 @@ class WithPrimitive(TestCase):
             self.config.runner.cib.load(
                 resources=self.fixture_resources_pre.format(
                     network='<network ip-range-start="192.168.100.200"/>'
-                )
+                ),
+                load_status=False,
             )
         )
         self.env_assist.assert_raise_library_error(
@@ -1643,7 +1701,8 @@ class WithPrimitive(TestCase):
             self.config.runner.cib.load(
                 resources=self.fixture_resources_pre.format(
                     network='<network ip-range-start="192.168.100.200"/>'
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network="<network />"
@@ -1673,7 +1732,8 @@ class WithPrimitive(TestCase):
             self.config.runner.cib.load(
                 resources=self.fixture_resources_pre.format(
                     network='<network control-port="1234"/>'
-                )
+                ),
+                load_status=False,
             )
         )
         self.env_assist.assert_raise_library_error(
@@ -1701,7 +1761,8 @@ class WithPrimitive(TestCase):
             self.config.runner.cib.load(
                 resources=self.fixture_resources_pre.format(
                     network='<network control-port="1234"/>'
-                )
+                ),
+                load_status=False,
             ).env.push_cib(
                 resources=self.fixture_resources_pre.format(
                     network="<network />"
@@ -403,7 +403,7 @@ class CreateRolesNormalization(TestCase):
             agent_name="ocf:pacemaker:Stateful",
             agent_filename=agent_file_name,
         )
-        self.config.runner.cib.load(filename=cib_file)
+        self.config.runner.cib.load(filename=cib_file, load_status=False)
 
     def create(self, operation_list=None):
         resource.create(
@@ -598,7 +598,7 @@ class Create(TestCase):
 
     def test_simplest_resource(self):
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=fixture_cib_resources_xml_primitive_simplest
         )
@@ -606,7 +606,7 @@ class Create(TestCase):
 
     def test_resource_self_validation_failure(self):
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.resource_agent_self_validation(
             {},
             output="""
@@ -636,7 +636,7 @@ class Create(TestCase):
 
     def test_resource_self_validation_failure_forced(self):
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.resource_agent_self_validation(
             {},
             output="""
@@ -668,7 +668,7 @@ class Create(TestCase):
 
     def test_resource_self_validation_invalid_output(self):
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.resource_agent_self_validation(
             {},
             output="""<not valid> xml""",
@@ -722,7 +722,7 @@ class Create(TestCase):
             name="runner.pcmk.list_agents_ocf_providers_pacemaker",
         )
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=fixture_cib_resources_xml_primitive_simplest
         )
@@ -840,7 +840,7 @@ class Create(TestCase):
             agent_is_missing=True,
             env={"PATH": "/usr/sbin:/bin:/usr/bin"},
         )
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources="""
                 <resources>
@@ -884,7 +884,7 @@ class Create(TestCase):
 
     def test_resource_with_operation(self):
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources="""
                 <resources>
@@ -929,13 +929,13 @@ class Create(TestCase):
                 "resource_agent_ocf_heartbeat_dummy_insane_action.xml"
             ),
         )
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(resources=self.fixture_sanitized_operation)
         create(self.env_assist.get_env())
 
     def test_sanitize_operation_id_from_user(self):
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(resources=self.fixture_sanitized_operation)
         create(
             self.env_assist.get_env(),
@@ -984,7 +984,7 @@ class Create(TestCase):
                 </resource-agent>
             """
         )
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources="""
                 <resources>
@@ -1052,6 +1052,7 @@ class Create(TestCase):
                     </primitive>
                 </resources>
             """,
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: resource.create(
@@ -1116,6 +1117,7 @@ class Create(TestCase):
                     </primitive>
                 </resources>
             """,
+            load_status=False,
         )
         self.config.env.push_cib(
             resources="""
@@ -1199,6 +1201,7 @@ class Create(TestCase):
         self.config.runner.cib.load(
             filename="cib-empty-3.3.xml",
             name="load_cib_old_version",
+            load_status=False,
         )
         self.config.runner.cib.upgrade()
         self.config.runner.cib.load(filename="cib-empty-3.4.xml")
@@ -1256,7 +1259,7 @@ class CreateWait(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=fixture_cib_resources_xml_primitive_simplest,
             wait=TIMEOUT,
@@ -1388,7 +1391,7 @@ class CreateInGroup(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
 
     def test_simplest_resource(self):
         (
@@ -1435,6 +1438,7 @@ class CreateInGroup(TestCase):
             filename="cib-empty-3.3.xml",
             instead="runner.cib.load",
             name="load_cib_old_version",
+            load_status=False,
         )
         self.config.runner.cib.upgrade()
         self.config.runner.cib.load(filename="cib-empty-3.4.xml")
@@ -1662,7 +1666,7 @@ class CreateAsClone(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
         self.config.runner.pcmk.load_agent()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
 
     def test_simplest_resource(self):
         (
@@ -1721,8 +1725,8 @@ class CreateAsClone(TestCase):
         )
 
     def test_custom_clone_id_error_id_already_exist(self):
-        self.config.remove(name="runner.cib.load")
         self.config.runner.cib.load(
+            instead="runner.cib.load",
             resources="""
                 <resources>
                     <primitive class="ocf" id="C" provider="heartbeat"
@@ -1735,6 +1739,7 @@ class CreateAsClone(TestCase):
                     </primitive>
                 </resources>
             """,
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: create_clone(
@@ -1748,6 +1753,7 @@ class CreateAsClone(TestCase):
             filename="cib-empty-3.3.xml",
             instead="runner.cib.load",
             name="load_cib_old_version",
+            load_status=False,
         )
         self.config.runner.cib.upgrade()
         self.config.runner.cib.load(filename="cib-empty-3.4.xml")
@@ -2220,7 +2226,7 @@ class CreateAsCloneFailures(TestCase):
     def test_promotable_not_supported_forced(self):
         agent = ResourceAgentName("ocf", "pacemaker", "Dummy")
         self.config.runner.pcmk.load_agent(agent_name=agent.full_name)
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.resource_agent_self_validation(
             {},
             standard=agent.standard,
@@ -2396,10 +2402,12 @@ class CreateInToBundle(TestCase):
         self.config.runner.cib.load(
             filename="cib-empty-3.3.xml",
             name="load_cib_old_version",
+            load_status=False,
         )
         self.config.runner.cib.upgrade()
         self.config.runner.cib.load(
-            filename="cib-empty-3.4.xml", resources=self.fixture_resources_pre
+            filename="cib-empty-3.4.xml",
+            resources=self.fixture_resources_pre,
         )
         self.config.env.push_cib(
             resources=self.fixture_resource_post_simple_without_network.format(
@@ -2429,12 +2437,16 @@ class CreateInToBundle(TestCase):
         )
 
     def test_simplest_resource(self):
-        self.config.runner.cib.load(resources=self.fixture_resources_pre)
+        self.config.runner.cib.load(
+            resources=self.fixture_resources_pre, load_status=False
+        )
         self.config.env.push_cib(resources=self.fixture_resources_post_simple)
         create_bundle(self.env_assist.get_env(), wait=False)
 
     def test_bundle_doesnt_exist(self):
-        self.config.runner.cib.load(resources=self.fixture_empty_resources)
+        self.config.runner.cib.load(
+            resources=self.fixture_empty_resources, load_status=False
+        )
         self.env_assist.assert_raise_library_error(
             lambda: create_bundle(self.env_assist.get_env(), wait=False),
             [
@@ -2455,7 +2467,8 @@ class CreateInToBundle(TestCase):
                     <resources>
                         <primitive id="B"/>
                     </resources>
-                """
+                """,
+            load_status=False,
         )
 
         self.env_assist.assert_raise_library_error(
@@ -2480,7 +2493,8 @@ class CreateInToBundle(TestCase):
                             <primitive id="P"/>
                         </bundle>
                     </resources>
-                """
+                """,
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: create_bundle(self.env_assist.get_env(), wait=False),
@@ -2495,7 +2509,9 @@ class CreateInToBundle(TestCase):
         )
 
     def test_wait_fail(self):
-        self.config.runner.cib.load(resources=self.fixture_resources_pre)
+        self.config.runner.cib.load(
+            resources=self.fixture_resources_pre, load_status=False
+        )
         self.config.env.push_cib(
             resources=self.fixture_resources_post_simple,
             wait=TIMEOUT,
@@ -2519,7 +2535,9 @@ class CreateInToBundle(TestCase):
         rc("pcmk_api_rng/api-result.rng"),
     )
     def test_wait_ok_run_ok(self):
-        self.config.runner.cib.load(resources=self.fixture_resources_pre)
+        self.config.runner.cib.load(
+            resources=self.fixture_resources_pre, load_status=False
+        )
         self.config.env.push_cib(
             resources=self.fixture_resources_post_simple, wait=TIMEOUT
         )
@@ -2539,7 +2557,9 @@ class CreateInToBundle(TestCase):
         rc("pcmk_api_rng/api-result.rng"),
     )
     def test_wait_ok_run_fail(self):
-        self.config.runner.cib.load(resources=self.fixture_resources_pre)
+        self.config.runner.cib.load(
+            resources=self.fixture_resources_pre, load_status=False
+        )
         self.config.env.push_cib(
             resources=self.fixture_resources_post_simple, wait=TIMEOUT
         )
@@ -2563,7 +2583,9 @@ class CreateInToBundle(TestCase):
         rc("pcmk_api_rng/api-result.rng"),
     )
     def test_disabled_wait_ok_not_running(self):
-        self.config.runner.cib.load(resources=self.fixture_resources_pre)
+        self.config.runner.cib.load(
+            resources=self.fixture_resources_pre, load_status=False
+        )
         self.config.env.push_cib(
             resources=self.fixture_resources_post_disabled, wait=TIMEOUT
         )
@@ -2581,7 +2603,9 @@ class CreateInToBundle(TestCase):
         rc("pcmk_api_rng/api-result.rng"),
     )
     def test_disabled_wait_ok_running(self):
-        self.config.runner.cib.load(resources=self.fixture_resources_pre)
+        self.config.runner.cib.load(
+            resources=self.fixture_resources_pre, load_status=False
+        )
         self.config.env.push_cib(
             resources=self.fixture_resources_post_disabled, wait=TIMEOUT
         )
@@ -2607,7 +2631,8 @@ class CreateInToBundle(TestCase):
                 <resources>
                     <bundle id="B"/>
                 </resources>
-            """
+            """,
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: create_bundle(self.env_assist.get_env(), wait=False)
@@ -2630,7 +2655,8 @@ class CreateInToBundle(TestCase):
                 <resources>
                     <bundle id="B"/>
                 </resources>
-            """
+            """,
+            load_status=False,
         )
         self.config.env.push_cib(
             resources=(
@@ -2662,7 +2688,8 @@ class CreateInToBundle(TestCase):
                         {network}
                     </bundle>
                 </resources>
-            """
+            """,
+            load_status=False,
         )
         self.config.env.push_cib(
             resources=(
@@ -2682,7 +2709,7 @@ class CreateInToBundle(TestCase):
         )
 
     def test_resource_self_validation_failure(self):
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.resource_agent_self_validation(
             {},
             output="""
@@ -6,11 +6,9 @@ from unittest import (
 )
 
 from pcs import settings
-from pcs.common import reports
 from pcs.common.reports import ReportItemSeverity as severities
 from pcs.common.reports import codes as report_codes
 from pcs.lib.commands import resource
-from pcs.lib.errors import LibraryError
 
 from pcs_test.tier0.lib.commands.tag.tag_common import fixture_tags_xml
 from pcs_test.tools import fixture
@@ -20,7 +18,6 @@ from pcs_test.tools.custom_mock import (
     TmpFileMock,
 )
 from pcs_test.tools.misc import get_test_resource as rc
-from pcs_test.tools.misc import outdent
 
 TIMEOUT = 10
 
@@ -913,19 +910,23 @@ class Wait(TestCase):
     """
     fixture_status_mixed = """
         <resources>
-            <resource id="A" managed="true" role="Stopped">
+            <resource id="A" managed="true" role="Started">
+                <node name="node1" id="1" cached="false"/>
             </resource>
             <resource id="B" managed="true" role="Stopped">
             </resource>
         </resources>
     """
-    fixture_wait_timeout_error = outdent(
-        """\
-        Pending actions:
-                Action 12: B-node2-stop on node2
-        Error performing operation: Timer expired
-        """
-    ).strip()
+    fixture_status_pending = """
+        <resources>
+            <resource id="A" managed="true" role="Started" pending="Monitoring">
+                <node name="node1" id="1" cached="false"/>
+            </resource>
+            <resource id="B" managed="true" role="Started">
+                <node name="node2" id="1" cached="false"/>
+            </resource>
+        </resources>
+    """
 
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
@@ -952,31 +953,30 @@ class Wait(TestCase):
             [fixture.report_not_resource_or_tag("B")]
         )
 
-    def test_enable_resource_stopped(self):
+    def test_enable_resource_running(self):
         (
             self.config.runner.cib.load(
                 resources=fixture_two_primitives_cib_disabled_both
             )
             .runner.pcmk.load_state(resources=self.fixture_status_stopped)
             .env.push_cib(
-                resources=fixture_two_primitives_cib_enabled_with_meta_both,
-                wait=TIMEOUT,
+                resources=fixture_two_primitives_cib_enabled_with_meta_both
             )
             .runner.pcmk.load_state(
                 name="",
-                resources=self.fixture_status_stopped,
+                resources=self.fixture_status_running,
             )
         )
 
-        self.env_assist.assert_raise_library_error(
-            lambda: resource.enable(
-                self.env_assist.get_env(), ["A", "B"], TIMEOUT
-            )
-        )
+        resource.enable(self.env_assist.get_env(), ["A", "B"], TIMEOUT)
+
         self.env_assist.assert_reports(
             [
-                fixture.report_resource_not_running("A", severities.ERROR),
-                fixture.report_resource_not_running("B", severities.ERROR),
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
+                fixture.report_resource_running("A", {"Started": ["node1"]}),
+                fixture.report_resource_running("B", {"Started": ["node2"]}),
             ]
         )
 
@@ -986,9 +986,7 @@ class Wait(TestCase):
                 resources=fixture_two_primitives_cib_enabled
             )
             .runner.pcmk.load_state(resources=self.fixture_status_running)
-            .env.push_cib(
-                resources=fixture_two_primitives_cib_disabled_both, wait=TIMEOUT
-            )
+            .env.push_cib(resources=fixture_two_primitives_cib_disabled_both)
             .runner.pcmk.load_state(
                 name="",
                 resources=self.fixture_status_stopped,
@@ -998,23 +996,39 @@ class Wait(TestCase):
         resource.disable(self.env_assist.get_env(), ["A", "B"], TIMEOUT)
         self.env_assist.assert_reports(
             [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
                 fixture.report_resource_not_running("A"),
                 fixture.report_resource_not_running("B"),
             ]
         )
 
-    def test_enable_resource_running(self):
+    def test_enable_resources_one_by_one(self):
         (
             self.config.runner.cib.load(
                 resources=fixture_two_primitives_cib_disabled_both
             )
             .runner.pcmk.load_state(resources=self.fixture_status_stopped)
             .env.push_cib(
-                resources=fixture_two_primitives_cib_enabled_with_meta_both,
-                wait=TIMEOUT,
+                resources=fixture_two_primitives_cib_enabled_with_meta_both
             )
             .runner.pcmk.load_state(
-                name="",
+                name="runner.pcmk.load_state.wait_1",
+                resources=self.fixture_status_stopped,
+            )
+            .runner.pcmk.wait(
+                name="runner.pcmk.wait.wait_1", timeout=1, returncode=124
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_2",
+                resources=self.fixture_status_mixed,
+            )
+            .runner.pcmk.wait(
+                name="runner.pcmk.wait.wait_2", timeout=1, returncode=124
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_3",
                 resources=self.fixture_status_running,
             )
         )
@@ -1023,20 +1037,97 @@ class Wait(TestCase):
 
         self.env_assist.assert_reports(
             [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
                 fixture.report_resource_running("A", {"Started": ["node1"]}),
                 fixture.report_resource_running("B", {"Started": ["node2"]}),
             ]
         )
 
-    def test_disable_resource_running(self):
+    def test_enable_pending_action(self):
         (
             self.config.runner.cib.load(
-                resources=fixture_two_primitives_cib_enabled
+                resources=fixture_two_primitives_cib_disabled_both
             )
-            .runner.pcmk.load_state(resources=self.fixture_status_running)
+            .runner.pcmk.load_state(resources=self.fixture_status_stopped)
             .env.push_cib(
-                resources=fixture_two_primitives_cib_disabled_both, wait=TIMEOUT
+                resources=fixture_two_primitives_cib_enabled_with_meta_both
             )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_1",
+                resources=self.fixture_status_pending,
+            )
+            .runner.pcmk.wait(
+                name="runner.pcmk.wait.wait_1", timeout=1, returncode=124
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_2",
+                resources=self.fixture_status_running,
+            )
+        )
+
+        resource.enable(self.env_assist.get_env(), ["A", "B"], TIMEOUT)
+
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
+                fixture.report_resource_running("B", {"Started": ["node2"]}),
+                fixture.report_resource_running("A", {"Started": ["node1"]}),
+            ]
+        )
+
+    @mock.patch("time.monotonic", mock.Mock(side_effect=[0, 5, 11]))
+    def test_enable_wait_timeout(self):
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_disabled_both
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_stopped)
+            .env.push_cib(
+                resources=fixture_two_primitives_cib_enabled_with_meta_both
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_1",
+                resources=self.fixture_status_stopped,
+            )
+            .runner.pcmk.wait(
+                name="runner.pcmk.wait.wait_1", timeout=1, returncode=124
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_2",
+                resources=self.fixture_status_mixed,
+            )
+        )
+
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.enable(
+                self.env_assist.get_env(), ["A", "B"], TIMEOUT
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
+                fixture.report_resource_running("A", {"Started": ["node1"]}),
+                fixture.report_resource_not_running("B", severities.ERROR),
+                fixture.report_wait_for_idle_timed_out(
+                    "Resources not in the expected state: 'B'"
+                ),
+            ]
+        )
+
+    @mock.patch("time.monotonic", mock.Mock(side_effect=[0, 11]))
+    def test_disable_wait_timeout(self):
+        (
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_enabled
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_running)
+            .env.push_cib(resources=fixture_two_primitives_cib_disabled_both)
             .runner.pcmk.load_state(
                 name="",
                 resources=self.fixture_status_running,
@@ -1050,70 +1141,92 @@ class Wait(TestCase):
         )
         self.env_assist.assert_reports(
             [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
                 fixture.report_resource_running(
                     "A", {"Started": ["node1"]}, severities.ERROR
                 ),
                 fixture.report_resource_running(
                     "B", {"Started": ["node2"]}, severities.ERROR
                 ),
+                fixture.report_wait_for_idle_timed_out(
+                    "Resources not in the expected state: 'A', 'B'"
+                ),
             ]
         )
 
-    def test_enable_wait_timeout(self):
+    def test_enable_no_timeout_cluster_idle(self):
         (
             self.config.runner.cib.load(
-                resources=fixture_primitive_cib_disabled
+                resources=fixture_two_primitives_cib_disabled_both
             )
             .runner.pcmk.load_state(resources=self.fixture_status_stopped)
             .env.push_cib(
-                resources=fixture_primitive_cib_enabled_with_meta,
-                wait=TIMEOUT,
-                exception=LibraryError(
-                    reports.item.ReportItem.error(
-                        reports.messages.WaitForIdleTimedOut(
-                            self.fixture_wait_timeout_error
-                        )
-                    )
-                ),
+                resources=fixture_two_primitives_cib_enabled_with_meta_both
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_1",
+                resources=self.fixture_status_stopped,
+            )
+            .runner.pcmk.wait(
+                name="runner.pcmk.wait.wait_1", timeout=1, returncode=124
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_2",
+                resources=self.fixture_status_mixed,
+            )
+            .runner.pcmk.wait(name="runner.pcmk.wait.wait_2", timeout=1)
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_3",
+                resources=self.fixture_status_mixed,
             )
         )
 
         self.env_assist.assert_raise_library_error(
-            lambda: resource.enable(self.env_assist.get_env(), ["A"], TIMEOUT),
+            lambda: resource.enable(self.env_assist.get_env(), ["A", "B"], 0)
+        )
+        self.env_assist.assert_reports(
             [
-                fixture.report_wait_for_idle_timed_out(
-                    self.fixture_wait_timeout_error
-                )
-            ],
-            expected_in_processor=False,
+                fixture.info(report_codes.WAIT_FOR_IDLE_STARTED, timeout=0),
+                fixture.report_resource_running("A", {"Started": ["node1"]}),
+                fixture.report_resource_not_running("B", severities.ERROR),
+            ]
         )
 
-    def test_disable_wait_timeout(self):
+    def test_wait_error(self):
         (
-            self.config.runner.cib.load(resources=fixture_primitive_cib_enabled)
-            .runner.pcmk.load_state(resources=self.fixture_status_running)
+            self.config.runner.cib.load(
+                resources=fixture_two_primitives_cib_disabled_both
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_stopped)
             .env.push_cib(
-                resources=fixture_primitive_cib_disabled,
-                wait=TIMEOUT,
-                exception=LibraryError(
-                    reports.item.ReportItem.error(
-                        reports.messages.WaitForIdleTimedOut(
-                            self.fixture_wait_timeout_error
-                        )
-                    )
-                ),
+                resources=fixture_two_primitives_cib_enabled_with_meta_both
+            )
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_1",
+                resources=self.fixture_status_stopped,
+            )
+            .runner.pcmk.wait(
+                name="runner.pcmk.wait.wait_1",
+                timeout=1,
+                stderr="some error",
+                returncode=1,
             )
         )
 
         self.env_assist.assert_raise_library_error(
-            lambda: resource.disable(self.env_assist.get_env(), ["A"], TIMEOUT),
+            lambda: resource.enable(self.env_assist.get_env(), ["A", "B"], 0),
             [
-                fixture.report_wait_for_idle_timed_out(
-                    self.fixture_wait_timeout_error
+                fixture.error(
+                    report_codes.WAIT_FOR_IDLE_ERROR, reason="some error"
                 )
             ],
             expected_in_processor=False,
         )
+        self.env_assist.assert_reports(
+            [fixture.info(report_codes.WAIT_FOR_IDLE_STARTED, timeout=0)]
+        )
 
 
 @mock.patch.object(
@@ -1142,6 +1255,17 @@ class WaitClone(TestCase):
             </clone>
         </resources>
     """
+    fixture_status_partially_running = """
+        <resources>
+            <clone id="A-clone" managed="true" multi_state="false" unique="false">
+                <resource id="A" managed="true" role="Started">
+                    <node name="node1" id="1" cached="false"/>
+                </resource>
+                <resource id="A" managed="true" role="Stopped">
+                </resource>
+            </clone>
+        </resources>
+    """
 
     def setUp(self):
         self.env_assist, self.config = get_env_tools(test_case=self)
@@ -1150,9 +1274,7 @@ class WaitClone(TestCase):
         (
             self.config.runner.cib.load(resources=fixture_clone_cib_enabled)
             .runner.pcmk.load_state(resources=self.fixture_status_running)
-            .env.push_cib(
-                resources=fixture_clone_cib_disabled_clone, wait=TIMEOUT
-            )
+            .env.push_cib(resources=fixture_clone_cib_disabled_clone)
             .runner.pcmk.load_state(
                 name="",
                 resources=self.fixture_status_stopped,
@@ -1162,6 +1284,9 @@ class WaitClone(TestCase):
         resource.disable(self.env_assist.get_env(), ["A-clone"], TIMEOUT)
         self.env_assist.assert_reports(
             [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
                 (
                     severities.INFO,
                     report_codes.RESOURCE_DOES_NOT_RUN,
@@ -1169,7 +1294,7 @@ class WaitClone(TestCase):
                         "resource_id": "A-clone",
                     },
                     None,
-                )
+                ),
             ]
         )
 
@@ -1179,10 +1304,7 @@ class WaitClone(TestCase):
                 resources=fixture_clone_cib_disabled_clone
             )
             .runner.pcmk.load_state(resources=self.fixture_status_stopped)
-            .env.push_cib(
-                resources=fixture_clone_cib_enabled_with_meta_clone,
-                wait=TIMEOUT,
-            )
+            .env.push_cib(resources=fixture_clone_cib_enabled_with_meta_clone)
             .runner.pcmk.load_state(
                 name="",
                 resources=self.fixture_status_running,
@@ -1192,6 +1314,9 @@ class WaitClone(TestCase):
         resource.enable(self.env_assist.get_env(), ["A-clone"], TIMEOUT)
         self.env_assist.assert_reports(
             [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
                 (
                     severities.INFO,
                     report_codes.RESOURCE_RUNNING_ON_NODES,
@@ -1200,7 +1325,37 @@ class WaitClone(TestCase):
                         "roles_with_nodes": {"Started": ["node1", "node2"]},
                     },
                     None,
-                )
+                ),
+            ]
+        )
+
+    def test_enable_clone_wait_for_all_instances(self):
+        (
+            self.config.runner.cib.load(
+                resources=fixture_clone_cib_disabled_clone
+            )
+            .runner.pcmk.load_state(resources=self.fixture_status_stopped)
+            .env.push_cib(resources=fixture_clone_cib_enabled_with_meta_clone)
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_1",
+                resources=self.fixture_status_partially_running,
+            )
+            .runner.pcmk.wait(timeout=1, returncode=124)
+            .runner.pcmk.load_state(
+                name="runner.pcmk.load_state.wait_2",
+                resources=self.fixture_status_running,
+            )
+        )
+
+        resource.enable(self.env_assist.get_env(), ["A-clone"], TIMEOUT)
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
+                fixture.report_resource_running(
+                    "A-clone", {"Started": ["node1", "node2"]}
+                ),
             ]
         )
 
@@ -2521,7 +2676,7 @@ class DisableSafeMixin(DisableSafeFixturesMixin):
             resources=fixture_two_primitives_cib_disabled_both,
         )
         self.config.env.push_cib(
-            resources=fixture_two_primitives_cib_disabled_both, wait=TIMEOUT
+            resources=fixture_two_primitives_cib_disabled_both
         )
         self.config.runner.pcmk.load_state(
             name="runner.pcmk.load_state_2",
@@ -2539,6 +2694,9 @@ class DisableSafeMixin(DisableSafeFixturesMixin):
         )
         self.env_assist.assert_reports(
             [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED, timeout=TIMEOUT
+                ),
                 fixture.report_resource_not_running("A"),
                 fixture.report_resource_not_running("B"),
             ]
@@ -1,5 +1,8 @@
 import os.path
-from unittest import TestCase
+from unittest import (
+    TestCase,
+    mock,
+)
 
 from pcs import settings
 from pcs.common import reports
@@ -25,6 +28,7 @@ from pcs_test.tools.command_env.config_runner_pcmk import (
     RULE_IN_EFFECT_RETURNCODE,
     RULE_NOT_YET_IN_EFFECT_RETURNCODE,
 )
+from pcs_test.tools.misc import get_test_resource as rc
 
 
 class DefaultsCreateMixin:
@@ -493,6 +497,11 @@ class OperationDefaultsCreate(DefaultsCreateMixin, TestCase):
         )
 
 
+@mock.patch.object(
+    settings,
+    "pacemaker_api_result_schema",
+    rc("pcmk_api_rng/api-result.rng"),
+)
 class DefaultsConfigMixin:
     @staticmethod
     def command(*args, **kwargs):
@@ -823,6 +832,18 @@ class DefaultsConfigMixin:
             ]
         )
 
+    def _setup_rules_in_effect_check(self, rules_returncodes, stdout=None):
+        self.config.runner.pcmk.can_check_rules_in_effect_status()
+        self.config.runner.pcmk.get_rules_in_effect_status(
+            rules_returncodes, stdout=stdout
+        )
+        if stdout is None:
+            self.config.fs.isfile(
+                settings.pacemaker_api_result_schema,
+                return_value=True,
+                name="fs.isfile.api_result_schema",
+            )
+
     def _setup_rule_in_effect(self, crm_rule_check=True, crm_rule_present=True):
         defaults_xml = f"""
             <{self.tag}>
@@ -879,9 +900,8 @@ class DefaultsConfigMixin:
 
     def test_expired(self):
         self._setup_rule_in_effect()
-        self.config.runner.pcmk.get_rule_in_effect_status(
-            "my-id-rule",
-            RULE_EXPIRED_RETURNCODE,
+        self._setup_rules_in_effect_check(
+            [("my-id-rule", RULE_EXPIRED_RETURNCODE)]
         )
         self.assertEqual(
             CibDefaultsDto(
@@ -895,9 +915,8 @@ class DefaultsConfigMixin:
 
     def test_not_yet_in_effect(self):
         self._setup_rule_in_effect()
-        self.config.runner.pcmk.get_rule_in_effect_status(
-            "my-id-rule",
-            RULE_NOT_YET_IN_EFFECT_RETURNCODE,
+        self._setup_rules_in_effect_check(
+            [("my-id-rule", RULE_NOT_YET_IN_EFFECT_RETURNCODE)]
         )
         self.assertEqual(
             CibDefaultsDto(
@@ -913,9 +932,8 @@ class DefaultsConfigMixin:
 
     def test_in_effect(self):
         self._setup_rule_in_effect()
-        self.config.runner.pcmk.get_rule_in_effect_status(
-            "my-id-rule",
-            RULE_IN_EFFECT_RETURNCODE,
+        self._setup_rules_in_effect_check(
+            [("my-id-rule", RULE_IN_EFFECT_RETURNCODE)]
         )
         self.assertEqual(
             CibDefaultsDto(
@@ -929,14 +947,89 @@ class DefaultsConfigMixin:
 
     def test_expired_error(self):
         self._setup_rule_in_effect()
+        self._setup_rules_in_effect_check([("my-id-rule", 2)])
+        self.assertEqual(
+            CibDefaultsDto(
+                meta_attributes=[
+                    self.fixture_expired_dto(CibRuleInEffectStatus.UNKNOWN)
+                ],
+                instance_attributes=[],
+            ),
+            self.command(self.env_assist.get_env(), True),
+        )
+
+    def test_expired_bad_output(self):
+        self._setup_rule_in_effect()
+        self._setup_rules_in_effect_check(
+            [("my-id-rule", RULE_EXPIRED_RETURNCODE)], stdout="not an xml"
+        )
         self.config.runner.pcmk.get_rule_in_effect_status(
             "my-id-rule",
-            2,  # unexpected return code
+            RULE_EXPIRED_RETURNCODE,
         )
         self.assertEqual(
             CibDefaultsDto(
                 meta_attributes=[
-                    self.fixture_expired_dto(CibRuleInEffectStatus.UNKNOWN)
+                    self.fixture_expired_dto(CibRuleInEffectStatus.EXPIRED)
+                ],
+                instance_attributes=[],
+            ),
+            self.command(self.env_assist.get_env(), True),
+        )
+
+    def test_nested_rules_not_checked(self):
+        defaults_xml = f"""
+            <{self.tag}>
+                <meta_attributes id="my-id">
+                    <rule id="my-id-rule" boolean-op="or">
+                        <expression
+                            id="my-id-rule-expr"
+                            operation="defined" attribute="attr1"
+                        />
+                        <rule id="my-id-rule-rule" boolean-op="and">
+                            <expression
+                                id="my-id-rule-rule-expr"
+                                operation="defined" attribute="attr2"
+                            />
+                        </rule>
+                    </rule>
+                    <nvpair id="my-id-pair1" name="name1" value="value1" />
+                </meta_attributes>
+            </{self.tag}>
+        """
+        self.config.runner.cib.load(
+            filename="cib-empty-3.4.xml", optional_in_conf=defaults_xml
+        )
+        self.config.fs.isfile(
+            (os.path.join(settings.pacemaker_binaries, "crm_rule")),
+            return_value=True,
+        )
+        self._setup_rules_in_effect_check(
+            [("my-id-rule", RULE_EXPIRED_RETURNCODE)]
+        )
+        rule_dto = (
+            self.command(self.env_assist.get_env(), True)
+            .meta_attributes[0]
+            .rule
+        )
+        self.assertEqual(rule_dto.in_effect, CibRuleInEffectStatus.EXPIRED)
+        self.assertEqual(
+            rule_dto.expressions[1].in_effect, CibRuleInEffectStatus.UNKNOWN
+        )
+
+    def test_expired_one_by_one(self):
+        self._setup_rule_in_effect()
+        self.config.runner.pcmk.can_check_rules_in_effect_status(
+            stderr="old crm_rule"
+        )
+        self.config.runner.pcmk.get_rule_in_effect_status(
+            "my-id-rule",
+            RULE_EXPIRED_RETURNCODE,
+        )
+        self.assertEqual(
+            CibDefaultsDto(
+                meta_attributes=[
+                    self.fixture_expired_dto(CibRuleInEffectStatus.EXPIRED)
                 ],
                 instance_attributes=[],
             ),
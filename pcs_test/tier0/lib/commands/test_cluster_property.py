@@ -104,7 +104,8 @@ class StonithWatchdogTimeoutMixin(LoadMetadataMixin):
         self.config.runner.cib.load(
             crm_config=fixture_crm_config_properties(
                 [("cib-bootstrap-options", {"stonith-watchdog-timeout": "10"})]
-            )
+            ),
+            load_status=False,
         )
         self.load_fake_agent_metadata()
         self.config.services.is_enabled("sbd", return_value=self.sbd_enabled)
@@ -409,7 +410,7 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
         )
 
     def test_no_properties_specified(self):
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.load_fake_agent_metadata()
         self.env_assist.assert_raise_library_error(lambda: self.command({}))
         self.env_assist.assert_reports(
@@ -425,7 +426,7 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
         )
 
     def test_no_properties_specified_forced(self):
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.load_fake_agent_metadata()
         self.config.env.push_cib(
             crm_config=fixture_crm_config_properties(
@@ -452,7 +453,8 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
                     <primitive class="ocf" id="cib-bootstrap-options"
                         provider="pacemaker" type="Dummy"/>
                 </resources>
-            """
+            """,
+            load_status=False,
         )
         self.env_assist.assert_raise_library_error(
             lambda: self.command({"no-quorum-policy": "freeze"}),
@@ -467,7 +469,7 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
         self.env_assist.assert_reports([])
 
     def test_create_cib_bootstrap_options(self):
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.load_fake_agent_metadata()
         self.config.env.push_cib(
             crm_config=fixture_crm_config_properties(
@@ -495,7 +497,8 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
                         },
                     )
                 ]
-            )
+            ),
+            load_status=False,
         )
         self.load_fake_agent_metadata()
         self.env_assist.assert_raise_library_error(
@@ -549,7 +552,8 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
                     ("first-set", orig_properties),
                     ("second-set", orig_properties),
                 ]
-            )
+            ),
+            load_status=False,
         )
         self.load_fake_agent_metadata()
         self.config.env.push_cib(
@@ -578,7 +582,8 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
                 [
                     ("cib-bootstrap-options", {}),
                 ]
-            )
+            ),
+            load_status=False,
         )
         self.load_fake_agent_metadata()
 
@@ -634,7 +639,8 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
                 [
                     ("cib-bootstrap-options", {}),
                 ]
-            )
+            ),
+            load_status=False,
         )
         self.load_fake_agent_metadata()
         self.config.env.push_cib(
@@ -697,7 +703,7 @@ class TestPropertySet(LoadMetadataMixin, TestCase):
     def _metadata_error(
         self, error_agent, stdout=None, reason=None, unsupported_version=False
     ):
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         for agent in [
             "pacemaker-based",
             "pacemaker-controld",
@@ -22,7 +22,7 @@ class SetCreate(TestCase):
             </resources>
         """
         self.env_assist, self.config = get_env_tools(self)
-        self.config.runner.cib.load(resources=resources_xml)
+        self.config.runner.cib.load(resources=resources_xml, load_status=False)
 
     def test_deny_resources_from_one_group_in_one_set(self):
         self.env_assist.assert_raise_library_error(
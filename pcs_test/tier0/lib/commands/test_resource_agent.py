@@ -1,5 +1,11 @@
 # coding=utf-8
-from unittest import TestCase
+import threading
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from lxml import etree
 
 from pcs.common import const
 from pcs.common.interface.dto import from_dict
@@ -16,7 +22,10 @@ from pcs.common.resource_agent.dto import (
     ResourceAgentParameterDto,
 )
 from pcs.lib.commands import resource_agent as lib
-from pcs.lib.resource_agent import ResourceAgentName
+from pcs.lib.resource_agent import (
+    ResourceAgentName,
+    UnableToGetAgentMetadata,
+)
 
 from pcs_test.tools import fixture
 from pcs_test.tools.command_env import get_env_tools
@@ -171,6 +180,54 @@ class ListAgents(TestCase):
             </resource-agent>
             """
 
+    @staticmethod
+    def _fixture_described_agents():
+        agent_stub = {
+            "parameters": [],
+            "actions": [],
+            "default_actions": [
+                {
+                    "interval": "60s",
+                    "name": "monitor",
+                    "OCF_CHECK_LEVEL": None,
+                    "automatic": False,
+                    "on_target": False,
+                    "role": None,
+                    "start-delay": None,
+                    "timeout": None,
+                }
+            ],
+        }
+        return [
+            dict(
+                name="ocf:test:Delay",
+                standard="ocf",
+                provider="test",
+                type="Delay",
+                shortdesc="short ocf:test:Delay",
+                longdesc="long ocf:test:Delay",
+                **agent_stub,
+            ),
+            dict(
+                name="service:corosync",
+                standard="service",
+                provider=None,
+                type="corosync",
+                shortdesc="short service:corosync",
+                longdesc="long service:corosync",
+                **agent_stub,
+            ),
+            dict(
+                name="service:pacemaker_remote",
+                standard="service",
+                provider=None,
+                type="pacemaker_remote",
+                shortdesc="short service:pacemaker_remote",
+                longdesc="long service:pacemaker_remote",
+                **agent_stub,
+            ),
+        ]
+
     def test_list_all(self):
         self.assertEqual(
             lib.list_agents(self.env_assist.get_env(), False, None),
@@ -232,53 +289,9 @@ class ListAgents(TestCase):
             name="runner.pcmk.load_agent.pacemaker_remote",
         )
 
-        agent_stub = {
-            "parameters": [],
-            "actions": [],
-            "default_actions": [
-                {
-                    "interval": "60s",
-                    "name": "monitor",
-                    "OCF_CHECK_LEVEL": None,
-                    "automatic": False,
-                    "on_target": False,
-                    "role": None,
-                    "start-delay": None,
-                    "timeout": None,
-                }
-            ],
-        }
         self.assertEqual(
             lib.list_agents(self.env_assist.get_env(), True, None),
-            [
-                dict(
-                    name="ocf:test:Delay",
-                    standard="ocf",
-                    provider="test",
-                    type="Delay",
-                    shortdesc="short ocf:test:Delay",
-                    longdesc="long ocf:test:Delay",
-                    **agent_stub,
-                ),
-                dict(
-                    name="service:corosync",
-                    standard="service",
-                    provider=None,
-                    type="corosync",
-                    shortdesc="short service:corosync",
-                    longdesc="long service:corosync",
-                    **agent_stub,
-                ),
-                dict(
-                    name="service:pacemaker_remote",
-                    standard="service",
-                    provider=None,
-                    type="pacemaker_remote",
-                    shortdesc="short service:pacemaker_remote",
-                    longdesc="long service:pacemaker_remote",
-                    **agent_stub,
-                ),
-            ],
+            self._fixture_described_agents(),
         )
         self.env_assist.assert_reports(
             [
@@ -294,6 +307,57 @@ class ListAgents(TestCase):
             ]
         )
 
+    def test_describe_concurrently(self):
+        agent_list = [
+            "ocf:test:Delay",
+            "ocf:test:Stateful",
+            "service:corosync",
+            "service:pacemaker_remote",
+        ]
+        loaded = {agent: threading.Event() for agent in agent_list}
+        load_threads = set()
+
+        def load_metadata(runner, agent_name):
+            del runner
+            name = agent_name.full_name
+            load_threads.add(threading.current_thread())
+            try:
+                # Metadata are loaded in the reverse order, each agent waits
+                # for the next one. This only passes if all agents are loaded
+                # at the same time.
+                next_index = agent_list.index(name) + 1
+                if next_index < len(agent_list):
+                    self.assertTrue(
+                        loaded[agent_list[next_index]].wait(timeout=10)
+                    )
+                if name == "ocf:test:Stateful":
+                    raise UnableToGetAgentMetadata(name, "metadata error")
+                return etree.fromstring(self._fixture_agent_metadata(name))
+            finally:
+                loaded[name].set()
+
+        env = self.env_assist.get_env()
+        with mock.patch(
+            "pcs.settings.resource_agent_metadata_load_workers", 4
+        ), mock.patch(
+            "pcs.lib.resource_agent.facade.load_metadata", load_metadata
+        ):
+            self.assertEqual(
+                lib.list_agents(env, True, None),
+                self._fixture_described_agents(),
+            )
+        self.assertEqual(len(load_threads), 4)
+        self.assertNotIn(threading.current_thread(), load_threads)
+        self.env_assist.assert_reports(
+            [
+                fixture.warn(
+                    report_codes.UNABLE_TO_GET_AGENT_METADATA,
+                    agent="ocf:test:Stateful",
+                    reason="metadata error",
+                )
+            ]
+        )
+
 
 class ActionToOperation(TestCase):
     # pylint: disable=protected-access
@@ -1205,3 +1269,20 @@ class GetAgentDefaultOperations(TestCase):
 
     def test_stonith_only_necessary(self):
         self._test_stonith(True)
+
+
+class ClearMetadataCache(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    def test_success(self):
+        env = self.env_assist.get_env()
+        with mock.patch.object(
+            env, "get_resource_agent_metadata_cache"
+        ) as mock_get_cache:
+            lib.clear_metadata_cache(env)
+        mock_get_cache.return_value.clear.assert_called_once_with()
+
+    def test_no_cache(self):
+        # the test environment does not provide the cache
+        lib.clear_metadata_cache(self.env_assist.get_env())
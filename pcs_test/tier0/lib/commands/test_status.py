@@ -1,4 +1,5 @@
 import os
+import threading
 from textwrap import dedent
 from unittest import (
     TestCase,
@@ -63,6 +64,45 @@ class PacemakerStatusXml(TestCase):
         self.assertEqual(cm.exception.output, "an error")
 
 
+class ProbeExecutor(TestCase):
+    @mock.patch("pcs.settings.cluster_status_probe_workers", 1)
+    def test_sequential(self):
+        call_list = []
+
+        def probe(name, fail=False):
+            call_list.append(name)
+            if fail:
+                raise LibraryError()
+            return name
+
+        with status._get_probe_executor() as executor:
+            future_1 = executor.submit(probe, "probe1")
+            future_2 = executor.submit(probe, "probe2", fail=True)
+            future_3 = executor.submit(probe, "probe3")
+        self.assertEqual(call_list, ["probe1", "probe2"])
+        self.assertEqual(future_1.result(), "probe1")
+        self.assertRaises(LibraryError, future_2.result)
+        self.assertTrue(future_3.cancelled())
+
+    @mock.patch("pcs.settings.cluster_status_probe_workers", 3)
+    def test_concurrent(self):
+        barrier = threading.Barrier(3, timeout=10)
+
+        def probe(name):
+            # passes only if all the probes run at the same time
+            barrier.wait()
+            return name
+
+        with status._get_probe_executor() as executor:
+            future_list = [
+                executor.submit(probe, f"probe{i}") for i in range(3)
+            ]
+        self.assertEqual(
+            [future.result() for future in future_list],
+            ["probe0", "probe1", "probe2"],
+        )
+
+
 class FullClusterStatusPlaintextBase(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(self)
@@ -84,12 +124,15 @@ class FullClusterStatusPlaintextBase(TestCase):
             name=name
         )
 
-    def _fixture_config_live_minimal(self):
+    def _fixture_config_live_minimal(self, **local_daemons):
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
+        )
+        self._fixture_config_local_daemons(**local_daemons)
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load(
                 resources="""
@@ -98,18 +141,17 @@ class FullClusterStatusPlaintextBase(TestCase):
                 </resources>
             """
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
 
-    def _fixture_config_live_remote_minimal(self):
+    def _fixture_config_live_remote_minimal(self, **local_daemons):
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
+        )
+        self._fixture_config_local_daemons(**local_daemons)
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
-            )
-            .fs.exists(settings.corosync_conf_file, return_value=False)
-            .runner.cib.load(
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=False
+            ).runner.cib.load(
                 optional_in_conf=self._fixture_xml_clustername("test-cib"),
                 resources="""
                 <resources>
@@ -117,9 +159,6 @@ class FullClusterStatusPlaintextBase(TestCase):
                 </resources>
             """,
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
 
     def _fixture_config_local_daemons(
@@ -136,57 +175,17 @@ class FullClusterStatusPlaintextBase(TestCase):
         sbd_active=False,
     ):
         # pylint: disable=too-many-arguments
-        (
-            self.config.services.is_enabled(
-                "corosync",
-                name="services.is_enabled.corosync",
-                return_value=corosync_enabled,
-            )
-            .services.is_running(
-                "corosync",
-                name="services.is_running.corosync",
-                return_value=corosync_active,
-            )
-            .services.is_enabled(
-                "pacemaker",
-                name="services.is_enabled.pacemaker",
-                return_value=pacemaker_enabled,
-            )
-            .services.is_running(
-                "pacemaker",
-                name="services.is_running.pacemaker",
-                return_value=pacemaker_active,
-            )
-            .services.is_enabled(
-                "pacemaker_remote",
-                name="services.is_enabled.pacemaker_remote",
-                return_value=pacemaker_remote_enabled,
-            )
-            .services.is_running(
-                "pacemaker_remote",
-                name="services.is_running.pacemaker_remote",
-                return_value=pacemaker_remote_active,
-            )
-            .services.is_enabled(
-                "pcsd",
-                name="services.is_enabled.pcsd",
-                return_value=pcsd_enabled,
-            )
-            .services.is_running(
-                "pcsd",
-                name="services.is_running.pcsd",
-                return_value=pcsd_active,
-            )
-            .services.is_enabled(
-                "sbd",
-                name="services.is_enabled.sbd_2",
-                return_value=sbd_enabled,
-            )
-            .services.is_running(
-                "sbd",
-                name="services.is_running.sbd_2",
-                return_value=sbd_active,
-            )
+        self.config.services.get_services_status(
+            {
+                "corosync": (corosync_enabled, corosync_active),
+                "pacemaker": (pacemaker_enabled, pacemaker_active),
+                "pacemaker_remote": (
+                    pacemaker_remote_enabled,
+                    pacemaker_remote_active,
+                ),
+                "pcsd": (pcsd_enabled, pcsd_active),
+                "sbd": (sbd_enabled, sbd_active),
+            }
         )
 
 
@@ -233,6 +232,10 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 stderr="some stderr",
                 returncode=1,
             )
+            # CIB and corosync.conf are loaded while other probes are running
+            .fs.exists(settings.corosync_conf_file, return_value=True)
+            .corosync_conf.load()
+            .runner.cib.load()
         )
         self.env_assist.assert_raise_library_error(
             lambda: status.full_cluster_status_plaintext(
@@ -248,12 +251,14 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_fail_getting_corosync_conf(self):
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
+        )
+        self._fixture_config_local_daemons()
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
-            )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
-            .corosync_conf.load_content("invalid corosync conf")
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
+            ).corosync_conf.load_content("invalid corosync conf")
         )
         self.env_assist.assert_raise_library_error(
             lambda: status.full_cluster_status_plaintext(
@@ -294,7 +299,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
 
     def test_success_live(self):
         self._fixture_config_live_minimal()
-        self._fixture_config_local_daemons()
         self.assertEqual(
             status.full_cluster_status_plaintext(self.env_assist.get_env()),
             dedent(
@@ -317,8 +321,15 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 verbose=True,
                 stdout="crm_mon cluster status",
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
+            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
+        )
+        self._fixture_config_local_daemons()
+        (
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
+            )
             .corosync_conf.load(node_name_list=self.node_name_list)
+            .http.host.check_reachability(node_labels=self.node_name_list)
             .runner.cib.load(
                 resources="""
                 <resources>
@@ -326,16 +337,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
-        )
-        self._fixture_config_local_daemons()
-        (
-            self.config.http.host.check_reachability(
-                node_labels=self.node_name_list
-            )
         )
 
         self.assertEqual(
@@ -363,8 +364,7 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_success_live_remote_node(self):
-        self._fixture_config_live_remote_minimal()
-        self._fixture_config_local_daemons(
+        self._fixture_config_live_remote_minimal(
             corosync_enabled=False,
             corosync_active=False,
             pacemaker_enabled=False,
@@ -396,19 +396,7 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 verbose=True,
                 stdout="crm_mon cluster status",
             )
-            .fs.exists(settings.corosync_conf_file, return_value=False)
-            .runner.cib.load(
-                optional_in_conf=self._fixture_xml_clustername("test-cib"),
-                resources="""
-                <resources>
-                    <primitive id="S" class="stonith" type="fence_dummy" />
-                </resources>
-            """,
-            )
             .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons(
             corosync_enabled=False,
@@ -418,6 +406,18 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             pacemaker_remote_enabled=True,
             pacemaker_remote_active=True,
         )
+        (
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=False
+            ).runner.cib.load(
+                optional_in_conf=self._fixture_xml_clustername("test-cib"),
+                resources="""
+                <resources>
+                    <primitive id="S" class="stonith" type="fence_dummy" />
+                </resources>
+            """,
+            )
+        )
 
         self.assertEqual(
             status.full_cluster_status_plaintext(
@@ -482,6 +482,9 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 stdout="crm_mon cluster status",
                 env=env,
             )
+            .runner.pcmk.load_ticket_state_plaintext(
+                stdout="ticket status", env=env
+            )
             .runner.cib.load(
                 resources="""
                 <resources>
@@ -490,9 +493,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             """,
                 env=env,
             )
-            .runner.pcmk.load_ticket_state_plaintext(
-                stdout="ticket status", env=env
-            )
         )
         self.assertEqual(
             status.full_cluster_status_plaintext(
@@ -518,8 +518,15 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 fence_history=True,
                 stdout="crm_mon cluster status",
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
+            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
+        )
+        self._fixture_config_local_daemons()
+        (
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
+            )
             .corosync_conf.load(node_name_list=self.node_name_list)
+            .http.host.check_reachability(node_labels=self.node_name_list)
             .runner.cib.load(
                 resources="""
                 <resources>
@@ -527,16 +534,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
-        )
-        self._fixture_config_local_daemons()
-        (
-            self.config.http.host.check_reachability(
-                node_labels=self.node_name_list
-            )
         )
 
         self.assertEqual(
@@ -573,8 +570,17 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 verbose=True,
                 stdout="crm_mon cluster status",
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
+            .runner.pcmk.load_ticket_state_plaintext(
+                stdout="ticket stdout", stderr=stderr, returncode=1
+            )
+        )
+        self._fixture_config_local_daemons()
+        (
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
+            )
             .corosync_conf.load(node_name_list=self.node_name_list)
+            .http.host.check_reachability(node_labels=self.node_name_list)
             .runner.cib.load(
                 resources="""
                 <resources>
@@ -582,18 +588,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .runner.pcmk.load_ticket_state_plaintext(
-                stdout="ticket stdout", stderr=stderr, returncode=1
-            )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
-        )
-        self._fixture_config_local_daemons()
-        (
-            self.config.http.host.check_reachability(
-                node_labels=self.node_name_list
-            )
         )
 
         self.assertEqual(
@@ -630,18 +624,17 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_stonith_warning_no_devices(self):
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
+        )
+        self._fixture_config_local_daemons()
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load()
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
-        self._fixture_config_local_daemons()
 
         self.assertEqual(
             status.full_cluster_status_plaintext(self.env_assist.get_env()),
@@ -662,18 +655,17 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_stonith_warning_no_devices_sbd_enabled(self):
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
+        )
+        self._fixture_config_local_daemons(sbd_active=True)
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load()
-            .services.is_running(
-                "sbd", return_value=True, name="services.is_running.sbd"
-            )
         )
-        self._fixture_config_local_daemons()
 
         self.assertEqual(
             status.full_cluster_status_plaintext(self.env_assist.get_env()),
@@ -685,16 +677,20 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 Daemon Status:
                   corosync: active/enabled
                   pacemaker: active/enabled
-                  pcsd: active/enabled"""
+                  pcsd: active/enabled
+                  sbd: active/disabled"""
             ),
         )
 
     def test_stonith_warnings_regarding_devices_configuration(self):
+        self.config.runner.pcmk.load_state_plaintext(
+            stdout="crm_mon cluster status",
+        )
+        self._fixture_config_local_daemons()
         (
-            self.config.runner.pcmk.load_state_plaintext(
-                stdout="crm_mon cluster status",
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
             .corosync_conf.load()
             .runner.cib.load(
                 resources="""
@@ -719,11 +715,7 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 </resources>
             """
             )
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
-        self._fixture_config_local_daemons()
 
         self.assertEqual(
             # pylint: disable=line-too-long
@@ -755,23 +747,15 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                 verbose=True,
                 stdout="crm_mon cluster status",
             )
-            .fs.exists(settings.corosync_conf_file, return_value=True)
-            .corosync_conf.load(node_name_list=self.node_name_list)
-            .runner.cib.load(
-                resources="""
-                <resources>
-                    <primitive id="S" class="stonith" type="fence_dummy" />
-                </resources>
-            """
-            )
             .runner.pcmk.load_ticket_state_plaintext(stdout="ticket status")
-            .services.is_running(
-                "sbd", return_value=False, name="services.is_running.sbd"
-            )
         )
         self._fixture_config_local_daemons()
         (
-            self.config.http.host.check_reachability(
+            self.config.fs.exists(
+                settings.corosync_conf_file, return_value=True
+            )
+            .corosync_conf.load(node_name_list=self.node_name_list)
+            .http.host.check_reachability(
                 communication_list=[
                     # node1 has no record in known-hosts
                     dict(
@@ -795,6 +779,13 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
                     ),
                 ]
             )
+            .runner.cib.load(
+                resources="""
+                <resources>
+                    <primitive id="S" class="stonith" type="fence_dummy" />
+                </resources>
+            """
+            )
         )
 
         self.assertEqual(
@@ -824,8 +815,7 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_daemon_status_all_on(self):
-        self._fixture_config_live_minimal()
-        self._fixture_config_local_daemons(
+        self._fixture_config_live_minimal(
             corosync_enabled=True,
             corosync_active=True,
             pacemaker_enabled=True,
@@ -854,8 +844,7 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
     def test_daemon_status_all_off(self):
-        self._fixture_config_live_minimal()
-        self._fixture_config_local_daemons(
+        self._fixture_config_live_minimal(
             corosync_enabled=False,
             corosync_active=False,
             pacemaker_enabled=False,
@@ -885,6 +874,7 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         self.config.runner.pcmk.load_state_plaintext(
             stdout="crm_mon cluster status",
         )
+        self._fixture_config_local_daemons(sbd_enabled=True, sbd_active=True)
         self.config.fs.exists(settings.corosync_conf_file, return_value=True)
         self.config.corosync_conf.load()
         self.config.runner.cib.load(
@@ -913,10 +903,6 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             </resources>
         """,
         )
-        self.config.services.is_running(
-            "sbd", return_value=True, name="services.is_running.sbd"
-        )
-        self._fixture_config_local_daemons(sbd_enabled=True, sbd_active=True)
 
         self.assertEqual(
             # pylint: disable=line-too-long
@@ -940,12 +926,122 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
         )
 
 
+@mock.patch("pcs.settings.booth_enable_authfile_set_enabled", False)
+@mock.patch("pcs.settings.booth_enable_authfile_unset_enabled", False)
+class FullClusterStatusPlaintextConcurrent(FullClusterStatusPlaintextBase):
+    def setUp(self):
+        super().setUp()
+        self.barrier = threading.Barrier(4, timeout=10)
+        self.probe_threads = {}
+        self.env_threads = {}
+
+    def _probe(self, name, result):
+        def probe(*args, **kwargs):
+            del args, kwargs
+            self.probe_threads[name] = threading.current_thread()
+            # passes only if all the probes run at the same time
+            self.barrier.wait()
+            return result
+
+        return probe
+
+    def _env_call(self, name, env_method):
+        def call():
+            self.env_threads[name] = threading.current_thread()
+            return env_method()
+
+        return call
+
+    def test_probes_run_concurrently(self):
+        (
+            self.config.env.set_known_nodes(self.node_name_list)
+            .fs.exists(settings.corosync_conf_file, return_value=True)
+            .corosync_conf.load(node_name_list=self.node_name_list)
+            .runner.cib.load(
+                resources="""
+                <resources>
+                    <primitive id="S" class="stonith" type="fence_dummy" />
+                </resources>
+            """
+            )
+        )
+        env = self.env_assist.get_env()
+        env.get_cib = self._env_call("cib", env.get_cib)
+        env.get_corosync_conf = self._env_call(
+            "corosync_conf", env.get_corosync_conf
+        )
+        with mock.patch(
+            "pcs.settings.cluster_status_probe_workers", 4
+        ), mock.patch.object(
+            status,
+            "get_cluster_status_text",
+            self._probe("status", ("crm_mon cluster status", [])),
+        ), mock.patch.object(
+            status,
+            "get_ticket_status_text",
+            self._probe("tickets", ("ticket status", "", 0)),
+        ), mock.patch.object(
+            status,
+            "_get_local_services_status",
+            self._probe(
+                "services",
+                [
+                    status._ServiceStatus("corosync", True, True, True),
+                    status._ServiceStatus("pacemaker", True, True, False),
+                ],
+            ),
+        ), mock.patch.object(
+            status,
+            "run_communication",
+            self._probe(
+                "reachability",
+                {
+                    "node1": "REACHABLE",
+                    "node2": "UNREACHABLE",
+                    "node3": "UNAUTH",
+                },
+            ),
+        ):
+            output = status.full_cluster_status_plaintext(env, verbose=True)
+
+        self.assertEqual(
+            output,
+            dedent(
+                """\
+                Cluster name: test99
+                crm_mon cluster status
+
+                Tickets:
+                  ticket status
+
+                PCSD Status:
+                  node1: Online
+                  node2: Offline
+                  node3: Unable to authenticate
+
+                Daemon Status:
+                  corosync: active/enabled
+                  pacemaker: inactive/enabled"""
+            ),
+        )
+        main_thread = threading.current_thread()
+        self.assertEqual(
+            sorted(self.probe_threads),
+            ["reachability", "services", "status", "tickets"],
+        )
+        for thread in self.probe_threads.values():
+            self.assertIsNot(thread, main_thread)
+        self.assertEqual(
+            self.env_threads,
+            {"cib": main_thread, "corosync_conf": main_thread},
+        )
+
+
 class FullClusterStatusPlaintextBoothWarning(FullClusterStatusPlaintextBase):
     # pylint: disable=too-many-public-methods
     def setUp(self):
         super().setUp()
         self._fixture_config_live_minimal()
-        self._fixture_config_local_daemons()
 
     def _assert_status_output(self, warning=None):
         warning_str = ""
@@ -107,7 +107,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=self._expected_cib(expected_cib_simple)
         )
@@ -133,7 +133,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.stonith_agent_self_validation(
             instance_attributes,
             agent_name,
@@ -180,7 +180,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.stonith_agent_self_validation(
             instance_attributes,
             agent_name,
@@ -229,7 +229,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.runner.pcmk.stonith_agent_self_validation(
             instance_attributes,
             agent_name,
@@ -265,7 +265,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_unfencing.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=self._expected_cib(expected_cib_unfencing)
         )
@@ -302,7 +302,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(resources=self._expected_cib(expected_cib))
 
         self._create(
@@ -327,7 +327,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_custom_actions.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=self._expected_cib(expected_cib_operations)
         )
@@ -357,7 +357,8 @@ class CreateMixin:
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
         self.config.runner.cib.load(
-            resources=self._expected_cib(expected_cib_simple)
+            resources=self._expected_cib(expected_cib_simple),
+            load_status=False,
         )
 
         self.env_assist.assert_raise_library_error(
@@ -385,7 +386,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=self._expected_cib(expected_cib_simple_forced)
         )
@@ -532,7 +533,7 @@ class CreateMixin:
             agent_name=f"stonith:{agent_name}", agent_is_missing=True
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=self._expected_cib(expected_cib_unknown)
         )
@@ -597,7 +598,7 @@ class CreateMixin:
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
         self.config.env.push_cib(
             resources=self._expected_cib(expected_cib_simple), wait=timeout
         )
@@ -655,7 +656,7 @@ class CreateInGroup(CreateMixin, TestCase):
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(load_status=False)
 
         self.env_assist.assert_raise_library_error(
             lambda: stonith.create_in_group(
@@ -710,7 +711,7 @@ class CreateInGroup(CreateMixin, TestCase):
             agent_filename="stonith_agent_fence_simple.xml",
         )
         self.config.runner.pcmk.load_fake_agent_metadata()
-        self.config.runner.cib.load(resources=original_cib)
+        self.config.runner.cib.load(resources=original_cib, load_status=False)
         self.config.env.push_cib(resources=expected_cib)
 
         stonith.create_in_group(
@@ -26,6 +26,7 @@ class CreateTest(TestCase):
                         <primitive id="resourceA" class="service" type="exim"/>
                     </resources>
                 """,
+                load_status=False,
             ).env.push_cib(
                 optional_in_conf="""
                     <constraints>
@@ -66,7 +67,7 @@ class CreateTest(TestCase):
 
     def test_refuse_for_nonexisting_resource(self):
         env_assist, config = get_env_tools(test_case=self)
-        config.runner.cib.load()
+        config.runner.cib.load(load_status=False)
         env_assist.assert_raise_library_error(
             lambda: ticket_command.create(
                 env_assist.get_env(),
@@ -0,0 +1,9 @@
+from unittest import TestCase
+
+
+class RunRemotelyPipeline(TestCase):
+    """
+    tested in:
+        pcs_test.tier0.lib.commands.cluster.test_add_nodes
+        pcs_test.tier0.lib.commands.cluster.test_setup.Failures
+    """
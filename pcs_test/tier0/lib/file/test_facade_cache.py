@@ -0,0 +1,108 @@
+import os
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.common.file import (
+    FileMetadata,
+    RawFileError,
+)
+from pcs.common.file_type_codes import PCS_USERS_CONF
+from pcs.lib.file import toolbox
+from pcs.lib.file.facade_cache import FileFacadeCache
+from pcs.lib.file.instance import FileInstance
+from pcs.lib.file.raw_file import (
+    GhostFile,
+    RealFile,
+)
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+def _fixture_tokens(username):
+    return (
+        f'[{{"token": "token-{username}", "username": "{username}", '
+        '"creation_date": "now"}]'
+    )
+
+
+class FileFacadeCacheTest(TestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_dir = get_tmp_dir("tier0_lib_file_facade_cache")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "pcs_users.conf")
+        self.metadata = FileMetadata(
+            file_type_code=PCS_USERS_CONF,
+            path=self.path,
+            owner_user_name=None,
+            owner_group_name=None,
+            permissions=None,
+            is_binary=False,
+        )
+        self.file_instance = FileInstance(
+            RealFile(self.metadata), toolbox.for_file_type(PCS_USERS_CONF)
+        )
+        self.read_mock = mock.Mock(wraps=self.file_instance.read_to_facade)
+        self.file_instance.read_to_facade = self.read_mock
+        self.cache = FileFacadeCache()
+
+    def _write(self, content):
+        with open(self.path, "w") as a_file:
+            a_file.write(content)
+
+    def test_cached(self):
+        self._write(_fixture_tokens("user1"))
+        facade_1 = self.cache.read_to_facade(self.file_instance)
+        facade_2 = self.cache.read_to_facade(self.file_instance)
+        self.assertIs(facade_1, facade_2)
+        self.assertEqual(facade_1.get_user("token-user1"), "user1")
+        self.read_mock.assert_called_once_with()
+
+    def test_file_changed(self):
+        self._write(_fixture_tokens("user1"))
+        self.cache.read_to_facade(self.file_instance)
+        self._write(_fixture_tokens("user22"))
+        facade = self.cache.read_to_facade(self.file_instance)
+        self.assertEqual(facade.get_user("token-user22"), "user22")
+        self.assertEqual(self.read_mock.call_count, 2)
+
+    def test_file_replaced(self):
+        self._write(_fixture_tokens("user1"))
+        stat = os.stat(self.path)
+        self.cache.read_to_facade(self.file_instance)
+        # same size and modification time, different inode
+        other_path = f"{self.path}.new"
+        with open(other_path, "w") as a_file:
+            a_file.write(_fixture_tokens("user2"))
+        os.utime(other_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(other_path, self.path)
+        facade = self.cache.read_to_facade(self.file_instance)
+        self.assertEqual(facade.get_user("token-user2"), "user2")
+        self.assertEqual(self.read_mock.call_count, 2)
+
+    def test_file_missing(self):
+        with self.assertRaises(RawFileError):
+            self.cache.read_to_facade(self.file_instance)
+        self.read_mock.assert_called_once_with()
+
+    def test_clear(self):
+        self._write(_fixture_tokens("user1"))
+        self.cache.read_to_facade(self.file_instance)
+        self.cache.clear()
+        self.cache.read_to_facade(self.file_instance)
+        self.assertEqual(self.read_mock.call_count, 2)
+
+    def test_ghost_file_not_cached(self):
+        file_instance = FileInstance(
+            GhostFile(
+                self.metadata, file_data=_fixture_tokens("user1").encode()
+            ),
+            toolbox.for_file_type(PCS_USERS_CONF),
+        )
+        read_mock = mock.Mock(wraps=file_instance.read_to_facade)
+        file_instance.read_to_facade = read_mock
+        self.cache.read_to_facade(file_instance)
+        self.cache.read_to_facade(file_instance)
+        self.assertEqual(read_mock.call_count, 2)
@@ -1,4 +1,5 @@
 # pylint: disable=too-many-lines
+import itertools
 import os.path
 from unittest import (
     TestCase,
@@ -461,6 +462,50 @@ class GetCibXmlTest(TestCase):
         )
 
 
+class GetCibXmlWithoutStatus(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    def test_success(self):
+        self.config.runner.cib.load(
+            resources="<resources><primitive id='R'/></resources>",
+            load_status=False,
+        )
+        env = self.env_assist.get_env()
+        assert_xml_equal(
+            """
+            <cib epoch="557" num_updates="122" admin_epoch="0"
+                validate-with="pacemaker-3.1" crm_feature_set="3.1.0"
+                update-origin="rh7-3" update-client="crmd"
+                cib-last-written="Thu Aug 23 16:49:17 2012"
+                have-quorum="0" dc-uuid="2"
+            >
+                <configuration>
+                    <crm_config/>
+                    <nodes/>
+                    <resources>
+                        <primitive id="R"/>
+                    </resources>
+                    <constraints/>
+                </configuration>
+                <status/>
+            </cib>
+            """,
+            lib.get_cib_xml_without_status(env.cmd_runner()),
+        )
+
+    def test_error(self):
+        self.config.runner.cib.load(
+            returncode=1, stderr="some error", load_status=False
+        )
+        env = self.env_assist.get_env()
+        self.env_assist.assert_raise_library_error(
+            lambda: lib.get_cib_xml_without_status(env.cmd_runner()),
+            [fixture.error(report_codes.CIB_LOAD_ERROR, reason="some error")],
+            expected_in_processor=False,
+        )
+
+
 class GetCibTest(TestCase):
     # pylint: disable=no-self-use
     def test_success(self):
@@ -1162,6 +1207,102 @@ class GetLocalNodeStatusTest(TestCase):
         )
 
 
+class IsNodeStatusStarted(TestCase):
+    def test_started(self):
+        self.assertTrue(
+            lib.is_node_status_started(dict(online=True, pending=False))
+        )
+
+    def test_pending(self):
+        self.assertFalse(
+            lib.is_node_status_started(dict(online=True, pending=True))
+        )
+
+    def test_not_online(self):
+        self.assertFalse(
+            lib.is_node_status_started(dict(online=False, pending=False))
+        )
+
+    def test_offline(self):
+        self.assertFalse(lib.is_node_status_started(dict(offline=True)))
+
+
+@mock.patch.object(
+    settings, "pacemaker_api_result_schema", rc("pcmk_api_rng/api-result.rng")
+)
+class WaitForLocalNodeStarted(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+        # each check of time moves the clock one second forward
+        patcher = mock.patch("time.monotonic", side_effect=itertools.count())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _nodes_xml(pending):
+        return f"""
+            <nodes>
+                <node id="1" name="name_1" />
+                <node id="2" name="name_2" pending="{str(pending).lower()}" />
+            </nodes>
+        """
+
+    @mock.patch("time.sleep")
+    def test_started(self, mock_sleep):
+        self.config.runner.pcmk.load_state(
+            nodes=self._nodes_xml(False)
+        ).runner.pcmk.local_node_name(node_name="name_2")
+
+        env = self.env_assist.get_env()
+        real_status = lib.wait_for_local_node_started(env.cmd_runner(), 10)
+        self.assertEqual("2", real_status["id"])
+        self.assertFalse(real_status["pending"])
+        mock_sleep.assert_not_called()
+
+    @mock.patch("time.sleep")
+    def test_started_later(self, mock_sleep):
+        (
+            self.config.runner.pcmk.load_state(
+                name="load_state_offline",
+                stdout=fixture_crm_mon.error_xml_not_connected(),
+                returncode=_EXITCODE_NOT_CONNECTED,
+            )
+            .runner.pcmk.load_state(
+                name="load_state_pending", nodes=self._nodes_xml(True)
+            )
+            .runner.pcmk.local_node_name(
+                name="local_node_name_pending", node_name="name_2"
+            )
+            .runner.pcmk.load_state(nodes=self._nodes_xml(False))
+            .runner.pcmk.local_node_name(node_name="name_2")
+        )
+
+        env = self.env_assist.get_env()
+        real_status = lib.wait_for_local_node_started(env.cmd_runner(), 10)
+        self.assertEqual("2", real_status["id"])
+        self.assertFalse(real_status["pending"])
+        self.assertEqual(mock_sleep.mock_calls, [mock.call(1), mock.call(1)])
+
+    @mock.patch("time.sleep")
+    def test_timeout(self, mock_sleep):
+        (
+            self.config.runner.pcmk.load_state(
+                name="load_state_1", nodes=self._nodes_xml(True)
+            )
+            .runner.pcmk.local_node_name(
+                name="local_node_name_1", node_name="name_2"
+            )
+            .runner.pcmk.load_state(nodes=self._nodes_xml(True))
+            .runner.pcmk.local_node_name(node_name="name_2")
+        )
+
+        env = self.env_assist.get_env()
+        real_status = lib.wait_for_local_node_started(env.cmd_runner(), 2)
+        self.assertEqual("2", real_status["id"])
+        self.assertTrue(real_status["pending"])
+        mock_sleep.assert_called_once_with(1)
+
+
 class RemoveNode(TestCase):
     # pylint: disable=no-self-use
     def test_success(self):
@@ -1493,6 +1634,34 @@ class ResourcesWaitingTest(TestCase):
         )
 
 
+class TryWaitForIdle(TestCase):
+    def assert_call(self, retval, expected_result):
+        mock_runner = get_runner("some info", "some error", retval)
+        self.assertEqual(expected_result, lib.try_wait_for_idle(mock_runner, 1))
+        mock_runner.run.assert_called_once_with(
+            [path("crm_resource"), "--wait", "--timeout=1"]
+        )
+
+    def test_idle(self):
+        self.assert_call(0, True)
+
+    def test_timeout(self):
+        self.assert_call(124, False)
+
+    def test_error(self):
+        mock_runner = get_runner("some info", "some error", 1)
+        assert_raise_library_error(
+            lambda: lib.try_wait_for_idle(mock_runner, 1),
+            (
+                Severity.ERROR,
+                report_codes.WAIT_FOR_IDLE_ERROR,
+                {
+                    "reason": "some error\nsome info",
+                },
+            ),
+        )
+
+
 class IsInPcmkToolHelp(TestCase):
     # pylint: disable=protected-access
     def test_all_in_stderr(self):
@@ -1538,6 +1707,93 @@ class GetRulesInEffectStatus(TestCase):
                 )
 
 
+class IsRuleInEffectStatusCheckOfMoreRulesSupported(TestCase):
+    def test_supported(self):
+        runner = get_runner(
+            stderr=(
+                "--output-as=FORMAT\n"
+                "-r, --rule  The ID of the rule to check (may be specified "
+                "multiple times)\n"
+            )
+        )
+        self.assertTrue(
+            lib.is_rule_in_effect_status_check_of_more_rules_supported(runner)
+        )
+        runner.run.assert_called_once_with([path("crm_rule"), "--help-all"])
+
+    def test_not_supported(self):
+        runner = get_runner(stderr="-r, --rule  The ID of the rule to check\n")
+        self.assertFalse(
+            lib.is_rule_in_effect_status_check_of_more_rules_supported(runner)
+        )
+
+
+@mock.patch.object(
+    settings, "pacemaker_api_result_schema", rc("pcmk_api_rng/api-result.rng")
+)
+class GetRulesInEffectStatusAllAtOnce(TestCase):
+    def test_success(self):
+        runner = get_runner(
+            stdout="""
+                <pacemaker-result api-version="2.9" request="crm_rule">
+                    <rule-check rule-id="r1" rc="110" />
+                    <rule-check rule-id="r2" rc="0" />
+                    <rule-check rule-id="r3" rc="111" />
+                    <rule-check rule-id="r4" rc="112" />
+                    <status code="0" message="OK" />
+                </pacemaker-result>
+            """,
+            returncode=112,
+        )
+        self.assertEqual(
+            lib.get_rules_in_effect_status(
+                runner, "mock cib", ["r1", "r2", "r3", "r4"]
+            ),
+            {
+                "r1": CibRuleInEffectStatus.EXPIRED,
+                "r2": CibRuleInEffectStatus.IN_EFFECT,
+                "r3": CibRuleInEffectStatus.NOT_YET_IN_EFFECT,
+                "r4": CibRuleInEffectStatus.UNKNOWN,
+            },
+        )
+        runner.run.assert_called_once_with(
+            [
+                path("crm_rule"),
+                "--check",
+                "--output-as",
+                "xml",
+                "--rule",
+                "r1",
+                "--rule",
+                "r2",
+                "--rule",
+                "r3",
+                "--rule",
+                "r4",
+                "--xml-text",
+                "-",
+            ],
+            stdin_string="mock cib",
+        )
+
+    def test_no_rules(self):
+        runner = get_runner()
+        self.assertEqual(lib.get_rules_in_effect_status(runner, "cib", []), {})
+        runner.run.assert_not_called()
+
+    def test_invalid_xml(self):
+        runner = get_runner(stdout="<pacemaker-result />", returncode=1)
+        self.assertIsNone(
+            lib.get_rules_in_effect_status(runner, "mock cib", ["r1"])
+        )
+
+    def test_not_xml(self):
+        runner = get_runner(stdout="not an xml", returncode=1)
+        self.assertIsNone(
+            lib.get_rules_in_effect_status(runner, "mock cib", ["r1"])
+        )
+
+
 @mock.patch.object(
     settings, "pacemaker_api_result_schema", rc("pcmk_api_rng/api-result.rng")
 )
@@ -0,0 +1,363 @@
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from lxml import etree
+
+from pcs.lib.pacemaker import patchset
+
+from pcs_test.tools.assertions import assert_xml_equal
+from pcs_test.tools.misc import get_test_resource as rc
+from pcs_test.tools.xml import etree_to_str
+
+CIB_OLD = """
+    <cib epoch="5" num_updates="1" admin_epoch="0" validate-with="pacemaker-3.8">
+        <configuration>
+            <crm_config/>
+            <nodes/>
+            <resources>
+                <primitive id="A" class="ocf" provider="pacemaker" type="Dummy">
+                    <meta_attributes id="A-meta">
+                        <nvpair id="A-meta-1" name="target-role" value="Stopped"/>
+                    </meta_attributes>
+                </primitive>
+                <primitive id="B" class="ocf" provider="pacemaker" type="Dummy"/>
+                <primitive id="C" class="ocf" provider="pacemaker" type="Dummy"/>
+                <primitive id="D" class="ocf" provider="pacemaker" type="Dummy"/>
+            </resources>
+            <constraints/>
+        </configuration>
+        <status/>
+    </cib>
+"""
+
+
+def _cib(cib_xml=CIB_OLD):
+    return etree.fromstring(cib_xml)
+
+
+def _resources(cib):
+    return cib.find("configuration/resources")
+
+
+class CreatePatchsetXml(TestCase):
+    def assert_round_trip(self, cib_new):
+        patchset_xml = patchset.create_patchset_xml(CIB_OLD, cib_new)
+        self.assertNotEqual(patchset_xml, "")
+        cib_patched = _cib()
+        patchset.apply_patchset(cib_patched, etree.fromstring(patchset_xml))
+        self.assertIsNone(patchset.create_patchset(cib_patched, cib_new))
+        return patchset_xml
+
+    def test_no_change(self):
+        self.assertEqual(patchset.create_patchset_xml(CIB_OLD, _cib()), "")
+
+    def test_version_ignored(self):
+        cib_new = _cib()
+        cib_new.set("epoch", "6")
+        cib_new.set("num_updates", "0")
+        self.assertEqual(patchset.create_patchset_xml(CIB_OLD, cib_new), "")
+
+    def test_whitespace_ignored(self):
+        cib_new = _cib()
+        for element in cib_new.iter():
+            element.text = None
+            element.tail = None
+        self.assertEqual(patchset.create_patchset_xml(CIB_OLD, cib_new), "")
+
+    def test_attribute_order_ignored(self):
+        cib_new = _cib()
+        primitive = _resources(cib_new)[1]
+        attrs = dict(primitive.attrib)
+        primitive.attrib.clear()
+        for name in reversed(list(attrs)):
+            primitive.set(name, attrs[name])
+        self.assertEqual(patchset.create_patchset_xml(CIB_OLD, cib_new), "")
+
+    def test_modify(self):
+        cib_new = _cib()
+        cib_new.set("epoch", "6")
+        cib_new.set("validate-with", "pacemaker-3.9")
+        nvpair = cib_new.find(".//nvpair")
+        nvpair.set("value", "Started")
+        del nvpair.attrib["name"]
+        assert_xml_equal(
+            """
+            <diff format="2">
+                <change operation="modify" path="/cib">
+                    <change-list>
+                        <change-attr name="validate-with" operation="set"
+                            value="pacemaker-3.9"
+                        />
+                    </change-list>
+                    <change-result>
+                        <cib validate-with="pacemaker-3.9"/>
+                    </change-result>
+                </change>
+                <change operation="modify"
+                    path="/cib/configuration/resources/primitive[@id='A']/meta_attributes[@id='A-meta']/nvpair[@id='A-meta-1']"
+                >
+                    <change-list>
+                        <change-attr name="value" operation="set"
+                            value="Started"
+                        />
+                        <change-attr name="name" operation="unset"/>
+                    </change-list>
+                    <change-result>
+                        <nvpair id="A-meta-1" value="Started"/>
+                    </change-result>
+                </change>
+            </diff>
+            """,
+            self.assert_round_trip(cib_new),
+        )
+
+    def test_create_and_delete(self):
+        cib_new = _cib()
+        resources = _resources(cib_new)
+        resources.remove(resources.find("primitive[@id='A']"))
+        resources.remove(resources.find("primitive[@id='C']"))
+        group = etree.Element("group", id="G")
+        etree.SubElement(group, "primitive", id="E", type="Dummy")
+        resources.insert(1, group)
+        assert_xml_equal(
+            """
+            <diff format="2">
+                <change operation="delete"
+                    path="/cib/configuration/resources/primitive[@id='A']"
+                    position="0"
+                />
+                <change operation="delete"
+                    path="/cib/configuration/resources/primitive[@id='C']"
+                    position="2"
+                />
+                <change operation="create" path="/cib/configuration/resources"
+                    position="1"
+                >
+                    <group id="G">
+                        <primitive id="E" type="Dummy"/>
+                    </group>
+                </change>
+            </diff>
+            """,
+            self.assert_round_trip(cib_new),
+        )
+
+    def test_move(self):
+        cib_new = _cib()
+        resources = _resources(cib_new)
+        resources.append(resources.find("primitive[@id='A']"))
+        assert_xml_equal(
+            """
+            <diff format="2">
+                <change operation="move"
+                    path="/cib/configuration/resources/primitive[@id='A']"
+                    position="3"
+                />
+            </diff>
+            """,
+            self.assert_round_trip(cib_new),
+        )
+
+    def test_move_modified(self):
+        cib_new = _cib()
+        resources = _resources(cib_new)
+        primitive = resources.find("primitive[@id='D']")
+        primitive.set("type", "Stateful")
+        resources.insert(0, primitive)
+        assert_xml_equal(
+            """
+            <diff format="2">
+                <change operation="modify"
+                    path="/cib/configuration/resources/primitive[@id='D']"
+                >
+                    <change-list>
+                        <change-attr name="type" operation="set"
+                            value="Stateful"
+                        />
+                    </change-list>
+                    <change-result>
+                        <primitive id="D" class="ocf" provider="pacemaker"
+                            type="Stateful"
+                        />
+                    </change-result>
+                </change>
+                <change operation="move"
+                    path="/cib/configuration/resources/primitive[@id='D']"
+                    position="0"
+                />
+            </diff>
+            """,
+            self.assert_round_trip(cib_new),
+        )
+
+    def test_reorder_create_delete(self):
+        cib_new = _cib()
+        resources = _resources(cib_new)
+        resources.remove(resources.find("primitive[@id='B']"))
+        resources.insert(0, etree.Element("primitive", id="E"))
+        resources.append(resources.find("primitive[@id='A']"))
+        resources.insert(1, resources.find("primitive[@id='D']"))
+        resources.append(etree.Element("primitive", id="F"))
+        self.assert_round_trip(cib_new)
+
+    def test_reverse_order(self):
+        cib_new = _cib()
+        resources = _resources(cib_new)
+        for primitive in reversed(list(resources)):
+            resources.append(primitive)
+        self.assertEqual(
+            [primitive.get("id") for primitive in resources],
+            ["D", "C", "B", "A"],
+        )
+        patchset_xml = self.assert_round_trip(cib_new)
+        self.assertEqual(patchset_xml.count('operation="move"'), 3)
+
+    @mock.patch("pcs.lib.pacemaker.patchset.apply_patchset")
+    def test_patched_cib_does_not_match(self, mock_apply):
+        cib_new = _cib()
+        cib_new.find(".//nvpair").set("value", "Started")
+        with self.assertRaises(patchset.PatchsetError) as cm:
+            patchset.create_patchset_xml(CIB_OLD, cib_new)
+        self.assertEqual(
+            str(cm.exception), "Patched CIB does not match the modified CIB"
+        )
+        mock_apply.assert_called_once()
+
+    def test_real_cib(self):
+        with open(rc("cib-large.xml")) as cib_file:
+            cib_old_xml = cib_file.read()
+        cib_new = _cib(cib_old_xml.encode())
+        constraints = cib_new.find("configuration/constraints")
+        constraints.remove(constraints[0])
+        constraints.append(constraints[0])
+        resources = _resources(cib_new)
+        resources.insert(0, resources[-1])
+        resources[1].set("description", "changed")
+        patchset_xml = patchset.create_patchset_xml(cib_old_xml, cib_new)
+        cib_patched = _cib(cib_old_xml.encode())
+        patchset.apply_patchset(cib_patched, etree.fromstring(patchset_xml))
+        self.assertIsNone(patchset.create_patchset(cib_patched, cib_new))
+
+
+class CreatePatchsetUnsupported(TestCase):
+    def assert_unsupported(self, cib_new, message):
+        with self.assertRaises(patchset.PatchsetError) as cm:
+            patchset.create_patchset(_cib(), cib_new)
+        self.assertEqual(str(cm.exception), message)
+
+    def test_comment(self):
+        cib_new = _cib()
+        _resources(cib_new).append(etree.Comment("comment"))
+        self.assert_unsupported(
+            cib_new, "Comment or processing instruction in resources"
+        )
+
+    def test_text(self):
+        cib_new = _cib()
+        _resources(cib_new)[0].tail = "text"
+        self.assert_unsupported(cib_new, "Text content in resources")
+
+    def test_duplicate_id(self):
+        cib_new = _cib()
+        _resources(cib_new).append(etree.Element("primitive", id="A"))
+        self.assert_unsupported(cib_new, "Ambiguous element primitive[@id='A']")
+
+    def test_unchanged_subtree_not_checked(self):
+        cib_old_xml = CIB_OLD.replace(
+            "<status/>", "<status><!-- x --></status>"
+        )
+        cib_new = _cib(cib_old_xml)
+        cib_new.find(".//nvpair").set("value", "Started")
+        self.assertIsNotNone(
+            patchset.create_patchset(_cib(cib_old_xml), cib_new)
+        )
+
+    def test_different_roots(self):
+        with self.assertRaises(patchset.PatchsetError):
+            patchset.create_patchset(_cib(), etree.Element("cib2"))
+
+
+class ApplyPatchset(TestCase):
+    def test_pacemaker_patchset(self):
+        cib = _cib()
+        patchset.apply_patchset(
+            cib,
+            etree.fromstring(
+                """
+                <diff format="2">
+                    <change operation="delete"
+                        path="/cib/configuration/resources/primitive[@id='B']"
+                        position="1"
+                    />
+                    <change operation="create"
+                        path="/cib/configuration/resources" position="0"
+                    >
+                        <primitive id="E"/>
+                    </change>
+                    <change operation="move"
+                        path="/cib/configuration/resources/primitive[@id='A']"
+                        position="3"
+                    />
+                    <change operation="modify"
+                        path="/cib/configuration/resources/primitive[@id='C']"
+                    >
+                        <change-list>
+                            <change-attr name="type" operation="set"
+                                value="Stateful"
+                            />
+                        </change-list>
+                        <change-result>
+                            <primitive id="C" type="Stateful"/>
+                        </change-result>
+                    </change>
+                </diff>
+                """
+            ),
+        )
+        assert_xml_equal(
+            """
+            <resources>
+                <primitive id="E"/>
+                <primitive id="C" type="Stateful"/>
+                <primitive id="D" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                />
+                <primitive id="A" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                >
+                    <meta_attributes id="A-meta">
+                        <nvpair id="A-meta-1" name="target-role"
+                            value="Stopped"
+                        />
+                    </meta_attributes>
+                </primitive>
+            </resources>
+            """,
+            etree_to_str(_resources(cib)),
+        )
+
+    def test_path_not_found(self):
+        with self.assertRaises(patchset.PatchsetError) as cm:
+            patchset.apply_patchset(
+                _cib(),
+                etree.fromstring(
+                    """
+                    <diff format="2">
+                        <change operation="move" position="0"
+                            path="/cib/configuration/resources/primitive[@id='X']"
+                        />
+                    </diff>
+                    """
+                ),
+            )
+        self.assertEqual(
+            str(cm.exception),
+            "Path not found: "
+            "/cib/configuration/resources/primitive[@id='X']",
+        )
+
+    def test_unsupported_format(self):
+        with self.assertRaises(patchset.PatchsetError):
+            patchset.apply_patchset(_cib(), etree.fromstring("<diff/>"))
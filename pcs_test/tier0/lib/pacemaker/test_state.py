@@ -586,6 +586,69 @@ class InfoResourceState(CommonResourceState):
         )
 
 
+class IsResourceInExpectedState(TestCase):
+    def setUp(self):
+        self.cluster_state = "state"
+        self.resource_id = "R"
+        patcher_primitives = mock.patch(
+            "pcs.lib.pacemaker.state._get_primitives_for_state_check"
+        )
+        self.addCleanup(patcher_primitives.stop)
+        self.get_primitives_for_state_check = patcher_primitives.start()
+
+    def assert_in_state(self, role_list, expected_running, expected_result):
+        self.get_primitives_for_state_check.return_value = [
+            etree.Element("resource", role=role) for role in role_list
+        ]
+        self.assertEqual(
+            state.is_resource_in_expected_state(
+                self.cluster_state, self.resource_id, expected_running
+            ),
+            expected_result,
+        )
+        self.get_primitives_for_state_check.assert_called_once_with(
+            self.cluster_state, self.resource_id, expected_running
+        )
+
+    def test_running_expected_running(self):
+        self.assert_in_state(["Started"], True, True)
+
+    def test_running_expected_not_running(self):
+        self.assert_in_state(["Started"], False, False)
+
+    def test_not_running_expected_running(self):
+        self.assert_in_state(["Stopped"], True, False)
+
+    def test_not_running_expected_not_running(self):
+        self.assert_in_state(["Stopped"], False, True)
+
+    def test_no_instance_expected_running(self):
+        self.assert_in_state([], True, False)
+
+    def test_no_instance_expected_not_running(self):
+        self.assert_in_state([], False, True)
+
+    def test_all_instances_running_expected_running(self):
+        self.assert_in_state(["Started", "Master", "Slave"], True, True)
+
+    def test_some_instances_running_expected_running(self):
+        self.assert_in_state(["Started", "Stopped"], True, False)
+
+    def test_some_instances_running_expected_not_running(self):
+        self.assert_in_state(["Started", "Stopped"], False, False)
+
+    def test_pending_action(self):
+        self.get_primitives_for_state_check.return_value = [
+            etree.Element("resource", role="Started"),
+            etree.Element("resource", role="Started", pending="Starting"),
+        ]
+        self.assertFalse(
+            state.is_resource_in_expected_state(
+                self.cluster_state, self.resource_id, True
+            )
+        )
+
+
 class IsResourceManaged(TestCase):
     status_xml = etree.fromstring(
         """
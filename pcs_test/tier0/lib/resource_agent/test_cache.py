@@ -0,0 +1,190 @@
+import os
+import os.path
+from unittest import (
+    TestCase,
+    mock,
+)
+
+from pcs.lib import resource_agent as ra
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+def _fixture_metadata(name, shortdesc="short description"):
+    return ra.ResourceAgentMetadata(
+        name,
+        agent_exists=True,
+        ocf_version=ra.const.OCF_1_1,
+        shortdesc=shortdesc,
+        longdesc=None,
+        parameters=[
+            ra.ResourceAgentParameter(
+                "param",
+                shortdesc=None,
+                longdesc="long description",
+                type="select",
+                default="a",
+                enum_values=["a", "b"],
+                required=True,
+                advanced=False,
+                deprecated=False,
+                deprecated_by=["new_param"],
+                deprecated_desc=None,
+                unique_group=None,
+                reloadable=True,
+            )
+        ],
+        actions=[
+            ra.ResourceAgentAction(
+                "monitor",
+                timeout="20s",
+                interval="10s",
+                role=None,
+                start_delay=None,
+                depth="0",
+                automatic=False,
+                on_target=False,
+            )
+        ],
+    )
+
+
+def _touch(path, content="agent"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as a_file:
+        a_file.write(content)
+
+
+class ResourceAgentMetadataCache(TestCase):
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_dir = get_tmp_dir("tier0_lib_ra_cache")
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.ocf_dir = os.path.join(self.tmp_dir.name, "ocf")
+        self.fence_dir = os.path.join(self.tmp_dir.name, "fence")
+        self.crm_resource = os.path.join(self.tmp_dir.name, "crm_resource")
+        _touch(self.crm_resource)
+        settings_patcher = mock.patch.multiple(
+            "pcs.lib.resource_agent.cache.settings",
+            ocf_resource_agents_dir=self.ocf_dir,
+            fence_agent_binaries=self.fence_dir,
+            crm_resource_binary=self.crm_resource,
+            pcs_version="1.2.3",
+        )
+        settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.name = ra.ResourceAgentName("ocf", "heartbeat", "Dummy")
+        self.agent_path = os.path.join(self.ocf_dir, "heartbeat", "Dummy")
+        _touch(self.agent_path)
+        self.cache = ra.ResourceAgentMetadataCache(self.cache_dir, 2)
+
+    def _list_cache_dir(self):
+        return os.listdir(self.cache_dir)
+
+    def test_miss(self):
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_put_and_get(self):
+        metadata = _fixture_metadata(self.name)
+        self.cache.put(self.name, metadata)
+        self.assertEqual(self.cache.get(self.name), metadata)
+
+    def test_stonith(self):
+        name = ra.ResourceAgentName("stonith", None, "fence_xvm")
+        _touch(os.path.join(self.fence_dir, "fence_xvm"))
+        metadata = _fixture_metadata(name)
+        self.cache.put(name, metadata)
+        self.assertEqual(self.cache.get(name), metadata)
+
+    def test_agent_file_missing(self):
+        name = ra.ResourceAgentName("ocf", "heartbeat", "Missing")
+        self.cache.put(name, _fixture_metadata(name))
+        self.assertIsNone(self.cache.get(name))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_not_cached_standard(self):
+        name = ra.ResourceAgentName("systemd", None, "pcsd")
+        self.cache.put(name, _fixture_metadata(name))
+        self.assertIsNone(self.cache.get(name))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_path_in_name(self):
+        name = ra.ResourceAgentName("ocf", "heartbeat", "../heartbeat/Dummy")
+        self.cache.put(name, _fixture_metadata(name))
+        self.assertIsNone(self.cache.get(name))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_agent_updated(self):
+        self.cache.put(self.name, _fixture_metadata(self.name))
+        _touch(self.agent_path, "updated agent")
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_pacemaker_updated(self):
+        self.cache.put(self.name, _fixture_metadata(self.name))
+        _touch(self.crm_resource, "updated pacemaker")
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_pcs_updated(self):
+        self.cache.put(self.name, _fixture_metadata(self.name))
+        with mock.patch(
+            "pcs.lib.resource_agent.cache.settings.pcs_version", "1.2.4"
+        ):
+            self.assertIsNone(self.cache.get(self.name))
+
+    def test_broken_entry(self):
+        self.cache.put(self.name, _fixture_metadata(self.name))
+        (entry_name,) = self._list_cache_dir()
+        _touch(os.path.join(self.cache_dir, entry_name), "{not a json")
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_not_writable(self):
+        _touch(self.cache_dir, "not a directory")
+        self.cache.put(self.name, _fixture_metadata(self.name))
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_dump_failed(self):
+        with mock.patch(
+            "pcs.lib.resource_agent.cache.json.dump",
+            side_effect=OSError("No space left on device"),
+        ):
+            self.cache.put(self.name, _fixture_metadata(self.name))
+        self.assertEqual(self._list_cache_dir(), [])
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_replace_failed(self):
+        with mock.patch(
+            "pcs.lib.resource_agent.cache.os.replace",
+            side_effect=OSError("Permission denied"),
+        ):
+            self.cache.put(self.name, _fixture_metadata(self.name))
+        self.assertEqual(self._list_cache_dir(), [])
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_eviction(self):
+        name_list = [
+            ra.ResourceAgentName("ocf", "heartbeat", agent)
+            for agent in ("A", "B", "C")
+        ]
+        for i, name in enumerate(name_list):
+            _touch(os.path.join(self.ocf_dir, "heartbeat", name.type))
+            self.cache.put(name, _fixture_metadata(name))
+            entry_path = self.cache._get_entry_path(name)
+            os.utime(entry_path, ns=(i, i))
+            if i == 1:
+                # using an entry postpones its eviction
+                self.cache.get(name_list[0])
+
+        self.assertEqual(len(self._list_cache_dir()), 2)
+        self.assertIsNotNone(self.cache.get(name_list[0]))
+        self.assertIsNone(self.cache.get(name_list[1]))
+        self.assertIsNotNone(self.cache.get(name_list[2]))
+
+    def test_clear(self):
+        self.cache.put(self.name, _fixture_metadata(self.name))
+        self.assertEqual(self.cache.clear(), 1)
+        self.assertEqual(self._list_cache_dir(), [])
+        self.assertIsNone(self.cache.get(self.name))
+
+    def test_clear_no_cache_dir(self):
+        self.assertEqual(self.cache.clear(), 0)
@@ -147,6 +147,72 @@ class ResourceAgentFacadeFactory(TestCase):
             ["fenced-param"],
         )
 
+    def test_facade_stored_to_cache(self):
+        name = ra.ResourceAgentName("service", None, "daemon")
+        self.config.runner.pcmk.load_agent(
+            agent_name="service:daemon", stdout=self._fixture_agent_xml
+        )
+        cache = mock.Mock(spec_set=ra.ResourceAgentMetadataCache)
+        cache.get.return_value = None
+
+        env = self.env_assist.get_env()
+        facade = ra.ResourceAgentFacadeFactory(
+            env.cmd_runner(), env.report_processor, cache
+        ).facade_from_parsed_name(name)
+        self.assertEqual(facade.metadata.name, name)
+        cache.get.assert_called_once_with(name)
+        cache.put.assert_called_once()
+        self.assertEqual(cache.put.call_args[0][0], name)
+        self.assertEqual(
+            [param.name for param in cache.put.call_args[0][1].parameters],
+            ["agent-param"],
+        )
+
+    def test_facade_loaded_from_cache(self):
+        name = ra.ResourceAgentName("service", None, "daemon")
+        cache = mock.Mock(spec_set=ra.ResourceAgentMetadataCache)
+        cache.get.return_value = ra.ResourceAgentMetadata(
+            name,
+            agent_exists=True,
+            ocf_version=ra.const.OCF_1_0,
+            shortdesc="cached",
+            longdesc=None,
+            parameters=[],
+            actions=[],
+        )
+
+        env = self.env_assist.get_env()
+        facade = ra.ResourceAgentFacadeFactory(
+            env.cmd_runner(), env.report_processor, cache
+        ).facade_from_parsed_name(name)
+        self.assertEqual(facade.metadata.name, name)
+        self.assertEqual(facade.metadata.shortdesc, "cached")
+        cache.get.assert_called_once_with(name)
+        cache.put.assert_not_called()
+
+    def test_facades_sequential(self):
+        name1 = ra.ResourceAgentName("service", None, "daemon1")
+        name2 = ra.ResourceAgentName("service", None, "daemon2")
+        self.config.runner.pcmk.load_agent(
+            name="agent1",
+            agent_name="service:daemon1",
+            stdout=self._fixture_agent_xml,
+        )
+        self.config.runner.pcmk.load_agent(
+            name="agent2", agent_name="service:daemon2", agent_is_missing=True
+        )
+
+        env = self.env_assist.get_env()
+        result = list(
+            ra.ResourceAgentFacadeFactory(
+                env.cmd_runner(), env.report_processor
+            ).facades_from_parsed_names([name1, name2])
+        )
+        self.assertEqual([name for name, _ in result], [name1, name2])
+        self.assertEqual(result[0][1].metadata.name, name1)
+        self.assertIsInstance(result[1][1], ra.UnableToGetAgentMetadata)
+        self.assertEqual(result[1][1].agent_name, name2.full_name)
+
     def test_facade_missing_agent(self):
         name = ra.ResourceAgentName("service", None, "daemon")
         self.config.runner.pcmk.load_agent(
@@ -399,3 +465,34 @@ class ResourceAgentFacadeFactory(TestCase):
             [param.name for param in facade.metadata.parameters],
             ["agent-param"],
         )
+
+
+class ResourceAgentFacadeFactoryConcurrentLoad(TestCase):
+    def test_success(self):
+        name_list = [
+            ra.ResourceAgentName("service", None, f"daemon{i}")
+            for i in range(10)
+        ]
+        missing_agent = "service:daemon3"
+
+        def run(args, env_extend=None):
+            del env_extend
+            if args[-1] == missing_agent:
+                return "", "agent not found", 1
+            return ResourceAgentFacadeFactory._fixture_agent_xml, "", 0
+
+        runner = mock.Mock(spec_set=["run"])
+        runner.run.side_effect = run
+        result = list(
+            ra.ResourceAgentFacadeFactory(
+                runner, mock.Mock()
+            ).facades_from_parsed_names(name_list, max_workers=4)
+        )
+
+        self.assertEqual(runner.run.call_count, len(name_list))
+        self.assertEqual([name for name, _ in result], name_list)
+        for name, facade in result:
+            if name.full_name == missing_agent:
+                self.assertIsInstance(facade, ra.UnableToGetAgentMetadata)
+            else:
+                self.assertEqual(facade.metadata.name, name)
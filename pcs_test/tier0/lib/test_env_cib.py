@@ -8,7 +8,10 @@ from lxml import etree
 
 from pcs.common.reports import codes as report_codes
 from pcs.common.tools import Version
+from pcs.lib.cib import tools as cib_tools
 from pcs.lib.env import LibraryEnvironment
+from pcs.lib.errors import LibraryError
+from pcs.lib.xml_tools import etree_to_str as lib_etree_to_str
 
 from pcs_test.tools import fixture
 from pcs_test.tools.assertions import assert_xml_equal
@@ -192,6 +195,12 @@ class GetCib(TestCase, ManageCibAssertionMixin):
                 cib_file.read(),
             )
 
+    def test_without_status(self):
+        self.config.runner.cib.load(filename="cib-tags.xml", load_status=False)
+        cib = self.env_assist.get_env().get_cib(load_status=False)
+        self.assertEqual(len(cib.find("status")), 0)
+        self.assertIsNotNone(cib.find("configuration/resources/primitive"))
+
     def test_get_and_property(self):
         self.config.runner.cib.load()
         env = self.env_assist.get_env()
@@ -209,6 +218,136 @@ class GetCib(TestCase, ManageCibAssertionMixin):
         self.assert_raises_cib_already_loaded(env.get_cib)
 
 
+def _add_comment(cib):
+    cib.append(etree.Comment("comment"))
+    return cib
+
+
+def _add_primitive(cib):
+    etree.SubElement(
+        cib.find("configuration/resources"),
+        "primitive",
+        {"id": "R", "class": "ocf", "provider": "pacemaker", "type": "Dummy"},
+    )
+
+
+class PushLoadedCibNativeDiff(TestCase, ManageCibAssertionMixin):
+    wait_timeout = 10
+    cib_diff = """
+        <diff format="2">
+            <change operation="create" path="/cib/configuration/resources"
+                position="0"
+            >
+                <primitive id="R" class="ocf" provider="pacemaker"
+                    type="Dummy"
+                />
+            </change>
+        </diff>
+    """
+
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(test_case=self)
+
+    def test_no_change(self):
+        self.config.runner.cib.load()
+        env = self.env_assist.get_env()
+
+        env.get_cib()
+        env.push_cib()
+
+    def test_get_and_push(self):
+        self.config.runner.cib.load()
+        self.config.runner.cib.push_diff(cib_diff=self.cib_diff)
+        env = self.env_assist.get_env()
+
+        _add_primitive(env.get_cib())
+        env.push_cib()
+
+    def test_can_get_after_push(self):
+        self.config.runner.cib.load()
+        self.config.runner.cib.push_diff(cib_diff=self.cib_diff)
+        self.config.runner.cib.load(name="load_cib_2")
+        env = self.env_assist.get_env()
+
+        _add_primitive(env.get_cib())
+        env.push_cib()
+        # need to use lambda because env.cib is a property
+        self.assert_raises_cib_not_loaded(lambda: env.cib)
+        env.get_cib()
+
+    def test_push_diff_fails(self):
+        self.config.runner.cib.load()
+        self.config.runner.cib.push_diff(
+            cib_diff=self.cib_diff, stderr="invalid cib", returncode=1
+        )
+        env = self.env_assist.get_env()
+
+        _add_primitive(env.get_cib())
+        self.env_assist.assert_raise_library_error(
+            env.push_cib,
+            [
+                fixture.error(
+                    report_codes.CIB_PUSH_ERROR,
+                    reason="invalid cib",
+                    pushed_cib="",
+                )
+            ],
+            expected_in_processor=False,
+        )
+
+    @mock.patch(
+        "pcs.lib.cib.tools._find_configuration_elements_by_id",
+        wraps=cib_tools._find_configuration_elements_by_id,
+    )
+    def test_id_index_released_on_push(self, mock_find):
+        self.config.runner.cib.load()
+        self.config.runner.cib.push_diff(cib_diff=self.cib_diff)
+        env = self.env_assist.get_env()
+
+        cib = env.get_cib()
+        _add_primitive(cib)
+        cib_tools.add_to_id_index(cib.find("configuration/resources/primitive"))
+        self.assertTrue(cib_tools.does_id_exist(cib, "R"))
+        mock_find.assert_not_called()
+        env.push_cib()
+        self.assertTrue(cib_tools.does_id_exist(cib, "R"))
+        mock_find.assert_called_once_with(cib, "R")
+
+    @mock.patch(
+        "pcs.lib.cib.tools._find_configuration_elements_by_id",
+        wraps=cib_tools._find_configuration_elements_by_id,
+    )
+    def test_id_index_released_when_push_fails(self, mock_find):
+        self.config.runner.cib.load()
+        self.config.runner.cib.push_diff(
+            cib_diff=self.cib_diff, stderr="invalid cib", returncode=1
+        )
+        env = self.env_assist.get_env()
+
+        cib = env.get_cib()
+        _add_primitive(cib)
+        self.assertRaises(LibraryError, env.push_cib)
+        self.assertTrue(cib_tools.does_id_exist(cib, "R"))
+        mock_find.assert_called_once_with(cib, "R")
+
+    def test_wait(self):
+        self.config.runner.cib.load()
+        self.config.runner.cib.push_diff(cib_diff=self.cib_diff)
+        self.config.runner.pcmk.wait(timeout=self.wait_timeout)
+        env = self.env_assist.get_env()
+
+        _add_primitive(env.get_cib())
+        env.push_cib(wait_timeout=self.wait_timeout)
+        self.env_assist.assert_reports(
+            [
+                fixture.info(
+                    report_codes.WAIT_FOR_IDLE_STARTED,
+                    timeout=self.wait_timeout,
+                )
+            ]
+        )
+
+
 class PushLoadedCib(TestCase, ManageCibAssertionMixin):
     # pylint: disable=too-many-public-methods
     wait_timeout = 10
@@ -230,7 +369,11 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
         self.env_assist, self.config = get_env_tools(test_case=self)
 
     def config_load_cib_files(self):
-        self.config.runner.cib.load(name=self.load_cib_name)
+        # Comments are not supported by the native CIB diff, so crm_diff is
+        # used instead.
+        self.config.runner.cib.load(
+            name=self.load_cib_name, modifiers=[_add_comment]
+        )
         loaded_cib = self.config.calls.get(self.load_cib_name).stdout
         self.tmp_file_mock_obj.set_calls(
             [
@@ -283,12 +426,35 @@ class PushLoadedCib(TestCase, ManageCibAssertionMixin):
         env.get_cib()
         self.env_assist.assert_reports(self.push_reports())
 
+    @mock.patch("pcs.lib.pacemaker.patchset.apply_patchset")
+    def test_native_diff_not_verified(self, mock_apply):
+        # The patchset is not applied, so the patched CIB does not match the
+        # modified one and crm_diff is used instead of the native diff.
+        self.config.runner.cib.load(name=self.load_cib_name)
+        self.config.runner.cib.diff(self.tmpfile_old, self.tmpfile_new)
+        self.config.runner.cib.push_diff()
+        loaded_cib = self.config.calls.get(self.load_cib_name).stdout
+        env = self.env_assist.get_env()
+
+        cib = env.get_cib()
+        _add_primitive(cib)
+        cib_new = lib_etree_to_str(cib)
+        self.tmp_file_mock_obj.set_calls(
+            [
+                TmpFileCall(self.tmpfile_old, orig_content=loaded_cib),
+                TmpFileCall(self.tmpfile_new, orig_content=cib_new),
+            ]
+        )
+        env.push_cib()
+        mock_apply.assert_called_once()
+        self.env_assist.assert_reports(self.push_reports(cib_new=cib_new))
+
     def test_not_loaded(self):
         env = self.env_assist.get_env()
         self.assert_raises_cib_not_loaded(env.push_cib)
 
     def test_tmpfile_fails(self):
-        self.config.runner.cib.load()
+        self.config.runner.cib.load(modifiers=[_add_comment])
         self.tmp_file_mock_obj.set_calls(
             [
                 TmpFileCall(
@@ -289,6 +289,60 @@ class CommandRunnerTest(TestCase):
             ],
         )
 
+    def _run_with_stdin(self, mock_popen, stdin, stdout):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = (stdout, "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        self.assertEqual(
+            runner.run(["a_command"], stdin_string=stdin), (stdout, "", 0)
+        )
+
+    def test_debug_log_disabled(self, mock_popen):
+        self.mock_logger.isEnabledFor.return_value = False
+        self._run_with_stdin(mock_popen, "stdin", "stdout")
+        self.mock_logger.isEnabledFor.assert_called_with(logging.DEBUG)
+        self.mock_logger.debug.assert_not_called()
+        self.assertEqual(len(self.mock_reporter.report_item_list), 2)
+
+    @mock.patch.object(settings, "external_process_log_payload_max_length", 5)
+    def test_debug_log_truncated(self, mock_popen):
+        self._run_with_stdin(mock_popen, "1234567", "abcdefgh")
+        self.mock_logger.debug.assert_has_calls(
+            [
+                mock.call(
+                    outdent(
+                        """\
+                        Running: a_command
+                        Environment:
+                        --Debug Input Start--
+                        12345
+                        --Truncated 2 of 7 characters--
+                        --Debug Input End--"""
+                    )
+                ),
+                mock.call(
+                    outdent(
+                        """\
+                        Finished running: a_command
+                        Return value: 0
+                        --Debug Stdout Start--
+                        abcde
+                        --Truncated 3 of 8 characters--
+                        --Debug Stdout End--
+                        --Debug Stderr Start--
+
+                        --Debug Stderr End--"""
+                    )
+                ),
+            ]
+        )
+        # reports are not truncated
+        self.assertEqual(
+            self.mock_reporter.report_item_list[1].message.stdout, "abcdefgh"
+        )
+
     def test_popen_error(self, mock_popen):
         expected_error = "expected error"
         command = ["a_command"]
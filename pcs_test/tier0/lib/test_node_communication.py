@@ -394,6 +394,19 @@ class IsProxySetTest(TestCase):
         )
 
 
+TIMINGS_INFO = {
+    pycurl.NAMELOOKUP_TIME: 0.001,
+    pycurl.CONNECT_TIME: 0.002,
+    pycurl.APPCONNECT_TIME: 0.012,
+    pycurl.STARTTRANSFER_TIME: 0.2,
+    pycurl.TOTAL_TIME: 0.21,
+}
+TIMINGS_DEBUG = (
+    "* Timings: name lookup: 0.001s, connect: 0.002s, TLS handshake: 0.012s, "
+    "first byte: 0.200s, total: 0.210s\n"
+)
+
+
 def fixture_logger_call_send(url, data):
     send_msg = "Sending HTTP Request to: {url}"
     if data:
@@ -543,7 +556,7 @@ class CommunicatorLoggerTest(TestCase):
         expected_debug_data = "* text\n>> data out\n"
         response = Response.connection_successful(
             MockCurlSimple(
-                info={pycurl.RESPONSE_CODE: expected_code},
+                info={pycurl.RESPONSE_CODE: expected_code, **TIMINGS_INFO},
                 output=expected_data.encode("utf-8"),
                 debug_output=expected_debug_data.encode("utf-8"),
                 request=fixture_request(),
@@ -555,17 +568,41 @@ class CommunicatorLoggerTest(TestCase):
                 response.request.url,
                 expected_code,
                 expected_data,
-                expected_debug_data,
+                expected_debug_data + TIMINGS_DEBUG,
             )
         )
         logger_calls = fixture_logger_calls_on_success(
             response.request.url,
             expected_code,
             expected_data,
-            expected_debug_data,
+            expected_debug_data + TIMINGS_DEBUG,
         )
         self.assertEqual(logger_calls, self.logger.mock_calls)
 
+    def test_log_response_debug_disabled(self):
+        self.logger.isEnabledFor.return_value = False
+        self.reporter.debug = False
+        response = Response.connection_successful(
+            MockCurlSimple(
+                info={pycurl.RESPONSE_CODE: 200},
+                output=b"data",
+                request=fixture_request(),
+            )
+        )
+        self.assertFalse(self.com_logger.is_debug_enabled())
+        self.com_logger.log_response(response)
+        self.reporter.assert_reports([])
+        self.assertEqual(
+            [
+                mock.call.isEnabledFor(logging.DEBUG),
+                fixture_logger_call_connected(
+                    response.request.url, 200, "data"
+                ),
+                mock.call.isEnabledFor(logging.DEBUG),
+            ],
+            self.logger.mock_calls,
+        )
+
     @mock.patch("pcs.lib.node_communication.is_proxy_set")
     def test_log_response_not_connected(self, mock_proxy):
         mock_proxy.return_value = False
@@ -573,6 +610,7 @@ class CommunicatorLoggerTest(TestCase):
         error_msg = "error"
         response = Response.connection_failure(
             MockCurlSimple(
+                info=TIMINGS_INFO,
                 debug_output=expected_debug_data.encode("utf-8"),
                 request=fixture_request(),
             ),
@@ -585,7 +623,7 @@ class CommunicatorLoggerTest(TestCase):
                 response.request.host_label, error_msg
             )
             + fixture_report_item_list_debug(
-                response.request.url, expected_debug_data
+                response.request.url, expected_debug_data + TIMINGS_DEBUG
             )
         )
         logger_calls = [
@@ -593,7 +631,7 @@ class CommunicatorLoggerTest(TestCase):
                 response.request.host_label, error_msg
             ),
             fixture_logger_call_debug_data(
-                response.request.url, expected_debug_data
+                response.request.url, expected_debug_data + TIMINGS_DEBUG
             ),
         ]
         self.assertEqual(logger_calls, self.logger.mock_calls)
@@ -605,6 +643,7 @@ class CommunicatorLoggerTest(TestCase):
         error_msg = "error"
         response = Response.connection_failure(
             MockCurlSimple(
+                info=TIMINGS_INFO,
                 debug_output=expected_debug_data.encode("utf-8"),
                 request=fixture_request(),
             ),
@@ -620,7 +659,7 @@ class CommunicatorLoggerTest(TestCase):
                 response.request.host_label, response.request.host_label
             )
             + fixture_report_item_list_debug(
-                response.request.url, expected_debug_data
+                response.request.url, expected_debug_data + TIMINGS_DEBUG
             )
         )
         logger_calls = [
@@ -629,7 +668,7 @@ class CommunicatorLoggerTest(TestCase):
             ),
             fixture_logger_call_proxy_set(),
             fixture_logger_call_debug_data(
-                response.request.url, expected_debug_data
+                response.request.url, expected_debug_data + TIMINGS_DEBUG
             ),
         ]
         self.assertEqual(logger_calls, self.logger.mock_calls)
@@ -0,0 +1,67 @@
+import os
+import re
+import subprocess
+import sys
+from unittest import TestCase
+
+import pcs
+
+# Modules which are supposed to be imported only when a command needing them
+# is run. Importing them on start noticeably slows down every run of pcs.
+ON_DEMAND_MODULES = (
+    "pcs.acl",
+    "pcs.cli.routing.",
+    "pcs.cluster",
+    "pcs.constraint",
+    "pcs.lib.commands.",
+    "pcs.lib.env",
+    "pcs.resource",
+    "pcs.stonith",
+)
+
+
+def _get_imported_modules(module_name):
+    """
+    Return names of modules imported when importing the specified module
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(pcs_path) for pcs_path in pcs.__path__]
+        + [env.get("PYTHONPATH", "")]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        check=True,
+        text=True,
+    )
+    return [
+        match.group(1)
+        for match in re.finditer(
+            r"^import time:\s+\d+ \|\s+\d+ \| +(\S+)$",
+            result.stderr,
+            re.MULTILINE,
+        )
+    ]
+
+
+class CliStartImports(TestCase):
+    maxDiff = None
+
+    def test_commands_imported_on_demand(self):
+        imported_modules = _get_imported_modules("pcs.app")
+        self.assertIn("pcs.app", imported_modules)
+        self.assertEqual(
+            [],
+            [
+                module
+                for module in imported_modules
+                if module.startswith(ON_DEMAND_MODULES)
+            ],
+            (
+                "These modules are imported on pcs start, which slows it "
+                "down. Import them only when they are needed."
+            ),
+        )
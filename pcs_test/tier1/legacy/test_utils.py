@@ -1718,3 +1718,118 @@ class TouchCibFile(TestCase):
         err.assert_called_once_with(
             "Unable to write to file: '/fake/filename': 'some message'"
         )
+
+
+CIB_SNAPSHOT_XML = """
+<cib>
+  <configuration>
+    <resources>
+      <primitive id="R1" class="ocf" provider="pacemaker" type="Dummy"/>
+      <group id="G1">
+        <primitive id="R2" class="ocf" provider="pacemaker" type="Dummy"/>
+      </group>
+    </resources>
+  </configuration>
+</cib>
+"""
+
+
+class CibSnapshot(TestCase):
+    def setUp(self):
+        utils.invalidate_cib_snapshot()
+        self.addCleanup(utils.invalidate_cib_snapshot)
+        original_run = utils.run
+
+        def _run(args, *other_args, **kwargs):
+            if args[:3] == ["cibadmin", "-l", "-Q"]:
+                return CIB_SNAPSHOT_XML, 0
+            return original_run(args, *other_args, **kwargs)
+
+        patcher = mock.patch("pcs.utils.run", side_effect=_run)
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_cib_queried(self, times):
+        self.assertEqual(
+            [mock.call(["cibadmin", "-l", "-Q"])] * times,
+            [
+                call
+                for call in self.mock_run.mock_calls
+                if call == mock.call(["cibadmin", "-l", "-Q"])
+            ],
+        )
+
+    def test_cib_queried_once(self):
+        self.assertEqual(CIB_SNAPSHOT_XML, utils.get_cib())
+        self.assertEqual(
+            "configuration",
+            utils.get_cib_dom().documentElement.firstChild.nextSibling.tagName,
+        )
+        self.assertTrue(utils.does_exist("//primitive[@id='R1']"))
+        self.assertEqual("cib", utils.get_cib_etree().tag)
+        self.assert_cib_queried(1)
+
+    def test_invalidated_by_command(self):
+        utils.get_cib()
+        self.mock_run(["true"])
+        utils.get_cib()
+        self.assert_cib_queried(2)
+
+    def test_not_invalidated_by_query(self):
+        utils.get_cib()
+        # pylint: disable=protected-access
+        self.assertTrue(utils._is_cib_query(["cibadmin", "-Q", "--xpath", "/"]))
+        self.assertTrue(utils._is_cib_query(["/usr/sbin/crm_mon", "--as-xml"]))
+        self.assertFalse(
+            utils._is_cib_query(["cibadmin", "-D", "--xpath", "/"])
+        )
+        self.assertFalse(utils._is_cib_query(["crm_resource", "--cleanup"]))
+
+    def test_invalidated_by_cib_file_change(self):
+        utils.get_cib()
+        with mock.patch("pcs.utils.usefile", True), mock.patch(
+            "pcs.utils.filename", "/tmp/cib.xml"
+        ):
+            utils.get_cib()
+        self.assert_cib_queried(2)
+
+    def test_invalidated_by_library_command(self):
+        utils.get_cib()
+        utils.get_middleware_factory().cib(
+            lambda env: None, mock.Mock(spec_set=["cib_data"])
+        )
+        utils.get_cib()
+        self.assert_cib_queried(2)
+
+    def test_xpath_single_element(self):
+        self.assertEqual(
+            '<primitive id="R1" class="ocf" provider="pacemaker" '
+            'type="Dummy"/>',
+            utils.get_cib_xpath("//primitive[@id='R1']"),
+        )
+
+    def test_xpath_attribute(self):
+        self.assertEqual(
+            '<primitive id="R1" class="ocf" provider="pacemaker" '
+            'type="Dummy"/>',
+            utils.get_cib_xpath("//primitive[@id='R1']/@id"),
+        )
+
+    def test_xpath_more_elements(self):
+        self.assertEqual(
+            "<xpath-query>"
+            '<primitive id="R1" class="ocf" provider="pacemaker" '
+            'type="Dummy"/>'
+            '<primitive id="R2" class="ocf" provider="pacemaker" '
+            'type="Dummy"/>'
+            "</xpath-query>",
+            utils.get_cib_xpath("//primitive"),
+        )
+
+    def test_xpath_no_match(self):
+        self.assertEqual("", utils.get_cib_xpath("//primitive[@id='R3']"))
+        self.assertFalse(utils.does_exist("//primitive[@id='R3']"))
+
+    def test_xpath_invalid(self):
+        self.assertEqual("", utils.get_cib_xpath("//primitive["))
+        self.assertEqual("", utils.get_cib_xpath("count(//primitive)"))
@@ -86,6 +86,12 @@ def patch_env(call_queue, config, init_env, is_systemd=True):
         patch_lib_env(
             "_get_service_manager", lambda _: ServiceManagerMock(call_queue)
         ),
+        # Agents metadata cache is stored on the host running tests. Do not
+        # let it affect loading agents metadata in tests.
+        patch_lib_env("get_resource_agent_metadata_cache", lambda _: None),
+        # Mocked runner expects commands to be run in a defined order.
+        mock.patch("pcs.settings.resource_agent_metadata_load_workers", 1),
+        mock.patch("pcs.settings.cluster_status_probe_workers", 1),
     ]
     if is_systemd:
         # In most test cases we don't care about underlying init system. But
@@ -4,6 +4,7 @@ from pcs.common.host import (
     PcsKnownHost,
 )
 
+from pcs_test.tools.command_env.config_runner_cib import get_loaded_cib
 from pcs_test.tools.command_env.mock_push_cib import Call as PushCibCall
 from pcs_test.tools.command_env.mock_push_corosync_conf import (
     Call as PushCorosyncConfCall,
@@ -110,7 +111,9 @@ class EnvConfig:
             here)
         """
         cib_xml = modify_cib(
-            self.__calls.get(load_key).stdout, modifiers, **modifier_shortcuts
+            get_loaded_cib(self.__calls, load_key),
+            modifiers,
+            **modifier_shortcuts,
         )
         self.__calls.place(
             name,
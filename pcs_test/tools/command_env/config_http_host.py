@@ -232,6 +232,8 @@ class HostShortcuts:
         pacemaker_started_node_list=(),
         pacemaker_not_started_node_list=(),
         communication_list=None,
+        wait=None,
+        waited=False,
         name="http.host.check_pacemaker_started",
     ):
         """
@@ -242,6 +244,8 @@ class HostShortcuts:
         pacemaker_not_started_node_list list -- listof node names on which
             pacemaker is not fully started yet
         communication_list list -- create custom responses
+        int wait -- how long the nodes are asked to wait for pacemaker to start
+        bool waited -- nodes not started report they have waited
         name string -- the key of this call
         """
         if bool(
@@ -271,6 +275,7 @@ class HostShortcuts:
                         dict(
                             pending=True,
                             online=False,
+                            **(dict(waited=True) if waited else {}),
                         )
                     ),
                 )
@@ -282,6 +287,7 @@ class HostShortcuts:
             name,
             communication_list,
             action="remote/pacemaker_node_status",
+            param_list=[("wait", str(wait))] if wait is not None else None,
         )
 
     def get_quorum_status(
@@ -1,9 +1,30 @@
+from lxml import etree
+
 from pcs_test.tools.command_env.mock_runner import Call as RunnerCall
 from pcs_test.tools.command_env.mock_runner import CheckStdinEqualXml
 from pcs_test.tools.fixture_cib import modify_cib
 from pcs_test.tools.misc import get_test_resource as rc
+from pcs_test.tools.xml import etree_to_str
 
 CIB_FILENAME = "cib-empty.xml"
+CONFIGURATION_KEY_SUFFIX = "_configuration"
+
+
+def get_loaded_cib(calls, load_key):
+    """
+    Return CIB loaded by a call created by CibShortcuts.load
+
+    CallCollection calls -- provides access to call list
+    string load_key -- key of the load call
+    """
+    configuration_key = f"{load_key}{CONFIGURATION_KEY_SUFFIX}"
+    if configuration_key not in calls.names:
+        return calls.get(load_key).stdout
+    # CIB loaded without the status section
+    cib = etree.fromstring(calls.get(load_key).stdout)
+    cib.append(etree.fromstring(calls.get(configuration_key).stdout))
+    etree.SubElement(cib, "status")
+    return etree_to_str(cib)
 
 
 class CibShortcuts:
@@ -24,6 +45,7 @@ class CibShortcuts:
         stderr=None,
         instead=None,
         env=None,
+        load_status=True,
         **modifier_shortcuts,
     ):
         """
@@ -39,6 +61,9 @@ class CibShortcuts:
         string instead -- key of call instead of which this new call is to be
             placed
         dict env -- CommandRunner environment variables
+        bool load_status -- if False, create calls for loading the CIB root
+            element and the configuration section separately, the name of the
+            latter call is the name suffixed by CONFIGURATION_KEY_SUFFIX
         dict modifier_shortcuts -- a new modifier is generated from each
             modifier shortcut.
             As key there can be keys of MODIFIER_GENERATORS.
@@ -56,7 +81,29 @@ class CibShortcuts:
                 " parameters 'modifiers', 'filename' and 'modifier_shortcuts'"
             )
 
+        if (
+            instead is not None
+            and f"{instead}{CONFIGURATION_KEY_SUFFIX}" in self.__calls.names
+        ):
+            # replacing a load without status
+            self.__calls.remove(f"{instead}{CONFIGURATION_KEY_SUFFIX}")
+
         command = ["cibadmin", "--local", "--query"]
+        if returncode == 0 and not load_status:
+            self.__load_without_status(
+                command,
+                modifiers,
+                name,
+                filename,
+                before,
+                instead,
+                env,
+                **modifier_shortcuts,
+            )
+            return
+
+        if not load_status:
+            command.append("--no-children")
         if returncode != 0:
             call = RunnerCall(
                 command, stderr=stderr, returncode=returncode, env=env
@@ -72,6 +119,50 @@ class CibShortcuts:
 
         self.__calls.place(name, call, before=before, instead=instead)
 
+    def __load_without_status(
+        self,
+        command,
+        modifiers,
+        name,
+        filename,
+        before,
+        instead,
+        env,
+        **modifier_shortcuts,
+    ):
+        # pylint: disable=too-many-arguments
+        with open(rc(filename if filename else self.cib_filename)) as cib_file:
+            cib = etree.fromstring(
+                modify_cib(cib_file.read(), modifiers, **modifier_shortcuts)
+            )
+        configuration = cib.find("configuration")
+        cib[:] = []
+        cib.text = None
+        self.__calls.place(
+            name,
+            RunnerCall(
+                command + ["--no-children"],
+                stdout=etree_to_str(cib),
+                env=env,
+            ),
+            before=before,
+            instead=instead,
+        )
+        # place the configuration call right after the root call
+        name_list = self.__calls.names
+        next_index = name_list.index(name) + 1
+        self.__calls.place(
+            f"{name}{CONFIGURATION_KEY_SUFFIX}",
+            RunnerCall(
+                command + ["--scope=configuration"],
+                stdout=etree_to_str(configuration),
+                env=env,
+            ),
+            before=(
+                name_list[next_index] if next_index < len(name_list) else None
+            ),
+        )
+
     def load_content(
         self,
         cib,
@@ -132,7 +223,9 @@ class CibShortcuts:
             here)
         """
         cib = modify_cib(
-            self.__calls.get(load_key).stdout, modifiers, **modifier_shortcuts
+            get_loaded_cib(self.__calls, load_key),
+            modifiers,
+            **modifier_shortcuts,
         )
         self.__calls.place(
             name,
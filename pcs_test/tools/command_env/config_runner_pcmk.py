@@ -1020,6 +1020,68 @@ class PcmkShortcuts:
             ),
         )
 
+    def can_check_rules_in_effect_status(
+        self,
+        name="runner.pcmk.can_check_rules_in_effect_status",
+        stderr=(
+            "--output-as\n"
+            "The ID of the rule to check (may be specified multiple times)"
+        ),
+    ):
+        """
+        Create a call to check if crm_rule can evaluate more rules at once
+
+        string name -- key of the call
+        string stderr -- crm_rule help text
+        """
+        self.__calls.place(
+            name, RunnerCall(["crm_rule", "--help-all"], stderr=stderr)
+        )
+
+    def get_rules_in_effect_status(
+        self,
+        rules_returncodes,
+        name="runner.pcmk.get_rules_in_effect_status",
+        cib_load_name="runner.cib.load",
+        stdout=None,
+    ):
+        """
+        Create a call for running a tool to get expired status of rules
+
+        list rules_returncodes -- tuples (rule id, result of the check)
+        sting name -- key of the call
+        string cib_load_name -- key of a call from whose stdout the cib is taken
+        string stdout -- tool's xml output, generated from rules_returncodes
+            if not specified
+        """
+        cib_xml = self.__calls.get(cib_load_name).stdout
+        cmd = ["crm_rule", "--check", "--output-as", "xml"]
+        for rule_id, _ in rules_returncodes:
+            cmd.extend(["--rule", rule_id])
+        cmd.extend(["--xml-text", "-"])
+        if stdout is None:
+            stdout = """
+                <pacemaker-result api-version="2.9" request="crm_rule">
+                    {rule_check_list}
+                    <status code="0" message="OK" />
+                </pacemaker-result>
+            """.format(
+                rule_check_list="\n".join(
+                    f'<rule-check rule-id="{rule_id}" rc="{returncode}" />'
+                    for rule_id, returncode in rules_returncodes
+                )
+            )
+        self.__calls.place(
+            name,
+            RunnerCall(
+                cmd,
+                check_stdin=CheckStdinEqualXml(cib_xml),
+                stdout=stdout,
+                stderr="",
+                returncode=rules_returncodes[-1][1] if rules_returncodes else 0,
+            ),
+        )
+
     def resource_agent_self_validation(
         self,
         attributes,
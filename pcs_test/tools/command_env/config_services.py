@@ -1,4 +1,5 @@
 from pcs.common.services import errors
+from pcs.common.services.types import ServiceStatus
 
 from pcs_test.tools.command_env.mock_service_manager import Call
 
@@ -180,6 +181,34 @@ class ServiceManagerConfig:
             instead=instead,
         )
 
+    def get_services_status(
+        self,
+        services_status,
+        name="services.get_services_status",
+        before=None,
+        instead=None,
+    ):
+        """
+        Create a call for getting status of several services
+
+        dict services_status -- key: service name, value: tuple (is enabled,
+            is running), services are expected to be queried in the order of
+            the keys
+        """
+        self.__calls.place(
+            name,
+            Call(
+                "get_services_status",
+                service=list(services_status),
+                return_value={
+                    service: ServiceStatus(enabled=enabled, running=running)
+                    for service, (enabled, running) in services_status.items()
+                },
+            ),
+            before=before,
+            instead=instead,
+        )
+
     def get_available_services(
         self,
         services,
@@ -1,4 +1,5 @@
 import json
+from collections import deque
 from urllib.parse import parse_qs
 
 from pcs import settings
@@ -345,24 +346,66 @@ def _compare_request_data(expected, real):
 
 
 class NodeCommunicator:
+    """
+    Mock of NodeCommunicator checking requests and providing responses
+    according to the expected calls
+
+    When requests are added while the loop is running, they may be added in
+    several smaller lists than the expected one, as a communication pipeline
+    does. Once all the expected requests are added, responses of the
+    StartLoopCall following the AddRequestCall (if any) are appended to the
+    responses of the running loop.
+    """
+
     def __init__(self, call_queue=None):
         self.__call_queue = call_queue
+        self.__response_queue = None
+        self.__partial_call = None
+        self.__partial_index = 0
 
     def add_requests(self, request_list):
-        _, add_request_call = self.__call_queue.take(
-            CALL_TYPE_HTTP_ADD_REQUESTS,
-            request_list,
-        )
-
-        expected_request_list = add_request_call.request_list
+        if self.__partial_call is None:
+            _, add_request_call = self.__call_queue.take(
+                CALL_TYPE_HTTP_ADD_REQUESTS,
+                request_list,
+            )
+            expected_request_list = add_request_call.request_list
+            if self.__response_queue is not None and 0 < len(
+                request_list
+            ) < len(expected_request_list):
+                self.__partial_call = add_request_call
+                self.__partial_index = 0
+
+        if self.__partial_call is not None:
+            expected_request_list = self.__partial_call.request_list[
+                self.__partial_index : self.__partial_index + len(request_list)
+            ]
 
         if len(expected_request_list) != len(request_list):
             raise different_request_lists(expected_request_list, request_list)
 
+        self.__check_requests(expected_request_list, request_list)
+
+        if self.__partial_call is not None:
+            self.__partial_index += len(request_list)
+            if self.__partial_index < len(self.__partial_call.request_list):
+                return
+            self.__partial_call = None
+
+        remaining_calls = self.__call_queue.remaining
+        if (
+            self.__response_queue is not None
+            and remaining_calls
+            and remaining_calls[0].type == CALL_TYPE_HTTP_START_LOOP
+        ):
+            _, call = self.__call_queue.take(CALL_TYPE_HTTP_START_LOOP)
+            self.__response_queue.extend(call.response_list)
+
+    def __check_requests(self, expected_request_list, request_list):
         errors = {}
         for i, real_request in enumerate(request_list):
             # We don't care about tokens, see _communication_to_response.
-            expected_request = add_request_call.request_list[i]
+            expected_request = expected_request_list[i]
 
             diff = {}
             if expected_request.action != real_request.action:
@@ -402,4 +445,17 @@ class NodeCommunicator:
 
     def start_loop(self):
         _, call = self.__call_queue.take(CALL_TYPE_HTTP_START_LOOP)
-        return call.response_list
+        self.__response_queue = deque(call.response_list)
+        return self.__loop()
+
+    def __loop(self):
+        while self.__response_queue:
+            yield self.__response_queue.popleft()
+        self.__response_queue = None
+        if self.__partial_call is not None:
+            raise self.__call_queue.error_with_context(
+                different_request_lists(
+                    self.__partial_call.request_list,
+                    self.__partial_call.request_list[: self.__partial_index],
+                )
+            )
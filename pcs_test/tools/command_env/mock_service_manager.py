@@ -69,6 +69,9 @@ class ServiceManagerMock(ServiceManagerInterface):
     def is_running(self, service, instance=None):
         return self._assert_call("is_running", service, instance)
 
+    def get_services_status(self, service_list):
+        return self._assert_call("get_services_status", list(service_list))
+
     def is_installed(self, service):
         return self._assert_call("is_installed", service)
 
@@ -158,6 +158,9 @@ class MockLibraryReportProcessor(ReportProcessor):
         if self.debug or report_item.severity != ReportItemSeverity.DEBUG:
             self.items.append(report_item)
 
+    def is_debug_enabled(self):
+        return self.debug
+
     @property
     def report_item_list(self):
         return self.items
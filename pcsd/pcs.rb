@@ -13,6 +13,7 @@ require 'backports/latest'
 require 'base64'
 require 'ethon'
 require 'openssl'
+require 'socket'
 
 require 'config.rb'
 require 'cfgsync.rb'
@@ -853,6 +854,17 @@ def run_cmd_options(auth_user, options, *args)
   cib_groups = (auth_user[:usergroups] || []).join(' ')
   $logger.info("CIB USER: #{cib_user}, groups: #{cib_groups}")
 
+  executor_result = run_cmd_in_executor(cib_user, cib_groups, options, args)
+  if executor_result
+    output, error_output, retval = executor_result
+    duration = Time.now - start
+    $logger.debug(output.join(" "))
+    $logger.debug(error_output.join(" "))
+    $logger.debug("Duration: " + duration.to_s + "s")
+    $logger.info("Return Value: " + retval.to_s)
+    return output, error_output, retval
+  end
+
   ChildProcess.posix_spawn = true
   cmd = ChildProcess.build(*args)
   cmd.io.stdout = out
@@ -889,6 +901,59 @@ def run_cmd_options(auth_user, options, *args)
   return output, error_output, retval
 end
 
+# Run pcs in the command executor of the python daemon, which has pcs already
+# loaded. Return nil if the executor is not available or the command cannot be
+# run by it, the command is supposed to be run in a new process then.
+def run_cmd_in_executor(cib_user, cib_groups, options, args)
+  if args[0] == PCS
+    cmd = 'pcs'
+  elsif args[0] == PCS_INTERNAL
+    cmd = 'pcs_internal'
+  else
+    return nil
+  end
+  stdin = nil
+  if options and options.key?('stdin')
+    # mimic IO.puts used when running the command in a new process
+    stdin = options['stdin'].to_s
+    stdin += "\n" unless stdin.end_with?("\n")
+  end
+  request = {
+    :cmd => cmd,
+    :args => args[1..-1],
+    :stdin => stdin,
+    :environment => {
+      'CIB_user' => cib_user,
+      'CIB_user_groups' => cib_groups,
+    },
+  }
+
+  begin
+    sock = UNIXSocket.new(PCSD_CLI_EXECUTOR_SOCKET)
+  rescue SystemCallError => e
+    $logger.debug("Command executor is not available: #{e}")
+    return nil
+  end
+  # The command may have been run already, do not run it again on errors.
+  begin
+    sock.write(JSON.generate(request))
+    sock.close_write
+    response = JSON.parse(sock.read)
+  rescue SystemCallError, IOError, JSON::ParserError => e
+    $logger.error("Unable to get a result from command executor: #{e}")
+    return [], ["Unable to get a result from command executor: #{e}\n"], 1
+  ensure
+    sock.close
+  end
+  if response.key?('error')
+    $logger.error("Command executor refused the command: #{response['error']}")
+    return nil
+  end
+  return [
+    response['stdout'].lines, response['stderr'].lines, response['exit_code']
+  ]
+end
+
 def is_score(score)
   return !!/^[+-]?((INFINITY)|(\d+))$/.match(score)
 end
@@ -729,7 +729,22 @@ def remote_pacemaker_node_status(params, request, auth_user)
   if not allowed_for_local_cluster(auth_user, Permissions::READ)
     return 403, 'Permission denied'
   end
-  output, stderr, retval = run_cmd(auth_user, PCS, '--', 'node', 'pacemaker-status')
+  flags = []
+  if params[:wait]
+    # Wait for pacemaker to start on the node and respond once it has
+    # started, so that clients waiting for a cluster to start do not have to
+    # poll the node repeatedly. The time is limited to not block the worker.
+    begin
+      wait = Integer(params[:wait])
+    rescue ArgumentError, TypeError
+      return [400, "Invalid wait timeout '#{params[:wait]}'"]
+    end
+    wait = [[wait, 0].max, PACEMAKER_NODE_STATUS_WAIT_MAX].min
+    flags << "--wait=#{wait}"
+  end
+  output, stderr, retval = run_cmd(
+    auth_user, PCS, *flags, '--', 'node', 'pacemaker-status'
+  )
   if retval != 0
     return [400, stderr]
   else